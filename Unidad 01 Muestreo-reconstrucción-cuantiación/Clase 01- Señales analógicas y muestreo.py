@@ -1,9 +1,18 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.signal import convolve, freqz
+from scipy.signal import convolve
 from scipy.fft import fft, fftfreq, fftshift
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import rejilla_frecuencias, respuesta_frecuencia
+
 # Señal de prueba: suma de dos senoidales
 def generar_senal(t, A1, f1, A2, f2):
     return A1 * np.cos(2 * np.pi * f1 * t) + A2 * np.cos(2 * np.pi * f2 * t)
@@ -45,10 +54,11 @@ def ejercicio_filtrado():
     axs[1,0].set_title("Filtro h(t)")
     l_h, = axs[1,0].plot(t_h, h)
 
-    # Espectro del filtro
-    w, H = freqz(h, worN=fs, fs=fs)
+    # Espectro del filtro: rejilla de 0 a fs/2 cada 0.5 Hz (en caché, evaluada con una FFT)
+    f_H = rejilla_frecuencias(fs + 1, fs)
+    H = respuesta_frecuencia(h, f=f_H, fs=fs).H
     axs[1,1].set_title("Respuesta en frecuencia |H(f)|")
-    l_H, = axs[1,1].plot(w, np.abs(H))
+    l_H, = axs[1,1].plot(f_H, np.abs(H))
     axs[1,1].set_xlim(0, 500)
 
     # Señal filtrada
@@ -91,8 +101,8 @@ def ejercicio_filtrado():
 
         h = filtro_pasabajas(fc, fs)
         l_h.set_ydata(h)
-        w, H = freqz(h, worN=fs, fs=fs)
-        l_H.set_data(w, np.abs(H))
+        H = respuesta_frecuencia(h, f=f_H, fs=fs).H
+        l_H.set_ydata(np.abs(H))
 
         y = convolve(x, h, mode='same')
         l_y.set_ydata(y)
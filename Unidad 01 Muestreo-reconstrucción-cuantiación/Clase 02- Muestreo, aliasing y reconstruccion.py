@@ -2,17 +2,47 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, TablaBarrido, actualizar_stem, rejilla
+
+# Eje de frecuencia del espectro en múltiplos de fs (el eje en Hz es u·fs)
+U_ESPECTRO = np.linspace(-3, 3, 1000)
+
 def frecuencia_alias(f, fs):
     # Calcula la frecuencia alias en el intervalo de Nyquist
     fa = ((f + fs/2) % fs) - fs/2
     return fa
 
+def espectro_replicas(f, fs):
+    # Réplicas gaussianas en f + m·fs sobre el eje U_ESPECTRO·fs
+    # (f y fs pueden ser columnas de valores: una fila por cada par)
+    f_axis = U_ESPECTRO * fs
+    spectrum = np.zeros(np.broadcast(f, fs, f_axis).shape)
+    for m in range(-3, 4):
+        spectrum += np.exp(-((f_axis-(f+m*fs))/0.2)**2)
+    return spectrum
+
 def plot_muestreo_aliasing():
     # Parámetros iniciales
     f_init = 10      # Frecuencia señal [Hz]
     fs_init = 12     # Frecuencia de muestreo [Hz]
     tmax = 1         # Duración [s]
     N = 1000         # Puntos para señal continua
+    paso = 0.5       # Paso de la rejilla de la tabla [Hz]
+
+    # Espectros de una rejilla que cubre el rango de los sliders, calculados mientras la figura
+    # está inactiva. Los sliders son continuos: fuera de la rejilla (a más de 0.01 Hz, 5% del
+    # ancho de las réplicas) el espectro se calcula en el valor exacto
+    tabla = TablaBarrido(espectro_replicas,
+                         {"f": np.r_[0.1, rejilla(paso, 40, paso)], "fs": rejilla(2, 50, paso)},
+                         tolerancia=0.01)
+    tabla.calcular_en_segundo_plano()
 
     # Figura y ejes
     fig, axs = plt.subplots(2, 2, figsize=(12, 7))
@@ -37,8 +67,6 @@ def plot_muestreo_aliasing():
     axs[0,0].legend()
     axs[0,0].set_xlim(0, tmax)
     axs[0,0].grid(True)
-    # Guardar los artistas del stem para eliminarlos después
-    stem_artists = list(stem_container)
 
     # Gráfico señal reconstruida (alias)
     axs[1,0].set_title("Señal reconstruida (alias)")
@@ -48,10 +76,8 @@ def plot_muestreo_aliasing():
     axs[1,0].grid(True)
 
     # Espectro de la señal muestreada (réplicas)
-    f_axis = np.linspace(-3*fs_init, 3*fs_init, 1000)
-    spectrum = np.zeros_like(f_axis)
-    for m in range(-3, 4):
-        spectrum += np.exp(-((f_axis-(f_init+m*fs_init))/0.2)**2)
+    f_axis = U_ESPECTRO * fs_init
+    spectrum = espectro_replicas(f_init, fs_init)
     axs[0,1].set_title("Réplicas en el espectro (Hz)")
     l_spec, = axs[0,1].plot(f_axis, spectrum)
     axs[0,1].axvline(fs_init/2, color='k', linestyle='--', alpha=0.5, label='Nyquist')
@@ -85,8 +111,11 @@ def plot_muestreo_aliasing():
     txt_alias.axis('off')
     alias_text = txt_alias.text(0.02, 0.5, f"Frecuencia alias: {fa_init:.2f} Hz", fontsize=12, va='center')
 
+    # Artistas que cambian con los sliders: se actualizan en su lugar y se redibujan por blitting
+    blit = GestorBlit(fig, [l_x, stem_container, l_alias, l_spec, l_fa, alias_text],
+                      sliders=[s_f, s_fs])
+
     def update(_):
-        nonlocal stem_artists
         f = s_f.val
         fs = s_fs.val
         n = np.arange(0, tmax, 1/fs)
@@ -97,28 +126,14 @@ def plot_muestreo_aliasing():
 
         # Update señal continua
         l_x.set_ydata(x)
-        # Eliminar el stem anterior (líneas, marcadores y base)
-        for artist in stem_artists:
-            try:
-                artist.remove()
-            except Exception:
-                pass
-        # Crear nuevo stem y guardar sus artistas
-        new_stem = axs[0,0].stem(n, x_n, linefmt='C1-', markerfmt='C1o', basefmt=" ")
-        stem_artists = list(new_stem)
-        axs[0,0].set_xlim(0, tmax)
-        if axs[0,0].get_legend() is not None:
-            axs[0,0].get_legend().remove()
+        # Update muestras (el número de muestras cambia con fs)
+        actualizar_stem(stem_container, n, x_n)
 
         # Update alias
         l_alias.set_ydata(x_alias)
 
         # Update espectro
-        f_axis = np.linspace(-3*fs, 3*fs, 1000)
-        spectrum = np.zeros_like(f_axis)
-        for m in range(-3, 4):
-            spectrum += np.exp(-((f_axis-(f+m*fs))/0.2)**2)
-        l_spec.set_data(f_axis, spectrum)
+        l_spec.set_data(U_ESPECTRO * fs, tabla.buscar(f=f, fs=fs))
         axs[0,1].set_xlim(-2*fs, 2*fs)
         axs[0,1].lines[1].set_xdata([fs/2, fs/2])
         axs[0,1].lines[2].set_xdata([-fs/2, -fs/2])
@@ -135,7 +150,8 @@ def plot_muestreo_aliasing():
         # Update alias text
         alias_text.set_text(f"Frecuencia alias: {fa:.2f} Hz")
 
-        fig.canvas.draw_idle()
+        # Si fs cambió los límites de los ejes se redibuja la figura completa
+        blit.actualizar()
 
     s_f.on_changed(update)
     s_fs.on_changed(update)
@@ -2,13 +2,23 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import TablaBarrido, rejilla
+
 def espectro_senoidal(f0, f_axis):
     # Espectro ideal de una senoidal: dos deltas en ±f0 (simulado como picos estrechos)
     return np.exp(-((f_axis-f0)/0.1)**2) + np.exp(-((f_axis+f0)/0.1)**2)
 
 def espectro_muestreado(f0, fs, f_axis, replicas=5):
     # Suma de réplicas desplazadas por múltiplos de fs
-    spectrum = np.zeros_like(f_axis)
+    # f0 y fs pueden ser columnas de valores (una fila del resultado por cada par)
+    spectrum = np.zeros(np.broadcast(f0, fs, f_axis).shape)
     for m in range(-replicas, replicas+1):
         spectrum += espectro_senoidal(f0 + m*fs, f_axis)
     return spectrum
@@ -20,6 +30,15 @@ def plot_espectro_muestreo():
     replicas = 5
     fmax = 50
     f_axis = np.linspace(-fmax, fmax, 2000)
+    paso = 0.5       # Paso de la rejilla de la tabla [Hz]
+
+    # Espectros muestreados de una rejilla que cubre el rango de los sliders, calculados mientras
+    # la figura está inactiva. Los sliders son continuos: fuera de la rejilla (a más de 0.005 Hz,
+    # 5% del ancho de los picos) el espectro se calcula en el valor exacto
+    tabla = TablaBarrido(lambda f0, fs: espectro_muestreado(f0, fs, f_axis, replicas),
+                         {"f0": rejilla(0.5, 20, paso), "fs": rejilla(5, 40, paso)},
+                         tolerancia=0.005)
+    tabla.calcular_en_segundo_plano()
 
     # Figura y ejes
     fig, axs = plt.subplots(2, 1, figsize=(10, 7))
@@ -65,7 +84,7 @@ def plot_espectro_muestreo():
         # Update espectro original
         l_orig.set_ydata(espectro_senoidal(f0, f_axis))
         # Update espectro muestreado
-        l_muest.set_ydata(espectro_muestreado(f0, fs, f_axis, replicas))
+        l_muest.set_ydata(tabla.buscar(f0=f0, fs=fs))
         # Update líneas de Nyquist
         nyq_line1.set_xdata([fs/2, fs/2])
         nyq_line2.set_xdata([-fs/2, -fs/2])
@@ -2,6 +2,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import TablaBarrido, rejilla
+
 def X_in(f):
     # f en kHz, devuelve |X_in(f)| según la fórmula de Orfanidis
     return 1 / np.sqrt(1 + (0.1 * f)**8)
@@ -24,6 +33,16 @@ def plot_antialias_Orfanidis():
     A_req = 60  # dB
 
     f_axis = np.linspace(0, fs_max, 2000)  # 0 a fs_max kHz (ajuste para ver todo el rango)
+    # Paso de la rejilla de la tabla: el de f_axis, de modo que la réplica del punto más
+    # cercano se desplaza menos de media muestra del eje respecto a la de fs exacta
+    paso = f_axis[1] - f_axis[0]
+
+    # Réplica desplazada para cada punto de la rejilla (tabla, 14 MB) y curva de atenuación
+    # vs fs (no depende del slider, se calcula una sola vez)
+    tabla_alias = TablaBarrido(lambda fs: X_in_alias(f_axis, fs), {"fs": rejilla(fs_min, fs_max, paso)})
+    tabla_alias.calcular_en_segundo_plano()
+    fs_range = tabla_alias.ejes[0]
+    att_db = atenuacion_db(fmax, fs_range)
 
     fig, axs = plt.subplots(2, 1, figsize=(10, 7))
     plt.subplots_adjust(left=0.1, bottom=0.25, hspace=0.4)
@@ -67,15 +86,13 @@ def plot_antialias_Orfanidis():
         fs = s_fs.val
         # Update espectros
         l_orig.set_ydata(X_in(f_axis))
-        l_alias.set_ydata(X_in_alias(f_axis, fs))
+        l_alias.set_ydata(tabla_alias.buscar(fs=fs))
         fs_line.set_xdata([fs, fs])
         axs[0].set_xlim(0, fs_max)  # Mantener el mismo límite al actualizar
 
         # Atenuación en dB para fs en el rango
-        fs_range = np.linspace(fs_min, fs_max, 300)
-        att_db = -20 * np.log10(X_in_alias(fmax, fs_range) / X_in(fmax))
         l_att.set_data(fs_range, -att_db)
-        att_fs = -20 * np.log10(X_in_alias(fmax, fs) / X_in(fmax))
+        att_fs = atenuacion_db(fmax, fs)
         att_point.set_data([fs], [-att_fs])
 
         # Mensaje de condición
@@ -2,6 +2,15 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, actualizar_stem, reconstruir
+
 def h_ideal(t, fs):
     # Reconstr. ideal: sinc(pi*fs*t)/(pi*t) = fs * sinc(fs*t)
     return np.sinc(fs * t)
@@ -10,13 +19,6 @@ def h_escalera(t, T):
     # Reconstr. en escalera: 1 para 0 <= t <= T, 0 en otro caso
     return np.where((t >= 0) & (t <= T), 1.0, 0.0)
 
-def reconstruccion(xn, n, t, h_func, *h_args):
-    # Suma de convoluciones desplazadas: sum_n x[n] * h(t - nT)
-    y = np.zeros_like(t)
-    for i, ni in enumerate(n):
-        y += xn[i] * h_func(t - ni, *h_args)
-    return y
-
 def plot_reconstruccion():
     # Parámetros de la señal y muestreo
     fs = 10  # Hz
@@ -27,16 +29,15 @@ def plot_reconstruccion():
     xn = np.cos(2 * np.pi * f0 * n)  # señal muestreada
 
     # Reconstrucción ideal y escalera
-    y_ideal = reconstruccion(xn, n, t, h_ideal, fs)
-    y_stair = reconstruccion(xn, n, t, h_escalera, T)
+    y_ideal = reconstruir(xn, t, T, "ideal", t0=n[0])
+    y_stair = reconstruir(xn, t, T, "zoh", t0=n[0])
 
     fig, axs = plt.subplots(2, 1, figsize=(10, 7))
     plt.subplots_adjust(left=0.1, bottom=0.25, hspace=0.4)
 
     # Señal original y muestras
     axs[0].set_title("Reconstrucción ideal vs escalera")
-    axs[0].plot(t, np.cos(2 * np.pi * f0 * t), 'k--', label="Señal original")
-    # Guardar el stem inicial para poder actualizarlo correctamente
+    l_orig, = axs[0].plot(t, np.cos(2 * np.pi * f0 * t), 'k--', label="Señal original")
     stem_container = axs[0].stem(n, xn, linefmt='C2-', markerfmt='C2o', basefmt=" ", label="Muestras")
     axs[0].set_xlim(-0.2, 2)
     axs[0].set_ylim(-1.5, 1.5)
@@ -61,30 +62,25 @@ def plot_reconstruccion():
     s_f0 = Slider(ax_f0, 'Frecuencia señal $f_0$ [Hz]', 0.5, 4, valinit=f0)
     s_fs = Slider(ax_fs, 'Frecuencia muestreo $f_s$ [Hz]', 6, 30, valinit=fs)
 
+    # Los límites son fijos: cada movimiento redibuja solo estos artistas (blitting)
+    blit = GestorBlit(fig, [l_orig, stem_container, l_ideal, l_stair, l_hi, l_hs],
+                      sliders=[s_f0, s_fs])
+
     def update(_):
-        nonlocal stem_container  # <-- Mueve esto al inicio de la función
         f0 = s_f0.val
         fs = s_fs.val
         T = 1/fs
         n = np.arange(0, 2, T)
         xn = np.cos(2 * np.pi * f0 * n)
-        y_ideal = reconstruccion(xn, n, t, h_ideal, fs)
-        y_stair = reconstruccion(xn, n, t, h_escalera, T)
+        y_ideal = reconstruir(xn, t, T, "ideal", t0=n[0])
+        y_stair = reconstruir(xn, t, T, "zoh", t0=n[0])
         l_ideal.set_ydata(y_ideal)
         l_stair.set_ydata(y_stair)
-        axs[0].lines[0].set_ydata(np.cos(2 * np.pi * f0 * t))
-        # Eliminar el stem anterior (líneas, marcadores y base)
-        for artist in stem_container:
-            try:
-                artist.remove()
-            except Exception:
-                pass
-        # Crear nuevo stem y guardar sus artistas
-        new_stem = axs[0].stem(n, xn, linefmt='C2-', markerfmt='C2o', basefmt=" ")
-        stem_container = new_stem
+        l_orig.set_ydata(np.cos(2 * np.pi * f0 * t))
+        actualizar_stem(stem_container, n, xn)
         l_hi.set_ydata(h_ideal(t_h, fs))
         l_hs.set_ydata(h_escalera(t_h, T))
-        fig.canvas.draw_idle()
+        blit.actualizar()
 
     s_f0.on_changed(update)
     s_fs.on_changed(update)
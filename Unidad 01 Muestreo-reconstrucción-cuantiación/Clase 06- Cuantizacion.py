@@ -1,15 +1,16 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
+# cuantizar(x, R, B) = clip(round(x/Q)·Q, -R/2, R/2 - Q); error_rms(R, B) = Q/√12 (teórico)
 
-def cuantizar(x, R, B):
-    Q = R / (2**B)
-    xq = np.clip(np.round(x / Q) * Q, -R/2, R/2 - Q)
-    return xq
-
-def error_rms(R, B):
-    Q = R / (2**B)
-    return Q / np.sqrt(12)
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import cuantizar, error_rms, metricas_cuantizacion
 
 def snr_db(B):
     return 6 * B
@@ -48,8 +49,12 @@ def plot_cuantizacion():
     bits = np.arange(2, 21)
     err_rms = error_rms(R_init, bits)
     snr = snr_db(bits)
+    # Valores medidos: la señal se cuantiza con todas las profundidades a la vez
+    snr_med, rms_med = metricas_cuantizacion(x, R_init, bits)
     l_rms, = axs[1,0].plot(bits, err_rms*1e6, 'b-o', label="Error RMS [$\\mu$V]")
     l_snr, = axs[1,0].plot(bits, snr, 'r-s', label="SNR [dB]")
+    l_rms_med, = axs[1,0].plot(bits, rms_med*1e6, 'c--', label="Error RMS medido")
+    l_snr_med, = axs[1,0].plot(bits, snr_med, 'm--', label="SNR medida")
     axs[1,0].set_xlabel("Bits")
     axs[1,0].set_ylabel("Error RMS [$\\mu$V] / SNR [dB]")
     axs[1,0].legend()
@@ -90,6 +95,9 @@ def plot_cuantizacion():
         err_rms = error_rms(R, bits)
         l_rms.set_ydata(err_rms*1e6)
         l_snr.set_ydata(snr_db(bits))
+        snr_med, rms_med = metricas_cuantizacion(x, R, bits)
+        l_rms_med.set_ydata(rms_med*1e6)
+        l_snr_med.set_ydata(snr_med)
         # Niveles de cuantización
         axs[1,1].cla()
         axs[1,1].set_title("Niveles de cuantización")
@@ -103,7 +111,8 @@ def plot_cuantizacion():
         axs[1,1].grid(True)
         # Info
         info_text.set_text(
-            f"Q = {Q:.4f} V, Error RMS = {error_rms(R,B)*1e6:.1f} μV, SNR = {snr_db(B):.1f} dB, Niveles = {2**B}"
+            f"Q = {Q:.4f} V, Error RMS = {error_rms(R,B)*1e6:.1f} μV, SNR = {snr_db(B):.1f} dB "
+            f"(medida {snr_med[B - bits[0]]:.1f} dB), Niveles = {2**B}"
         )
         fig.canvas.draw_idle()
 
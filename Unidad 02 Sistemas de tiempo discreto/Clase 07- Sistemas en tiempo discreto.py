@@ -2,16 +2,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import dsp_core
+
 def sistema_lineal(x, a=2, b=3, c=4):
-    # y(n) = a*x(n) + b*x(n-1) + c*x(n-2)
-    y = np.zeros_like(x)
-    for n in range(len(x)):
-        y[n] = a*x[n]
-        if n-1 >= 0:
-            y[n] += b*x[n-1]
-        if n-2 >= 0:
-            y[n] += c*x[n-2]
-    return y
+    # y(n) = a*x(n) + b*x(n-1) + c*x(n-2): ecuación en diferencias con b = [a, b, c]
+    return dsp_core.filtrar(x, b=[a, b, c])
 
 def sistema_escalamiento(x, k=2):
     # y(n) = k*x(n)
@@ -41,6 +43,7 @@ def plot_sistemas_lineales():
     axs[0].legend()
     axs[0].set_xlabel("n")
     axs[0].set_ylabel("Amplitud")
+    axs[0].set_ylim(-0.5, 5.5)  # Cubre la salida para todo el rango de los sliders
     axs[0].grid(True)
 
     # Sistema de escalamiento
@@ -51,6 +54,7 @@ def plot_sistemas_lineales():
     axs[1].legend()
     axs[1].set_xlabel("n")
     axs[1].set_ylabel("Amplitud")
+    axs[1].set_ylim(-0.5, 5.5)
     axs[1].grid(True)
 
     # Sliders
@@ -64,8 +68,8 @@ def plot_sistemas_lineales():
     s_c = Slider(ax_c, 'c', 0, 5, valinit=c_init)
     s_k = Slider(ax_k, 'k', 0, 5, valinit=k_init)
 
-    # Guardar referencias a los stems de salida para actualizar
-    stems_out = [stem_y0, stem_y1]
+    # Los stems de salida se actualizan en su lugar y se redibujan por blitting
+    blit = dsp_core.GestorBlit(fig, [stem_y0, stem_y1], sliders=[s_a, s_b, s_c, s_k])
 
     def update(_):
         a = s_a.val
@@ -74,19 +78,9 @@ def plot_sistemas_lineales():
         k = s_k.val
         y = sistema_lineal(x, a, b, c)
         y2 = sistema_escalamiento(x, k)
-        # Eliminar stems de salida anteriores
-        for stem in stems_out:
-            for artist in stem:
-                try:
-                    artist.remove()
-                except Exception:
-                    pass
-        # Dibujar nuevos stems de salida y actualizar referencias
-        new_stem_y0 = axs[0].stem(n, y, linefmt='C1-', markerfmt='C1s', basefmt=" ")
-        new_stem_y1 = axs[1].stem(n, y2, linefmt='C2-', markerfmt='C2s', basefmt=" ")
-        stems_out[0] = new_stem_y0
-        stems_out[1] = new_stem_y1
-        fig.canvas.draw_idle()
+        dsp_core.actualizar_stem(stem_y0, n, y)
+        dsp_core.actualizar_stem(stem_y1, n, y2)
+        blit.actualizar()
 
     s_a.on_changed(update)
     s_b.on_changed(update)
@@ -1,16 +1,24 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
-from scipy.signal import lfilter, firwin, butter
+from scipy.signal import lfilter
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, actualizar_stem, disenar_filtro, filtrar
 
 def crear_fir(numtaps, cutoff, fs):
-    # Filtro FIR pasa bajas
-    return firwin(numtaps, cutoff, fs=fs)
+    # Filtro FIR pasa bajas (ventana de Hamming); los diseños se guardan en caché
+    return disenar_filtro("fir", "Pasa Bajas", cutoff, numtaps - 1, fs=fs).b
 
 def crear_iir(order, cutoff, fs):
-    # Filtro IIR pasa bajas Butterworth
-    b, a = butter(order, cutoff, fs=fs)
-    return b, a
+    # Filtro IIR pasa bajas Butterworth, en secciones de segundo orden
+    return disenar_filtro("butter", "Pasa Bajas", cutoff, order, fs=fs).sos
 
 def plot_fir_iir_comparacion():
     fs = 8000
@@ -34,9 +42,9 @@ def plot_fir_iir_comparacion():
     iir_order_init = 2
     cutoff_init = 1000
     fir_coef = crear_fir(fir_order_init+1, cutoff_init, fs)
-    iir_b, iir_a = crear_iir(iir_order_init, cutoff_init, fs)
+    iir_sos = crear_iir(iir_order_init, cutoff_init, fs)
     y_fir = lfilter(fir_coef, 1, x)
-    y_iir = lfilter(iir_b, iir_a, x)
+    y_iir = filtrar(x, sos=iir_sos)
 
     # Señal original y FIR
     axs[0,0].set_title("Original y salida FIR (pasa bajas)")
@@ -71,7 +79,7 @@ def plot_fir_iir_comparacion():
     axs[1,1].set_title("Respuesta al impulso IIR")
     impulse = np.zeros(100)
     impulse[0] = 1
-    h_iir = lfilter(iir_b, iir_a, impulse)
+    h_iir = filtrar(impulse, sos=iir_sos)
     n_iir = np.arange(len(h_iir))
     l_hiir = axs[1,1].stem(n_iir, h_iir, linefmt='C2-', markerfmt='C2o', basefmt=" ")
     axs[1,1].set_xlabel("n")
@@ -87,41 +95,28 @@ def plot_fir_iir_comparacion():
     s_iir = Slider(ax_iir, 'Orden IIR', 1, 8, valinit=iir_order_init, valstep=1)
     s_cut = Slider(ax_cut, 'Frecuencia de corte [Hz]', 200, 3000, valinit=cutoff_init, valstep=10)
 
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, [l_yfir, l_yiir, l_hfir, l_hiir], sliders=[s_fir, s_iir, s_cut])
+
     def update(_):
-        nonlocal l_hfir, l_hiir
         fir_order = int(s_fir.val)
         iir_order = int(s_iir.val)
         cutoff = s_cut.val
         fir_coef = crear_fir(fir_order+1, cutoff, fs)
-        iir_b, iir_a = crear_iir(iir_order, cutoff, fs)
+        iir_sos = crear_iir(iir_order, cutoff, fs)
         y_fir = lfilter(fir_coef, 1, x)
-        y_iir = lfilter(iir_b, iir_a, x)
+        y_iir = filtrar(x, sos=iir_sos)
         # Señal filtrada
         l_yfir.set_ydata(y_fir)
         l_yiir.set_ydata(y_iir)
-        # Respuesta al impulso FIR
-        for artist in l_hfir:
-            try:
-                artist.remove()
-            except Exception:
-                pass
+        # Respuesta al impulso FIR (su longitud cambia con el orden)
         h_fir = fir_coef
         n_fir = np.arange(len(h_fir))
-        l_hfir_new = axs[1,0].stem(n_fir, h_fir, linefmt='C1-', markerfmt='C1o', basefmt=" ")
-        l_hfir = l_hfir_new
+        actualizar_stem(l_hfir, n_fir, h_fir, reescalar=True)
         # Respuesta al impulso IIR
-        for artist in l_hiir:
-            try:
-                artist.remove()
-            except Exception:
-                pass
-        impulse = np.zeros(100)
-        impulse[0] = 1
-        h_iir = lfilter(iir_b, iir_a, impulse)
-        n_iir = np.arange(len(h_iir))
-        l_hiir_new = axs[1,1].stem(n_iir, h_iir, linefmt='C2-', markerfmt='C2o', basefmt=" ")
-        l_hiir = l_hiir_new
-        fig.canvas.draw_idle()
+        h_iir = filtrar(impulse, sos=iir_sos)
+        actualizar_stem(l_hiir, n_iir, h_iir, reescalar=True)
+        blit.actualizar()
 
     s_fir.on_changed(update)
     s_iir.on_changed(update)
@@ -2,26 +2,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
-def convolucion_directa(x, h):
-    L = len(x)
-    M = len(h) - 1
-    y = np.zeros(L + M)
-    for n in range(L + M):
-        m_min = max(0, n - L + 1)
-        m_max = min(n, M)
-        for m in range(m_min, m_max + 1):
-            y[n] += h[m] * x[n - m]
-    return y
-
-def convolucion_circular(x, h):
-    N = max(len(x), len(h))
-    x_pad = np.pad(x, (0, N - len(x)), mode='constant')
-    h_pad = np.pad(h, (0, N - len(h)), mode='constant')
-    y = np.zeros(N)
-    for n in range(N):
-        for m in range(N):
-            y[n] += x_pad[m] * h_pad[(n - m) % N]
-    return y
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import convolucion_directa, convolucion_circular
 
 def plot_convolucion():
     # Señales de ejemplo
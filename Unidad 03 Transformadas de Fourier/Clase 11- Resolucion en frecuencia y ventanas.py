@@ -2,26 +2,42 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
 
-def ventana_rect(L):
-    return np.ones(L)
-
-def ventana_hamming(L):
-    n = np.arange(L)
-    return 0.54 - 0.46 * np.cos(2 * np.pi * n / (L - 1))
-
-def ventana_hann(L):
-    n = np.arange(L)
-    return 0.5 - 0.5 * np.cos(2 * np.pi * n / (L - 1))
-
-def ventana_blackman(L):
-    n = np.arange(L)
-    return 0.42 - 0.5 * np.cos(2 * np.pi * n / (L - 1)) + 0.08 * np.cos(4 * np.pi * n / (L - 1))
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import ventana_rect, ventana_hamming, ventana_hann, ventana_blackman, TablaBarrido
+from dsp_core import metricas_ventana, AnalizadorEspectral
+
+VENTANAS_CLASE = (ventana_rect, ventana_hamming, ventana_hann, ventana_blackman)
 
 def senal_cos(L, f0, fs):
     n = np.arange(L)
     w0 = 2 * np.pi * f0 / fs
     return np.cos(w0 * n)
 
+def texto_metricas(L):
+    # ENBW y mayor lóbulo lateral de cada ventana para la longitud L (métricas en caché)
+    lineas = []
+    for nombre in ("Rectangular", "Hamming", "Hann", "Blackman"):
+        m = metricas_ventana(nombre, L)
+        lineas.append(f"{nombre}: ENBW {m.enbw:.2f} bins, lóbulo lateral {m.lobulo_lateral_db:.1f} dB")
+    return "   ".join(lineas[:2]) + "\n" + "   ".join(lineas[2:])
+
+def espectros_ventaneados(L, f0, fs, Nfft):
+    # |X_L(ω)| de 0 a fs/2 de la señal con cada ventana, para una columna de longitudes L
+    # (todas las FFT se calculan en un solo lote: resultado de forma (len(L), 4, Nfft/2))
+    L = np.asarray(L, dtype=int).ravel()
+    xw = np.zeros((L.size, len(VENTANAS_CLASE), L.max()))
+    for i, Li in enumerate(L):
+        x = senal_cos(Li, f0, fs)
+        for j, ventana in enumerate(VENTANAS_CLASE):
+            xw[i, j, :Li] = x * ventana(Li)
+    return np.abs(np.fft.rfft(xw, Nfft, axis=-1)[..., :Nfft//2])
+
 def plot_ventaneo():
     # Parámetros iniciales
     fs = 1000
@@ -39,18 +55,16 @@ def plot_ventaneo():
     x_hann = x * w_hann
     x_black = x * w_black
 
-    # FFT
+    # FFT: las cuatro señales ventaneadas en una sola rfft (bins de 0 a fs/2, sin incluir fs/2)
     Nfft = 2048
-    def calc_fft(xw):
-        X = np.fft.fft(xw, Nfft)
-        w = np.fft.fftfreq(Nfft, 1/fs)
-        idx = np.where((w >= 0) & (w <= fs/2))
-        return w[idx], np.abs(X[idx])
+    analizador = AnalizadorEspectral(Nfft, fs)
+    analizador.analizar([x_rect, x_ham, x_hann, x_black])
+    X_rect, X_ham, X_hann, X_black = analizador.magnitud()[:, :Nfft//2]
+    w_f = analizador.frecuencias[:Nfft//2]
 
-    w_rect_f, X_rect = calc_fft(x_rect)
-    w_ham_f, X_ham = calc_fft(x_ham)
-    w_hann_f, X_hann = calc_fft(x_hann)
-    w_black_f, X_black = calc_fft(x_black)
+    # Espectros de todas las longitudes del slider, calculados mientras la figura está inactiva
+    tabla = TablaBarrido(lambda L: espectros_ventaneados(L, f0, fs, Nfft), {"L": np.arange(20, 401)})
+    tabla.calcular_en_segundo_plano()
 
     fig, axs = plt.subplots(3, 2, figsize=(14, 10))
     fig.suptitle(
@@ -94,10 +108,10 @@ def plot_ventaneo():
 
     # Espectros
     axs[2,0].set_title("Espectro |X_L(ω)| ventanas rect, Hamming, Hann, Blackman")
-    l_rect, = axs[2,0].plot(w_rect_f/(fs/2)*np.pi, X_rect, 'r', label="Rectangular")
-    l_ham, = axs[2,0].plot(w_ham_f/(fs/2)*np.pi, X_ham, 'b', label="Hamming")
-    l_hann, = axs[2,0].plot(w_hann_f/(fs/2)*np.pi, X_hann, 'g', label="Hann")
-    l_black, = axs[2,0].plot(w_black_f/(fs/2)*np.pi, X_black, 'm', label="Blackman")
+    l_rect, = axs[2,0].plot(w_f/(fs/2)*np.pi, X_rect, 'r', label="Rectangular")
+    l_ham, = axs[2,0].plot(w_f/(fs/2)*np.pi, X_ham, 'b', label="Hamming")
+    l_hann, = axs[2,0].plot(w_f/(fs/2)*np.pi, X_hann, 'g', label="Hann")
+    l_black, = axs[2,0].plot(w_f/(fs/2)*np.pi, X_black, 'm', label="Blackman")
     axs[2,0].set_xlim(0, 0.2*np.pi)
     axs[2,0].set_xlabel("ω/π")
     axs[2,0].set_ylabel("|X_L(ω)|")
@@ -118,6 +132,11 @@ def plot_ventaneo():
     ax_L = plt.axes([0.15, 0.18, 0.7, 0.03], facecolor=axcolor)
     s_L = Slider(ax_L, 'L (longitud ventana)', 20, 400, valinit=L_init, valstep=1)
 
+    # Métricas espectrales de las ventanas
+    ax_met = plt.axes([0.08, 0.08, 0.75, 0.06])
+    ax_met.axis('off')
+    met_text = ax_met.text(0, 0.5, texto_metricas(L_init), fontsize=9, va='center')
+
     def update(_):
         L = int(s_L.val)
         x = senal_cos(L, f0, fs)
@@ -129,10 +148,7 @@ def plot_ventaneo():
         x_ham = x * w_ham
         x_hann = x * w_hann
         x_black = x * w_black
-        w_rect_f, X_rect = calc_fft(x_rect)
-        w_ham_f, X_ham = calc_fft(x_ham)
-        w_hann_f, X_hann = calc_fft(x_hann)
-        w_black_f, X_black = calc_fft(x_black)
+        X_rect, X_ham, X_hann, X_black = tabla.buscar(L=L)
         l_xorig.set_data(np.arange(L), x)
         axs[0,0].set_xlim(0, L)
         l_rectw.set_data(np.arange(L), w_rect)
@@ -147,10 +163,11 @@ def plot_ventaneo():
         l_xhann.set_data(np.arange(L), x_hann)
         l_xblack.set_data(np.arange(L), x_black)
         axs[2,1].set_xlim(0, L)
-        l_rect.set_data(w_rect_f/(fs/2)*np.pi, X_rect)
-        l_ham.set_data(w_ham_f/(fs/2)*np.pi, X_ham)
-        l_hann.set_data(w_hann_f/(fs/2)*np.pi, X_hann)
-        l_black.set_data(w_black_f/(fs/2)*np.pi, X_black)
+        l_rect.set_ydata(X_rect)
+        l_ham.set_ydata(X_ham)
+        l_hann.set_ydata(X_hann)
+        l_black.set_ydata(X_black)
+        met_text.set_text(texto_metricas(L))
         fig.canvas.draw_idle()
 
     s_L.on_changed(update)
@@ -11,12 +11,20 @@ y su inversa, así como su interpretación matricial como proyección sobre base
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import dsp_core
+
 # Configuración para gráficos
 plt.style.use('default')
 plt.rcParams['font.size'] = 9
@@ -30,11 +38,23 @@ class DFTInteractivaGUI:
         self.root.geometry("1400x900")
         self.root.configure(bg='#f0f0f0')
         
-        # Variables
-        self.current_figure = None
-        self.current_canvas = None
+        # Lienzos persistentes de las pestañas (se liberan al cerrar)
+        self.lienzos = []
         
         self.crear_interfaz()
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
+        
+    def crear_lienzo(self, contenedor, figsize, actualizar=None):
+        """Crear el lienzo persistente de una pestaña y registrarlo para el cierre"""
+        lienzo = dsp_core.LienzoTk(contenedor, figsize, actualizar)
+        self.lienzos.append(lienzo)
+        return lienzo
+    
+    def cerrar(self):
+        """Liberar las figuras de todas las pestañas y cerrar la ventana"""
+        for lienzo in self.lienzos:
+            lienzo.cerrar()
+        self.root.destroy()
         
     def crear_interfaz(self):
         """Crear la interfaz principal"""
@@ -75,6 +95,10 @@ class DFTInteractivaGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros de la Exponencial Compleja")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo del gráfico (los controles programan su actualización)
+        self.exp_graph_frame = ttk.Frame(frame)
+        self.exp_lienzo = self.crear_lienzo(self.exp_graph_frame, (12, 8), self.actualizar_exponencial)
+        
         # Controles
         self.A_var = tk.DoubleVar(value=1.0)
         self.omega_var = tk.DoubleVar(value=0.5)
@@ -83,32 +107,31 @@ class DFTInteractivaGUI:
         
         ttk.Label(control_frame, text="Amplitud A:").grid(row=0, column=0, padx=5, pady=2)
         A_scale = ttk.Scale(control_frame, from_=0.1, to=3.0, variable=self.A_var, 
-                           command=self.actualizar_exponencial)
+                           command=self.exp_lienzo.programar)
         A_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.A_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Frecuencia ω:").grid(row=1, column=0, padx=5, pady=2)
         omega_scale = ttk.Scale(control_frame, from_=0, to=2*np.pi, variable=self.omega_var,
-                               command=self.actualizar_exponencial)
+                               command=self.exp_lienzo.programar)
         omega_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.omega_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Fase φ:").grid(row=2, column=0, padx=5, pady=2)
         phi_scale = ttk.Scale(control_frame, from_=0, to=2*np.pi, variable=self.phi_var,
-                             command=self.actualizar_exponencial)
+                             command=self.exp_lienzo.programar)
         phi_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.phi_var).grid(row=2, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="N puntos:").grid(row=3, column=0, padx=5, pady=2)
         N_scale = ttk.Scale(control_frame, from_=8, to=64, variable=self.N_var,
-                           command=self.actualizar_exponencial)
+                           command=self.exp_lienzo.programar)
         N_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.N_var).grid(row=3, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para el gráfico
-        self.exp_graph_frame = ttk.Frame(frame)
         self.exp_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -128,72 +151,78 @@ class DFTInteractivaGUI:
         phi = self.phi_var.get()
         N = int(self.N_var.get())
         
-        # Limpiar frame anterior
-        for widget in self.exp_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal
         n = np.arange(N)
         x = A * np.exp(1j * (omega * n + phi))
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        # Actualizar los artistas existentes
+        real, imag, magnitud, plano, circulo, leyenda = self.exp_lienzo.preparar(self.construir_exponencial)
+        dsp_core.actualizar_stem(real, n, x.real, reescalar=True)
+        dsp_core.actualizar_stem(imag, n, x.imag, reescalar=True)
+        dsp_core.actualizar_stem(magnitud, n, np.abs(x), reescalar=True)
+        plano.set_data(x.real, x.imag)
+        
+        # Círculo unitario si A ≈ 1
+        circulo.set_visible(abs(A - 1) < 0.1)
+        leyenda.set_visible(circulo.get_visible())
+        plano.axes.relim(visible_only=True)
+        plano.axes.autoscale_view()
+        
+        self.exp_lienzo.dibujar()
+        
+        # Actualizar información
+        freq_hz = omega / (2 * np.pi)
+        M_N_ratio = omega * N / (2 * np.pi)
+        periodica = abs(M_N_ratio - round(M_N_ratio)) < 0.01
+        
+        info_text = f"A={A:.2f}, ω={omega:.2f} rad, φ={phi:.2f} rad\n"
+        info_text += f"Frecuencia: f = {freq_hz:.3f} Hz (fs=1)\n"
+        info_text += f"Periodicidad: {'PERIÓDICA' if periodica else 'NO periódica'}"
+        if periodica:
+            info_text += f" → ω = 2π({round(M_N_ratio)}/{N})"
+        
+        self.exp_info_label.config(text=info_text)
+    
+    def construir_exponencial(self, fig):
+        """Ejes y artistas de la exponencial compleja (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Exponencial Compleja Discreta: x(n) = A·e^(j(ωn + φ))', fontsize=14)
         
         # Parte real
-        ax1.stem(n, x.real, basefmt=" ")
+        real = ax1.stem([0], [0], basefmt=" ")
         ax1.set_title('Parte Real: A·cos(ωn + φ)')
         ax1.set_xlabel('n')
         ax1.set_ylabel('Re{x(n)}')
         ax1.grid(True, alpha=0.3)
         
         # Parte imaginaria
-        ax2.stem(n, x.imag, basefmt=" ", linefmt='r-', markerfmt='ro')
+        imag = ax2.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
         ax2.set_title('Parte Imaginaria: A·sin(ωn + φ)')
         ax2.set_xlabel('n')
         ax2.set_ylabel('Im{x(n)}')
         ax2.grid(True, alpha=0.3)
         
         # Magnitud
-        ax3.stem(n, np.abs(x), basefmt=" ", linefmt='g-', markerfmt='go')
+        magnitud = ax3.stem([0], [0], basefmt=" ", linefmt='g-', markerfmt='go')
         ax3.set_title('Magnitud: |x(n)|')
         ax3.set_xlabel('n')
         ax3.set_ylabel('|x(n)|')
         ax3.grid(True, alpha=0.3)
         
         # Plano complejo
-        ax4.plot(x.real, x.imag, 'b.-', markersize=6)
+        plano, = ax4.plot([], [], 'b.-', markersize=6)
         ax4.set_title('Representación en el Plano Complejo')
         ax4.set_xlabel('Real')
         ax4.set_ylabel('Imaginario')
         ax4.grid(True, alpha=0.3)
         ax4.axis('equal')
         
-        # Círculo unitario si A ≈ 1
-        if abs(A - 1) < 0.1:
-            theta = np.linspace(0, 2*np.pi, 100)
-            ax4.plot(np.cos(theta), np.sin(theta), 'k--', alpha=0.3, label='Círculo unitario')
-            ax4.legend()
-        
-        plt.tight_layout()
-        
-        # Agregar a la interfaz
-        canvas = FigureCanvasTkAgg(fig, self.exp_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Actualizar información
-        freq_hz = omega / (2 * np.pi)
-        M_N_ratio = omega * N / (2 * np.pi)
-        periodica = abs(M_N_ratio - round(M_N_ratio)) < 0.01
+        # Círculo unitario (solo visible si A ≈ 1)
+        theta = np.linspace(0, 2*np.pi, 100)
+        circulo, = ax4.plot(np.cos(theta), np.sin(theta), 'k--', alpha=0.3, label='Círculo unitario')
+        leyenda = ax4.legend()
         
-        info_text = f"A={A:.2f}, ω={omega:.2f} rad, φ={phi:.2f} rad\n"
-        info_text += f"Frecuencia: f = {freq_hz:.3f} Hz (fs=1)\n"
-        info_text += f"Periodicidad: {'PERIÓDICA' if periodica else 'NO periódica'}"
-        if periodica:
-            info_text += f" → ω = 2π({round(M_N_ratio)}/{N})"
-        
-        self.exp_info_label.config(text=info_text)
+        return real, imag, magnitud, plano, circulo, leyenda
     
     def crear_pestaña_dft_4_puntos(self):
         """Pestaña para ejemplo DFT de 4 puntos"""
@@ -283,7 +312,9 @@ class DFTInteractivaGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Gráfico
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(8, 6))
+        lienzo = self.crear_lienzo(right_frame, (8, 6))
+        fig = lienzo.figura
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('DFT de 4 Puntos - Ejemplo', fontsize=12)
         
         # Señal original
@@ -319,19 +350,12 @@ class DFTInteractivaGUI:
         ax4.grid(True, alpha=0.3)
         ax4.axis('equal')
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, right_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        fig.tight_layout()
+        lienzo.dibujar()
         
     def matriz_dft(self, N):
-        """Genera la matriz DFT de N puntos"""
-        W = np.zeros((N, N), dtype=complex)
-        for k in range(N):
-            for n in range(N):
-                W[k, n] = np.exp(-2j * np.pi * k * n / N)
-        return W
+        """Genera la matriz DFT de N puntos (compartida desde la caché, solo lectura)"""
+        return dsp_core.matriz_dft(N)
     
     
     def crear_pestaña_dft_inversa(self):
@@ -407,7 +431,9 @@ class DFTInteractivaGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Gráfico
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(8, 6))
+        lienzo = self.crear_lienzo(right_frame, (8, 6))
+        fig = lienzo.figura
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('DFT Inversa - Ejemplo del Material', fontsize=12)
         
         k = np.arange(N)
@@ -445,11 +471,8 @@ class DFTInteractivaGUI:
         ax4.grid(True, alpha=0.3)
         ax4.axis('equal')
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, right_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        fig.tight_layout()
+        lienzo.dibujar()
     
     def crear_pestaña_bases_dft(self):
         """Pestaña para vectores base DFT"""
@@ -460,15 +483,18 @@ class DFTInteractivaGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo del gráfico
+        self.bases_graph_frame = ttk.Frame(frame)
+        self.bases_lienzo = self.crear_lienzo(self.bases_graph_frame, (14, 7), self.actualizar_bases_dft)
+        
         self.N_bases_var = tk.IntVar(value=8)
         ttk.Label(control_frame, text="N puntos:").pack(side=tk.LEFT, padx=5)
         N_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.N_bases_var,
-                           command=self.actualizar_bases_dft)
+                           command=self.bases_lienzo.programar)
         N_scale.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         ttk.Label(control_frame, textvariable=self.N_bases_var).pack(side=tk.LEFT, padx=5)
         
         # Frame para gráfico
-        self.bases_graph_frame = ttk.Frame(frame)
         self.bases_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info
@@ -484,37 +510,49 @@ class DFTInteractivaGUI:
     def actualizar_bases_dft(self, event=None):
         """Actualizar visualización de bases DFT"""
         N = int(self.N_bases_var.get())
+        num_plots = min(8, N)
         
-        # Limpiar frame
-        for widget in self.bases_graph_frame.winfo_children():
-            widget.destroy()
+        titulo, lineas, numeros = self.bases_lienzo.preparar(self.construir_bases_dft)
+        titulo.set_text(f'Vectores Base de la DFT (N={N})')
         
-        # Crear figura
-        num_plots = min(8, N)
-        cols = 4
-        rows = 2
-        fig, axes = plt.subplots(rows, cols, figsize=(14, 7))
-        fig.suptitle(f'Vectores Base de la DFT (N={N})', fontsize=14)
-        axes = axes.flatten()
+        # La numeración de los puntos depende de N: se reemplaza
+        for numero in numeros:
+            numero.remove()
+        numeros.clear()
         
-        for k in range(num_plots):
+        n = np.arange(N)
+        for k, linea in enumerate(lineas):
+            # Ocultar axes no usados
+            linea.axes.set_visible(k < num_plots)
+            if k >= num_plots:
+                continue
+            
             # Vector base w_k
-            n = np.arange(N)
             w_k = np.exp(-2j * np.pi * k * n / N)
+            linea.set_data(w_k.real, w_k.imag)
             
-            ax = axes[k]
-            ax.plot(w_k.real, w_k.imag, 'bo-', markersize=6)
+            # Numeración de puntos
+            for i in range(N):
+                numeros.append(linea.axes.annotate(f'{i}', (w_k[i].real, w_k[i].imag), 
+                                                   xytext=(3, 3), textcoords='offset points', 
+                                                   fontsize=8))
+        
+        self.bases_lienzo.dibujar()
+    
+    def construir_bases_dft(self, fig):
+        """Ejes de los 8 primeros vectores base (se crean una sola vez)"""
+        axes = fig.subplots(2, 4).flatten()
+        titulo = fig.suptitle('', fontsize=14)
+        theta = np.linspace(0, 2*np.pi, 100)
+        
+        lineas = []
+        for k, ax in enumerate(axes):
+            linea, = ax.plot([], [], 'bo-', markersize=6)
+            lineas.append(linea)
             
             # Círculo unitario
-            theta = np.linspace(0, 2*np.pi, 100)
             ax.plot(np.cos(theta), np.sin(theta), 'k--', alpha=0.3)
             
-            # Numeración de puntos
-            for i in range(N):
-                ax.annotate(f'{i}', (w_k[i].real, w_k[i].imag), 
-                           xytext=(3, 3), textcoords='offset points', 
-                           fontsize=8)
-            
             ax.set_title(f'Base w_{k} (k={k})')
             ax.set_xlabel('Real')
             ax.set_ylabel('Imaginario')
@@ -523,15 +561,7 @@ class DFTInteractivaGUI:
             ax.set_xlim(-1.2, 1.2)
             ax.set_ylim(-1.2, 1.2)
         
-        # Ocultar axes no usados
-        for k in range(num_plots, len(axes)):
-            axes[k].set_visible(False)
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.bases_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        return titulo, lineas, []
     
     def crear_pestaña_dft_interactiva(self):
         """Pestaña para DFT interactiva"""
@@ -542,12 +572,16 @@ class DFTInteractivaGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo del gráfico
+        self.dft_graph_frame = ttk.Frame(frame)
+        self.dft_lienzo = self.crear_lienzo(self.dft_graph_frame, (12, 8), self.actualizar_dft_interactiva)
+        
         self.N_dft_var = tk.IntVar(value=8)
         self.signal_type_var = tk.StringVar(value="Impulso")
         
         ttk.Label(control_frame, text="N puntos:").grid(row=0, column=0, padx=5, pady=2)
         N_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.N_dft_var,
-                           command=self.actualizar_dft_interactiva)
+                           command=self.dft_lienzo.programar)
         N_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.N_dft_var).grid(row=0, column=2, padx=5, pady=2)
         
@@ -555,12 +589,11 @@ class DFTInteractivaGUI:
         signal_combo = ttk.Combobox(control_frame, textvariable=self.signal_type_var,
                                    values=["Impulso", "Escalón", "Senoidal", "Exponencial", "Aleatorio"])
         signal_combo.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
-        signal_combo.bind('<<ComboboxSelected>>', self.actualizar_dft_interactiva)
+        signal_combo.bind('<<ComboboxSelected>>', self.dft_lienzo.programar)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráfico
-        self.dft_graph_frame = ttk.Frame(frame)
         self.dft_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -577,10 +610,6 @@ class DFTInteractivaGUI:
         N = int(self.N_dft_var.get())
         signal_type = self.signal_type_var.get()
         
-        # Limpiar frame
-        for widget in self.dft_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal
         n = np.arange(N)
         if signal_type == "Impulso":
@@ -596,62 +625,75 @@ class DFTInteractivaGUI:
             np.random.seed(42)  # Para reproducibilidad
             x = np.random.randn(N)
         
-        # Calcular DFT
-        W = self.matriz_dft(N)
-        X = W @ x
+        # Calcular DFT (forma matricial para N pequeño, FFT para N grande)
+        X = dsp_core.dft(x)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
-        fig.suptitle(f'DFT Interactiva - {signal_type} (N={N})', fontsize=14)
+        # Actualizar los artistas existentes
+        titulo, senal, magnitud, fase, plano, etiquetas = self.dft_lienzo.preparar(self.construir_dft_interactiva)
+        titulo.set_text(f'DFT Interactiva - {signal_type} (N={N})')
         
         k = np.arange(N)
+        dsp_core.actualizar_stem(senal, n, x, reescalar=True)
+        dsp_core.actualizar_stem(magnitud, k, np.abs(X), reescalar=True)
+        dsp_core.actualizar_stem(fase, k, np.angle(X), reescalar=True)
+        
+        # Plano complejo (las etiquetas k=i se reemplazan)
+        plano.set_data(X.real, X.imag)
+        for etiqueta in etiquetas:
+            etiqueta.remove()
+        etiquetas.clear()
+        for i in range(len(X)):
+            etiquetas.append(plano.axes.annotate(f'k={i}', (X[i].real, X[i].imag), 
+                                                 xytext=(5, 5), textcoords='offset points'))
+        plano.axes.relim()
+        plano.axes.autoscale_view()
+        
+        self.dft_lienzo.dibujar()
+        
+        # Actualizar información
+        info_text = f"Señal: {signal_type}, N = {N}\n"
+        info_text += f"Frecuencias DFT: ωk = 2πk/N, k = 0, 1, ..., {N-1}\n\n"
+        info_text += "Primeros valores de la DFT:\n"
+        for i in range(min(4, N)):
+            info_text += f"X[{i}] = {X[i]:8.3f}\n"
+        
+        self.dft_info_label.config(text=info_text)
+    
+    def construir_dft_interactiva(self, fig):
+        """Ejes y artistas de la DFT interactiva (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        titulo = fig.suptitle('', fontsize=14)
         
         # Señal original
-        ax1.stem(n, x, basefmt=" ")
+        senal = ax1.stem([0], [0], basefmt=" ")
         ax1.set_title('Señal x(n)')
         ax1.set_xlabel('n')
         ax1.set_ylabel('x(n)')
         ax1.grid(True, alpha=0.3)
         
         # Magnitud DFT
-        ax2.stem(k, np.abs(X), basefmt=" ", linefmt='r-', markerfmt='ro')
+        magnitud = ax2.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
         ax2.set_title('Magnitud |X(k)|')
         ax2.set_xlabel('k')
         ax2.set_ylabel('|X(k)|')
         ax2.grid(True, alpha=0.3)
         
         # Fase DFT
-        ax3.stem(k, np.angle(X), basefmt=" ", linefmt='g-', markerfmt='go')
+        fase = ax3.stem([0], [0], basefmt=" ", linefmt='g-', markerfmt='go')
         ax3.set_title('Fase ∠X(k)')
         ax3.set_xlabel('k')
         ax3.set_ylabel('∠X(k) [rad]')
         ax3.grid(True, alpha=0.3)
         
         # Plano complejo
-        ax4.plot(X.real, X.imag, 'bo', markersize=8)
-        for i in range(len(X)):
-            ax4.annotate(f'k={i}', (X[i].real, X[i].imag), 
-                        xytext=(5, 5), textcoords='offset points')
+        plano, = ax4.plot([], [], 'bo', markersize=8)
         ax4.set_title('DFT en Plano Complejo')
         ax4.set_xlabel('Real')
         ax4.set_ylabel('Imaginario')
         ax4.grid(True, alpha=0.3)
         ax4.axis('equal')
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.dft_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Actualizar información
-        info_text = f"Señal: {signal_type}, N = {N}\n"
-        info_text += f"Frecuencias DFT: ωk = 2πk/N, k = 0, 1, ..., {N-1}\n\n"
-        info_text += "Primeros valores de la DFT:\n"
-        for i in range(min(4, N)):
-            info_text += f"X[{i}] = {X[i]:8.3f}\n"
-        
-        self.dft_info_label.config(text=info_text)
+        return titulo, senal, magnitud, fase, plano, []
     
     def crear_pestaña_ejercicio(self):
         """Pestaña para ejercicio de bonificación"""
@@ -761,7 +803,9 @@ class DFTInteractivaGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Gráfico
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(8, 6))
+        lienzo = self.crear_lienzo(right_frame, (8, 6))
+        fig = lienzo.figura
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Ejercicio Bonificación: x = [5, 0, 4]', fontsize=12)
         
         n = np.arange(N)
@@ -795,11 +839,8 @@ class DFTInteractivaGUI:
         ax4.set_ylabel('x(n)')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, right_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        fig.tight_layout()
+        lienzo.dibujar()
     
     def ejecutar(self):
         """Ejecutar la aplicación"""
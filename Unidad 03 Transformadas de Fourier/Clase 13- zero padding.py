@@ -10,12 +10,20 @@ su implementación práctica y sus implicancias en la resolución y precisión d
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import dsp_core
+
 # Configuración para gráficos
 plt.style.use('default')
 plt.rcParams['font.size'] = 9
@@ -29,11 +37,23 @@ class ZeroPaddingGUI:
         self.root.geometry("1500x900")
         self.root.configure(bg='#f0f0f0')
         
-        # Variables
-        self.current_figure = None
-        self.current_canvas = None
+        # Lienzos persistentes de las pestañas (se liberan al cerrar)
+        self.lienzos = []
         
         self.crear_interfaz()
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
+        
+    def crear_lienzo(self, contenedor, figsize, actualizar=None):
+        """Crear el lienzo persistente de una pestaña y registrarlo para el cierre"""
+        lienzo = dsp_core.LienzoTk(contenedor, figsize, actualizar)
+        self.lienzos.append(lienzo)
+        return lienzo
+    
+    def cerrar(self):
+        """Liberar las figuras de todas las pestañas y cerrar la ventana"""
+        for lienzo in self.lienzos:
+            lienzo.cerrar()
+        self.root.destroy()
         
     def crear_interfaz(self):
         """Crear la interfaz principal"""
@@ -73,7 +93,11 @@ class ZeroPaddingGUI:
         # Panel de controles
         control_frame = ttk.LabelFrame(frame, text="Parámetros de la Señal")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
-        
+
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.conceptos_graph_frame = ttk.Frame(frame)
+        self.conceptos_lienzo = self.crear_lienzo(self.conceptos_graph_frame, (14, 10), self.actualizar_conceptos)
+                
         # Variables de control
         self.L_var = tk.IntVar(value=8)  # Longitud original
         self.D_var = tk.IntVar(value=8)  # Zeros a agregar
@@ -83,13 +107,13 @@ class ZeroPaddingGUI:
         # Controles
         ttk.Label(control_frame, text="Longitud L:").grid(row=0, column=0, padx=5, pady=2)
         L_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.L_var, 
-                           command=self.actualizar_conceptos)
+                           command=self.conceptos_lienzo.programar)
         L_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.L_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Zeros D:").grid(row=1, column=0, padx=5, pady=2)
         D_scale = ttk.Scale(control_frame, from_=0, to=24, variable=self.D_var,
-                           command=self.actualizar_conceptos)
+                           command=self.conceptos_lienzo.programar)
         D_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.D_var).grid(row=1, column=2, padx=5, pady=2)
         
@@ -97,18 +121,17 @@ class ZeroPaddingGUI:
         signal_combo = ttk.Combobox(control_frame, textvariable=self.signal_type_var,
                                    values=["Senoidal", "Pulso rectangular", "Exponencial", "Chirp"])
         signal_combo.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
-        signal_combo.bind('<<ComboboxSelected>>', self.actualizar_conceptos)
+        signal_combo.bind('<<ComboboxSelected>>', self.conceptos_lienzo.programar)
         
         ttk.Label(control_frame, text="Frecuencia:").grid(row=3, column=0, padx=5, pady=2)
         freq_scale = ttk.Scale(control_frame, from_=0.5, to=3.0, variable=self.freq_var,
-                              command=self.actualizar_conceptos)
+                              command=self.conceptos_lienzo.programar)
         freq_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.freq_var).grid(row=3, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.conceptos_graph_frame = ttk.Frame(frame)
         self.conceptos_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -168,10 +191,6 @@ class ZeroPaddingGUI:
         signal_type = self.signal_type_var.get()
         freq = self.freq_var.get()
         
-        # Limpiar frame anterior
-        for widget in self.conceptos_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal original
         x_original = self.generar_señal(L, signal_type, freq)
         
@@ -182,33 +201,64 @@ class ZeroPaddingGUI:
         X_original = np.fft.fft(x_original)
         X_padded = np.fft.fft(x_padded)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('Conceptos Básicos de Zero Padding', fontsize=14)
+        original, padded, franja, linea_orig, linea_padded = self.conceptos_lienzo.preparar(
+            self.construir_conceptos)
         
         # Señal original
         n_orig = np.arange(L)
-        ax1.stem(n_orig, x_original, basefmt=" ")
+        ax1 = original.markerline.axes
         ax1.set_title(f'Señal Original (L={L})')
-        ax1.set_xlabel('n')
-        ax1.set_ylabel('x(n)')
-        ax1.grid(True, alpha=0.3)
         ax1.set_xlim(-1, L+D+1)
+        dsp_core.actualizar_stem(original, n_orig, x_original, reescalar=True)
         
         # Señal con zero padding
         n_padded = np.arange(len(x_padded))
-        ax2.stem(n_padded, x_padded, basefmt=" ", linefmt='r-', markerfmt='ro')
-        ax2.axvspan(L-0.5, len(x_padded)-0.5, alpha=0.2, color='red', label='Zeros agregados')
+        ax2 = padded.markerline.axes
         ax2.set_title(f'Señal con Zero Padding (L+D={L+D})')
+        ax2.set_xlim(-1, L+D+1)
+        dsp_core.actualizar_franja(franja, L-0.5, len(x_padded)-0.5)
+        dsp_core.actualizar_stem(padded, n_padded, x_padded, reescalar=True)
+        
+        # Magnitud DFT original y con zero padding
+        freq_orig = np.arange(L) / L
+        dsp_core.actualizar_linea(linea_orig, freq_orig, np.abs(X_original), reescalar=True)
+        freq_padded = np.arange(len(x_padded)) / len(x_padded)
+        dsp_core.actualizar_linea(linea_padded, freq_padded, np.abs(X_padded), reescalar=True)
+        
+        self.conceptos_lienzo.dibujar()
+        
+        # Actualizar información
+        info_text = f"Señal: {signal_type}\n"
+        info_text += f"Longitud original (L): {L} muestras\n"
+        info_text += f"Zeros agregados (D): {D} muestras\n"
+        info_text += f"Longitud total: {L+D} muestras\n\n"
+        info_text += f"Resolución original: Δf = 1/L = {1/L:.3f}\n"
+        info_text += f"Resolución con padding: Δf = 1/(L+D) = {1/(L+D):.3f}\n"
+        info_text += f"Mejora en resolución: {(L+D)/L:.1f}x"
+        
+        self.conceptos_info_label.config(text=info_text)
+    
+    def construir_conceptos(self, fig):
+        """Ejes y artistas de los conceptos básicos (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        fig.suptitle('Conceptos Básicos de Zero Padding', fontsize=14)
+        
+        # Señal original
+        original = ax1.stem([0], [0], basefmt=" ")
+        ax1.set_xlabel('n')
+        ax1.set_ylabel('x(n)')
+        ax1.grid(True, alpha=0.3)
+        
+        # Señal con zero padding
+        padded = ax2.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
+        franja = ax2.axvspan(0, 1, alpha=0.2, color='red', label='Zeros agregados')
         ax2.set_xlabel('n')
         ax2.set_ylabel('x_D(n)')
         ax2.grid(True, alpha=0.3)
         ax2.legend()
-        ax2.set_xlim(-1, L+D+1)
         
         # Magnitud DFT original
-        freq_orig = np.arange(L) / L
-        ax3.plot(freq_orig, np.abs(X_original), 'b.-', label='DFT Original')
+        linea_orig, = ax3.plot([], [], 'b.-', label='DFT Original')
         ax3.set_title('|X(k)| - DFT Original')
         ax3.set_xlabel('Frecuencia normalizada (k/L)')
         ax3.set_ylabel('|X(k)|')
@@ -216,31 +266,14 @@ class ZeroPaddingGUI:
         ax3.legend()
         
         # Magnitud DFT con zero padding
-        freq_padded = np.arange(len(x_padded)) / len(x_padded)
-        ax4.plot(freq_padded, np.abs(X_padded), 'r.-', label='DFT con Zero Padding')
+        linea_padded, = ax4.plot([], [], 'r.-', label='DFT con Zero Padding')
         ax4.set_title('|X_D(k)| - DFT con Zero Padding')
         ax4.set_xlabel('Frecuencia normalizada (k/(L+D))')
         ax4.set_ylabel('|X_D(k)|')
         ax4.grid(True, alpha=0.3)
         ax4.legend()
         
-        plt.tight_layout()
-        
-        # Agregar a la interfaz
-        canvas = FigureCanvasTkAgg(fig, self.conceptos_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Actualizar información
-        info_text = f"Señal: {signal_type}\n"
-        info_text += f"Longitud original (L): {L} muestras\n"
-        info_text += f"Zeros agregados (D): {D} muestras\n"
-        info_text += f"Longitud total: {L+D} muestras\n\n"
-        info_text += f"Resolución original: Δf = 1/L = {1/L:.3f}\n"
-        info_text += f"Resolución con padding: Δf = 1/(L+D) = {1/(L+D):.3f}\n"
-        info_text += f"Mejora en resolución: {(L+D)/L:.1f}x"
-        
-        self.conceptos_info_label.config(text=info_text)
+        return original, padded, franja, linea_orig, linea_padded
     
     def crear_pestaña_tipos_zero_padding(self):
         """Pestaña para tipos de zero padding"""
@@ -251,25 +284,28 @@ class ZeroPaddingGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.tipos_graph_frame = ttk.Frame(frame)
+        self.tipos_lienzo = self.crear_lienzo(self.tipos_graph_frame, (16, 10), self.actualizar_tipos)
+        
         self.L_tipos_var = tk.IntVar(value=8)
         self.D_tipos_var = tk.IntVar(value=8)
         
         ttk.Label(control_frame, text="Longitud L:").grid(row=0, column=0, padx=5, pady=2)
         L_scale = ttk.Scale(control_frame, from_=6, to=12, variable=self.L_tipos_var, 
-                           command=self.actualizar_tipos)
+                           command=self.tipos_lienzo.programar)
         L_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.L_tipos_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Zeros D:").grid(row=1, column=0, padx=5, pady=2)
         D_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.D_tipos_var,
-                           command=self.actualizar_tipos)
+                           command=self.tipos_lienzo.programar)
         D_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.D_tipos_var).grid(row=1, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.tipos_graph_frame = ttk.Frame(frame)
         self.tipos_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -288,10 +324,6 @@ class ZeroPaddingGUI:
         L = int(self.L_tipos_var.get())
         D = int(self.D_tipos_var.get())
         
-        # Limpiar frame
-        for widget in self.tipos_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal de prueba (pulso rectangular)
         x_original = np.zeros(L)
         x_original[:L//3] = 1
@@ -301,69 +333,62 @@ class ZeroPaddingGUI:
         x_simetrico = self.aplicar_zero_padding(x_original, D, "simetrico")
         x_inicial = self.aplicar_zero_padding(x_original, D, "inicial")
         
-        # Calcular DFT
-        X_asimetrico = np.fft.fft(x_asimetrico)
-        X_simetrico = np.fft.fft(x_simetrico)
-        X_inicial = np.fft.fft(x_inicial)
+        # Calcular las tres DFT con una sola rfft (todas tienen L+D muestras)
+        espectros = dsp_core.analizador(len(x_asimetrico))
+        espectros.analizar(np.stack([x_asimetrico, x_simetrico, x_inicial]))
+        X_asimetrico, X_simetrico, X_inicial = espectros.magnitud(completo=True)
         
-        # Crear figura
-        fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(2, 3, figsize=(16, 10))
-        fig.suptitle('Comparación de Tipos de Zero Padding', fontsize=14)
+        stems, franjas, lineas = self.tipos_lienzo.preparar(self.construir_tipos)
         
-        # Señales en el tiempo
-        n_asim = np.arange(len(x_asimetrico))
-        ax1.stem(n_asim, x_asimetrico, basefmt=" ")
-        ax1.axvspan(L-0.5, len(x_asimetrico)-0.5, alpha=0.2, color='red')
-        ax1.set_title('1. Asimétrico (zeros al final)')
-        ax1.set_xlabel('n')
-        ax1.set_ylabel('x(n)')
-        ax1.grid(True, alpha=0.3)
-        
-        n_sim = np.arange(len(x_simetrico))
-        ax2.stem(n_sim, x_simetrico, basefmt=" ", linefmt='g-', markerfmt='go')
+        # Zonas de zeros de cada tipo
+        N = len(x_asimetrico)
         D_half = D // 2
-        ax2.axvspan(-0.5, D_half-0.5, alpha=0.2, color='green')
-        ax2.axvspan(D_half+L-0.5, len(x_simetrico)-0.5, alpha=0.2, color='green')
-        ax2.set_title('2. Simétrico (zeros inicio y final)')
-        ax2.set_xlabel('n')
-        ax2.set_ylabel('x(n)')
-        ax2.grid(True, alpha=0.3)
+        dsp_core.actualizar_franja(franjas[0], L-0.5, N-0.5)
+        dsp_core.actualizar_franja(franjas[1], -0.5, D_half-0.5)
+        dsp_core.actualizar_franja(franjas[2], D_half+L-0.5, N-0.5)
+        dsp_core.actualizar_franja(franjas[3], -0.5, D-0.5)
+        
+        # Señales en el tiempo y magnitud DFT (las tres tienen L+D muestras)
+        n = np.arange(N)
+        freq = n / N
+        for stem, linea, x, X in zip(stems, lineas,
+                                     (x_asimetrico, x_simetrico, x_inicial),
+                                     (X_asimetrico, X_simetrico, X_inicial)):
+            dsp_core.actualizar_stem(stem, n, x, reescalar=True)
+            dsp_core.actualizar_linea(linea, freq, X, reescalar=True)
+        
+        self.tipos_lienzo.dibujar()
+    
+    def construir_tipos(self, fig):
+        """Ejes y artistas de la comparación de tipos (se crean una sola vez)"""
+        (ax1, ax2, ax3), (ax4, ax5, ax6) = fig.subplots(2, 3)
+        fig.suptitle('Comparación de Tipos de Zero Padding', fontsize=14)
         
-        n_ini = np.arange(len(x_inicial))
-        ax3.stem(n_ini, x_inicial, basefmt=" ", linefmt='m-', markerfmt='mo')
-        ax3.axvspan(-0.5, D-0.5, alpha=0.2, color='magenta')
-        ax3.set_title('3. Inicial (zeros al inicio)')
-        ax3.set_xlabel('n')
-        ax3.set_ylabel('x(n)')
-        ax3.grid(True, alpha=0.3)
+        # Señales en el tiempo
+        stems = [ax1.stem([0], [0], basefmt=" "),
+                 ax2.stem([0], [0], basefmt=" ", linefmt='g-', markerfmt='go'),
+                 ax3.stem([0], [0], basefmt=" ", linefmt='m-', markerfmt='mo')]
+        franjas = [ax1.axvspan(0, 1, alpha=0.2, color='red'),
+                   ax2.axvspan(0, 1, alpha=0.2, color='green'),
+                   ax2.axvspan(0, 1, alpha=0.2, color='green'),
+                   ax3.axvspan(0, 1, alpha=0.2, color='magenta')]
+        titulos = ['1. Asimétrico (zeros al final)', '2. Simétrico (zeros inicio y final)',
+                   '3. Inicial (zeros al inicio)']
+        for ax, titulo in zip((ax1, ax2, ax3), titulos):
+            ax.set_title(titulo)
+            ax.set_xlabel('n')
+            ax.set_ylabel('x(n)')
+            ax.grid(True, alpha=0.3)
         
         # Magnitud DFT
-        freq_asim = np.arange(len(x_asimetrico)) / len(x_asimetrico)
-        ax4.plot(freq_asim, np.abs(X_asimetrico), 'b.-')
-        ax4.set_title('|X(k)| - Asimétrico')
-        ax4.set_xlabel('Frecuencia normalizada')
-        ax4.set_ylabel('|X(k)|')
-        ax4.grid(True, alpha=0.3)
-        
-        freq_sim = np.arange(len(x_simetrico)) / len(x_simetrico)
-        ax5.plot(freq_sim, np.abs(X_simetrico), 'g.-')
-        ax5.set_title('|X(k)| - Simétrico')
-        ax5.set_xlabel('Frecuencia normalizada')
-        ax5.set_ylabel('|X(k)|')
-        ax5.grid(True, alpha=0.3)
-        
-        freq_ini = np.arange(len(x_inicial)) / len(x_inicial)
-        ax6.plot(freq_ini, np.abs(X_inicial), 'm.-')
-        ax6.set_title('|X(k)| - Inicial')
-        ax6.set_xlabel('Frecuencia normalizada')
-        ax6.set_ylabel('|X(k)|')
-        ax6.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.tipos_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        lineas = [ax4.plot([], [], 'b.-')[0], ax5.plot([], [], 'g.-')[0], ax6.plot([], [], 'm.-')[0]]
+        for ax, titulo in zip((ax4, ax5, ax6), ['Asimétrico', 'Simétrico', 'Inicial']):
+            ax.set_title(f'|X(k)| - {titulo}')
+            ax.set_xlabel('Frecuencia normalizada')
+            ax.set_ylabel('|X(k)|')
+            ax.grid(True, alpha=0.3)
+        
+        return stems, franjas, lineas
     
     def crear_pestaña_comparacion_dtft(self):
         """Pestaña para comparación con DTFT"""
@@ -374,25 +399,28 @@ class ZeroPaddingGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.dtft_graph_frame = ttk.Frame(frame)
+        self.dtft_lienzo = self.crear_lienzo(self.dtft_graph_frame, (14, 10), self.actualizar_dtft)
+        
         self.L_dtft_var = tk.IntVar(value=8)
         self.D_dtft_var = tk.IntVar(value=24)
         
         ttk.Label(control_frame, text="Longitud L:").grid(row=0, column=0, padx=5, pady=2)
         L_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.L_dtft_var, 
-                           command=self.actualizar_dtft)
+                           command=self.dtft_lienzo.programar)
         L_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.L_dtft_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Zeros D:").grid(row=1, column=0, padx=5, pady=2)
         D_scale = ttk.Scale(control_frame, from_=0, to=48, variable=self.D_dtft_var,
-                           command=self.actualizar_dtft)
+                           command=self.dtft_lienzo.programar)
         D_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.D_dtft_var).grid(row=1, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.dtft_graph_frame = ttk.Frame(frame)
         self.dtft_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -406,21 +434,13 @@ class ZeroPaddingGUI:
     
     def calcular_dtft(self, x, omega):
         """Calcular DTFT de una señal"""
-        n = np.arange(len(x))
-        X = np.zeros(len(omega), dtype=complex)
-        for i, w in enumerate(omega):
-            X[i] = np.sum(x * np.exp(-1j * w * n))
-        return X
+        return dsp_core.calcular_dtft(x, omega)
     
     def actualizar_dtft(self, event=None):
         """Actualizar comparación DTFT vs DFT"""
         L = int(self.L_dtft_var.get())
         D = int(self.D_dtft_var.get())
         
-        # Limpiar frame
-        for widget in self.dtft_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal de prueba
         x_original = np.zeros(L)
         x_original[:L//2] = 1
@@ -436,60 +456,33 @@ class ZeroPaddingGUI:
         X_original = np.fft.fft(x_original)
         X_padded = np.fft.fft(x_padded)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('DTFT vs DFT: Efecto del Zero Padding', fontsize=14)
+        original, padded, franja, dtft_orig, dft_orig, dtft_padded, dft_padded = \
+            self.dtft_lienzo.preparar(self.construir_dtft)
         
         # Señal original
         n_orig = np.arange(L)
-        ax1.stem(n_orig, x_original, basefmt=" ")
-        ax1.set_title(f'Señal Original (L={L})')
-        ax1.set_xlabel('n')
-        ax1.set_ylabel('x(n)')
-        ax1.grid(True, alpha=0.3)
+        original.markerline.axes.set_title(f'Señal Original (L={L})')
+        dsp_core.actualizar_stem(original, n_orig, x_original, reescalar=True)
         
         # Señal con zero padding
         n_padded = np.arange(len(x_padded))
-        ax2.stem(n_padded, x_padded, basefmt=" ", linefmt='r-', markerfmt='ro')
-        ax2.axvspan(L-0.5, len(x_padded)-0.5, alpha=0.2, color='red', label='Zeros')
-        ax2.set_title(f'Con Zero Padding (L+D={L+D})')
-        ax2.set_xlabel('n')
-        ax2.set_ylabel('x_D(n)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
+        padded.markerline.axes.set_title(f'Con Zero Padding (L+D={L+D})')
+        dsp_core.actualizar_franja(franja, L-0.5, len(x_padded)-0.5)
+        dsp_core.actualizar_stem(padded, n_padded, x_padded, reescalar=True)
         
-        # DTFT vs DFT original
+        # DTFT vs DFT original y con zero padding
         freq_dtft = omega_dtft / (2*np.pi)
-        ax3.plot(freq_dtft, np.abs(X_dtft), 'k-', linewidth=2, label='DTFT (continua)')
-        
         freq_orig = np.arange(L) / L
-        ax3.stem(freq_orig, np.abs(X_original), basefmt=" ", linefmt='b-', markerfmt='bo',
-                label=f'DFT (L={L})')
-        ax3.set_title('Comparación: DTFT vs DFT Original')
-        ax3.set_xlabel('Frecuencia normalizada')
-        ax3.set_ylabel('|X(k)|')
-        ax3.grid(True, alpha=0.3)
-        ax3.legend()
-        ax3.set_xlim(0, 1)
-        
-        # DTFT vs DFT con zero padding
-        ax4.plot(freq_dtft, np.abs(X_dtft), 'k-', linewidth=2, label='DTFT (continua)')
-        
         freq_padded = np.arange(len(x_padded)) / len(x_padded)
-        ax4.stem(freq_padded, np.abs(X_padded), basefmt=" ", linefmt='r-', markerfmt='ro',
-                label=f'DFT con Zero Padding (L+D={L+D})')
-        ax4.set_title('Comparación: DTFT vs DFT con Zero Padding')
-        ax4.set_xlabel('Frecuencia normalizada')
-        ax4.set_ylabel('|X(k)|')
-        ax4.grid(True, alpha=0.3)
-        ax4.legend()
-        ax4.set_xlim(0, 1)
-        
-        plt.tight_layout()
+        dft_orig.set_label(f'DFT (L={L})')
+        dft_padded.set_label(f'DFT con Zero Padding (L+D={L+D})')
+        for dtft, dft, freq, X in ((dtft_orig, dft_orig, freq_orig, X_original),
+                                   (dtft_padded, dft_padded, freq_padded, X_padded)):
+            dtft.set_data(freq_dtft, np.abs(X_dtft))
+            dsp_core.actualizar_stem(dft, freq, np.abs(X), reescalar=True)
+            dtft.axes.legend()
         
-        canvas = FigureCanvasTkAgg(fig, self.dtft_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.dtft_lienzo.dibujar()
         
         # Actualizar información
         info_text = f"DEMOSTRACIÓN: XD(ω) = X(ω)\n"
@@ -499,6 +492,43 @@ class ZeroPaddingGUI:
         info_text += f"El zero padding NO agrega información nueva,\n"
         info_text += f"solo proporciona más muestras de la misma DTFT"
         
+    def construir_dtft(self, fig):
+        """Ejes y artistas de la comparación DTFT vs DFT (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        fig.suptitle('DTFT vs DFT: Efecto del Zero Padding', fontsize=14)
+        
+        # Señal original
+        original = ax1.stem([0], [0], basefmt=" ")
+        ax1.set_xlabel('n')
+        ax1.set_ylabel('x(n)')
+        ax1.grid(True, alpha=0.3)
+        
+        # Señal con zero padding
+        padded = ax2.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
+        franja = ax2.axvspan(0, 1, alpha=0.2, color='red', label='Zeros')
+        ax2.set_xlabel('n')
+        ax2.set_ylabel('x_D(n)')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        
+        # DTFT vs DFT original
+        dtft_orig, = ax3.plot([], [], 'k-', linewidth=2, label='DTFT (continua)')
+        dft_orig = ax3.stem([0], [0], basefmt=" ", linefmt='b-', markerfmt='bo')
+        ax3.set_title('Comparación: DTFT vs DFT Original')
+        
+        # DTFT vs DFT con zero padding
+        dtft_padded, = ax4.plot([], [], 'k-', linewidth=2, label='DTFT (continua)')
+        dft_padded = ax4.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
+        ax4.set_title('Comparación: DTFT vs DFT con Zero Padding')
+        
+        for ax in (ax3, ax4):
+            ax.set_xlabel('Frecuencia normalizada')
+            ax.set_ylabel('|X(k)|')
+            ax.grid(True, alpha=0.3)
+            ax.set_xlim(0, 1)
+        
+        return original, padded, franja, dtft_orig, dft_orig, dtft_padded, dft_padded
+    
     
     def crear_pestaña_resolucion_frecuencia(self):
         """Pestaña para resolución en frecuencia"""
@@ -509,6 +539,10 @@ class ZeroPaddingGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.res_graph_frame = ttk.Frame(frame)
+        self.res_lienzo = self.crear_lienzo(self.res_graph_frame, (14, 10), self.actualizar_resolucion)
+        
         self.L_res_var = tk.IntVar(value=16)
         self.factor_padding_var = tk.IntVar(value=4)
         self.freq1_var = tk.DoubleVar(value=0.2)
@@ -516,32 +550,31 @@ class ZeroPaddingGUI:
         
         ttk.Label(control_frame, text="Longitud L:").grid(row=0, column=0, padx=5, pady=2)
         L_scale = ttk.Scale(control_frame, from_=8, to=32, variable=self.L_res_var, 
-                           command=self.actualizar_resolucion)
+                           command=self.res_lienzo.programar)
         L_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.L_res_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Factor Padding:").grid(row=1, column=0, padx=5, pady=2)
         factor_scale = ttk.Scale(control_frame, from_=1, to=8, variable=self.factor_padding_var,
-                                command=self.actualizar_resolucion)
+                                command=self.res_lienzo.programar)
         factor_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.factor_padding_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Frecuencia 1:").grid(row=2, column=0, padx=5, pady=2)
         freq1_scale = ttk.Scale(control_frame, from_=0.1, to=0.4, variable=self.freq1_var,
-                               command=self.actualizar_resolucion)
+                               command=self.res_lienzo.programar)
         freq1_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.freq1_var).grid(row=2, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Frecuencia 2:").grid(row=3, column=0, padx=5, pady=2)
         freq2_scale = ttk.Scale(control_frame, from_=0.1, to=0.4, variable=self.freq2_var,
-                               command=self.actualizar_resolucion)
+                               command=self.res_lienzo.programar)
         freq2_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.freq2_var).grid(row=3, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.res_graph_frame = ttk.Frame(frame)
         self.res_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -560,10 +593,6 @@ class ZeroPaddingGUI:
         freq1 = self.freq1_var.get()
         freq2 = self.freq2_var.get()
         
-        # Limpiar frame
-        for widget in self.res_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal con dos frecuencias cercanas
         n = np.arange(L)
         x = np.cos(2 * np.pi * freq1 * n) + np.cos(2 * np.pi * freq2 * n)
@@ -576,58 +605,36 @@ class ZeroPaddingGUI:
         x_padded = self.aplicar_zero_padding(x, D, "asimetrico")
         X_padded = np.fft.fft(x_padded)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('Efecto del Zero Padding en la Resolución en Frecuencia', fontsize=14)
+        senal, senal_padded, franja, dft, dft_padded, marcas = self.res_lienzo.preparar(
+            self.construir_resolucion)
         
-        # Señal original
-        ax1.plot(n, x, 'b.-')
-        ax1.set_title(f'Señal: cos(2πf₁n) + cos(2πf₂n)')
-        ax1.set_xlabel('n')
-        ax1.set_ylabel('x(n)')
-        ax1.grid(True, alpha=0.3)
-        
-        # Señal con zero padding
+        # Señal original y con zero padding
         n_padded = np.arange(len(x_padded))
-        ax2.plot(n_padded, x_padded, 'r.-')
-        ax2.axvspan(L-0.5, len(x_padded)-0.5, alpha=0.2, color='red', label='Zero padding')
-        ax2.set_title(f'Con Zero Padding (factor {factor}x)')
-        ax2.set_xlabel('n')
-        ax2.set_ylabel('x_D(n)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
+        dsp_core.actualizar_linea(senal, n, x, reescalar=True)
+        senal_padded.axes.set_title(f'Con Zero Padding (factor {factor}x)')
+        dsp_core.actualizar_franja(franja, L-0.5, len(x_padded)-0.5)
+        dsp_core.actualizar_linea(senal_padded, n_padded, x_padded, reescalar=True)
         
-        # DFT sin zero padding
+        # DFT sin y con zero padding
         freq_orig = np.arange(L) / L
-        ax3.stem(freq_orig[:L//2], np.abs(X_original[:L//2]), basefmt=" ")
-        ax3.axvline(freq1, color='g', linestyle='--', alpha=0.7, label=f'f₁={freq1}')
-        ax3.axvline(freq2, color='m', linestyle='--', alpha=0.7, label=f'f₂={freq2}')
-        ax3.set_title(f'DFT Original (Δf = {1/L:.3f})')
-        ax3.set_xlabel('Frecuencia normalizada')
-        ax3.set_ylabel('|X(k)|')
-        ax3.grid(True, alpha=0.3)
-        ax3.legend()
-        ax3.set_xlim(0, 0.5)
+        dft.markerline.axes.set_title(f'DFT Original (Δf = {1/L:.3f})')
+        dsp_core.actualizar_stem(dft, freq_orig[:L//2], np.abs(X_original[:L//2]), reescalar=True)
         
-        # DFT con zero padding
         freq_padded = np.arange(len(x_padded)) / len(x_padded)
         half_padded = len(x_padded) // 2
-        ax4.stem(freq_padded[:half_padded], np.abs(X_padded[:half_padded]), 
-                basefmt=" ", linefmt='r-', markerfmt='ro')
-        ax4.axvline(freq1, color='g', linestyle='--', alpha=0.7, label=f'f₁={freq1}')
-        ax4.axvline(freq2, color='m', linestyle='--', alpha=0.7, label=f'f₂={freq2}')
-        ax4.set_title(f'DFT con Zero Padding (Δf = {1/len(x_padded):.4f})')
-        ax4.set_xlabel('Frecuencia normalizada')
-        ax4.set_ylabel('|X_D(k)|')
-        ax4.grid(True, alpha=0.3)
-        ax4.legend()
-        ax4.set_xlim(0, 0.5)
+        dft_padded.markerline.axes.set_title(f'DFT con Zero Padding (Δf = {1/len(x_padded):.4f})')
+        dsp_core.actualizar_stem(dft_padded, freq_padded[:half_padded], np.abs(X_padded[:half_padded]),
+                                 reescalar=True)
         
-        plt.tight_layout()
+        # Frecuencias de la señal
+        for marca_f1, marca_f2 in marcas:
+            marca_f1.set_xdata([freq1, freq1])
+            marca_f1.set_label(f'f₁={freq1}')
+            marca_f2.set_xdata([freq2, freq2])
+            marca_f2.set_label(f'f₂={freq2}')
+            marca_f1.axes.legend()
         
-        canvas = FigureCanvasTkAgg(fig, self.res_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.res_lienzo.dibujar()
         
         # Actualizar información
         delta_f = abs(freq2 - freq1)
@@ -652,6 +659,42 @@ class ZeroPaddingGUI:
         
         self.res_info_label.config(text=info_text)
     
+    def construir_resolucion(self, fig):
+        """Ejes y artistas del análisis de resolución (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        fig.suptitle('Efecto del Zero Padding en la Resolución en Frecuencia', fontsize=14)
+        
+        # Señal original
+        senal, = ax1.plot([], [], 'b.-')
+        ax1.set_title(f'Señal: cos(2πf₁n) + cos(2πf₂n)')
+        ax1.set_xlabel('n')
+        ax1.set_ylabel('x(n)')
+        ax1.grid(True, alpha=0.3)
+        
+        # Señal con zero padding
+        senal_padded, = ax2.plot([], [], 'r.-')
+        franja = ax2.axvspan(0, 1, alpha=0.2, color='red', label='Zero padding')
+        ax2.set_xlabel('n')
+        ax2.set_ylabel('x_D(n)')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        
+        # DFT sin y con zero padding
+        dft = ax3.stem([0], [0], basefmt=" ")
+        ax3.set_ylabel('|X(k)|')
+        dft_padded = ax4.stem([0], [0], basefmt=" ", linefmt='r-', markerfmt='ro')
+        ax4.set_ylabel('|X_D(k)|')
+        
+        marcas = []
+        for ax in (ax3, ax4):
+            marcas.append((ax.axvline(0, color='g', linestyle='--', alpha=0.7),
+                           ax.axvline(0, color='m', linestyle='--', alpha=0.7)))
+            ax.set_xlabel('Frecuencia normalizada')
+            ax.grid(True, alpha=0.3)
+            ax.set_xlim(0, 0.5)
+        
+        return senal, senal_padded, franja, dft, dft_padded, marcas
+    
     def crear_pestaña_spectral_leakage(self):
         """Pestaña para spectral leakage"""
         frame = ttk.Frame(self.notebook)
@@ -661,6 +704,10 @@ class ZeroPaddingGUI:
         control_frame = ttk.LabelFrame(frame, text="Parámetros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.leak_graph_frame = ttk.Frame(frame)
+        self.leak_lienzo = self.crear_lienzo(self.leak_graph_frame, (14, 10), self.actualizar_leakage)
+        
         self.L_leak_var = tk.IntVar(value=32)
         self.D_leak_var = tk.IntVar(value=32)
         self.freq_leak_var = tk.DoubleVar(value=5.3)
@@ -668,32 +715,32 @@ class ZeroPaddingGUI:
         
         ttk.Label(control_frame, text="Longitud L:").grid(row=0, column=0, padx=5, pady=2)
         L_scale = ttk.Scale(control_frame, from_=16, to=64, variable=self.L_leak_var, 
-                           command=self.actualizar_leakage)
+                           command=self.leak_lienzo.programar)
         L_scale.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.L_leak_var).grid(row=0, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Zero Padding D:").grid(row=1, column=0, padx=5, pady=2)
         D_scale = ttk.Scale(control_frame, from_=0, to=128, variable=self.D_leak_var,
-                           command=self.actualizar_leakage)
+                           command=self.leak_lienzo.programar)
         D_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.D_leak_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Frecuencia:").grid(row=2, column=0, padx=5, pady=2)
         freq_scale = ttk.Scale(control_frame, from_=1.0, to=10.0, variable=self.freq_leak_var,
-                              command=self.actualizar_leakage)
+                              command=self.leak_lienzo.programar)
         freq_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.freq_leak_var).grid(row=2, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Ventana:").grid(row=3, column=0, padx=5, pady=2)
         window_combo = ttk.Combobox(control_frame, textvariable=self.window_var,
-                                   values=["Rectangular", "Hanning", "Hamming", "Blackman"])
+                                   values=["Rectangular", "Hanning", "Hamming", "Blackman",
+                                           "Kaiser", "Tukey", "Flat-top", "DPSS"])
         window_combo.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
-        window_combo.bind('<<ComboboxSelected>>', self.actualizar_leakage)
+        window_combo.bind('<<ComboboxSelected>>', self.leak_lienzo.programar)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.leak_graph_frame = ttk.Frame(frame)
         self.leak_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -710,20 +757,9 @@ class ZeroPaddingGUI:
     
     def aplicar_ventana(self, x, window_type):
         """Aplicar ventana a la señal"""
-        L = len(x)
-        
-        if window_type == "Rectangular":
-            w = np.ones(L)
-        elif window_type == "Hanning":
-            w = np.hanning(L)
-        elif window_type == "Hamming":
-            w = np.hamming(L)
-        elif window_type == "Blackman":
-            w = np.blackman(L)
-        else:
-            w = np.ones(L)
-        
-        return x * w
+        if window_type.lower() not in dsp_core.VENTANAS:
+            window_type = "Rectangular"
+        return dsp_core.aplicar_ventana(x, window_type)
     
     def actualizar_leakage(self, event=None):
         """Actualizar análisis de spectral leakage"""
@@ -732,74 +768,70 @@ class ZeroPaddingGUI:
         freq = self.freq_leak_var.get()
         window_type = self.window_var.get()
         
-        # Limpiar frame
-        for widget in self.leak_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal senoidal
         n = np.arange(L)
         x = np.cos(2 * np.pi * freq * n / L)
         
         # Sin ventana
         x_padded_sin_ventana = self.aplicar_zero_padding(x, D, "asimetrico")
-        X_sin_ventana = np.fft.fft(x_padded_sin_ventana)
         
         # Con ventana
         x_ventana = self.aplicar_ventana(x, window_type)
         x_padded_con_ventana = self.aplicar_zero_padding(x_ventana, D, "asimetrico")
-        X_con_ventana = np.fft.fft(x_padded_con_ventana)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        # Espectros en dB de ambas señales con una sola rfft
+        N = len(x_padded_sin_ventana)
+        espectros = dsp_core.analizador(N)
+        espectros.analizar(np.stack([x_padded_sin_ventana, x_padded_con_ventana]))
+        X_sin_ventana_db, X_con_ventana_db = espectros.db()[:, :N//2]
+        
+        senales, franjas, espectros_db, marcas = self.leak_lienzo.preparar(self.construir_leakage)
+        
+        # Señales sin y con ventana
+        n_total = np.arange(N)
+        senales[1].axes.set_title(f'Señal con Ventana {window_type} + Zero Padding')
+        for senal, franja, x_padded in zip(senales, franjas, (x_padded_sin_ventana, x_padded_con_ventana)):
+            dsp_core.actualizar_franja(franja, L-0.5, N-0.5)
+            dsp_core.actualizar_linea(senal, n_total, x_padded, reescalar=True)
+        
+        # Espectros sin y con ventana
+        freq_axis = np.arange(N) / N
+        espectros_db[1].axes.set_title(f'Espectro CON Ventana {window_type} (dB)')
+        for espectro, marca, X_db in zip(espectros_db, marcas, (X_sin_ventana_db, X_con_ventana_db)):
+            marca.set_xdata([freq/L, freq/L])
+            dsp_core.actualizar_linea(espectro, freq_axis[:N//2], X_db, reescalar=True)
+        
+        self.leak_lienzo.dibujar()
+    
+    def construir_leakage(self, fig):
+        """Ejes y artistas del análisis de spectral leakage (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Spectral Leakage y el Efecto de las Ventanas', fontsize=14)
         
-        # Señal sin ventana
-        n_total = np.arange(len(x_padded_sin_ventana))
-        ax1.plot(n_total, x_padded_sin_ventana, 'b-')
-        ax1.axvspan(L-0.5, len(x_padded_sin_ventana)-0.5, alpha=0.2, color='red', label='Zero padding')
+        # Señales sin y con ventana
+        senales = [ax1.plot([], [], 'b-')[0], ax2.plot([], [], 'g-')[0]]
         ax1.set_title('Señal sin Ventana + Zero Padding')
-        ax1.set_xlabel('n')
-        ax1.set_ylabel('x(n)')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        
-        # Señal con ventana
-        ax2.plot(n_total, x_padded_con_ventana, 'g-')
-        ax2.axvspan(L-0.5, len(x_padded_con_ventana)-0.5, alpha=0.2, color='red', label='Zero padding')
-        ax2.set_title(f'Señal con Ventana {window_type} + Zero Padding')
-        ax2.set_xlabel('n')
-        ax2.set_ylabel('x(n)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        
-        # Espectro sin ventana
-        freq_axis = np.arange(len(x_padded_sin_ventana)) / len(x_padded_sin_ventana)
-        ax3.plot(freq_axis[:len(freq_axis)//2], 
-                20*np.log10(np.abs(X_sin_ventana[:len(X_sin_ventana)//2]) + 1e-10), 'b-')
-        ax3.axvline(freq/L, color='r', linestyle='--', label=f'Frecuencia teórica')
+        franjas = []
+        for ax in (ax1, ax2):
+            franjas.append(ax.axvspan(0, 1, alpha=0.2, color='red', label='Zero padding'))
+            ax.set_xlabel('n')
+            ax.set_ylabel('x(n)')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+        
+        # Espectros sin y con ventana
+        espectros_db = [ax3.plot([], [], 'b-')[0], ax4.plot([], [], 'g-')[0]]
         ax3.set_title('Espectro SIN Ventana (dB)')
-        ax3.set_xlabel('Frecuencia normalizada')
-        ax3.set_ylabel('|X(k)| [dB]')
-        ax3.grid(True, alpha=0.3)
-        ax3.legend()
-        ax3.set_ylim(-80, 40)
-        
-        # Espectro con ventana
-        ax4.plot(freq_axis[:len(freq_axis)//2], 
-                20*np.log10(np.abs(X_con_ventana[:len(X_con_ventana)//2]) + 1e-10), 'g-')
-        ax4.axvline(freq/L, color='r', linestyle='--', label=f'Frecuencia teórica')
-        ax4.set_title(f'Espectro CON Ventana {window_type} (dB)')
-        ax4.set_xlabel('Frecuencia normalizada')
-        ax4.set_ylabel('|X(k)| [dB]')
-        ax4.grid(True, alpha=0.3)
-        ax4.legend()
-        ax4.set_ylim(-80, 40)
-        
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.leak_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        marcas = []
+        for ax in (ax3, ax4):
+            marcas.append(ax.axvline(0, color='r', linestyle='--', label=f'Frecuencia teórica'))
+            ax.set_xlabel('Frecuencia normalizada')
+            ax.set_ylabel('|X(k)| [dB]')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+            ax.set_ylim(-80, 40)
+        
+        return senales, franjas, espectros_db, marcas
     
     def crear_pestaña_aplicaciones(self):
         """Pestaña para aplicaciones prácticas"""
@@ -11,13 +11,21 @@ para analizar sistemas LTI y funciones de transferencia H(z).
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk, messagebox
 from matplotlib.patches import Circle
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import dsp_core
+
 # Configuración para gráficos
 plt.style.use('default')
 plt.rcParams['font.size'] = 9
@@ -31,12 +39,17 @@ class TransformadaZGUI(tk.Tk):
         self.geometry("1500x900")
         self.configure(bg='#f0f0f0')
         
-        # Variables
-        self.current_figure = None
-        self.current_canvas = None
+        # Lienzos persistentes de las pestañas (se liberan al cerrar)
+        self.lienzos = []
         
         self.crear_interfaz()
         
+    def crear_lienzo(self, contenedor, figsize, actualizar=None):
+        """Crear el lienzo persistente de una pestaña y registrarlo para el cierre"""
+        lienzo = dsp_core.LienzoTk(contenedor, figsize, actualizar)
+        self.lienzos.append(lienzo)
+        return lienzo
+        
     def crear_interfaz(self):
         """Crear la interfaz principal"""
         # Título principal
@@ -71,11 +84,9 @@ class TransformadaZGUI(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def on_closing(self):
-        """Manejar el cierre de la aplicación"""
-        try:
-            plt.close('all')
-        except:
-            pass
+        """Manejar el cierre de la aplicación: liberar las figuras de todas las pestañas"""
+        for lienzo in self.lienzos:
+            lienzo.cerrar()
         self.destroy()
         
     def crear_pestaña_definicion(self):
@@ -87,6 +98,10 @@ class TransformadaZGUI(tk.Tk):
         control_frame = ttk.LabelFrame(frame, text="Parámetros de la Señal")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.def_graph_frame = ttk.Frame(frame)
+        self.def_lienzo = self.crear_lienzo(self.def_graph_frame, (14, 10), self.actualizar_definicion)
+        
         # Variables de control
         self.signal_type_var = tk.StringVar(value="Impulso unitario")
         self.length_var = tk.IntVar(value=8)
@@ -99,30 +114,29 @@ class TransformadaZGUI(tk.Tk):
                                    values=["Impulso unitario", "Escalón unitario", "Rampa", 
                                           "Exponencial", "Senoidal", "Secuencia finita"])
         signal_combo.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
-        signal_combo.bind('<<ComboboxSelected>>', self.actualizar_definicion)
+        signal_combo.bind('<<ComboboxSelected>>', self.def_lienzo.programar)
         
         ttk.Label(control_frame, text="Longitud:").grid(row=1, column=0, padx=5, pady=2)
         length_scale = ttk.Scale(control_frame, from_=4, to=16, variable=self.length_var,
-                                command=self.actualizar_definicion)
+                                command=self.def_lienzo.programar)
         length_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.length_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Retardo:").grid(row=2, column=0, padx=5, pady=2)
         delay_scale = ttk.Scale(control_frame, from_=0, to=5, variable=self.delay_var,
-                               command=self.actualizar_definicion)
+                               command=self.def_lienzo.programar)
         delay_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.delay_var).grid(row=2, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Amplitud:").grid(row=3, column=0, padx=5, pady=2)
         amp_scale = ttk.Scale(control_frame, from_=0.1, to=3.0, variable=self.amplitude_var,
-                             command=self.actualizar_definicion)
+                             command=self.def_lienzo.programar)
         amp_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.amplitude_var).grid(row=3, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.def_graph_frame = ttk.Frame(frame)
         self.def_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -189,22 +203,11 @@ class TransformadaZGUI(tk.Tk):
         
         # Evaluar en el círculo unitario (DTFT)
         z_unit = np.exp(1j * theta_vals)
-        X_unit = np.zeros_like(z_unit, dtype=complex)
+        X_unit = dsp_core.transformada_z(x, z_unit, n=n)
         
-        for i, z in enumerate(z_unit):
-            X_unit[i] = np.sum(x * (z ** (-n)))
-        
-        # Evaluar en diferentes radios
-        X_magnitude = np.zeros((len(r_vals), len(theta_vals)))
-        
-        for i, r in enumerate(r_vals):
-            for j, theta in enumerate(theta_vals):
-                z = r * np.exp(1j * theta)
-                try:
-                    X_z = np.sum(x * (z ** (-n)))
-                    X_magnitude[i, j] = np.abs(X_z)
-                except:
-                    X_magnitude[i, j] = np.inf
+        # Evaluar en diferentes radios (toda la malla polar a la vez)
+        z_polar = np.outer(r_vals, z_unit)
+        X_magnitude = np.abs(dsp_core.transformada_z(x, z_polar, n=n))
         
         return theta_vals, X_unit, r_vals, X_magnitude
     
@@ -271,47 +274,72 @@ class TransformadaZGUI(tk.Tk):
         delay = int(self.delay_var.get())
         amplitude = self.amplitude_var.get()
         
-        # Limpiar frame anterior
-        for widget in self.def_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Generar señal
         n, x = self.generar_señal(signal_type, length, delay, amplitude)
         
         # Calcular transformada Z
         theta_vals, X_unit, r_vals, X_magnitude = self.calcular_transformada_z(n, x)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        senal, magnitud, fase, barra = self.def_lienzo.preparar(self.construir_definicion)
+        
+        # Señal en el tiempo
+        senal.markerline.axes.set_title(f'Señal: {signal_type}')
+        dsp_core.actualizar_stem(senal, n, x, reescalar=True)
+        
+        # Magnitud y fase en el círculo unitario (DTFT)
+        freq_norm = theta_vals / (2 * np.pi)
+        dsp_core.actualizar_linea(magnitud, freq_norm, np.abs(X_unit), reescalar=True)
+        dsp_core.actualizar_linea(fase, freq_norm, np.angle(X_unit), reescalar=True)
+        
+        # Magnitud en el plano Z: los contornos rellenos no admiten cambiar sus datos,
+        # así que se reemplazan solo ellos (la barra de color se reutiliza)
+        ax4 = barra.mappable.axes
+        for contornos in list(ax4.collections):
+            contornos.remove()
+        self.dibujar_contornos_definicion(ax4, theta_vals, r_vals, X_magnitude)
+        barra.update_normal(ax4.collections[-1])
+        
+        self.def_lienzo.dibujar()
+        
+        # Actualizar información
+        expr_simbolica = self.obtener_expresion_simbolica(n, x, signal_type)
+        
+        info_text = f"DEFINICIÓN DE LA TRANSFORMADA Z:\n"
+        info_text += f"X(z) = Σ x(n)z^(-n)\n\n"
+        info_text += f"Para la señal {signal_type}:\n"
+        info_text += f"{expr_simbolica}\n\n"
+        info_text += f"Valores no nulos: n ∈ {{{', '.join(map(str, n[np.abs(x) > 1e-10]))}}}\n"
+        info_text += f"Muestras: {{{', '.join([f'{xi:.2f}' for xi in x[np.abs(x) > 1e-10]])}}}"
+        
+    
+    def construir_definicion(self, fig):
+        """Ejes y artistas de la definición (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Definición de la Transformada Z', fontsize=14)
         
         # Señal en el tiempo
-        ax1.stem(n, x, basefmt=" ")
-        ax1.set_title(f'Señal: {signal_type}')
+        senal = ax1.stem([0], [0], basefmt=" ")
         ax1.set_xlabel('n')
         ax1.set_ylabel('x(n)')
         ax1.grid(True, alpha=0.3)
         
         # Magnitud en el círculo unitario (DTFT)
-        freq_norm = theta_vals / (2 * np.pi)
-        ax2.plot(freq_norm, np.abs(X_unit))
+        magnitud, = ax2.plot([], [])
         ax2.set_title('|X(z)| en el círculo unitario (DTFT)')
         ax2.set_xlabel('Frecuencia normalizada')
         ax2.set_ylabel('|X(e^(jω))|')
         ax2.grid(True, alpha=0.3)
         
         # Fase en el círculo unitario
-        ax3.plot(freq_norm, np.angle(X_unit))
+        fase, = ax3.plot([], [])
         ax3.set_title('∠X(z) en el círculo unitario')
         ax3.set_xlabel('Frecuencia normalizada')
         ax3.set_ylabel('∠X(e^(jω)) [rad]')
         ax3.grid(True, alpha=0.3)
         
-        # Superficie 3D de magnitud (vista polar)
-        theta_mesh, r_mesh = np.meshgrid(theta_vals, r_vals)
-        X_mag_safe = np.clip(X_magnitude, 0, 10)  # Limitar para visualización
-        
-        im = ax4.contourf(theta_mesh, r_mesh, X_mag_safe, levels=20, cmap='viridis')
+        # Superficie de magnitud (vista polar), con contornos provisionales para la barra
+        im = self.dibujar_contornos_definicion(ax4, np.array([0, 2*np.pi]), np.array([0.1, 3]),
+                                               np.array([[0, 1], [1, 0]]))
         ax4.set_title('|X(z)| en el plano Z (coordenadas polares)')
         ax4.set_xlabel('θ [rad]')
         ax4.set_ylabel('r')
@@ -322,24 +350,14 @@ class TransformadaZGUI(tk.Tk):
         ax4.plot(circle_theta, np.ones_like(circle_theta), 'w--', linewidth=2, label='Círculo unitario')
         ax4.legend()
         
-        plt.colorbar(im, ax=ax4, shrink=0.8)
-        plt.tight_layout()
-        
-        # Agregar a la interfaz
-        canvas = FigureCanvasTkAgg(fig, self.def_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Actualizar información
-        expr_simbolica = self.obtener_expresion_simbolica(n, x, signal_type)
-        
-        info_text = f"DEFINICIÓN DE LA TRANSFORMADA Z:\n"
-        info_text += f"X(z) = Σ x(n)z^(-n)\n\n"
-        info_text += f"Para la señal {signal_type}:\n"
-        info_text += f"{expr_simbolica}\n\n"
-        info_text += f"Valores no nulos: n ∈ {{{', '.join(map(str, n[np.abs(x) > 1e-10]))}}}\n"
-        info_text += f"Muestras: {{{', '.join([f'{xi:.2f}' for xi in x[np.abs(x) > 1e-10]])}}}"
-        
+        barra = fig.colorbar(im, ax=ax4, shrink=0.8)
+        return senal, magnitud, fase, barra
+    
+    def dibujar_contornos_definicion(self, ax, theta_vals, r_vals, X_magnitude):
+        """Contornos rellenos de |X(z)| sobre la malla (θ, r)"""
+        theta_mesh, r_mesh = np.meshgrid(theta_vals, r_vals)
+        X_mag_safe = np.clip(X_magnitude, 0, 10)  # Limitar para visualización
+        return ax.contourf(theta_mesh, r_mesh, X_mag_safe, levels=20, cmap='viridis')
     
     def crear_pestaña_propiedades(self):
         """Pestaña para propiedades de la Transformada Z"""
@@ -350,6 +368,10 @@ class TransformadaZGUI(tk.Tk):
         control_frame = ttk.LabelFrame(frame, text="Demostración de Propiedades")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.prop_graph_frame = ttk.Frame(frame)
+        self.prop_lienzo = self.crear_lienzo(self.prop_graph_frame, (14, 10), self.actualizar_propiedades)
+        
         self.propiedad_var = tk.StringVar(value="Linealidad")
         self.a1_var = tk.DoubleVar(value=2.0)
         self.a2_var = tk.DoubleVar(value=3.0)
@@ -359,30 +381,29 @@ class TransformadaZGUI(tk.Tk):
         prop_combo = ttk.Combobox(control_frame, textvariable=self.propiedad_var,
                                  values=["Linealidad", "Retardo", "Convolución"])
         prop_combo.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
-        prop_combo.bind('<<ComboboxSelected>>', self.actualizar_propiedades)
+        prop_combo.bind('<<ComboboxSelected>>', self.prop_lienzo.programar)
         
         ttk.Label(control_frame, text="Coef. a1:").grid(row=1, column=0, padx=5, pady=2)
         a1_scale = ttk.Scale(control_frame, from_=0.5, to=5.0, variable=self.a1_var,
-                            command=self.actualizar_propiedades)
+                            command=self.prop_lienzo.programar)
         a1_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.a1_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Coef. a2:").grid(row=2, column=0, padx=5, pady=2)
         a2_scale = ttk.Scale(control_frame, from_=0.5, to=5.0, variable=self.a2_var,
-                            command=self.actualizar_propiedades)
+                            command=self.prop_lienzo.programar)
         a2_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.a2_var).grid(row=2, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Retardo D:").grid(row=3, column=0, padx=5, pady=2)
         delay_scale = ttk.Scale(control_frame, from_=1, to=5, variable=self.delay_prop_var,
-                               command=self.actualizar_propiedades)
+                               command=self.prop_lienzo.programar)
         delay_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.delay_prop_var).grid(row=3, column=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.prop_graph_frame = ttk.Frame(frame)
         self.prop_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -393,6 +414,9 @@ class TransformadaZGUI(tk.Tk):
                                         font=("Courier", 8), justify=tk.LEFT)
         self.prop_info_label.pack(padx=10, pady=5)
         
+        # Parámetros de la demostración mostrada (para no repetirla si no cambian)
+        self.prop_mostrada = None
+        
         self.actualizar_propiedades()
     
     def actualizar_propiedades(self, event=None):
@@ -402,9 +426,11 @@ class TransformadaZGUI(tk.Tk):
         a2 = self.a2_var.get()
         delay = int(self.delay_prop_var.get())
         
-        # Limpiar frame
-        for widget in self.prop_graph_frame.winfo_children():
-            widget.destroy()
+        # Cada demostración depende solo de sus propios parámetros
+        parametros = {"Linealidad": (a1, a2), "Retardo": (delay,)}.get(propiedad, ())
+        if (propiedad, parametros) == self.prop_mostrada:
+            return
+        self.prop_mostrada = (propiedad, parametros)
         
         if propiedad == "Linealidad":
             self.demo_linealidad(a1, a2)
@@ -412,6 +438,18 @@ class TransformadaZGUI(tk.Tk):
             self.demo_retardo(delay)
         elif propiedad == "Convolución":
             self.demo_convolucion()
+        
+        self.prop_lienzo.dibujar()
+    
+    def ejes_propiedades(self):
+        """
+        Figura y ejes 2×2 del lienzo de propiedades, vacíos. Los ejes se crean de nuevo
+        solo al cambiar de propiedad; con la misma propiedad se reutilizan
+        """
+        ejes = self.prop_lienzo.preparar(lambda fig: fig.subplots(2, 2), clave=self.propiedad_var.get())
+        for ax in ejes.flat:
+            ax.cla()
+        return self.prop_lienzo.figura, ejes
     
     def demo_linealidad(self, a1, a2):
         """Demostrar propiedad de linealidad"""
@@ -423,23 +461,14 @@ class TransformadaZGUI(tk.Tk):
         # Combinación lineal
         y = a1 * x1 + a2 * x2
         
-        # Transformadas Z (evaluadas en el círculo unitario)
+        # Transformadas Z (evaluadas en el círculo unitario): las tres secuencias en un lote,
+        # con fs = 2π para que las frecuencias sean ω en rad/muestra
         omega = np.linspace(0, 2*np.pi, 256)
-        z = np.exp(1j * omega)
-        
-        X1 = np.zeros_like(z, dtype=complex)
-        X2 = np.zeros_like(z, dtype=complex)
-        Y_direct = np.zeros_like(z, dtype=complex)
-        Y_linear = np.zeros_like(z, dtype=complex)
+        X1, X2, Y_direct = dsp_core.respuesta_frecuencia(np.stack([x1, x2, y]), f=omega, fs=2*np.pi).H
+        Y_linear = a1 * X1 + a2 * X2
         
-        for i, zi in enumerate(z):
-            X1[i] = np.sum(x1 * (zi ** (-n)))
-            X2[i] = np.sum(x2 * (zi ** (-n)))
-            Y_direct[i] = np.sum(y * (zi ** (-n)))
-            Y_linear[i] = a1 * X1[i] + a2 * X2[i]
-        
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        # Ejes del lienzo persistente
+        fig, ((ax1, ax2), (ax3, ax4)) = self.ejes_propiedades()
         fig.suptitle('Propiedad de Linealidad', fontsize=14)
         
         # Señales originales
@@ -476,12 +505,6 @@ class TransformadaZGUI(tk.Tk):
         ax4.set_ylabel('Error')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.prop_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
         # Información
         max_error = np.max(error)
         info_text = f"PROPIEDAD DE LINEALIDAD:\n"
@@ -519,8 +542,8 @@ class TransformadaZGUI(tk.Tk):
             X_delayed_direct[i] = np.sum(x_delayed * (zi ** (-n)))
             X_delayed_prop[i] = (zi ** (-delay)) * X[i]
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        # Ejes del lienzo persistente
+        fig, ((ax1, ax2), (ax3, ax4)) = self.ejes_propiedades()
         fig.suptitle('Propiedad de Retardo', fontsize=14)
         
         # Señales
@@ -561,12 +584,6 @@ class TransformadaZGUI(tk.Tk):
         ax4.set_ylabel('Error')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.prop_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
         # Información
         max_error = np.max(error)
         info_text = f"PROPIEDAD DE RETARDO:\n"
@@ -591,23 +608,13 @@ class TransformadaZGUI(tk.Tk):
         # Convolución
         y = np.convolve(h, x, mode='same')
         
-        # Transformadas Z
+        # Transformadas Z (en el círculo unitario, las tres secuencias en un lote)
         omega = np.linspace(0, 2*np.pi, 256)
-        z = np.exp(1j * omega)
-        
-        H = np.zeros_like(z, dtype=complex)
-        X = np.zeros_like(z, dtype=complex)
-        Y_direct = np.zeros_like(z, dtype=complex)
-        Y_product = np.zeros_like(z, dtype=complex)
+        H, X, Y_direct = dsp_core.respuesta_frecuencia(np.stack([h, x, y]), f=omega, fs=2*np.pi).H
+        Y_product = H * X
         
-        for i, zi in enumerate(z):
-            H[i] = np.sum(h * (zi ** (-n)))
-            X[i] = np.sum(x * (zi ** (-n)))
-            Y_direct[i] = np.sum(y * (zi ** (-n)))
-            Y_product[i] = H[i] * X[i]
-        
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        # Ejes del lienzo persistente
+        fig, ((ax1, ax2), (ax3, ax4)) = self.ejes_propiedades()
         fig.suptitle('Propiedad de Convolución', fontsize=14)
         
         # Señales
@@ -647,12 +654,6 @@ class TransformadaZGUI(tk.Tk):
         ax4.set_ylabel('Error')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.prop_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
         # Información
         max_error = np.max(error)
         info_text = f"PROPIEDAD DE CONVOLUCIÓN:\n"
@@ -747,7 +748,9 @@ class TransformadaZGUI(tk.Tk):
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Gráfico
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(10, 8))
+        lienzo = self.crear_lienzo(right_frame, (10, 8))
+        fig = lienzo.figura
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.suptitle('Ejemplo: h(n) = {2, 3, 5, 2}', fontsize=12)
         
         # Señal h(n)
@@ -759,11 +762,7 @@ class TransformadaZGUI(tk.Tk):
         
         # Transformada Z en el círculo unitario
         omega = np.linspace(0, 2*np.pi, 256)
-        z = np.exp(1j * omega)
-        H_z = np.zeros_like(z, dtype=complex)
-        
-        for i, zi in enumerate(z):
-            H_z[i] = np.sum(h * (zi ** (-n)))
+        H_z = dsp_core.respuesta_frecuencia(h, f=omega, fs=2*np.pi).H
         
         freq_norm = omega / (2 * np.pi)
         ax2.plot(freq_norm, np.abs(H_z))
@@ -804,11 +803,8 @@ class TransformadaZGUI(tk.Tk):
         ax4.legend()
         ax4.axis('equal')
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, right_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        fig.tight_layout()
+        lienzo.dibujar()
     
     def crear_pestaña_plano_z(self):
         """Pestaña para análisis en el plano Z"""
@@ -819,6 +815,10 @@ class TransformadaZGUI(tk.Tk):
         control_frame = ttk.LabelFrame(frame, text="Configuración del Sistema")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.plano_graph_frame = ttk.Frame(frame)
+        self.plano_lienzo = self.crear_lienzo(self.plano_graph_frame, (15, 10), self.actualizar_plano_z)
+        
         # Variables para polos y ceros
         self.num_polos_var = tk.IntVar(value=2)
         self.num_ceros_var = tk.IntVar(value=1)
@@ -835,26 +835,26 @@ class TransformadaZGUI(tk.Tk):
         
         ttk.Label(polos_frame, text="Número:").grid(row=0, column=0, padx=2, pady=2)
         ttk.Spinbox(polos_frame, from_=0, to=3, textvariable=self.num_polos_var,
-                   command=self.actualizar_plano_z, width=5).grid(row=0, column=1, padx=2, pady=2)
+                   command=self.plano_lienzo.programar, width=5).grid(row=0, column=1, padx=2, pady=2)
         
         ttk.Label(polos_frame, text="Polo 1 - r:").grid(row=1, column=0, padx=2, pady=2)
         ttk.Scale(polos_frame, from_=0.1, to=0.99, variable=self.polo1_r_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=1, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=1, column=1, padx=2, pady=2)
         ttk.Label(polos_frame, textvariable=self.polo1_r_var).grid(row=1, column=2, padx=2, pady=2)
         
         ttk.Label(polos_frame, text="Polo 1 - θ:").grid(row=2, column=0, padx=2, pady=2)
         ttk.Scale(polos_frame, from_=-180, to=180, variable=self.polo1_angle_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=2, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=2, column=1, padx=2, pady=2)
         ttk.Label(polos_frame, textvariable=self.polo1_angle_var).grid(row=2, column=2, padx=2, pady=2)
         
         ttk.Label(polos_frame, text="Polo 2 - r:").grid(row=3, column=0, padx=2, pady=2)
         ttk.Scale(polos_frame, from_=0.1, to=0.99, variable=self.polo2_r_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=3, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=3, column=1, padx=2, pady=2)
         ttk.Label(polos_frame, textvariable=self.polo2_r_var).grid(row=3, column=2, padx=2, pady=2)
         
         ttk.Label(polos_frame, text="Polo 2 - θ:").grid(row=4, column=0, padx=2, pady=2)
         ttk.Scale(polos_frame, from_=-180, to=180, variable=self.polo2_angle_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=4, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=4, column=1, padx=2, pady=2)
         ttk.Label(polos_frame, textvariable=self.polo2_angle_var).grid(row=4, column=2, padx=2, pady=2)
         
         # Configuración de ceros
@@ -863,23 +863,22 @@ class TransformadaZGUI(tk.Tk):
         
         ttk.Label(ceros_frame, text="Número:").grid(row=0, column=0, padx=2, pady=2)
         ttk.Spinbox(ceros_frame, from_=0, to=3, textvariable=self.num_ceros_var,
-                   command=self.actualizar_plano_z, width=5).grid(row=0, column=1, padx=2, pady=2)
+                   command=self.plano_lienzo.programar, width=5).grid(row=0, column=1, padx=2, pady=2)
         
         ttk.Label(ceros_frame, text="Cero 1 - r:").grid(row=1, column=0, padx=2, pady=2)
         ttk.Scale(ceros_frame, from_=0.1, to=2.0, variable=self.cero1_r_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=1, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=1, column=1, padx=2, pady=2)
         ttk.Label(ceros_frame, textvariable=self.cero1_r_var).grid(row=1, column=2, padx=2, pady=2)
         
         ttk.Label(ceros_frame, text="Cero 1 - θ:").grid(row=2, column=0, padx=2, pady=2)
         ttk.Scale(ceros_frame, from_=-180, to=180, variable=self.cero1_angle_var,
-                 command=self.actualizar_plano_z, length=100).grid(row=2, column=1, padx=2, pady=2)
+                 command=self.plano_lienzo.programar, length=100).grid(row=2, column=1, padx=2, pady=2)
         ttk.Label(ceros_frame, textvariable=self.cero1_angle_var).grid(row=2, column=2, padx=2, pady=2)
         
         control_frame.columnconfigure(0, weight=1)
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.plano_graph_frame = ttk.Frame(frame)
         self.plano_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -894,10 +893,6 @@ class TransformadaZGUI(tk.Tk):
     
     def actualizar_plano_z(self, event=None):
         """Actualizar visualización del plano Z"""
-        # Limpiar frame
-        for widget in self.plano_graph_frame.winfo_children():
-            widget.destroy()
-        
         # Obtener configuración
         num_polos = self.num_polos_var.get()
         num_ceros = self.num_ceros_var.get()
@@ -927,47 +922,35 @@ class TransformadaZGUI(tk.Tk):
         polos = np.array(polos) if polos else np.array([])
         ceros = np.array(ceros) if ceros else np.array([])
         
-        # Crear función de transferencia
+        # H(z) = Π(z - cero_i) / Π(z - polo_i) en el círculo unitario
         omega = np.linspace(0, 2*np.pi, 512)
-        z = np.exp(1j * omega)
-        
-        # Calcular H(z) en el círculo unitario
-        H = np.ones_like(z, dtype=complex)
-        
-        # Multiplicar por (z - cero_i) para cada cero
-        for cero in ceros:
-            H *= (z - cero)
+        respuesta = dsp_core.respuesta_frecuencia(zpk=(ceros, polos, 1.0), f=omega, fs=2*np.pi)
         
-        # Dividir por (z - polo_i) para cada polo
-        for polo in polos:
-            H /= (z - polo)
-        
-        # Crear figura
-        fig = plt.figure(figsize=(15, 10))
+        # Ejes persistentes (el número de polos y ceros cambia la estructura de cada
+        # gráfico, así que se vacían y se vuelven a dibujar)
+        ax1, ax2, ax3, ax4, ax5, ax6 = self.plano_lienzo.preparar(self.construir_plano_z)
+        for ax in (ax1, ax2, ax3, ax4, ax5, ax6):
+            ax.cla()
         
         # Plano Z
-        ax1 = fig.add_subplot(2, 3, 1)
         self.plot_plano_z(ax1, polos, ceros)
         
         # Respuesta en frecuencia - magnitud
-        ax2 = fig.add_subplot(2, 3, 2)
         freq_norm = omega / (2 * np.pi)
-        ax2.plot(freq_norm, 20*np.log10(np.abs(H) + 1e-10))
+        ax2.plot(freq_norm, np.maximum(respuesta.db, -200))
         ax2.set_title('Respuesta en Frecuencia - Magnitud')
         ax2.set_xlabel('Frecuencia normalizada')
         ax2.set_ylabel('|H(z)| [dB]')
         ax2.grid(True, alpha=0.3)
         
         # Respuesta en frecuencia - fase
-        ax3 = fig.add_subplot(2, 3, 3)
-        ax3.plot(freq_norm, np.unwrap(np.angle(H)))
+        ax3.plot(freq_norm, respuesta.fase)
         ax3.set_title('Respuesta en Frecuencia - Fase')
         ax3.set_xlabel('Frecuencia normalizada')
         ax3.set_ylabel('∠H(z) [rad]')
         ax3.grid(True, alpha=0.3)
         
         # Respuesta al impulso
-        ax4 = fig.add_subplot(2, 3, 4)
         h = self.calcular_respuesta_impulso(polos, ceros)
         n = np.arange(len(h))
         ax4.stem(n, h.real, basefmt=" ")
@@ -977,22 +960,20 @@ class TransformadaZGUI(tk.Tk):
         ax4.grid(True, alpha=0.3)
         
         # Superficie 3D de |H(z)|
-        ax5 = fig.add_subplot(2, 3, 5, projection='3d')
         self.plot_superficie_hz(ax5, polos, ceros)
         
         # Análisis de estabilidad
-        ax6 = fig.add_subplot(2, 3, 6)
         self.plot_analisis_estabilidad(ax6, polos)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.plano_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.plano_lienzo.dibujar()
         
         # Información de estabilidad
         self.mostrar_info_estabilidad(polos, ceros)
     
+    def construir_plano_z(self, fig):
+        """Ejes del análisis en el plano Z, 2×3 con la superficie en 3D (se crean una sola vez)"""
+        return [fig.add_subplot(2, 3, i, projection='3d' if i == 5 else None) for i in range(1, 7)]
+    
     def plot_plano_z(self, ax, polos, ceros):
         """Dibujar el plano Z con polos y ceros"""
         # Círculo unitario
@@ -1033,32 +1014,9 @@ class TransformadaZGUI(tk.Tk):
     
     def plot_superficie_hz(self, ax, polos, ceros):
         """Dibujar superficie 3D de |H(z)|"""
-        # Crear malla en el plano Z
-        x = np.linspace(-1.5, 1.5, 50)
-        y = np.linspace(-1.5, 1.5, 50)
-        X, Y = np.meshgrid(x, y)
-        Z_plane = X + 1j * Y
-        
-        # Calcular |H(z)| en toda la malla
-        H_mag = np.ones_like(Z_plane, dtype=float)
-        
-        for i in range(Z_plane.shape[0]):
-            for j in range(Z_plane.shape[1]):
-                z = Z_plane[i, j]
-                h_val = 1.0 + 0j
-                
-                # Multiplicar por (z - cero_i)
-                for cero in ceros:
-                    h_val *= (z - cero)
-                
-                # Dividir por (z - polo_i)
-                for polo in polos:
-                    if np.abs(z - polo) > 1e-6:  # Evitar singularidades
-                        h_val /= (z - polo)
-                    else:
-                        h_val = np.inf
-                
-                H_mag[i, j] = np.abs(h_val)
+        # Calcular |H(z)| en toda la malla (inf en los polos, resultado en caché)
+        X, Y, H_mag = dsp_core.superficie_hz(polos, ceros, limites=(-1.5, 1.5, -1.5, 1.5),
+                                             puntos=(50, 50))
         
         # Limitar valores para visualización
         H_mag = np.clip(H_mag, 0, 10)
@@ -1132,28 +1090,12 @@ class TransformadaZGUI(tk.Tk):
         ax.set_aspect('equal')
     
     def calcular_respuesta_impulso(self, polos, ceros, N=20):
-        """Calcular respuesta al impulso aproximada"""
-        if len(polos) == 0:
-            # Sistema FIR simple
-            h = np.zeros(N)
-            h[0] = 1
-            for cero in ceros:
-                h_temp = np.zeros(N)
-                h_temp[0] = 1
-                h_temp[1] = -cero.real if np.isreal(cero) else -cero
-                h = np.convolve(h, h_temp)[:N]
-            return h
-        else:
-            # Sistema IIR - aproximación usando residuos
-            h = np.zeros(N, dtype=complex)
-            n = np.arange(N)
-            
-            # Para cada polo, agregar su contribución
-            for polo in polos:
-                if np.abs(polo) < 1:  # Solo si es estable
-                    h += (polo ** n)
-            
-            return h.real
+        """
+        Respuesta al impulso exacta de H(z) = Π(1 - c·z^(-1)) / Π(1 - p·z^(-1)), por
+        recursión (incluye los polos inestables, cuya respuesta crece). Con polos o ceros
+        sin su conjugado el sistema es complejo y se grafica la parte real
+        """
+        return np.real(dsp_core.respuesta_impulso(ceros, polos, N=N))
     
     def mostrar_info_estabilidad(self, polos, ceros):
         """Mostrar información de estabilidad"""
@@ -1208,39 +1150,42 @@ class TransformadaZGUI(tk.Tk):
         control_frame = ttk.LabelFrame(frame, text="Diseño de Filtros")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.lti_graph_frame = ttk.Frame(frame)
+        self.lti_lienzo = self.crear_lienzo(self.lti_graph_frame, (14, 10), self.actualizar_sistemas_lti)
+        
         self.filter_type_var = tk.StringVar(value="Pasa Bajas")
         self.fc_var = tk.DoubleVar(value=0.25)
         self.order_var = tk.IntVar(value=2)
-        self.r_var = tk.DoubleVar(value=0.8)
+        self.familia_var = tk.StringVar(value="Butterworth")
         
         ttk.Label(control_frame, text="Tipo de Filtro:").grid(row=0, column=0, padx=5, pady=2)
         filter_combo = ttk.Combobox(control_frame, textvariable=self.filter_type_var,
                                    values=["Pasa Bajas", "Pasa Altas", "Pasa Banda", "Rechaza Banda"])
         filter_combo.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
-        filter_combo.bind('<<ComboboxSelected>>', self.actualizar_sistemas_lti)
+        filter_combo.bind('<<ComboboxSelected>>', self.lti_lienzo.programar)
         
         ttk.Label(control_frame, text="Freq. Corte:").grid(row=1, column=0, padx=5, pady=2)
         fc_scale = ttk.Scale(control_frame, from_=0.05, to=0.45, variable=self.fc_var,
-                            command=self.actualizar_sistemas_lti)
+                            command=self.lti_lienzo.programar)
         fc_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.fc_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Label(control_frame, text="Orden:").grid(row=2, column=0, padx=5, pady=2)
         order_scale = ttk.Scale(control_frame, from_=1, to=4, variable=self.order_var,
-                               command=self.actualizar_sistemas_lti)
+                               command=self.lti_lienzo.programar)
         order_scale.grid(row=2, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.order_var).grid(row=2, column=2, padx=5, pady=2)
         
-        ttk.Label(control_frame, text="Radio r:").grid(row=3, column=0, padx=5, pady=2)
-        r_scale = ttk.Scale(control_frame, from_=0.1, to=0.95, variable=self.r_var,
-                           command=self.actualizar_sistemas_lti)
-        r_scale.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
-        ttk.Label(control_frame, textvariable=self.r_var).grid(row=3, column=2, padx=5, pady=2)
+        ttk.Label(control_frame, text="Familia:").grid(row=3, column=0, padx=5, pady=2)
+        familia_combo = ttk.Combobox(control_frame, textvariable=self.familia_var,
+                                    values=["Butterworth", "Chebyshev I", "Chebyshev II", "Elíptico", "Bessel"])
+        familia_combo.grid(row=3, column=1, padx=5, pady=2, sticky="ew")
+        familia_combo.bind('<<ComboboxSelected>>', self.lti_lienzo.programar)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.lti_graph_frame = ttk.Frame(frame)
         self.lti_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Info frame
@@ -1255,120 +1200,93 @@ class TransformadaZGUI(tk.Tk):
     
     def actualizar_sistemas_lti(self, event=None):
         """Actualizar análisis de sistemas LTI"""
-        # Limpiar frame
-        for widget in self.lti_graph_frame.winfo_children():
-            widget.destroy()
-        
         filter_type = self.filter_type_var.get()
         fc = self.fc_var.get()
         order = int(self.order_var.get())
-        r = self.r_var.get()
+        familia = self.familia_var.get()
         
         # Diseñar filtro
-        polos, ceros, gain = self.disenar_filtro(filter_type, fc, order, r)
+        polos, ceros, gain = self.disenar_filtro(filter_type, fc, order, familia)
         
-        # Calcular respuesta
+        # Calcular respuesta (magnitud y fase desenrollada en un solo llamado)
         omega = np.linspace(0, np.pi, 512)
-        z = np.exp(1j * omega)
+        respuesta = dsp_core.respuesta_frecuencia(zpk=(ceros, polos, gain), f=omega, fs=2*np.pi)
         
-        H = np.ones_like(z, dtype=complex) * gain
+        titulo, linea_polos, linea_ceros, magnitud, corte, fase, impulso = \
+            self.lti_lienzo.preparar(self.construir_sistemas_lti)
+        titulo.set_text(f'Sistema LTI: Filtro {filter_type}')
         
-        for cero in ceros:
-            H *= (z - cero)
+        # Plano Z (la leyenda muestra solo los polos y ceros presentes)
+        for linea, puntos, etiqueta in ((linea_polos, polos, 'Polos'), (linea_ceros, ceros, 'Ceros')):
+            linea.set_data(np.real(puntos), np.imag(puntos))
+            linea.set_label(etiqueta if len(puntos) > 0 else '_nolegend_')
+        linea_polos.axes.legend()
         
-        for polo in polos:
-            H /= (z - polo)
+        # Respuesta en frecuencia - magnitud y fase
+        freq_norm = omega / np.pi
+        corte.set_xdata([fc*2, fc*2])
+        corte.set_label(f'fc = {fc:.2f}')
+        corte.axes.legend()
+        dsp_core.actualizar_linea(magnitud, freq_norm, np.maximum(respuesta.db, -200), reescalar=True)
+        dsp_core.actualizar_linea(fase, freq_norm, respuesta.fase, reescalar=True)
+        
+        # Respuesta al impulso
+        h = self.calcular_respuesta_impulso_filtro(polos, ceros, gain)
+        dsp_core.actualizar_stem(impulso, np.arange(len(h)), h, reescalar=True)
         
-        # Crear figura
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle(f'Sistema LTI: Filtro {filter_type}', fontsize=14)
+        self.lti_lienzo.dibujar()
+        
+        # Información del filtro
+        self.mostrar_info_filtro(filter_type, polos, ceros, gain, fc, order, familia)
+    
+    def construir_sistemas_lti(self, fig):
+        """Ejes y artistas del análisis de sistemas LTI (se crean una sola vez)"""
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
+        titulo = fig.suptitle('', fontsize=14)
         
         # Plano Z
-        self.plot_filter_plano_z(ax1, polos, ceros)
+        linea_polos, linea_ceros = self.plot_filter_plano_z(ax1, np.array([]), np.array([]))
         
         # Respuesta en frecuencia - magnitud
-        freq_norm = omega / np.pi
-        ax2.plot(freq_norm, 20*np.log10(np.abs(H) + 1e-10))
-        ax2.axvline(fc*2, color='r', linestyle='--', label=f'fc = {fc:.2f}')
+        magnitud, = ax2.plot([], [])
+        corte = ax2.axvline(0, color='r', linestyle='--')
         ax2.set_title('Respuesta en Frecuencia - Magnitud')
         ax2.set_xlabel('Frecuencia normalizada (×π)')
         ax2.set_ylabel('|H(ω)| [dB]')
         ax2.grid(True, alpha=0.3)
-        ax2.legend()
         
         # Respuesta en frecuencia - fase
-        ax3.plot(freq_norm, np.unwrap(np.angle(H)))
+        fase, = ax3.plot([], [])
         ax3.set_title('Respuesta en Frecuencia - Fase')
         ax3.set_xlabel('Frecuencia normalizada (×π)')
         ax3.set_ylabel('∠H(ω) [rad]')
         ax3.grid(True, alpha=0.3)
         
         # Respuesta al impulso
-        h = self.calcular_respuesta_impulso_filtro(polos, ceros, gain)
-        n = np.arange(len(h))
-        ax4.stem(n, h, basefmt=" ")
+        impulso = ax4.stem([0], [0], basefmt=" ")
         ax4.set_title('Respuesta al Impulso h(n)')
         ax4.set_xlabel('n')
         ax4.set_ylabel('h(n)')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.lti_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Información del filtro
-        self.mostrar_info_filtro(filter_type, polos, ceros, gain, fc, order)
+        return titulo, linea_polos, linea_ceros, magnitud, corte, fase, impulso
     
-    def disenar_filtro(self, filter_type, fc, order, r):
-        """Diseñar filtro digital básico"""
-        wc = 2 * np.pi * fc  # Frecuencia de corte en rad/sample
-        
-        if filter_type == "Pasa Bajas":
-            # Filtro pasa bajas con polos en círculo de radio r
-            angles = np.linspace(np.pi/4, 2*np.pi - np.pi/4, order)
-            polos = r * np.exp(1j * angles)
-            # Ceros en z = -1 para rechazar alta frecuencia
-            ceros = -np.ones(order)
-            gain = (1-r)**order  # Normalizar ganancia
-            
-        elif filter_type == "Pasa Altas":
-            # Filtro pasa altas con polos cerca del origen
-            angles = np.linspace(np.pi/4, 2*np.pi - np.pi/4, order)
-            polos = r * np.exp(1j * angles)
-            # Ceros en z = 1 para rechazar baja frecuencia
-            ceros = np.ones(order)
-            gain = (1-r)**order
-            
-        elif filter_type == "Pasa Banda":
-            # Filtro pasa banda
-            center_freq = wc
-            polos = []
-            for i in range(order//2):
-                angle = center_freq + (-1)**i * np.pi/8
-                polos.extend([r * np.exp(1j * angle), r * np.exp(-1j * angle)])
-            polos = np.array(polos[:order])
-            
-            # Ceros en z = 1 y z = -1
-            ceros = np.array([1, -1] * (order//2))[:order]
-            gain = (1-r)**(order//2)
-            
-        else:  # Rechaza Banda
-            # Filtro rechaza banda
-            center_freq = wc
-            # Polos lejos de la frecuencia de rechazo
-            angles = [center_freq + np.pi/2, center_freq - np.pi/2]
-            polos = r * np.exp(1j * np.array(angles * (order//2)))[:order]
-            
-            # Ceros en la frecuencia de rechazo
-            ceros = 0.9 * np.exp(1j * np.array([center_freq, -center_freq] * (order//2)))[:order]
-            gain = 1.0
-        
+    def disenar_filtro(self, filter_type, fc, order, familia):
+        """
+        Diseñar el filtro digital con dsp_core (bilineal, 1 dB de rizado y 40 dB de atenuación
+        en Chebyshev y elíptico). fc está en ciclos/muestra; las bandas de pasa banda y
+        rechaza banda van de fc - 1/16 a fc + 1/16. Retorna (polos, ceros, ganancia)
+        """
+        if filter_type in ("Pasa Banda", "Rechaza Banda"):
+            corte = (max(fc - 1/16, 0.01), min(fc + 1/16, 0.49))
+        else:
+            corte = fc
+        diseno = dsp_core.disenar_filtro(familia, filter_type, corte, order, fs=1.0)
+        ceros, polos, gain = diseno.zpk
         return polos, ceros, gain
     
     def plot_filter_plano_z(self, ax, polos, ceros):
-        """Dibujar plano Z para filtro"""
+        """Dibujar plano Z para filtro; retorna las líneas de polos y de ceros"""
         # Círculo unitario
         theta = np.linspace(0, 2*np.pi, 100)
         ax.plot(np.cos(theta), np.sin(theta), 'k-', linewidth=2, label='Círculo unitario')
@@ -1377,13 +1295,11 @@ class TransformadaZGUI(tk.Tk):
         ax.axhline(y=0, color='k', linestyle='-', alpha=0.3)
         ax.axvline(x=0, color='k', linestyle='-', alpha=0.3)
         
-        # Polos
-        if len(polos) > 0:
-            ax.plot(polos.real, polos.imag, 'xr', markersize=10, markeredgewidth=2, label='Polos')
-        
-        # Ceros
-        if len(ceros) > 0:
-            ax.plot(ceros.real, ceros.imag, 'ob', markersize=8, label='Ceros')
+        # Polos y ceros (las líneas se crean aunque estén vacías, para actualizarlas)
+        linea_polos, = ax.plot(polos.real, polos.imag, 'xr', markersize=10, markeredgewidth=2,
+                               label='Polos' if len(polos) > 0 else '_nolegend_')
+        linea_ceros, = ax.plot(ceros.real, ceros.imag, 'ob', markersize=8,
+                               label='Ceros' if len(ceros) > 0 else '_nolegend_')
         
         ax.set_xlim(-1.2, 1.2)
         ax.set_ylim(-1.2, 1.2)
@@ -1393,30 +1309,15 @@ class TransformadaZGUI(tk.Tk):
         ax.grid(True, alpha=0.3)
         ax.legend()
         ax.set_aspect('equal')
+        return linea_polos, linea_ceros
     
     def calcular_respuesta_impulso_filtro(self, polos, ceros, gain, N=30):
-        """Calcular respuesta al impulso del filtro"""
-        # Método simple: usar la definición de la transformada Z inversa
-        h = np.zeros(N, dtype=complex)
-        
-        # Para sistemas simples, aproximar usando expansión en serie
-        if len(polos) == 0:  # Sistema FIR
-            h[0] = gain
-            for i, cero in enumerate(ceros):
-                if i < N-1:
-                    h[i+1] = -gain * cero
-        else:  # Sistema IIR
-            # Aproximación usando la fórmula de residuos
-            n = np.arange(N)
-            for polo in polos:
-                if np.abs(polo) < 1:  # Solo contribuyen polos estables
-                    h += gain * (polo ** n) / len(polos)
-        
-        return h.real
+        """Respuesta al impulso exacta del filtro (parte real si el diseño no es conjugado)"""
+        return np.real(dsp_core.respuesta_impulso(ceros, polos, gain, N=N))
     
-    def mostrar_info_filtro(self, filter_type, polos, ceros, gain, fc, order):
+    def mostrar_info_filtro(self, filter_type, polos, ceros, gain, fc, order, familia):
         """Mostrar información del filtro"""
-        info_text = f"FILTRO {filter_type.upper()}:\n"
+        info_text = f"FILTRO {filter_type.upper()} ({familia}):\n"
         info_text += "=" * 30 + "\n\n"
         
         info_text += f"Orden: {order}\n"
@@ -1517,6 +1418,10 @@ class TransformadaZGUI(tk.Tk):
         control_frame = ttk.LabelFrame(frame, text="Parámetros de Comparación")
         control_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
         
+        # Frame y lienzo de los gráficos (los controles programan su actualización)
+        self.comp_graph_frame = ttk.Frame(frame)
+        self.comp_lienzo = self.crear_lienzo(self.comp_graph_frame, (15, 12), self.actualizar_comparacion)
+        
         self.comp_signal_var = tk.StringVar(value="Exponencial")
         self.comp_a_var = tk.DoubleVar(value=0.8)
         self.comp_show_roc_var = tk.BooleanVar(value=True)
@@ -1525,32 +1430,27 @@ class TransformadaZGUI(tk.Tk):
         comp_combo = ttk.Combobox(control_frame, textvariable=self.comp_signal_var,
                                  values=["Exponencial", "Coseno", "Impulso Retardado"])
         comp_combo.grid(row=0, column=1, padx=5, pady=2, sticky="ew")
-        comp_combo.bind('<<ComboboxSelected>>', self.actualizar_comparacion)
+        comp_combo.bind('<<ComboboxSelected>>', self.comp_lienzo.programar)
         
         ttk.Label(control_frame, text="Parámetro a:").grid(row=1, column=0, padx=5, pady=2)
         a_scale = ttk.Scale(control_frame, from_=0.1, to=1.5, variable=self.comp_a_var,
-                           command=self.actualizar_comparacion)
+                           command=self.comp_lienzo.programar)
         a_scale.grid(row=1, column=1, padx=5, pady=2, sticky="ew")
         ttk.Label(control_frame, textvariable=self.comp_a_var).grid(row=1, column=2, padx=5, pady=2)
         
         ttk.Checkbutton(control_frame, text="Mostrar ROC", 
                        variable=self.comp_show_roc_var,
-                       command=self.actualizar_comparacion).grid(row=2, column=0, columnspan=2, padx=5, pady=2)
+                       command=self.comp_lienzo.programar).grid(row=2, column=0, columnspan=2, padx=5, pady=2)
         
         control_frame.columnconfigure(1, weight=1)
         
         # Frame para gráficos
-        self.comp_graph_frame = ttk.Frame(frame)
         self.comp_graph_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         self.actualizar_comparacion()
     
     def actualizar_comparacion(self, event=None):
         """Actualizar comparación Z vs DTFT"""
-        # Limpiar frame
-        for widget in self.comp_graph_frame.winfo_children():
-            widget.destroy()
-        
         signal_type = self.comp_signal_var.get()
         a = self.comp_a_var.get()
         show_roc = self.comp_show_roc_var.get()
@@ -1569,11 +1469,13 @@ class TransformadaZGUI(tk.Tk):
             x[delay] = 1
             title_signal = f"x(n) = δ(n-{delay})"
         
-        # Crear figura
-        fig = plt.figure(figsize=(15, 12))
+        # Ejes persistentes, vaciados para volver a dibujar (la ROC y los polos cambian
+        # según la señal)
+        ax1, ax2, ax3, ax4, ax5, ax6 = self.comp_lienzo.preparar(self.construir_comparacion)
+        for ax in (ax1, ax2, ax3, ax4, ax5, ax6):
+            ax.cla()
         
         # Señal original
-        ax1 = fig.add_subplot(3, 2, 1)
         ax1.stem(n, x, basefmt=" ")
         ax1.set_title(f'Señal: {title_signal}')
         ax1.set_xlabel('n')
@@ -1581,7 +1483,6 @@ class TransformadaZGUI(tk.Tk):
         ax1.grid(True, alpha=0.3)
         
         # DTFT
-        ax2 = fig.add_subplot(3, 2, 2)
         omega = np.linspace(-np.pi, np.pi, 512)
         X_dtft = self.calcular_dtft(x, omega)
         ax2.plot(omega/np.pi, np.abs(X_dtft))
@@ -1591,9 +1492,7 @@ class TransformadaZGUI(tk.Tk):
         ax2.grid(True, alpha=0.3)
         
         # Transformada Z en círculo unitario
-        ax3 = fig.add_subplot(3, 2, 3)
-        z_unit = np.exp(1j * omega)
-        X_z_unit = self.calcular_transformada_z_evaluada(x, z_unit)
+        X_z_unit = self.calcular_transformada_z_circulo(x, omega)
         ax3.plot(omega/np.pi, np.abs(X_z_unit), 'r-', label='|X(z)| en |z|=1')
         ax3.plot(omega/np.pi, np.abs(X_dtft), 'b--', label='|X(e^jω)| DTFT')
         ax3.set_title('Comparación en círculo unitario')
@@ -1603,45 +1502,30 @@ class TransformadaZGUI(tk.Tk):
         ax3.grid(True, alpha=0.3)
         
         # Plano Z completo
-        ax4 = fig.add_subplot(3, 2, 4)
         self.plot_plano_z_completo(ax4, x, show_roc, signal_type, a)
         
         # Superficie |X(z)|
-        ax5 = fig.add_subplot(3, 2, 5, projection='3d')
         self.plot_superficie_transformada_z(ax5, x)
         
         # Información teórica
-        ax6 = fig.add_subplot(3, 2, 6)
         ax6.axis('off')
         info_text = self.generar_info_comparacion(signal_type, a)
         ax6.text(0.05, 0.95, info_text, transform=ax6.transAxes, fontsize=10,
                 verticalalignment='top', fontfamily='monospace')
         
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, self.comp_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.comp_lienzo.dibujar()
+    
+    def construir_comparacion(self, fig):
+        """Ejes de la comparación Z vs DTFT, 3×2 con la superficie en 3D (se crean una sola vez)"""
+        return [fig.add_subplot(3, 2, i, projection='3d' if i == 5 else None) for i in range(1, 7)]
     
     def calcular_dtft(self, x, omega):
         """Calcular DTFT de la señal"""
-        X = np.zeros_like(omega, dtype=complex)
-        n = np.arange(len(x))
-        
-        for i, w in enumerate(omega):
-            X[i] = np.sum(x * np.exp(-1j * w * n))
-        
-        return X
+        return dsp_core.calcular_dtft(x, omega)
     
-    def calcular_transformada_z_evaluada(self, x, z_values):
-        """Calcular transformada Z evaluada en puntos específicos"""
-        X = np.zeros_like(z_values, dtype=complex)
-        n = np.arange(len(x))
-        
-        for i, z in enumerate(z_values):
-            X[i] = np.sum(x * (z ** (-n)))
-        
-        return X
+    def calcular_transformada_z_circulo(self, x, omega):
+        """Calcular transformada Z evaluada en z = e^{jω} (rejilla uniforme: una FFT)"""
+        return dsp_core.respuesta_frecuencia(x, f=omega, fs=2*np.pi).H
     
     def plot_plano_z_completo(self, ax, x, show_roc, signal_type, a):
         """Dibujar plano Z con ROC"""
@@ -1683,23 +1567,9 @@ class TransformadaZGUI(tk.Tk):
     
     def plot_superficie_transformada_z(self, ax, x):
         """Dibujar superficie de |X(z)| en 3D"""
-        # Crear malla
-        real_range = np.linspace(-2, 2, 30)
-        imag_range = np.linspace(-2, 2, 30)
-        Real, Imag = np.meshgrid(real_range, imag_range)
-        Z_plane = Real + 1j * Imag
-        
-        # Calcular |X(z)|
-        X_mag = np.zeros_like(Real)
-        n = np.arange(len(x))
-        
-        for i in range(Real.shape[0]):
-            for j in range(Real.shape[1]):
-                z = Z_plane[i, j]
-                if np.abs(z) > 0.1:  # Evitar singularidades
-                    X_mag[i, j] = np.abs(np.sum(x * (z ** (-n))))
-                else:
-                    X_mag[i, j] = np.inf
+        # Calcular |X(z)| en toda la malla (inf cerca de z=0, resultado en caché)
+        Real, Imag, X_mag = dsp_core.superficie_transformada_z(x, limites=(-2, 2, -2, 2),
+                                                               puntos=(30, 30), radio_minimo=0.1)
         
         # Limitar para visualización
         X_mag = np.clip(X_mag, 0, 20)
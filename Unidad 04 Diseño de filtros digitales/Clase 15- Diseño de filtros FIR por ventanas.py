@@ -0,0 +1,224 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider, Button, RadioButtons
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, actualizar_franja, actualizar_linea, convolucionar
+from dsp_core import disenar_fir, estimar_kaiser, estimar_orden, respuesta_fir, metricas_fir
+
+VENTANAS_CLASE = ("Rectangular", "Hann", "Hamming", "Blackman", "Kaiser")
+TIPOS_CLASE = ("Pasa Bajas", "Pasa Altas")
+
+# Escalas (dB) del acercamiento a la banda de paso: los límites solo cambian al cambiar de escala
+ESCALAS_ZOOM = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50)
+
+def senal_prueba(fs, duracion=4.0):
+    # Señal de prueba: 150 Hz (banda baja) + 700 Hz (banda alta)
+    t = np.arange(int(fs * duracion)) / fs
+    return t, np.sin(2*np.pi*150*t) + 0.5*np.sin(2*np.pi*700*t)
+
+def bandas(tipo, fc, df, fs):
+    # Banda de paso y de rechazo (Hz) según el tipo, con la transición fc ± Δf/2
+    baja = (0, max(fc - df/2, 0))
+    alta = (min(fc + df/2, fs/2), fs/2)
+    return (baja, alta) if tipo == "Pasa Bajas" else (alta, baja)
+
+def escala_zoom(db_paso, rp):
+    # Menor escala de ESCALAS_ZOOM que contiene la desviación en la banda de paso y el rizado ±rp/2
+    desviacion = max(np.abs(db_paso).max(), rp/2)
+    for escala in ESCALAS_ZOOM:
+        if desviacion <= escala:
+            return escala
+    return ESCALAS_ZOOM[-1]
+
+def plot_diseno_fir():
+    # Parámetros iniciales
+    fs = 2000
+    fc_init = 400
+    orden_init = 80
+    df_init = 100
+    A_init = 60
+    rp_init = 0.1
+
+    t, x = senal_prueba(fs)
+    estado = {"nombre": "Hamming", "tipo": "Pasa Bajas"}
+
+    def disenar(fc, orden, A, rp):
+        # Coeficientes y respuesta en frecuencia (ambos en caché: repetir un valor no recalcula)
+        filtro = disenar_fir(estado["tipo"], fc, orden, fs=fs, ventana=estado["nombre"],
+                             rizado_db=rp, atenuacion_db=A)
+        return filtro, respuesta_fir(filtro, fs=fs)
+
+    filtro, resp = disenar(fc_init, orden_init, A_init, rp_init)
+    h = filtro.b
+    y = convolucionar(x, h, "same")
+    paso, rechazo = bandas(estado["tipo"], fc_init, df_init, fs)
+    mascara_paso = (resp.f >= paso[0]) & (resp.f <= paso[1])
+
+    fig, axs = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        "Diseño de filtros FIR por ventanas: h[n] = h_d[n]·w[n], n = 0..M\n"
+        "Estimación de Kaiser: A = -20·log10(min(δp, δs)), M = (A - 7.95)/(2.285·Δω)",
+        fontsize=13, y=0.97
+    )
+    plt.subplots_adjust(left=0.2, bottom=0.3, hspace=0.4, wspace=0.25)
+
+    # Respuesta al impulso (miles de coeficientes: línea en lugar de stem)
+    axs[0,0].set_title("Respuesta al impulso h[n]")
+    l_h, = axs[0,0].plot(np.arange(len(h)), h, 'C0')
+    axs[0,0].set_xlabel("n")
+    axs[0,0].set_ylabel("h[n]")
+    axs[0,0].grid(True)
+
+    # Magnitud en dB con la especificación
+    axs[0,1].set_title("|H(e^{jω})| [dB]")
+    l_H, = axs[0,1].plot(resp.f, resp.db, 'C1')
+    l_A = axs[0,1].axhline(-A_init, color='r', linestyle='--', label="-A")
+    franja = axs[0,1].axvspan(fc_init - df_init/2, fc_init + df_init/2, color='gray', alpha=0.25,
+                              label="Transición Δf")
+    axs[0,1].set_xlim(0, fs/2)
+    axs[0,1].set_ylim(-140, 10)
+    axs[0,1].set_xlabel("Frecuencia [Hz]")
+    axs[0,1].set_ylabel("dB")
+    axs[0,1].legend(loc='lower left')
+    axs[0,1].grid(True)
+
+    # Acercamiento a la banda de paso
+    axs[1,0].set_title("Banda de paso (rizado)")
+    l_paso, = axs[1,0].plot(resp.f[mascara_paso], resp.db[mascara_paso], 'C2')
+    l_rp_sup = axs[1,0].axhline(rp_init/2, color='r', linestyle='--')
+    l_rp_inf = axs[1,0].axhline(-rp_init/2, color='r', linestyle='--')
+    escala = escala_zoom(resp.db[mascara_paso], rp_init)
+    axs[1,0].set_xlim(paso[0], max(paso[1], paso[0] + 1))
+    axs[1,0].set_ylim(-escala, escala)
+    axs[1,0].set_xlabel("Frecuencia [Hz]")
+    axs[1,0].set_ylabel("dB")
+    axs[1,0].grid(True)
+
+    # Señal de prueba filtrada (convolución centrada: sin el retardo M/2 de la fase lineal)
+    vista = (t >= 1.0) & (t < 1.05)
+    axs[1,1].set_title("Señal de prueba: 150 Hz + 700 Hz")
+    axs[1,1].plot(t[vista]*1e3, x[vista], 'b', alpha=0.5, label="Original")
+    l_y, = axs[1,1].plot(t[vista]*1e3, y[vista], 'r', label="Filtrada")
+    axs[1,1].set_xlabel("Tiempo [ms]")
+    axs[1,1].set_ylabel("Amplitud")
+    axs[1,1].legend(loc='upper right')
+    axs[1,1].grid(True)
+
+    # Sliders
+    axcolor = 'lightgoldenrodyellow'
+    ax_fc = plt.axes([0.2, 0.21, 0.3, 0.03], facecolor=axcolor)
+    ax_orden = plt.axes([0.2, 0.16, 0.3, 0.03], facecolor=axcolor)
+    ax_df = plt.axes([0.62, 0.21, 0.3, 0.03], facecolor=axcolor)
+    ax_A = plt.axes([0.62, 0.16, 0.3, 0.03], facecolor=axcolor)
+    ax_rp = plt.axes([0.62, 0.11, 0.3, 0.03], facecolor=axcolor)
+    s_fc = Slider(ax_fc, 'fc [Hz]', 50, 900, valinit=fc_init, valstep=5)
+    s_orden = Slider(ax_orden, 'Orden M', 10, 4000, valinit=orden_init, valstep=2)
+    s_df = Slider(ax_df, 'Δf [Hz]', 10, 300, valinit=df_init, valstep=5)
+    s_A = Slider(ax_A, 'A [dB]', 20, 100, valinit=A_init, valstep=1)
+    s_rp = Slider(ax_rp, 'Rizado [dB]', 0.01, 1, valinit=rp_init, valstep=0.01)
+
+    # Ventana y tipo de filtro
+    ax_ventana = plt.axes([0.02, 0.55, 0.11, 0.2], facecolor=axcolor)
+    ax_tipo = plt.axes([0.02, 0.38, 0.11, 0.1], facecolor=axcolor)
+    radio_ventana = RadioButtons(ax_ventana, VENTANAS_CLASE, active=VENTANAS_CLASE.index("Hamming"))
+    radio_tipo = RadioButtons(ax_tipo, TIPOS_CLASE, active=0)
+    ax_ventana.set_title("Ventana", fontsize=10)
+    ax_tipo.set_title("Tipo", fontsize=10)
+
+    # Estimaciones y métricas medidas
+    ax_info = plt.axes([0.2, 0.02, 0.5, 0.07])
+    ax_info.axis('off')
+    info_text = ax_info.text(0, 0.5, "", fontsize=9, va='center', family='monospace')
+
+    def texto_info(filtro, resp, fc, df, A, rp):
+        kaiser = estimar_kaiser(rp, A, df, fs)
+        paso, rechazo = bandas(estado["tipo"], fc, df, fs)
+        rizado, atenuacion = metricas_fir(resp, paso, rechazo)
+        nombre = estado["nombre"]
+        return (f"Kaiser: M = {kaiser.orden}, β = {kaiser.beta:.2f}, A = {kaiser.atenuacion_db:.1f} dB"
+                f"   |   {nombre}: M estimado = {estimar_orden(nombre, df, fs, rp, A)}\n"
+                f"Diseño: M = {filtro.espec.orden} ({len(filtro.b)} coeficientes)"
+                f"   |   Medido: rizado {rizado:.3f} dB, atenuación {atenuacion:.1f} dB")
+
+    info_text.set_text(texto_info(filtro, resp, fc_init, df_init, A_init, rp_init))
+
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, [l_h, l_H, l_A, franja, l_paso, l_rp_sup, l_rp_inf, l_y, info_text],
+                      sliders=[s_fc, s_orden, s_df, s_A, s_rp])
+
+    def update(_=None):
+        fc = s_fc.val
+        orden = int(s_orden.val)
+        df = s_df.val
+        A = s_A.val
+        rp = s_rp.val
+        filtro, resp = disenar(fc, orden, A, rp)
+        h = filtro.b
+        y = convolucionar(x, h, "same")
+        paso, _ = bandas(estado["tipo"], fc, df, fs)
+        mascara_paso = (resp.f >= paso[0]) & (resp.f <= paso[1])
+        # Respuesta al impulso (su longitud cambia con el orden)
+        actualizar_linea(l_h, np.arange(len(h)), h, reescalar=True)
+        # Respuesta en frecuencia y especificación
+        actualizar_linea(l_H, resp.f, resp.db)
+        l_A.set_ydata([-A, -A])
+        actualizar_franja(franja, max(fc - df/2, 0), min(fc + df/2, fs/2))
+        # Banda de paso, con la escala del rizado medido
+        actualizar_linea(l_paso, resp.f[mascara_paso], resp.db[mascara_paso])
+        l_rp_sup.set_ydata([rp/2, rp/2])
+        l_rp_inf.set_ydata([-rp/2, -rp/2])
+        escala = escala_zoom(resp.db[mascara_paso], rp)
+        axs[1,0].set_xlim(paso[0], max(paso[1], paso[0] + 1))
+        axs[1,0].set_ylim(-escala, escala)
+        # Señal filtrada
+        l_y.set_ydata(y[vista])
+        info_text.set_text(texto_info(filtro, resp, fc, df, A, rp))
+        blit.actualizar()
+
+    s_fc.on_changed(update)
+    s_orden.on_changed(update)
+    s_df.on_changed(update)
+    s_A.on_changed(update)
+    s_rp.on_changed(update)
+
+    def cambiar_ventana(nombre):
+        estado["nombre"] = nombre
+        update()
+
+    def cambiar_tipo(tipo):
+        estado["tipo"] = tipo
+        update()
+
+    radio_ventana.on_clicked(cambiar_ventana)
+    radio_tipo.on_clicked(cambiar_tipo)
+
+    # Botón para llevar el orden al estimado para la ventana y la especificación actuales
+    estimarax = plt.axes([0.74, 0.04, 0.1, 0.04])
+    button_estimar = Button(estimarax, 'Estimar orden', color=axcolor, hovercolor='0.975')
+    def estimar(_):
+        orden = estimar_orden(estado["nombre"], s_df.val, fs, s_rp.val, s_A.val)
+        s_orden.set_val(min(max(orden, s_orden.valmin), s_orden.valmax))
+    button_estimar.on_clicked(estimar)
+
+    # Botón de reset
+    resetax = plt.axes([0.85, 0.04, 0.1, 0.04])
+    button = Button(resetax, 'Reset', color=axcolor, hovercolor='0.975')
+    def reset(_):
+        s_fc.reset()
+        s_orden.reset()
+        s_df.reset()
+        s_A.reset()
+        s_rp.reset()
+    button.on_clicked(reset)
+
+    plt.show()
+
+if __name__ == "__main__":
+    plot_diseno_fir()
@@ -0,0 +1,189 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider, Button, RadioButtons
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, actualizar_linea, disenar_bilineal, frecuencia_digital, predistorsion
+from dsp_core import respuesta_analogica, respuesta_sos
+
+FAMILIAS_CLASE = ("Butterworth", "Chebyshev I", "Chebyshev II", "Elíptico", "Bessel")
+TIPOS_CLASE = ("Pasa Bajas", "Pasa Altas")
+
+def disenos(tipo, fc, orden, fs, familia, rp, rs):
+    # Mismo filtro con y sin predistorsión de fc (ambos en caché)
+    con = disenar_bilineal(tipo, fc, orden, fs=fs, familia=familia, rp=rp, rs=rs)
+    sin = disenar_bilineal(tipo, fc, orden, fs=fs, familia=familia, rp=rp, rs=rs, predistorsionar=False)
+    return con, sin
+
+def plot_bilineal():
+    # Parámetros iniciales
+    fs = 1000
+    fc_init = 200
+    orden_init = 4
+    rp_init = 1.0
+    rs_init = 40
+
+    estado = {"familia": "Butterworth", "tipo": "Pasa Bajas"}
+    f = np.linspace(0, fs/2, 1024)
+    # Eje analógico hasta 3·fs: la bilineal comprime todo el eje jΩ en 0..fs/2
+    f_analogica = np.linspace(0, 3*fs, 1000)
+
+    con, sin = disenos(estado["tipo"], fc_init, orden_init, fs, estado["familia"], rp_init, rs_init)
+    resp = respuesta_sos(np.stack([con.sos, sin.sos]), f, fs=fs)
+    H_analogica = respuesta_analogica(sin.analogico, f)
+    Fp = predistorsion(fc_init, fs) / (2*np.pi)
+
+    fig, axs = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        "Transformación bilineal: s = 2·fs·(z - 1)/(z + 1)\n"
+        "Compresión ω = 2·arctan(Ω/(2·fs)); predistorsión Ωc = 2·fs·tan(π·fc/fs)",
+        fontsize=13, y=0.97
+    )
+    plt.subplots_adjust(left=0.2, bottom=0.25, hspace=0.4, wspace=0.25)
+
+    # Compresión de frecuencias
+    axs[0,0].set_title("Frecuencia digital vs. analógica")
+    axs[0,0].plot(f_analogica, frecuencia_digital(2*np.pi*f_analogica, fs), 'k', label="Bilineal")
+    axs[0,0].plot(f_analogica, f_analogica, 'k:', label="f = F (sin compresión)")
+    l_sin, = axs[0,0].plot([fc_init], [frecuencia_digital(2*np.pi*fc_init, fs)], 'ro',
+                           label="F = fc (sin predistorsión)")
+    l_con, = axs[0,0].plot([Fp], [fc_init], 'go', label="F = Ωc/2π (predistorsionada)")
+    axs[0,0].axhline(fs/2, color='gray', linestyle='--')
+    axs[0,0].set_xlim(0, 3*fs)
+    axs[0,0].set_ylim(0, fs/2 * 1.1)
+    axs[0,0].set_xlabel("Frecuencia analógica F [Hz]")
+    axs[0,0].set_ylabel("Frecuencia digital f [Hz]")
+    axs[0,0].legend(loc='lower right', fontsize=8)
+    axs[0,0].grid(True)
+
+    # Magnitud: analógico, digital con y sin predistorsión
+    axs[0,1].set_title("|H| [dB]")
+    l_ana, = axs[0,1].plot(f, 20*np.log10(np.abs(H_analogica) + 1e-20), 'k:', label="Analógico Ha(j2πf)")
+    l_Hcon, = axs[0,1].plot(f, resp.db[0], 'g', label="Digital con predistorsión")
+    l_Hsin, = axs[0,1].plot(f, resp.db[1], 'r--', label="Digital sin predistorsión")
+    l_fc = axs[0,1].axvline(fc_init, color='gray', linestyle='--')
+    axs[0,1].axhline(-3, color='gray', linestyle=':')
+    axs[0,1].set_xlim(0, fs/2)
+    axs[0,1].set_ylim(-80, 5)
+    axs[0,1].set_xlabel("Frecuencia [Hz]")
+    axs[0,1].set_ylabel("dB")
+    axs[0,1].legend(loc='lower left', fontsize=8)
+    axs[0,1].grid(True)
+
+    # Polos y ceros del diseño con predistorsión
+    axs[1,0].set_title("Plano Z (con predistorsión)")
+    theta = np.linspace(0, 2*np.pi, 400)
+    axs[1,0].plot(np.cos(theta), np.sin(theta), 'k', linewidth=0.8)
+    l_ceros, = axs[1,0].plot(con.zpk[0].real, con.zpk[0].imag, 'bo', fillstyle='none', label="Ceros")
+    l_polos, = axs[1,0].plot(con.zpk[1].real, con.zpk[1].imag, 'rx', label="Polos")
+    axs[1,0].set_xlim(-1.3, 1.3)
+    axs[1,0].set_ylim(-1.3, 1.3)
+    axs[1,0].set_aspect('equal')
+    axs[1,0].set_xlabel("Re{z}")
+    axs[1,0].set_ylabel("Im{z}")
+    axs[1,0].legend(loc='upper right', fontsize=8)
+    axs[1,0].grid(True)
+
+    # Retardo de grupo
+    axs[1,1].set_title("Retardo de grupo")
+    l_rcon, = axs[1,1].plot(f, resp.retardo[0], 'g', label="Con predistorsión")
+    l_rsin, = axs[1,1].plot(f, resp.retardo[1], 'r--', label="Sin predistorsión")
+    axs[1,1].set_xlim(0, fs/2)
+    axs[1,1].set_xlabel("Frecuencia [Hz]")
+    axs[1,1].set_ylabel("Muestras")
+    axs[1,1].legend(loc='upper right', fontsize=8)
+    axs[1,1].grid(True)
+
+    # Sliders
+    axcolor = 'lightgoldenrodyellow'
+    ax_fc = plt.axes([0.2, 0.14, 0.3, 0.03], facecolor=axcolor)
+    ax_orden = plt.axes([0.2, 0.09, 0.3, 0.03], facecolor=axcolor)
+    ax_rp = plt.axes([0.62, 0.14, 0.3, 0.03], facecolor=axcolor)
+    ax_rs = plt.axes([0.62, 0.09, 0.3, 0.03], facecolor=axcolor)
+    s_fc = Slider(ax_fc, 'fc [Hz]', 10, 450, valinit=fc_init, valstep=5)
+    s_orden = Slider(ax_orden, 'Orden', 1, 20, valinit=orden_init, valstep=1)
+    s_rp = Slider(ax_rp, 'Rizado rp [dB]', 0.1, 3, valinit=rp_init, valstep=0.1)
+    s_rs = Slider(ax_rs, 'Atenuación rs [dB]', 20, 80, valinit=rs_init, valstep=1)
+
+    # Familia y tipo
+    ax_familia = plt.axes([0.02, 0.55, 0.11, 0.2], facecolor=axcolor)
+    ax_tipo = plt.axes([0.02, 0.38, 0.11, 0.1], facecolor=axcolor)
+    radio_familia = RadioButtons(ax_familia, FAMILIAS_CLASE, active=0)
+    radio_tipo = RadioButtons(ax_tipo, TIPOS_CLASE, active=0)
+    ax_familia.set_title("Familia", fontsize=10)
+    ax_tipo.set_title("Tipo", fontsize=10)
+
+    # Frecuencias de corte resultantes
+    ax_info = plt.axes([0.2, 0.01, 0.6, 0.05])
+    ax_info.axis('off')
+    info_text = ax_info.text(0, 0.5, "", fontsize=9, va='center', family='monospace')
+
+    def texto_info(fc, Fp):
+        f_sin = frecuencia_digital(2*np.pi*fc, fs)
+        return (f"Sin predistorsión: Ωc = 2π·{fc:.0f} → fc digital = {f_sin:.1f} Hz"
+                f" (error {f_sin - fc:+.1f} Hz)\n"
+                f"Con predistorsión: Ωc = 2π·{Fp:.1f} → fc digital = {fc:.1f} Hz")
+
+    info_text.set_text(texto_info(fc_init, Fp))
+
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, [l_sin, l_con, l_ana, l_Hcon, l_Hsin, l_fc, l_ceros, l_polos,
+                            l_rcon, l_rsin, info_text], sliders=[s_fc, s_orden, s_rp, s_rs])
+
+    def update(_=None):
+        fc = s_fc.val
+        orden = int(s_orden.val)
+        con, sin = disenos(estado["tipo"], fc, orden, fs, estado["familia"], s_rp.val, s_rs.val)
+        # Ambos diseños tienen las mismas secciones: se evalúan juntos
+        resp = respuesta_sos(np.stack([con.sos, sin.sos]), f, fs=fs)
+        H_analogica = respuesta_analogica(sin.analogico, f)
+        Fp = predistorsion(fc, fs) / (2*np.pi)
+        l_sin.set_data([fc], [frecuencia_digital(2*np.pi*fc, fs)])
+        l_con.set_data([Fp], [fc])
+        l_ana.set_ydata(20*np.log10(np.abs(H_analogica) + 1e-20))
+        l_Hcon.set_ydata(resp.db[0])
+        l_Hsin.set_ydata(resp.db[1])
+        l_fc.set_xdata([fc, fc])
+        l_ceros.set_data(con.zpk[0].real, con.zpk[0].imag)
+        l_polos.set_data(con.zpk[1].real, con.zpk[1].imag)
+        actualizar_linea(l_rcon, y=resp.retardo[0])
+        actualizar_linea(l_rsin, y=resp.retardo[1], reescalar=True)
+        info_text.set_text(texto_info(fc, Fp))
+        blit.actualizar()
+
+    s_fc.on_changed(update)
+    s_orden.on_changed(update)
+    s_rp.on_changed(update)
+    s_rs.on_changed(update)
+
+    def cambiar_familia(familia):
+        estado["familia"] = familia
+        update()
+
+    def cambiar_tipo(tipo):
+        estado["tipo"] = tipo
+        update()
+
+    radio_familia.on_clicked(cambiar_familia)
+    radio_tipo.on_clicked(cambiar_tipo)
+
+    # Botón de reset
+    resetax = plt.axes([0.85, 0.02, 0.1, 0.04])
+    button = Button(resetax, 'Reset', color=axcolor, hovercolor='0.975')
+    def reset(_):
+        s_fc.reset()
+        s_orden.reset()
+        s_rp.reset()
+        s_rs.reset()
+    button.on_clicked(reset)
+
+    plt.show()
+
+if __name__ == "__main__":
+    plot_bilineal()
@@ -0,0 +1,190 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider, Button, RadioButtons
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, actualizar_linea, filtrar, respuesta_sos, seccion_segundo_orden
+
+SECCIONES_CLASE = ("Notch", "Pico", "Pasa Banda", "Pasa Bajas", "Pasa Altas")
+
+# Factores de calidad de las curvas de referencia (se evalúan todas en un solo lote)
+Q_REFERENCIA = np.array([0.5, 1, 2, 5, 10, 30])
+
+def ecg_sintetico(fs, duracion=4.0, fc_red=60):
+    # Pulsos QRS gaussianos a 72 lpm + onda T, con interferencia de la red y deriva de línea base
+    t = np.arange(int(fs * duracion)) / fs
+    fase = np.mod(t, 60/72)
+    ecg = np.exp(-((fase - 0.2) / 0.012)**2) + 0.3*np.exp(-((fase - 0.45) / 0.05)**2)
+    red = 0.3*np.sin(2*np.pi*fc_red*t)
+    deriva = 0.2*np.sin(2*np.pi*0.3*t)
+    return t, ecg, ecg + red + deriva
+
+def polos_ceros(sos):
+    # Raíces del numerador y del denominador de una sección
+    return np.roots(sos[0, :3]), np.roots(sos[0, 3:])
+
+def plot_segundo_orden():
+    # Parámetros iniciales
+    fs = 500
+    f0_init = 60
+    Q_init = 30
+    G_init = 6
+
+    estado = {"tipo": "Notch"}
+    f = np.linspace(0, fs/2, 2048)
+    t, ecg, x = ecg_sintetico(fs)
+
+    sos = seccion_segundo_orden(estado["tipo"], f0_init, Q_init, fs=fs, ganancia_db=G_init)
+    resp = respuesta_sos(sos, f, fs=fs)
+    familia = respuesta_sos(seccion_segundo_orden(estado["tipo"], f0_init, Q_REFERENCIA, fs=fs,
+                                                  ganancia_db=G_init), f, fs=fs)
+    ceros, polos = polos_ceros(sos)
+    y = filtrar(x, sos=sos)
+
+    fig = plt.figure(figsize=(14, 10))
+    gs = fig.add_gridspec(3, 2)
+    ax_mag = fig.add_subplot(gs[0, 0])
+    ax_fase = fig.add_subplot(gs[0, 1])
+    ax_ret = fig.add_subplot(gs[1, 0])
+    ax_z = fig.add_subplot(gs[1, 1])
+    ax_senal = fig.add_subplot(gs[2, :])
+    fig.suptitle(
+        "Secciones IIR de segundo orden: H(z) = (b0 + b1·z⁻¹ + b2·z⁻²)/(1 + a1·z⁻¹ + a2·z⁻²)\n"
+        "Bilineal del prototipo analógico con predistorsión en f0: α = sin(ω0)/(2Q)",
+        fontsize=13, y=0.98
+    )
+    plt.subplots_adjust(left=0.2, bottom=0.2, hspace=0.5, wspace=0.25)
+
+    # Magnitud, con la misma sección para varios Q de referencia
+    ax_mag.set_title("|H| [dB] (gris: Q = 0.5, 1, 2, 5, 10, 30)")
+    l_familia = ax_mag.plot(f, familia.db.T, color='0.8', linewidth=0.8)
+    l_mag, = ax_mag.plot(f, resp.db, 'C0')
+    ax_mag.set_xlim(0, fs/2)
+    ax_mag.set_ylim(-50, 25)
+    ax_mag.set_xlabel("Frecuencia [Hz]")
+    ax_mag.set_ylabel("dB")
+    ax_mag.grid(True)
+
+    # Fase desenrollada
+    ax_fase.set_title("Fase")
+    l_fase, = ax_fase.plot(f, resp.fase, 'C1')
+    ax_fase.set_xlim(0, fs/2)
+    ax_fase.set_ylim(-np.pi - 0.3, np.pi + 0.3)
+    ax_fase.set_xlabel("Frecuencia [Hz]")
+    ax_fase.set_ylabel("Radianes")
+    ax_fase.grid(True)
+
+    # Retardo de grupo
+    ax_ret.set_title("Retardo de grupo")
+    l_ret, = ax_ret.plot(f, resp.retardo, 'C2')
+    ax_ret.set_xlim(0, fs/2)
+    ax_ret.set_xlabel("Frecuencia [Hz]")
+    ax_ret.set_ylabel("Muestras")
+    ax_ret.grid(True)
+
+    # Polos y ceros de la sección
+    ax_z.set_title("Plano Z")
+    theta = np.linspace(0, 2*np.pi, 400)
+    ax_z.plot(np.cos(theta), np.sin(theta), 'k', linewidth=0.8)
+    l_ceros, = ax_z.plot(ceros.real, ceros.imag, 'bo', fillstyle='none', label="Ceros")
+    l_polos, = ax_z.plot(polos.real, polos.imag, 'rx', label="Polos")
+    ax_z.set_xlim(-1.3, 1.3)
+    ax_z.set_ylim(-1.3, 1.3)
+    ax_z.set_aspect('equal')
+    ax_z.set_xlabel("Re{z}")
+    ax_z.set_ylabel("Im{z}")
+    ax_z.legend(loc='upper right', fontsize=8)
+    ax_z.grid(True)
+
+    # ECG con interferencia de 60 Hz, antes y después de la sección
+    ax_senal.set_title("ECG sintético + 60 Hz + deriva de línea base")
+    ax_senal.plot(t, x, color='0.6', label="Entrada")
+    ax_senal.plot(t, ecg, 'k:', linewidth=0.8, label="ECG limpio")
+    l_y, = ax_senal.plot(t, y, 'C3', label="Salida")
+    ax_senal.set_xlim(0, t[-1])
+    ax_senal.set_ylim(-1, 2)
+    ax_senal.set_xlabel("Tiempo [s]")
+    ax_senal.set_ylabel("Amplitud")
+    ax_senal.legend(loc='upper right', fontsize=8)
+    ax_senal.grid(True)
+
+    # Sliders
+    axcolor = 'lightgoldenrodyellow'
+    ax_f0 = plt.axes([0.2, 0.1, 0.3, 0.03], facecolor=axcolor)
+    ax_Q = plt.axes([0.2, 0.05, 0.3, 0.03], facecolor=axcolor)
+    ax_G = plt.axes([0.62, 0.1, 0.3, 0.03], facecolor=axcolor)
+    s_f0 = Slider(ax_f0, 'f0 [Hz]', 1, 240, valinit=f0_init, valstep=1)
+    s_Q = Slider(ax_Q, 'Q', 0.5, 50, valinit=Q_init, valstep=0.5)
+    s_G = Slider(ax_G, 'Ganancia pico [dB]', -20, 20, valinit=G_init, valstep=1)
+
+    # Tipo de sección
+    ax_tipo = plt.axes([0.02, 0.5, 0.11, 0.2], facecolor=axcolor)
+    radio_tipo = RadioButtons(ax_tipo, SECCIONES_CLASE, active=0)
+    ax_tipo.set_title("Sección", fontsize=10)
+
+    # Coeficientes de la sección
+    ax_info = plt.axes([0.55, 0.02, 0.25, 0.05])
+    ax_info.axis('off')
+    info_text = ax_info.text(0, 0.5, "", fontsize=9, va='center', family='monospace')
+
+    def texto_info(sos):
+        b0, b1, b2, _, a1, a2 = sos[0]
+        return (f"b = [{b0:.4f}, {b1:.4f}, {b2:.4f}]\n"
+                f"a = [1, {a1:.4f}, {a2:.4f}]   |p| = {np.sqrt(abs(a2)):.4f}")
+
+    info_text.set_text(texto_info(sos))
+
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, l_familia + [l_mag, l_fase, l_ret, l_ceros, l_polos, l_y, info_text],
+                      sliders=[s_f0, s_Q, s_G])
+
+    def update(_=None):
+        f0 = s_f0.val
+        Q = s_Q.val
+        G = s_G.val
+        sos = seccion_segundo_orden(estado["tipo"], f0, Q, fs=fs, ganancia_db=G)
+        resp = respuesta_sos(sos, f, fs=fs)
+        # Las curvas de referencia: un lote de secciones con los Q de Q_REFERENCIA
+        familia = respuesta_sos(seccion_segundo_orden(estado["tipo"], f0, Q_REFERENCIA, fs=fs,
+                                                      ganancia_db=G), f, fs=fs)
+        ceros, polos = polos_ceros(sos)
+        for linea, db in zip(l_familia, familia.db):
+            linea.set_ydata(db)
+        l_mag.set_ydata(resp.db)
+        l_fase.set_ydata(resp.fase)
+        actualizar_linea(l_ret, y=resp.retardo, reescalar=True)
+        l_ceros.set_data(ceros.real, ceros.imag)
+        l_polos.set_data(polos.real, polos.imag)
+        l_y.set_ydata(filtrar(x, sos=sos))
+        info_text.set_text(texto_info(sos))
+        blit.actualizar()
+
+    s_f0.on_changed(update)
+    s_Q.on_changed(update)
+    s_G.on_changed(update)
+
+    def cambiar_tipo(tipo):
+        estado["tipo"] = tipo
+        update()
+
+    radio_tipo.on_clicked(cambiar_tipo)
+
+    # Botón de reset
+    resetax = plt.axes([0.85, 0.03, 0.1, 0.04])
+    button = Button(resetax, 'Reset', color=axcolor, hovercolor='0.975')
+    def reset(_):
+        s_f0.reset()
+        s_Q.reset()
+        s_G.reset()
+    button.on_clicked(reset)
+
+    plt.show()
+
+if __name__ == "__main__":
+    plot_segundo_orden()
@@ -0,0 +1,211 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider, Button, RadioButtons
+from scipy.signal import freqz, lfilter
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, coeficientes, disenar_bilineal, respuesta_sos
+
+FAMILIAS_CLASE = ("Butterworth", "Chebyshev I", "Chebyshev II", "Elíptico", "Bessel")
+TIPOS_CLASE = ("Pasa Bajas", "Pasa Altas")
+
+def comparar_formas(diseno, f, fs, N):
+    # Mismo diseño como cascada SOS y como polinomios (b, a) completos: respuesta en frecuencia,
+    # polos (raíces de a) y respuesta al impulso de cada forma
+    b, a = coeficientes(*diseno.zpk)
+    impulso = np.zeros(N)
+    impulso[0] = 1
+    with np.errstate(all='ignore'):
+        _, H_poli = freqz(b, a, worN=f, fs=fs)
+        db_poli = 20*np.log10(np.abs(H_poli) + 1e-300)
+        h_poli = lfilter(b, a, impulso)
+    return db_poli, np.roots(a), diseno.filtrar(impulso), h_poli
+
+def encuadre(*polos):
+    # Límites cuadrados (x0, x1, y0, y1) que contienen todos los polos, con margen
+    z = np.concatenate(polos)
+    mitad = 0.6 * max(np.ptp(z.real), np.ptp(z.imag), 0.2)
+    cx = (z.real.min() + z.real.max()) / 2
+    cy = (z.imag.min() + z.imag.max()) / 2
+    return cx - mitad, cx + mitad, cy - mitad, cy + mitad
+
+def plot_orden_superior():
+    # Parámetros iniciales
+    fs = 1000
+    fc_init = 30
+    orden_init = 14
+    rp_init = 0.5
+    rs_init = 60
+    N = 600
+
+    estado = {"familia": "Elíptico", "tipo": "Pasa Bajas"}
+    f = np.linspace(0, fs/2, 2048)
+    n = np.arange(N)
+
+    def disenar(familia, fc, orden, rp, rs):
+        return disenar_bilineal(estado["tipo"], fc, orden, fs=fs, familia=familia, rp=rp, rs=rs)
+
+    diseno = disenar(estado["familia"], fc_init, orden_init, rp_init, rs_init)
+    resp = respuesta_sos(diseno.sos, f, fs=fs)
+    db_poli, polos_poli, h_sos, h_poli = comparar_formas(diseno, f, fs, N)
+    # Todas las familias tienen las mismas secciones para un mismo orden: un solo lote
+    familias = respuesta_sos(np.stack([disenar(nombre, fc_init, orden_init, rp_init, rs_init).sos
+                                       for nombre in FAMILIAS_CLASE]), f, fs=fs)
+
+    fig, axs = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        "Filtros IIR de orden superior: cascada de secciones de segundo orden vs. polinomios (b, a)\n"
+        "Con orden alto y fc ≪ fs, redondear los coeficientes de a(z) desplaza sus raíces fuera del círculo unitario",
+        fontsize=12, y=0.97
+    )
+    plt.subplots_adjust(left=0.2, bottom=0.25, hspace=0.4, wspace=0.25)
+
+    # Magnitud: SOS vs. polinomios
+    axs[0,0].set_title("|H| [dB]: SOS vs. (b, a)")
+    l_sos, = axs[0,0].plot(f, resp.db, 'C0', label="Cascada SOS")
+    l_poli, = axs[0,0].plot(f, db_poli, 'r--', label="Polinomios (b, a)")
+    axs[0,0].set_xlim(0, fs/2)
+    axs[0,0].set_ylim(-120, 40)
+    axs[0,0].set_xlabel("Frecuencia [Hz]")
+    axs[0,0].set_ylabel("dB")
+    axs[0,0].legend(loc='upper right', fontsize=8)
+    axs[0,0].grid(True)
+
+    # Polos de cada forma
+    axs[0,1].set_title("Polos: diseño (SOS) vs. raíces de a(z)")
+    theta = np.linspace(0, 2*np.pi, 400)
+    axs[0,1].plot(np.cos(theta), np.sin(theta), 'k', linewidth=0.8)
+    l_psos, = axs[0,1].plot(diseno.zpk[1].real, diseno.zpk[1].imag, 'bx', label="Polos del diseño")
+    l_ppoli, = axs[0,1].plot(polos_poli.real, polos_poli.imag, 'r+', label="Raíces de a(z)")
+    x0, x1, y0, y1 = encuadre(diseno.zpk[1], polos_poli)
+    axs[0,1].set_xlim(x0, x1)
+    axs[0,1].set_ylim(y0, y1)
+    axs[0,1].set_aspect('equal')
+    axs[0,1].set_xlabel("Re{z}")
+    axs[0,1].set_ylabel("Im{z}")
+    axs[0,1].legend(loc='lower left', fontsize=8)
+    axs[0,1].grid(True)
+
+    # Respuesta al impulso de cada forma
+    axs[1,0].set_title("Respuesta al impulso")
+    l_hsos, = axs[1,0].plot(n, h_sos, 'C0', label="Cascada SOS")
+    l_hpoli, = axs[1,0].plot(n, h_poli, 'r--', label="Polinomios (b, a)")
+    axs[1,0].set_xlim(0, N)
+    axs[1,0].set_ylim(-1.2*np.abs(h_sos).max(), 1.2*np.abs(h_sos).max())
+    axs[1,0].set_xlabel("n")
+    axs[1,0].set_ylabel("h[n]")
+    axs[1,0].legend(loc='upper right', fontsize=8)
+    axs[1,0].grid(True)
+
+    # Todas las familias con el mismo orden y corte
+    axs[1,1].set_title("Familias con el mismo orden (SOS)")
+    l_familias = axs[1,1].plot(f, familias.db.T)
+    for linea, nombre in zip(l_familias, FAMILIAS_CLASE):
+        linea.set_label(nombre)
+    axs[1,1].set_xlim(0, fs/2)
+    axs[1,1].set_ylim(-120, 5)
+    axs[1,1].set_xlabel("Frecuencia [Hz]")
+    axs[1,1].set_ylabel("dB")
+    axs[1,1].legend(loc='upper right', fontsize=8)
+    axs[1,1].grid(True)
+
+    # Sliders
+    axcolor = 'lightgoldenrodyellow'
+    ax_fc = plt.axes([0.2, 0.14, 0.3, 0.03], facecolor=axcolor)
+    ax_orden = plt.axes([0.2, 0.09, 0.3, 0.03], facecolor=axcolor)
+    ax_rp = plt.axes([0.62, 0.14, 0.3, 0.03], facecolor=axcolor)
+    ax_rs = plt.axes([0.62, 0.09, 0.3, 0.03], facecolor=axcolor)
+    s_fc = Slider(ax_fc, 'fc [Hz]', 5, 450, valinit=fc_init, valstep=5)
+    s_orden = Slider(ax_orden, 'Orden', 2, 20, valinit=orden_init, valstep=1)
+    s_rp = Slider(ax_rp, 'Rizado rp [dB]', 0.1, 3, valinit=rp_init, valstep=0.1)
+    s_rs = Slider(ax_rs, 'Atenuación rs [dB]', 20, 100, valinit=rs_init, valstep=1)
+
+    # Familia y tipo
+    ax_familia = plt.axes([0.02, 0.55, 0.11, 0.2], facecolor=axcolor)
+    ax_tipo = plt.axes([0.02, 0.38, 0.11, 0.1], facecolor=axcolor)
+    radio_familia = RadioButtons(ax_familia, FAMILIAS_CLASE, active=FAMILIAS_CLASE.index("Elíptico"))
+    radio_tipo = RadioButtons(ax_tipo, TIPOS_CLASE, active=0)
+    ax_familia.set_title("Familia", fontsize=10)
+    ax_tipo.set_title("Tipo", fontsize=10)
+
+    # Estabilidad de cada forma
+    ax_info = plt.axes([0.2, 0.01, 0.6, 0.05])
+    ax_info.axis('off')
+    info_text = ax_info.text(0, 0.5, "", fontsize=9, va='center', family='monospace')
+
+    def texto_info(diseno, polos_poli):
+        radio_sos = np.abs(diseno.zpk[1]).max()
+        radio_poli = np.abs(polos_poli).max()
+        estabilidad = lambda radio: "INESTABLE" if radio >= 1 else "estable"
+        return (f"{len(diseno.sos)} secciones: max|p| = {radio_sos:.6f} ({estabilidad(radio_sos)})\n"
+                f"Polinomio a(z) de orden {len(polos_poli)}: max|p| = {radio_poli:.6f} ({estabilidad(radio_poli)})")
+
+    info_text.set_text(texto_info(diseno, polos_poli))
+
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, [l_sos, l_poli, l_psos, l_ppoli, l_hsos, l_hpoli, info_text] + l_familias,
+                      sliders=[s_fc, s_orden, s_rp, s_rs])
+
+    def update(_=None):
+        fc = s_fc.val
+        orden = int(s_orden.val)
+        rp = s_rp.val
+        rs = s_rs.val
+        diseno = disenar(estado["familia"], fc, orden, rp, rs)
+        resp = respuesta_sos(diseno.sos, f, fs=fs)
+        db_poli, polos_poli, h_sos, h_poli = comparar_formas(diseno, f, fs, N)
+        familias = respuesta_sos(np.stack([disenar(nombre, fc, orden, rp, rs).sos
+                                           for nombre in FAMILIAS_CLASE]), f, fs=fs)
+        l_sos.set_ydata(resp.db)
+        l_poli.set_ydata(db_poli)
+        l_psos.set_data(diseno.zpk[1].real, diseno.zpk[1].imag)
+        l_ppoli.set_data(polos_poli.real, polos_poli.imag)
+        x0, x1, y0, y1 = encuadre(diseno.zpk[1], polos_poli)
+        axs[0,1].set_xlim(x0, x1)
+        axs[0,1].set_ylim(y0, y1)
+        # La escala vertical sigue a la forma SOS (la de (b, a) puede diverger)
+        l_hsos.set_ydata(h_sos)
+        l_hpoli.set_ydata(h_poli)
+        margen = 1.2 * np.abs(h_sos).max()
+        axs[1,0].set_ylim(-margen, margen)
+        for linea, db in zip(l_familias, familias.db):
+            linea.set_ydata(db)
+        info_text.set_text(texto_info(diseno, polos_poli))
+        blit.actualizar()
+
+    s_fc.on_changed(update)
+    s_orden.on_changed(update)
+    s_rp.on_changed(update)
+    s_rs.on_changed(update)
+
+    def cambiar_familia(familia):
+        estado["familia"] = familia
+        update()
+
+    def cambiar_tipo(tipo):
+        estado["tipo"] = tipo
+        update()
+
+    radio_familia.on_clicked(cambiar_familia)
+    radio_tipo.on_clicked(cambiar_tipo)
+
+    # Botón de reset
+    resetax = plt.axes([0.85, 0.02, 0.1, 0.04])
+    button = Button(resetax, 'Reset', color=axcolor, hovercolor='0.975')
+    def reset(_):
+        s_fc.reset()
+        s_orden.reset()
+        s_rp.reset()
+        s_rs.reset()
+    button.on_clicked(reset)
+
+    plt.show()
+
+if __name__ == "__main__":
+    plot_orden_superior()
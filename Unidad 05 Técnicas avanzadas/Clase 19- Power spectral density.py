@@ -0,0 +1,186 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.widgets import Slider, Button, RadioButtons
+
+try:
+    import dsp_core
+except ImportError:
+    # Ejecución directa (python "Clase NN.py"): dsp_core está en la raíz del curso
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from dsp_core import GestorBlit, WelchBloques, actualizar_franja, actualizar_linea, bloques_de
+from dsp_core import filtrar, metricas_ventana, periodograma
+
+VENTANAS_CLASE = ("Rectangular", "Hann", "Hamming", "Blackman", "Flat-top")
+
+# Segmentos dibujados en el esquema de solapamiento
+SEGMENTOS_ESQUEMA = 4
+
+def eeg_sintetico(fs, duracion=120.0, fc_red=50):
+    # Ritmo alfa (10 Hz) que aparece y desaparece, beta (22 Hz), fondo con espectro decreciente
+    # (ruido blanco por un polo en 0.95) e interferencia de la red, en µV
+    rng = np.random.default_rng(19)
+    t = np.arange(int(fs * duracion)) / fs
+    alfa = 20 * (1 + np.sin(2*np.pi*0.02*t)) / 2 * np.sin(2*np.pi*10*t)
+    beta = 5 * np.sin(2*np.pi*22*t + 0.3)
+    fondo = filtrar(3 * rng.standard_normal(t.size), b=[1], a=[1, -0.95])
+    red = 10 * np.sin(2*np.pi*fc_red*t)
+    return t, alfa + beta + fondo + red
+
+def db(psd):
+    return 10*np.log10(psd + 1e-20)
+
+def plot_psd():
+    # Parámetros iniciales
+    fs = 250
+    log2_nperseg_init = 9
+    solapamiento_init = 50
+    t_init = 30
+
+    t, x = eeg_sintetico(fs)
+    duracion = int(t[-1] + 1/fs)
+    estado = {"ventana": "Hann"}
+    per = periodograma(x, fs=fs)
+
+    def estimar(log2_nperseg, solapamiento):
+        # La señal llega en bloques de 1 s; tras cada bloque se guarda la estimación parcial
+        # (None mientras no haya un segmento completo). La última es la de todo el registro
+        nperseg = 2**int(log2_nperseg)
+        estimador = WelchBloques(fs, nperseg, int(nperseg * solapamiento / 100), estado["ventana"])
+        parciales = []
+        for bloque in bloques_de(x, fs):
+            estimador.procesar(bloque)
+            parciales.append(estimador.estimacion() if estimador.segmentos else None)
+        return estimador, parciales
+
+    estimador, parciales = estimar(log2_nperseg_init, solapamiento_init)
+    final = parciales[-1]
+
+    fig, axs = plt.subplots(2, 2, figsize=(14, 9))
+    fig.suptitle(
+        "Densidad espectral de potencia: método de Welch\n"
+        "P(f) = (1/K)·Σ|DFT{w·x_k}|² / (fs·Σw²), con K segmentos solapados de nperseg muestras",
+        fontsize=13, y=0.97
+    )
+    plt.subplots_adjust(left=0.2, bottom=0.25, hspace=0.4, wspace=0.25)
+
+    # Registro, con la parte ya recibida marcada
+    axs[0,0].set_title("EEG sintético (llega en bloques de 1 s)")
+    axs[0,0].plot(t, x, color='0.5', linewidth=0.5)
+    franja = axs[0,0].axvspan(0, t_init, color='C1', alpha=0.2, label="Recibido")
+    axs[0,0].set_xlim(0, duracion)
+    axs[0,0].set_xlabel("Tiempo [s]")
+    axs[0,0].set_ylabel("µV")
+    axs[0,0].legend(loc='upper right', fontsize=8)
+    axs[0,0].grid(True)
+
+    # Periodograma del registro completo vs. Welch
+    axs[0,1].set_title("Registro completo: periodograma vs. Welch")
+    axs[0,1].plot(per.f, db(per.psd), color='0.75', linewidth=0.5, label="Periodograma")
+    l_welch, = axs[0,1].plot(final.f, db(final.psd), 'C0', label="Welch")
+    axs[0,1].set_xlim(0, fs/2)
+    axs[0,1].set_ylim(-40, 40)
+    axs[0,1].set_xlabel("Frecuencia [Hz]")
+    axs[0,1].set_ylabel("dB (µV²/Hz)")
+    axs[0,1].legend(loc='upper right', fontsize=8)
+    axs[0,1].grid(True)
+
+    # Estimación parcial con los bloques recibidos hasta t
+    axs[1,0].set_title("Welch en streaming: estimación con los bloques recibidos")
+    l_final, = axs[1,0].plot(final.f, db(final.psd), color='0.6', linestyle='--', label="Registro completo")
+    l_parcial, = axs[1,0].plot([], [], 'C1', label="Bloques recibidos")
+    axs[1,0].set_xlim(0, fs/2)
+    axs[1,0].set_ylim(-40, 40)
+    axs[1,0].set_xlabel("Frecuencia [Hz]")
+    axs[1,0].set_ylabel("dB (µV²/Hz)")
+    axs[1,0].legend(loc='upper right', fontsize=8)
+    axs[1,0].grid(True)
+
+    # Ventanas de los primeros segmentos, desplazadas en pasos de nperseg - solapamiento
+    axs[1,1].set_title("Segmentación: ventanas solapadas")
+    l_ventanas = [axs[1,1].plot([], [])[0] for _ in range(SEGMENTOS_ESQUEMA)]
+    axs[1,1].set_ylim(-0.1, 1.1)
+    axs[1,1].set_xlabel("Muestra")
+    axs[1,1].set_ylabel("w[n - k·paso]")
+    axs[1,1].grid(True)
+
+    # Sliders
+    axcolor = 'lightgoldenrodyellow'
+    ax_nperseg = plt.axes([0.2, 0.14, 0.3, 0.03], facecolor=axcolor)
+    ax_solap = plt.axes([0.2, 0.09, 0.3, 0.03], facecolor=axcolor)
+    ax_t = plt.axes([0.62, 0.14, 0.3, 0.03], facecolor=axcolor)
+    s_nperseg = Slider(ax_nperseg, 'log2(nperseg)', 6, 11, valinit=log2_nperseg_init, valstep=1)
+    s_solap = Slider(ax_solap, 'Solapamiento [%]', 0, 90, valinit=solapamiento_init, valstep=5)
+    s_t = Slider(ax_t, 'Tiempo recibido [s]', 1, duracion, valinit=t_init, valstep=1)
+
+    # Ventana
+    ax_ventana = plt.axes([0.02, 0.55, 0.11, 0.2], facecolor=axcolor)
+    radio_ventana = RadioButtons(ax_ventana, VENTANAS_CLASE, active=VENTANAS_CLASE.index("Hann"))
+    ax_ventana.set_title("Ventana", fontsize=10)
+
+    # Resolución y promedios de la estimación parcial
+    ax_info = plt.axes([0.62, 0.01, 0.22, 0.07])
+    ax_info.axis('off')
+    info_text = ax_info.text(0, 0.5, "", fontsize=9, va='center', family='monospace')
+
+    def texto_info(estimador, parcial, t_recibido):
+        enbw = metricas_ventana(estado["ventana"], estimador.nperseg, simetrica=False).enbw
+        segmentos = parcial.segmentos if parcial is not None else 0
+        return (f"nperseg = {estimador.nperseg}, paso = {estimador.paso}\n"
+                f"Resolución ENBW·fs/nperseg = {enbw * fs / estimador.nperseg:.2f} Hz\n"
+                f"t = {t_recibido} s: K = {segmentos} de {final.segmentos} promedios")
+
+    # Artistas actualizados en su lugar; solo se redibuja todo si cambian los límites
+    blit = GestorBlit(fig, [franja, l_welch, l_final, l_parcial, info_text] + l_ventanas,
+                      sliders=[s_nperseg, s_solap, s_t])
+
+    def mostrar(_=None):
+        # Estimación parcial tras el bloque que termina en t (sin recalcular nada)
+        t_recibido = int(s_t.val)
+        parcial = parciales[t_recibido - 1]
+        actualizar_franja(franja, 0, t_recibido)
+        if parcial is None:
+            # Aún no llega un segmento completo
+            l_parcial.set_data([], [])
+        else:
+            l_parcial.set_data(parcial.f, db(parcial.psd))
+        info_text.set_text(texto_info(estimador, parcial, t_recibido))
+        blit.actualizar()
+
+    def update(_=None):
+        nonlocal estimador, parciales, final
+        estimador, parciales = estimar(s_nperseg.val, s_solap.val)
+        final = parciales[-1]
+        actualizar_linea(l_welch, final.f, db(final.psd))
+        actualizar_linea(l_final, final.f, db(final.psd))
+        n = np.arange(estimador.nperseg)
+        for k, linea in enumerate(l_ventanas):
+            linea.set_data(n + k*estimador.paso, estimador.ventana)
+        axs[1,1].set_xlim(0, estimador.nperseg + (SEGMENTOS_ESQUEMA - 1)*estimador.paso)
+        mostrar()
+
+    s_nperseg.on_changed(update)
+    s_solap.on_changed(update)
+    s_t.on_changed(mostrar)
+
+    def cambiar_ventana(nombre):
+        estado["ventana"] = nombre
+        update()
+
+    radio_ventana.on_clicked(cambiar_ventana)
+
+    # Botón de reset
+    resetax = plt.axes([0.85, 0.02, 0.1, 0.04])
+    button = Button(resetax, 'Reset', color=axcolor, hovercolor='0.975')
+    def reset(_):
+        s_nperseg.reset()
+        s_solap.reset()
+        s_t.reset()
+    button.on_clicked(reset)
+
+    update()
+    plt.show()
+
+if __name__ == "__main__":
+    plot_psd()
@@ -0,0 +1,207 @@
+"""
+Paquete indexado de recursos del curso para Biomedical DSP
+
+Formato del archivo (little-endian):
+    cabecera fija  : magic (8 bytes) | versión (u32) | offset TOC (u64) | tamaño TOC (u64)
+    datos          : contenido de cada recurso, alineado a 8 bytes
+    tabla (TOC)    : JSON UTF-8 {"entries": {nombre: [offset, tamaño]}}
+
+El manifiesto del curso se guarda como el recurso "manifest.json". El lector usa mmap,
+de modo que los recursos se leen directamente del archivo sin extraerlos a disco. Por
+eso el paquete se distribuye junto al ejecutable y no dentro de él: lo que va dentro de
+un ejecutable onefile se extrae a una carpeta temporal en cada inicio.
+
+Uso para construir el paquete:
+    python asset_bundle.py [salida] [--sin-prerender]
+"""
+
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+BUNDLE_NAME = "course_assets.bdsp"
+MAGIC = b"BDSPBNDL"
+VERSION = 1
+HEADER = struct.Struct("<8sIQQ")
+ALIGNMENT = 8
+MANIFEST_ENTRY = "manifest.json"
+PRERENDER_ZOOM = 1.0
+
+
+class AssetBundle:
+    """Lector de un paquete de recursos mapeado en memoria"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        magic, version, toc_offset, toc_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path.name} no es un paquete de recursos válido")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Versión de paquete no soportada: {version}")
+
+        toc = json.loads(bytes(self._mmap[toc_offset:toc_offset + toc_length]).decode('utf-8'))
+        self._entries = {name: tuple(span) for name, span in toc["entries"].items()}
+        self._manifest = None
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def names(self):
+        """Nombres de todos los recursos del paquete"""
+        return list(self._entries)
+
+    def size(self, name):
+        """Tamaño en bytes de un recurso"""
+        return self._entries[name][1]
+
+    def read(self, name):
+        """Vista sin copia (memoryview) del contenido de un recurso"""
+        offset, length = self._entries[name]
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def read_bytes(self, name):
+        """Contenido de un recurso como bytes"""
+        offset, length = self._entries[name]
+        return self._mmap[offset:offset + length]
+
+    def read_text(self, name, encoding='utf-8'):
+        """Contenido de un recurso como texto"""
+        return self.read_bytes(name).decode(encoding)
+
+    @property
+    def manifest(self):
+        """Manifiesto del curso (unidades y archivos)"""
+        if self._manifest is None:
+            self._manifest = json.loads(self.read_text(MANIFEST_ENTRY))
+        return self._manifest
+
+    def prerendered_page(self, pdf_name):
+        """(zoom, bytes PNG) de la primera página pre-renderizada de un PDF, o None"""
+        info = self.manifest.get("prerendered", {}).get(pdf_name)
+        if not info or info["entry"] not in self:
+            return None
+        return info["zoom"], self.read_bytes(info["entry"])
+
+    def close(self):
+        """Cerrar el mapeo y el archivo"""
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Aún hay vistas exportadas (p. ej. documentos abiertos); se libera al recolectar
+            pass
+        self._file.close()
+
+
+def find_bundle(fallback_dir=None):
+    """
+    Ruta del paquete de recursos, o None si no existe. Se busca primero junto al
+    ejecutable (sys.executable) y después en fallback_dir (p. ej. sys._MEIPASS, para
+    ejecutables que lo llevan dentro)
+    """
+    candidates = [Path(sys.executable).resolve().parent / BUNDLE_NAME]
+    if fallback_dir is not None:
+        candidates.append(Path(fallback_dir) / BUNDLE_NAME)
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _render_first_page(pdf_path, zoom=PRERENDER_ZOOM):
+    """Renderizar la primera página de un PDF como PNG"""
+    import fitz  # PyMuPDF
+
+    with fitz.open(str(pdf_path)) as document:
+        if len(document) == 0:
+            return None
+        pix = document[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        return pix.tobytes("png")
+
+
+def build_bundle(base_dir, output_path=None, prerender=True):
+    """
+    Construir el paquete de recursos a partir de las carpetas "Unidad*" de base_dir.
+    Retorna la ruta del paquete creado
+    """
+    base_dir = Path(base_dir)
+    output_path = Path(output_path) if output_path else base_dir / BUNDLE_NAME
+
+    manifest = {"units": [], "prerendered": {}}
+    blobs = []  # (nombre, bytes)
+
+    for unit_dir in sorted(d for d in base_dir.iterdir() if d.is_dir() and d.name.startswith("Unidad")):
+        files = []
+        for file in sorted(unit_dir.rglob("*")):
+            if not file.is_file() or "__pycache__" in file.parts:
+                continue
+            name = file.relative_to(base_dir).as_posix()
+            files.append(name)
+            blobs.append((name, file.read_bytes()))
+
+            if prerender and file.suffix.lower() == ".pdf":
+                try:
+                    png = _render_first_page(file)
+                except Exception as e:
+                    print(f"⚠️ No se pudo pre-renderizar {name}: {e}")
+                    png = None
+                if png:
+                    entry = f"prerender/{name}.png"
+                    blobs.append((entry, png))
+                    manifest["prerendered"][name] = {"entry": entry, "zoom": PRERENDER_ZOOM}
+
+        manifest["units"].append({"name": unit_dir.name, "files": files})
+
+    blobs.append((MANIFEST_ENTRY, json.dumps(manifest, ensure_ascii=False).encode('utf-8')))
+
+    entries = {}
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        for name, data in blobs:
+            # Alinear cada recurso
+            padding = -out.tell() % ALIGNMENT
+            out.write(b"\0" * padding)
+            entries[name] = [out.tell(), len(data)]
+            out.write(data)
+
+        toc = json.dumps({"entries": entries}, ensure_ascii=False).encode('utf-8')
+        toc_offset = out.tell()
+        out.write(toc)
+
+        # Completar la cabecera con la ubicación de la tabla de contenidos
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, VERSION, toc_offset, len(toc)))
+
+    tmp_path.replace(output_path)
+    return output_path
+
+
+def main():
+    """Construir el paquete de recursos desde la línea de comandos"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    prerender = "--sin-prerender" not in sys.argv
+    base_dir = Path(__file__).parent
+    output = build_bundle(base_dir, args[0] if args else None, prerender=prerender)
+
+    bundle = AssetBundle(output)
+    total_files = sum(len(unit["files"]) for unit in bundle.manifest["units"])
+    print(f"✅ Paquete creado: {output.name}")
+    print(f"📦 {len(bundle.manifest['units'])} unidades, {total_files} archivos, "
+          f"{len(bundle.manifest['prerendered'])} páginas pre-renderizadas")
+    print(f"📊 Tamaño: {output.stat().st_size / (1024 * 1024):.1f} MB")
+    bundle.close()
+
+
+if __name__ == "__main__":
+    main()
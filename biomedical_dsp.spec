@@ -1,6 +1,7 @@
 # -*- mode: python ; coding: utf-8 -*-
 
 import os
+import sys
 from pathlib import Path
 
 # Obtener la ruta base
@@ -18,14 +19,27 @@ unit_folders = [
     "Unidad 05 Técnicas avanzadas"
 ]
 
-for folder in unit_folders:
-    folder_path = base_path / folder
-    if folder_path.exists():
-        # Agregar todos los archivos de la carpeta
-        for file in folder_path.rglob("*"):
-            if file.is_file():
-                rel_path = file.relative_to(base_path)
-                data_files.append((str(file), str(rel_path.parent)))
+# Empaquetar las unidades en un único paquete indexado (manifiesto, código, PDFs y
+# primeras páginas pre-renderizadas) que la aplicación lee por mmap sin extraer archivos.
+# El paquete no va en datas: en un ejecutable onefile se extraería a _MEIPASS en cada
+# inicio. Se copia junto al ejecutable al final de este archivo
+bundle_path = None
+try:
+    sys.path.insert(0, str(base_path))
+    from asset_bundle import build_bundle
+    bundle_path = build_bundle(base_path)
+    print(f"Paquete de recursos: {bundle_path.name}")
+except Exception as e:
+    # Fallback: agregar los archivos sueltos de cada unidad
+    print(f"No se pudo crear el paquete de recursos, usando archivos sueltos: {e}")
+    for folder in unit_folders:
+        folder_path = base_path / folder
+        if folder_path.exists():
+            # Agregar todos los archivos de la carpeta
+            for file in folder_path.rglob("*"):
+                if file.is_file():
+                    rel_path = file.relative_to(base_path)
+                    data_files.append((str(file), str(rel_path.parent)))
 
 # Agregar icono
 icon_path = base_path / "icon.ico"
@@ -62,7 +76,29 @@ a = Analysis(
         'warnings',
         'darkdetect',  # Nueva dependencia para detección de tema
         'scipy',       # Agregada en requirements
-        'typing'       # Para compatibilidad de tipos
+        'typing',      # Para compatibilidad de tipos
+        'dsp_core',    # Núcleos DSP compartidos por las clases
+        'dsp_core._bloques',
+        'dsp_core._cache',
+        'dsp_core.dtft',
+        'dsp_core.dft',
+        'dsp_core.ventanas',
+        'dsp_core.convolucion',
+        'dsp_core.reconstruccion',
+        'dsp_core.plano_z',
+        'dsp_core.streaming',
+        'dsp_core.lti',
+        'dsp_core.barrido',
+        'dsp_core.cuantizacion',
+        'dsp_core.espectro',
+        'dsp_core.artistas',
+        'dsp_core.respuesta_impulso',
+        'dsp_core.diseno',
+        'dsp_core.fir',
+        'dsp_core.iir',
+        'dsp_core.respuesta_frecuencia',
+        'dsp_core.psd',
+        'dsp_core.referencia'
     ],
     hookspath=[],
     hooksconfig={},
@@ -98,3 +134,9 @@ exe = EXE(
     entitlements_file=None,
     icon='icon.ico' if icon_path.exists() else None,
 )
+
+# Paquete de recursos junto al ejecutable (dist/course_assets.bdsp)
+if bundle_path is not None:
+    import shutil
+    shutil.copy2(bundle_path, Path(DISTPATH) / bundle_path.name)
+    print(f"Paquete de recursos copiado a {Path(DISTPATH) / bundle_path.name}")
@@ -62,8 +62,9 @@ echo.
 echo 5. Creando package de distribución...
 if not exist "distribution\" mkdir "distribution"
 
-REM Copiar ejecutable
+REM Copiar ejecutable y el paquete de recursos que lee junto a él
 copy "dist\Biomedical-DSP.exe" "distribution\" >nul
+if exist "dist\course_assets.bdsp" copy "dist\course_assets.bdsp" "distribution\" >nul
 
 REM Copiar archivos necesarios
 if exist "icon.ico" copy "icon.ico" "distribution\" >nul
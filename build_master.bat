@@ -72,6 +72,18 @@ if errorlevel 1 (
     echo ✅ Ejecutable creado exitosamente
 )
 
+echo.
+echo 📦 Paquete de recursos del curso (debe ir junto al ejecutable)...
+if not exist "dist\course_assets.bdsp" (
+    echo ❌ ERROR: No se generó dist\course_assets.bdsp; el ejecutable no tendría contenido del curso
+    pause
+    exit /b 1
+)
+if not exist "distribution" mkdir "distribution"
+copy "dist\Biomedical-DSP.exe" "distribution\" >nul
+copy "dist\course_assets.bdsp" "distribution\" >nul
+echo ✅ distribution\ contiene Biomedical-DSP.exe y course_assets.bdsp
+
 echo.
 echo 🎨 [PASO 4] Optimización y empaquetado...
 echo ========================================
@@ -122,6 +134,7 @@ echo 🎉 ¡Construcción exitosa!
 echo.
 echo 📁 Archivos generados:
 echo    • dist/Biomedical-DSP.exe          (Ejecutable principal)
+echo    • dist/course_assets.bdsp          (Contenido del curso, junto al .exe)
 echo    • distribution/                    (Paquete completo)
 echo    • Biomedical-DSP-Portable.zip     (Archivo para distribución)
 echo.
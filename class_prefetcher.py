@@ -0,0 +1,231 @@
+"""
+Precarga predictiva de clases para Biomedical DSP
+Mientras la aplicación está ociosa se prepara la clase siguiente (y opcionalmente la
+anterior): lectura del PDF y del código en un hilo de fondo, compilación del código y
+renderizado de la primera página en pequeños pasos del bucle de eventos
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+import fitz  # PyMuPDF
+
+
+class PrefetchTask:
+    """Trabajo de precarga cancelable para una clase"""
+
+    def __init__(self, key, pdf_path, py_path, zoom_for_page, generation):
+        self.key = key
+        self.pdf_path = pdf_path
+        self.py_path = py_path
+        self.zoom_for_page = zoom_for_page
+        self.generation = generation
+        self.cancelled = False
+
+        # Resultados
+        self.pdf_bytes = None
+        self.pdf_document = None
+        self.page_render = None  # (página, zoom, bytes PPM) de la primera página
+        self.code_content = None
+        self.code_mtime = None
+        self.compiled = None  # (clave, objeto código) listo para exec
+
+    def release(self):
+        """Liberar los recursos precargados"""
+        self.cancelled = True
+        if self.pdf_document is not None:
+            try:
+                self.pdf_document.close()
+            except Exception as e:
+                print(f"Error al cerrar documento precargado: {e}")
+            self.pdf_document = None
+        self.pdf_bytes = None
+        self.page_render = None
+
+
+class ClassPrefetcher:
+    """
+    Precargador de baja prioridad.
+
+    La lectura de archivos y la compilación se hacen en un único hilo de fondo que
+    cede el paso mientras is_busy() sea verdadero (p. ej. durante una ejecución).
+    PyMuPDF no es seguro entre hilos, así que abrir el documento y renderizar la
+    primera página se hace en el hilo de Tk, en pasos separados y solo cuando la
+    aplicación está ociosa. Cada nueva solicitud cancela las anteriores.
+    """
+
+    def __init__(self, root, compile_source, read_bytes=None, get_mtime=None, is_busy=None,
+                 idle_delay_ms=800, max_results=2):
+        self.root = root
+        self.compile_source = compile_source
+        self.read_bytes = read_bytes or self._read_file_bytes
+        self.get_mtime = get_mtime or self._file_mtime
+        self.is_busy = is_busy or (lambda: False)
+        self.idle_delay_ms = idle_delay_ms
+        self.max_results = max_results
+
+        self._generation = 0
+        self._after_id = None
+        self._lock = threading.Lock()
+        self._results = OrderedDict()  # clave -> PrefetchTask terminado
+        self._active = {}  # clave -> PrefetchTask en curso
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="ClassPrefetcher", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # API usada desde el hilo de Tk
+    # ------------------------------------------------------------------
+    def schedule(self, targets, zoom_for_page):
+        """
+        Programar la precarga de targets = [(clave, ruta_pdf, ruta_py), ...].
+        zoom_for_page(ancho, alto) calcula el zoom de ajuste para la primera página
+        """
+        self.cancel()
+        generation = self._generation
+        self._after_id = self.root.after(
+            self.idle_delay_ms, self._start, targets, zoom_for_page, generation
+        )
+
+    def cancel(self):
+        """Cancelar los trabajos pendientes (los resultados terminados se conservan)"""
+        self._generation += 1
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        with self._lock:
+            for task in self._active.values():
+                task.release()
+            self._active.clear()
+
+    def take(self, key):
+        """Retirar el resultado precargado de una clase (el llamador pasa a ser su dueño)"""
+        with self._lock:
+            return self._results.pop(key, None)
+
+    def shutdown(self):
+        """Cancelar todo y liberar los resultados"""
+        self.cancel()
+        with self._lock:
+            for task in self._results.values():
+                task.release()
+            self._results.clear()
+        self._queue.put(None)
+
+    # ------------------------------------------------------------------
+    # Flujo de trabajo
+    # ------------------------------------------------------------------
+    def _start(self, targets, zoom_for_page, generation):
+        """Encolar los trabajos una vez transcurrido el retardo ocioso"""
+        self._after_id = None
+        if generation != self._generation:
+            return
+
+        with self._lock:
+            for key, pdf_path, py_path in targets:
+                if key in self._results or key in self._active:
+                    continue
+                task = PrefetchTask(key, pdf_path, py_path, zoom_for_page, generation)
+                self._active[key] = task
+                self._queue.put(task)
+
+    def _worker(self):
+        """Hilo de fondo: leer archivos y compilar el código"""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+
+            try:
+                # Ceder el paso mientras la aplicación está ocupada
+                while self.is_busy() and not task.cancelled:
+                    time.sleep(0.2)
+                if task.cancelled:
+                    continue
+
+                if task.py_path:
+                    task.code_mtime = self.get_mtime(task.py_path)
+                    task.code_content = self.read_bytes(task.py_path).decode('utf-8')
+                    time.sleep(0)  # Ceder el GIL entre pasos
+                    if task.cancelled:
+                        continue
+                    task.compiled = self.compile_source(task.code_content, task.py_path)
+                    time.sleep(0)
+
+                if task.pdf_path and not task.cancelled:
+                    task.pdf_bytes = self.read_bytes(task.pdf_path)
+
+                if not task.cancelled:
+                    self.root.after(0, self._open_document, task)
+            except Exception as e:
+                print(f"Error en precarga de {task.key}: {e}")
+                self._discard(task)
+
+    def _open_document(self, task):
+        """Paso 1 en el hilo de Tk: abrir el PDF desde memoria"""
+        if task.cancelled:
+            return
+
+        if task.pdf_bytes is None:
+            self._finish(task)
+            return
+
+        try:
+            task.pdf_document = fitz.open(stream=task.pdf_bytes, filetype="pdf")
+            self.root.after_idle(self._render_first_page, task)
+        except Exception as e:
+            print(f"Error abriendo PDF precargado: {e}")
+            self._discard(task)
+
+    def _render_first_page(self, task):
+        """Paso 2 en el hilo de Tk: renderizar la primera página al zoom de ajuste"""
+        if task.cancelled:
+            return
+
+        try:
+            if len(task.pdf_document) > 0:
+                page = task.pdf_document[0]
+                zoom = task.zoom_for_page(page.rect.width, page.rect.height)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+                task.page_render = (0, zoom, pix.tobytes("ppm"))
+            self._finish(task)
+        except Exception as e:
+            print(f"Error renderizando página precargada: {e}")
+            self._discard(task)
+
+    def _finish(self, task):
+        """Publicar el resultado y respetar el máximo de resultados guardados"""
+        task.pdf_bytes = None
+        with self._lock:
+            if self._active.get(task.key) is task:
+                del self._active[task.key]
+            if task.cancelled:
+                return
+            self._results[task.key] = task
+            while len(self._results) > self.max_results:
+                _, old_task = self._results.popitem(last=False)
+                old_task.release()
+
+    def _discard(self, task):
+        """Descartar un trabajo fallido"""
+        with self._lock:
+            if self._active.get(task.key) is task:
+                del self._active[task.key]
+        task.release()
+
+    @staticmethod
+    def _file_mtime(path):
+        """Fecha de modificación de un archivo (None si no existe en disco)"""
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _read_file_bytes(path):
+        """Leer un archivo completo del disco"""
+        with open(path, 'rb') as file:
+            return file.read()
@@ -0,0 +1,68 @@
+"""
+dsp_core: núcleos de procesamiento digital de señales compartidos por las clases del curso
+
+Todas las funciones están vectorizadas con NumPy, tienen firmas estables y se
+verifican contra las implementaciones con bucles de dsp_core.referencia.
+Benchmarks: python -m dsp_core.benchmark
+"""
+
+from .dtft import calcular_dtft
+from .dft import matriz_dft, dft, idft
+from .ventanas import (ventana, aplicar_ventana, ventana_rect, ventana_hamming,
+                       ventana_hann, ventana_blackman, ventana_kaiser, ventana_tukey,
+                       ventana_flattop, ventana_dpss, metricas_ventana, MetricasVentana, VENTANAS)
+from .convolucion import convolucionar, convolucion_directa, convolucion_circular
+from .reconstruccion import interpolar_fft, interpolar_polifase, reconstruccion, reconstruir
+from .streaming import (FiltroFIRBloques, bloques_de, bloques_de_archivo, bloques_wav, formato_wav,
+                        filtrar_en_bloques)
+from .lti import SistemaLTI, filtrar
+from .plano_z import (transformada_z, log_transformada_z, respuesta_hz, malla_plano_z,
+                      superficie_hz, superficie_transformada_z)
+from .respuesta_impulso import (coeficientes, zpk_a_sos, respuesta_impulso, respuestas_impulso,
+                                expansion_residuos, respuesta_residuos, ExpansionResiduos)
+from .diseno import (disenar_filtro, disenar, disenar_banco, especificacion, DisenoFiltro,
+                     EspecFiltro, BancoFiltros)
+from .fir import (disenar_fir, estimar_kaiser, estimar_orden, beta_kaiser, desviaciones, respuesta_fir,
+                  metricas_fir, EstimacionKaiser, RespuestaFIR)
+from .iir import (disenar_bilineal, bilineal, predistorsion, frecuencia_digital, respuesta_analogica,
+                  seccion_segundo_orden, cascada, respuesta_sos, DisenoIIR, RespuestaIIR)
+from .respuesta_frecuencia import respuesta_frecuencia, rejilla_frecuencias, RespuestaFrecuencia
+from .psd import WelchBloques, welch, periodograma, EstimacionPSD
+from .barrido import TablaBarrido, rejilla
+from .cuantizacion import (codigos, cuantizar, recuantizar, error_rms, metricas_cuantizacion,
+                           MedidorCuantizacion, cuantizar_wav)
+from .espectro import AnalizadorEspectral, analizador
+from .artistas import GestorBlit, LienzoTk, actualizar_franja, actualizar_linea, actualizar_stem
+
+__all__ = [
+    "calcular_dtft",
+    "matriz_dft", "dft", "idft",
+    "ventana", "aplicar_ventana", "ventana_rect", "ventana_hamming",
+    "ventana_hann", "ventana_blackman", "ventana_kaiser", "ventana_tukey",
+    "ventana_flattop", "ventana_dpss", "metricas_ventana", "MetricasVentana", "VENTANAS",
+    "convolucionar", "convolucion_directa", "convolucion_circular",
+    "reconstruccion",
+    "reconstruir",
+    "interpolar_polifase",
+    "interpolar_fft",
+    "FiltroFIRBloques", "bloques_de", "bloques_de_archivo", "bloques_wav", "formato_wav",
+    "filtrar_en_bloques",
+    "SistemaLTI", "filtrar",
+    "transformada_z", "log_transformada_z", "respuesta_hz", "malla_plano_z",
+    "superficie_hz", "superficie_transformada_z",
+    "coeficientes", "zpk_a_sos", "respuesta_impulso", "respuestas_impulso",
+    "expansion_residuos", "respuesta_residuos", "ExpansionResiduos",
+    "disenar_filtro", "disenar", "disenar_banco", "especificacion", "DisenoFiltro",
+    "EspecFiltro", "BancoFiltros",
+    "disenar_fir", "estimar_kaiser", "estimar_orden", "beta_kaiser", "desviaciones", "respuesta_fir",
+    "metricas_fir", "EstimacionKaiser", "RespuestaFIR",
+    "disenar_bilineal", "bilineal", "predistorsion", "frecuencia_digital", "respuesta_analogica",
+    "seccion_segundo_orden", "cascada", "respuesta_sos", "DisenoIIR", "RespuestaIIR",
+    "respuesta_frecuencia", "rejilla_frecuencias", "RespuestaFrecuencia",
+    "WelchBloques", "welch", "periodograma", "EstimacionPSD",
+    "TablaBarrido", "rejilla",
+    "codigos", "cuantizar", "recuantizar", "error_rms", "metricas_cuantizacion",
+    "MedidorCuantizacion", "cuantizar_wav",
+    "AnalizadorEspectral", "analizador",
+    "GestorBlit", "LienzoTk", "actualizar_franja", "actualizar_linea", "actualizar_stem",
+]
@@ -0,0 +1,22 @@
+"""
+Utilidades internas para procesar arreglos grandes en bloques con memoria acotada
+"""
+
+# Memoria máxima por bloque intermedio (bytes)
+MEMORIA_MAXIMA_BYTES = 32 * 1024 * 1024
+
+
+def filas_por_bloque(ancho, itemsize=16, max_bytes=None):
+    """
+    Número de filas de un bloque (filas × ancho elementos de itemsize bytes)
+    que cabe en el presupuesto de memoria
+    """
+    max_bytes = MEMORIA_MAXIMA_BYTES if max_bytes is None else max_bytes
+    return max(1, int(max_bytes // (max(1, ancho) * itemsize)))
+
+
+def iterar_bloques(total, ancho, itemsize=16, max_bytes=None):
+    """Generar rebanadas consecutivas de [0, total) con memoria acotada por bloque"""
+    paso = filas_por_bloque(ancho, itemsize, max_bytes)
+    for inicio in range(0, total, paso):
+        yield slice(inicio, min(inicio + paso, total))
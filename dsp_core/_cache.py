@@ -0,0 +1,58 @@
+"""
+Caché LRU interna para resultados costosos (mallas, matrices) de dsp_core
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class CacheLRU:
+    """
+    Caché LRU con un número máximo de entradas.
+    Los arreglos guardados se marcan como de solo lectura para que ningún
+    llamador modifique por accidente un resultado compartido.
+    """
+
+    def __init__(self, max_entradas=16):
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener(self, clave, calcular):
+        """Retornar el valor guardado para clave, o calcularlo con calcular() y guardarlo"""
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return self._entradas[clave]
+
+        valor = calcular()
+        _solo_lectura(valor)
+
+        with self._lock:
+            self.fallos += 1
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+        return valor
+
+    def limpiar(self):
+        """Vaciar la caché"""
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+
+def _solo_lectura(valor):
+    """Marcar como no modificables los arreglos de un valor (o de una tupla de valores)"""
+    valores = valor if isinstance(valor, tuple) else (valor,)
+    for arreglo in valores:
+        if hasattr(arreglo, "setflags"):
+            arreglo.setflags(write=False)
@@ -0,0 +1,314 @@
+"""
+Actualización de gráficas interactivas sin recrear artistas
+
+Las clases con sliders redibujaban sus stems borrándolos y llamando otra vez a
+ax.stem en cada evento, y luego redibujaban la figura completa. Aquí:
+
+    actualizar_stem : cambia en su lugar los datos de un stem existente (segmentos de
+                      la LineCollection, marcadores y línea base), aunque cambie el
+                      número de muestras
+    actualizar_linea: lo mismo para una Line2D
+    actualizar_franja: mueve una franja vertical creada con ax.axvspan
+    GestorBlit      : redibuja solo los artistas registrados y solo en los ejes donde
+                      están, sobre un fondo guardado de cada eje (blitting). Si cambian
+                      los límites o la posición de alguno de esos ejes, o el lienzo no
+                      admite blitting, hace un redibujo completo. También mueve la barra,
+                      el tirador y el texto de los sliders registrados, a los que quita
+                      drawon (si no, Slider.set_val redibuja toda la figura en cada evento)
+    LienzoTk        : figura y lienzo persistentes de una pestaña de las interfaces Tkinter,
+                      con los eventos de los controles agrupados (debounce) y cierre explícito
+
+El módulo no importa matplotlib (LienzoTk lo importa al crearse): trabaja con los
+artistas que recibe.
+"""
+
+import numpy as np
+
+# Espera (ms) tras el último evento de un control antes de redibujar una pestaña Tkinter
+RETARDO_MS = 30
+
+
+def actualizar_stem(stem, x, y, reescalar=False):
+    """
+    Reemplazar los datos de un StemContainer (retornado por ax.stem, vertical) por
+    los puntos (x, y) sin crear artistas nuevos. Con reescalar=True los límites del
+    eje se ajustan a los datos nuevos (como al crear el stem). Retorna el mismo stem
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if x.shape != y.shape:
+        raise ValueError("x e y deben tener la misma longitud")
+    base = stem.baseline.get_ydata()[0] if len(stem.baseline.get_ydata()) else 0.0
+
+    # Segmento k: (x[k], base) → (x[k], y[k])
+    segmentos = np.empty((x.size, 2, 2))
+    segmentos[:, :, 0] = x[:, None]
+    segmentos[:, 0, 1] = base
+    segmentos[:, 1, 1] = y
+    stem.stemlines.set_segments(segmentos)
+    stem.markerline.set_data(x, y)
+    if x.size:
+        stem.baseline.set_data([x.min(), x.max()], [base, base])
+    if reescalar:
+        ejes = stem.markerline.axes
+        ejes.relim()
+        ejes.autoscale_view()
+    return stem
+
+
+def actualizar_linea(linea, x=None, y=None, reescalar=False):
+    """
+    Reemplazar los datos de una Line2D (x o y pueden omitirse si no cambian);
+    reescalar como en actualizar_stem
+    """
+    if x is None:
+        linea.set_ydata(y)
+    elif y is None:
+        linea.set_xdata(x)
+    else:
+        linea.set_data(x, y)
+    if reescalar:
+        linea.axes.relim()
+        linea.axes.autoscale_view()
+    return linea
+
+
+def actualizar_franja(franja, x0, x1):
+    """Mover una franja vertical (retornada por ax.axvspan) al intervalo [x0, x1]"""
+    if hasattr(franja, "set_width"):
+        # Rectangle (matplotlib ≥ 3.9)
+        franja.set_x(x0)
+        franja.set_width(x1 - x0)
+    else:
+        # Polygon de 4 o 5 vértices: (x0, y0), (x0, y1), (x1, y1), (x1, y0)[, (x0, y0)]
+        xy = np.array(franja.get_xy(), dtype=float)
+        xy[:, 0] = [x0, x0, x1, x1, x0][:len(xy)]
+        franja.set_xy(xy)
+    return franja
+
+
+class GestorBlit:
+    """
+    Redibujo por blitting de los artistas que cambian en cada evento de los sliders.
+
+    figura   : figura de matplotlib (con su lienzo ya creado)
+    artistas : artistas (Line2D, StemContainer, Text, ...) que se actualizan
+    sliders  : sliders (matplotlib.widgets.Slider) cuyos cambios llaman a actualizar()
+
+    Los artistas registrados se marcan como animados: el dibujo normal de la figura
+    los omite y queda guardado como fondo de cada eje; actualizar() restaura el fondo
+    de los ejes con artistas, dibuja solo esos artistas y copia esas regiones a la pantalla.
+    """
+
+    def __init__(self, figura, artistas=(), sliders=()):
+        self.figura = figura
+        self._artistas = []
+        self._fondos = {}
+        self._limites = {}
+        self._regiones = {}
+        self._sliders = {}
+        for artista in artistas:
+            self.agregar(artista)
+        for slider in sliders:
+            self.agregar_slider(slider)
+        self._conexion = self.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    @property
+    def canvas(self):
+        """Lienzo actual de la figura (cambia si la figura se inserta en otra interfaz)"""
+        return self.figura.canvas
+
+    def agregar(self, artista):
+        """Registrar un artista (o un contenedor, como el de ax.stem); retorna el artista"""
+        for parte in _partes(artista):
+            if parte.figure is not self.figura:
+                raise ValueError("El artista no pertenece a la figura del gestor")
+            parte.set_animated(True)
+            self._artistas.append(parte)
+        self._fondos.clear()
+        return artista
+
+    def agregar_slider(self, slider):
+        """
+        Registrar un slider: su barra (poly), su tirador y su texto de valor se
+        redibujan con los demás artistas en cada actualizar(). Se le quita drawon
+        para que set_val no pida un redibujo completo; retorna el slider
+        """
+        slider.drawon = False
+        self._sliders[slider.ax] = slider
+        # La línea del valor inicial no cambia, pero va encima de la barra
+        partes = [slider.poly, getattr(slider, "vline", None), getattr(slider, "hline", None),
+                  getattr(slider, "_handle", None), slider.valtext]
+        for parte in partes:
+            if parte is not None:
+                self.agregar(parte)
+        return slider
+
+    def actualizar(self, completo=False):
+        """
+        Mostrar los cambios de los artistas registrados. Con completo=True (p. ej. tras
+        cambiar artistas no registrados) se redibuja toda la figura
+        """
+        if completo or not self._puede_blit():
+            self.canvas.draw_idle()
+            return
+        for ejes, artistas in self._por_ejes().items():
+            self.canvas.restore_region(self._fondos[ejes])
+            for artista in artistas:
+                ejes.draw_artist(artista)
+            self.canvas.blit(self._regiones[ejes])
+        self.canvas.flush_events()
+
+    def desconectar(self):
+        """Dejar de seguir los redibujos de la figura y volver a dibujar los artistas normalmente"""
+        self.canvas.mpl_disconnect(self._conexion)
+        for artista in self._artistas:
+            artista.set_animated(False)
+        for slider in self._sliders.values():
+            slider.drawon = True
+        self._artistas.clear()
+        self._sliders.clear()
+        self._fondos.clear()
+        self.canvas.draw_idle()
+
+    def _puede_blit(self):
+        """Hay fondo guardado para cada eje y ningún eje cambió de límites desde entonces"""
+        if not getattr(self.canvas, "supports_blit", False):
+            return False
+        for ejes in self._por_ejes():
+            if ejes not in self._fondos or self._limites[ejes] != _limites(ejes):
+                return False
+        return True
+
+    def _por_ejes(self):
+        """Artistas registrados (y aún en la figura) agrupados por eje, en orden de zorder"""
+        grupos = {}
+        for artista in sorted(self._artistas, key=lambda artista: artista.get_zorder()):
+            if artista.axes is None:
+                continue
+            grupos.setdefault(artista.axes, []).append(artista)
+        return grupos
+
+    def _al_dibujar(self, _evento):
+        """Tras un dibujo completo: guardar el fondo de cada eje y dibujar encima los artistas"""
+        if not getattr(self.canvas, "supports_blit", False):
+            return
+        grupos = self._por_ejes()
+        self._regiones = {ejes: self._region(ejes) for ejes in grupos}
+        self._fondos = {ejes: self.canvas.copy_from_bbox(self._regiones[ejes]) for ejes in grupos}
+        self._limites = {ejes: _limites(ejes) for ejes in grupos}
+        for ejes, artistas in grupos.items():
+            for artista in artistas:
+                ejes.draw_artist(artista)
+
+    def _region(self, ejes):
+        """
+        Región de la pantalla que se guarda y se copia para un eje: su caja, o para
+        un slider la caja extendida hasta el borde de la figura del lado del texto
+        de valor (que queda fuera del eje y cambia de ancho)
+        """
+        slider = self._sliders.get(ejes)
+        if slider is None:
+            return ejes.bbox
+        from matplotlib.transforms import Bbox
+
+        caja, figura = ejes.bbox, self.figura.bbox
+        if slider.orientation == "vertical":
+            extendida = Bbox.from_extents(caja.x0, figura.y0, caja.x1, caja.y1)
+        else:
+            extendida = Bbox.from_extents(caja.x0, caja.y0, figura.x1, caja.y1)
+        texto = slider.valtext.get_window_extent(self.canvas.get_renderer())
+        return Bbox.intersection(Bbox.union([extendida, texto]), figura) or extendida
+
+
+class LienzoTk:
+    """
+    Figura persistente de una pestaña de una interfaz Tkinter.
+
+    contenedor : frame de Tkinter donde se inserta el lienzo
+    figsize    : tamaño de la figura (pulgadas)
+    actualizar : función sin argumentos que redibuja la pestaña (la que llama programar)
+    retardo_ms : espera tras el último evento antes de llamar a actualizar
+
+    La figura se crea sin pyplot (no queda en el registro global de figuras, que la
+    mantendría viva) y con un único FigureCanvasTkAgg para toda la vida de la pestaña.
+    preparar() construye los ejes y artistas solo la primera vez, o cuando cambia la
+    estructura de la gráfica; cada actualización cambia los datos de esos artistas y
+    llama a dibujar().
+    """
+
+    def __init__(self, contenedor, figsize=(12, 8), actualizar=None, retardo_ms=RETARDO_MS):
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.figura = Figure(figsize=figsize)
+        self.canvas = FigureCanvasTkAgg(self.figura, contenedor)
+        self.widget.pack(fill="both", expand=True)
+        self.actualizar = actualizar
+        self.retardo_ms = retardo_ms
+        self.artistas = None
+        self._clave = None
+        self._ajustar = False
+        self._pendiente = None
+
+    @property
+    def widget(self):
+        """Widget de Tkinter del lienzo"""
+        return self.canvas.get_tk_widget()
+
+    def preparar(self, construir, clave=None):
+        """
+        Artistas de la pestaña: construir(figura) se llama la primera vez y cada vez que
+        cambia la clave (p. ej. la propiedad mostrada), sobre la figura vacía; retorna
+        lo que retornó construir
+        """
+        if self.artistas is None or clave != self._clave:
+            self.figura.clear()
+            self.artistas = construir(self.figura)
+            self._clave = clave
+            self._ajustar = True
+        return self.artistas
+
+    def programar(self, *_evento):
+        """
+        Pedir una actualización (sirve como command o callback de los controles): los
+        eventos seguidos de un slider se agrupan y actualizar se llama una sola vez,
+        retardo_ms después del último
+        """
+        if self._pendiente is not None:
+            self.widget.after_cancel(self._pendiente)
+        self._pendiente = self.widget.after(self.retardo_ms, self._ejecutar)
+
+    def dibujar(self):
+        """Redibujar la figura cuando Tk esté libre (ajustando márgenes solo tras construirla)"""
+        if self._ajustar:
+            self.figura.tight_layout()
+            self._ajustar = False
+        self.canvas.draw_idle()
+
+    def cerrar(self):
+        """Cancelar la actualización pendiente y liberar la figura y el widget"""
+        if self._pendiente is not None:
+            self.widget.after_cancel(self._pendiente)
+            self._pendiente = None
+        self.figura.clear()
+        self.artistas = None
+        self.widget.destroy()
+
+    def _ejecutar(self):
+        """Llamar a actualizar (fin de la espera de programar)"""
+        self._pendiente = None
+        if self.actualizar is not None:
+            self.actualizar()
+
+
+def _partes(artista):
+    """Artistas individuales de un contenedor (o el propio artista)"""
+    if isinstance(artista, tuple):
+        return [parte for elemento in artista for parte in _partes(elemento)]
+    return [artista]
+
+
+def _limites(ejes):
+    """Límites visibles y posición de un eje"""
+    return tuple(ejes.viewLim.bounds) + tuple(ejes.bbox.bounds)
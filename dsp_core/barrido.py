@@ -0,0 +1,183 @@
+"""
+Tablas precalculadas de barridos de parámetros para las clases con sliders
+
+TablaBarrido evalúa una función de cálculo pura sobre toda la rejilla de valores de
+los sliders y guarda los resultados en un único arreglo (rejilla × salida), de modo
+que cada movimiento de un slider es una búsqueda en la tabla en lugar de un recálculo.
+
+Formas de evaluación:
+    vectorizada=True  : la función recibe cada parámetro como columna (P, 1) con los
+                        P puntos de la rejilla y retorna (P, ...) en una sola pasada
+                        con broadcasting (por bloques de memoria acotada)
+    vectorizada=False : la función se evalúa punto a punto con escalares, en un
+                        conjunto de procesos si procesos > 1 (la función debe poder
+                        serializarse con pickle, es decir, estar definida en un módulo)
+
+La tabla puede llenarse en segundo plano (calcular_en_segundo_plano) mientras la
+interfaz está inactiva; hasta que esté lista, buscar() evalúa el punto pedido.
+
+Los sliders no tienen que moverse por la rejilla: con tolerancia, buscar() solo usa la
+tabla si el valor pedido está a menos de tolerancia de un punto de la rejilla, y si no
+evalúa la función en el valor exacto (también fuera del rango de la rejilla).
+"""
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ._bloques import iterar_bloques
+
+# Tamaño máximo de una tabla (bytes)
+TABLA_MAXIMA_BYTES = 64 * 1024 * 1024
+
+# Memoria por bloque de la evaluación vectorizada: bloques pequeños, que caben en la
+# caché del procesador, son más rápidos que uno solo del tamaño de la tabla
+BLOQUE_EVALUACION_BYTES = 1024 * 1024
+
+
+class TablaBarrido:
+    """
+    Tabla de resultados de funcion(**parametros) sobre la rejilla de los ejes.
+
+    funcion     : función pura de los parámetros nombrados en ejes
+    ejes        : diccionario {nombre: valores} con los valores (1-D, crecientes) de cada slider
+    vectorizada : la función acepta columnas de parámetros (ver el docstring del módulo)
+    dtype       : tipo de la tabla (float32 por defecto para que sea compacta)
+    procesos    : procesos para la evaluación punto a punto (None o 1 = sin procesos)
+    max_bytes   : memoria por bloque de la evaluación vectorizada (None = BLOQUE_EVALUACION_BYTES)
+    tolerancia  : distancia máxima (en unidades de los ejes) al punto de la rejilla para usar
+                  la tabla; más lejos se evalúa el valor exacto (None = siempre el más cercano)
+    """
+
+    def __init__(self, funcion, ejes, vectorizada=True, dtype=np.float32, procesos=None,
+                 max_bytes=None, tolerancia=None):
+        if not ejes:
+            raise ValueError("Indique al menos un eje de parámetros")
+        self.funcion = funcion
+        self.nombres = tuple(ejes)
+        self.ejes = tuple(np.asarray(valores, dtype=float).ravel() for valores in ejes.values())
+        for nombre, valores in zip(self.nombres, self.ejes):
+            if valores.size == 0 or np.any(np.diff(valores) <= 0):
+                raise ValueError(f"Los valores del eje {nombre!r} deben ser crecientes y no vacíos")
+        self.forma_rejilla = tuple(valores.size for valores in self.ejes)
+        self.vectorizada = vectorizada
+        self.dtype = np.dtype(dtype)
+        self.procesos = procesos
+        self.max_bytes = BLOQUE_EVALUACION_BYTES if max_bytes is None else max_bytes
+        self.tolerancia = tolerancia
+
+        self.tabla = None
+        self._lock = threading.Lock()
+        self._hilo = None
+
+    @property
+    def lista(self):
+        """True cuando la tabla ya está calculada"""
+        return self.tabla is not None
+
+    def calcular(self):
+        """Calcular la tabla completa (si aún no lo está) y retornarla"""
+        with self._lock:
+            if self.tabla is None:
+                tabla = self._evaluar_rejilla()
+                tabla.setflags(write=False)
+                self.tabla = tabla
+        return self.tabla
+
+    def calcular_en_segundo_plano(self):
+        """Llenar la tabla en un hilo aparte; retorna la misma tabla para encadenar"""
+        if self._hilo is None and not self.lista:
+            self._hilo = threading.Thread(target=self.calcular, name="TablaBarrido", daemon=True)
+            self._hilo.start()
+        return self
+
+    def esperar(self, timeout=None):
+        """Esperar a que termine el cálculo en segundo plano"""
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+        return self.lista
+
+    def indices(self, **valores):
+        """Índices en la rejilla del punto más cercano a los valores dados"""
+        faltantes = set(self.nombres) - set(valores)
+        if faltantes:
+            raise ValueError(f"Faltan valores para los ejes: {sorted(faltantes)}")
+        return tuple(_mas_cercano(eje, valores[nombre]) for nombre, eje in zip(self.nombres, self.ejes))
+
+    def buscar(self, **valores):
+        """
+        Resultado para el punto de la rejilla más cercano a los valores dados.
+        Si la tabla aún no está lista, se evalúa la función en ese punto; si el punto
+        está a más de tolerancia de los valores, se evalúa en los valores exactos
+        """
+        indices = self.indices(**valores)
+        if self.tolerancia is not None and any(
+                abs(valores[nombre] - eje[i]) > self.tolerancia
+                for nombre, eje, i in zip(self.nombres, self.ejes, indices)):
+            return self._evaluar_punto({nombre: float(valores[nombre]) for nombre in self.nombres})
+        if self.tabla is not None:
+            return self.tabla[indices]
+        punto = {nombre: eje[i] for nombre, eje, i in zip(self.nombres, self.ejes, indices)}
+        return self._evaluar_punto(punto)
+
+    __call__ = buscar
+
+    def _evaluar_punto(self, punto):
+        """Evaluar la función en un único punto de la rejilla"""
+        if self.vectorizada:
+            columnas = {nombre: np.array([[valor]]) for nombre, valor in punto.items()}
+            return np.asarray(self.funcion(**columnas))[0].astype(self.dtype, copy=False)
+        return np.asarray(self.funcion(**punto)).astype(self.dtype, copy=False)
+
+    def _evaluar_rejilla(self):
+        """Evaluar la función en todos los puntos de la rejilla"""
+        mallas = np.meshgrid(*self.ejes, indexing='ij')
+        puntos = np.stack([malla.ravel() for malla in mallas], axis=1)
+        P = puntos.shape[0]
+
+        # La forma de la salida se obtiene del primer punto
+        primero = self._evaluar_punto(dict(zip(self.nombres, puntos[0])))
+        nbytes = P * max(primero.size, 1) * self.dtype.itemsize
+        if nbytes > TABLA_MAXIMA_BYTES:
+            raise ValueError(f"La tabla ocuparía {nbytes / 2**20:.0f} MB "
+                             f"(máximo {TABLA_MAXIMA_BYTES / 2**20:.0f} MB); use una rejilla más gruesa")
+        tabla = np.empty((P,) + primero.shape, dtype=self.dtype)
+
+        if self.vectorizada:
+            # Se reserva espacio para unos pocos temporales float64 por elemento de salida
+            for bloque in iterar_bloques(P, max(primero.size, 1), itemsize=8 * 4, max_bytes=self.max_bytes):
+                columnas = {nombre: puntos[bloque, i:i + 1] for i, nombre in enumerate(self.nombres)}
+                tabla[bloque] = self.funcion(**columnas)
+        elif self.procesos and self.procesos > 1 and P > 1:
+            lotes = np.array_split(puntos, self.procesos * 4)
+            with ProcessPoolExecutor(self.procesos) as ejecutor:
+                resultados = ejecutor.map(_evaluar_lote, [self.funcion] * len(lotes),
+                                          [self.nombres] * len(lotes), lotes)
+                inicio = 0
+                for resultado in resultados:
+                    tabla[inicio:inicio + len(resultado)] = resultado
+                    inicio += len(resultado)
+        else:
+            tabla[:] = _evaluar_lote(self.funcion, self.nombres, puntos)
+
+        return tabla.reshape(self.forma_rejilla + primero.shape)
+
+
+def rejilla(minimo, maximo, paso):
+    """Valores minimo, minimo + paso, ... ≤ maximo (los de un Slider con valstep=paso)"""
+    cantidad = int(np.floor((maximo - minimo) / paso + 1e-9)) + 1
+    return minimo + paso * np.arange(cantidad)
+
+
+def _mas_cercano(eje, valor):
+    """Índice del valor de eje (creciente) más cercano a valor"""
+    i = int(np.clip(np.searchsorted(eje, valor), 1, max(eje.size - 1, 1)))
+    if eje.size == 1:
+        return 0
+    return i - 1 if valor - eje[i - 1] <= eje[i] - valor else i
+
+
+def _evaluar_lote(funcion, nombres, puntos):
+    """Evaluar funcion punto a punto sobre las filas de puntos (usado también por los procesos)"""
+    return np.array([np.asarray(funcion(**dict(zip(nombres, fila)))) for fila in puntos])
@@ -0,0 +1,438 @@
+"""
+Benchmarks de los núcleos de dsp_core frente a las implementaciones con bucles
+
+Uso:
+    python -m dsp_core.benchmark [núcleo ...]
+    python -m dsp_core.benchmark cruces     (cruces entre métodos de convolución)
+"""
+
+import timeit
+
+import numpy as np
+
+from . import referencia
+from .artistas import GestorBlit, actualizar_stem
+from .barrido import TablaBarrido, rejilla
+from .cuantizacion import cuantizar
+from .convolucion import convolucion_circular, convolucion_directa, convolucionar, elegir_metodo
+from .diseno import disenar_filtro
+from .dft import _construir_matriz, dft, matriz_dft
+from .dtft import calcular_dtft
+from .espectro import AnalizadorEspectral
+from .fir import PUNTOS_RESPUESTA, disenar_fir, respuesta_fir
+from .iir import disenar_bilineal, respuesta_sos
+from .psd import welch
+from .plano_z import malla_plano_z, respuesta_hz, transformada_z
+from .lti import SistemaLTI, filtrar
+from .respuesta_frecuencia import rejilla_frecuencias, respuesta_frecuencia
+from .respuesta_impulso import coeficientes, respuesta_impulso
+from .reconstruccion import _sinc_banda, reconstruccion, reconstruir
+from .streaming import filtrar_en_bloques
+from .ventanas import ventana
+
+# Registro de benchmarks: nombre -> función que retorna (caso, t_referencia, t_núcleo)
+BENCHMARKS = {}
+
+
+def benchmark(nombre):
+    """Decorador para registrar un benchmark"""
+    def registrar(funcion):
+        BENCHMARKS[nombre] = funcion
+        return funcion
+    return registrar
+
+
+def medir(funcion, repeticiones=3):
+    """Mejor tiempo (s) de varias ejecuciones de funcion()"""
+    return min(timeit.repeat(funcion, number=1, repeat=repeticiones))
+
+
+@benchmark("calcular_dtft")
+def bench_dtft():
+    x = np.random.default_rng(0).standard_normal(512)
+    omega = np.linspace(-np.pi, np.pi, 2048)
+    return ("N=512, M=2048",
+            medir(lambda: referencia.calcular_dtft_bucle(x, omega)),
+            medir(lambda: calcular_dtft(x, omega)))
+
+
+@benchmark("calcular_dtft_czt")
+def bench_dtft_czt():
+    x = np.random.default_rng(3).standard_normal(4096)
+    omega = np.linspace(0.2, 0.4, 1024)
+    return ("N=4096, sub-banda M=1024",
+            medir(lambda: referencia.calcular_dtft_bucle(x, omega), 1),
+            medir(lambda: calcular_dtft(x, omega)))
+
+
+@benchmark("calcular_dtft_directo")
+def bench_dtft_directo():
+    rng = np.random.default_rng(4)
+    x = rng.standard_normal(1024)
+    omega = np.sort(rng.uniform(-np.pi, np.pi, 1024))
+    return ("N=1024, rejilla no uniforme",
+            medir(lambda: referencia.calcular_dtft_bucle(x, omega), 1),
+            medir(lambda: calcular_dtft(x, omega)))
+
+
+@benchmark("matriz_dft")
+def bench_matriz_dft():
+    return ("N=128 (caché)",
+            medir(lambda: referencia.matriz_dft_bucle(128)),
+            medir(lambda: matriz_dft(128)))
+
+
+@benchmark("dft")
+def bench_dft():
+    # Línea base: reconstruir la matriz en cada llamada (sin bucles) y multiplicar
+    x = np.random.default_rng(6).standard_normal(2048)
+    return ("N=2048, W·x vs auto (FFT)",
+            medir(lambda: _construir_matriz(x.size) @ x, 1),
+            medir(lambda: dft(x)))
+
+
+@benchmark("ventanas")
+def bench_ventanas():
+    tipos = ("rectangular", "hamming", "hann", "blackman")
+    return ("4 tipos × L=20..400",
+            medir(lambda: [referencia.ventana_formula(t, L) for t in tipos for L in range(20, 401)]),
+            medir(lambda: [ventana(t, L) for t in tipos for L in range(20, 401)]))
+
+
+@benchmark("convolucion_directa")
+def bench_convolucion_directa():
+    rng = np.random.default_rng(1)
+    x, h = rng.standard_normal(2000), rng.standard_normal(64)
+    return ("L=2000, M=64",
+            medir(lambda: referencia.convolucion_directa_bucle(x, h), 1),
+            medir(lambda: convolucion_directa(x, h)))
+
+
+@benchmark("convolucion_ecg")
+def bench_convolucion_ecg():
+    # 10 minutos de ECG a 500 Hz filtrados con un FIR de 1001 coeficientes
+    rng = np.random.default_rng(7)
+    x, h = rng.standard_normal(300000), rng.standard_normal(1001)
+    return ("ECG 300k, FIR 1001 (directo)",
+            medir(lambda: np.convolve(x, h), 1),
+            medir(lambda: convolucionar(x, h)))
+
+
+@benchmark("fir_bloques")
+def bench_fir_bloques():
+    # Línea base: convolución de una sola vez con toda la señal en memoria
+    rng = np.random.default_rng(9)
+    x, h = rng.standard_normal(2_000_000), rng.standard_normal(101)
+    return ("2M muestras, bloques de 64k",
+            medir(lambda: np.convolve(x, h)[:x.size], 1),
+            medir(lambda: [y for y in filtrar_en_bloques(h, x)], 1))
+
+
+@benchmark("ecuacion_diferencias")
+def bench_ecuacion_diferencias():
+    x = np.random.default_rng(10).standard_normal(20000)
+    b, a = [0.2, 0.3, 0.2], [1.0, -0.5, 0.25]
+    return ("N=20000, orden 2",
+            medir(lambda: referencia.ecuacion_diferencias_bucle(b, a, x), 1),
+            medir(lambda: filtrar(x, b=b, a=a)))
+
+
+@benchmark("lti_eeg")
+def bench_lti_eeg():
+    # 64 canales a 1 kHz en bloques de 100 ms; línea base: bucle por muestra medido
+    # en 4 canales y escalado a 64
+    rng = np.random.default_rng(11)
+    eeg = rng.standard_normal((64, 10000)).astype(np.float32)
+    b, a = [0.2, 0.3, 0.2], [1.0, -0.5, 0.25]
+
+    def procesar_bloques():
+        sistema = SistemaLTI(b=b, a=a, canales=64, dtype=np.float32)
+        for inicio in range(0, eeg.shape[1], 100):
+            sistema.procesar(eeg[:, inicio:inicio + 100])
+        sistema.cerrar()
+
+    return ("EEG 64 canales × 10 s",
+            medir(lambda: [referencia.ecuacion_diferencias_bucle(b, a, c) for c in eeg[:4]], 1) * 16,
+            medir(procesar_bloques))
+
+
+@benchmark("convolucion_circular")
+def bench_convolucion_circular():
+    rng = np.random.default_rng(2)
+    x, h = rng.standard_normal(256), rng.standard_normal(256)
+    return ("N=256",
+            medir(lambda: referencia.convolucion_circular_bucle(x, h), 1),
+            medir(lambda: convolucion_circular(x, h)))
+
+
+@benchmark("reconstruccion")
+def bench_reconstruccion():
+    fs = 30
+    n = np.arange(0, 2, 1 / fs)
+    xn = np.cos(2 * np.pi * 2 * n)
+    t = np.linspace(-1, 2, 2000)
+    h = lambda t, fs: np.sinc(fs * t)
+    return ("60 muestras → 2000 puntos",
+            medir(lambda: referencia.reconstruccion_bucle(xn, n, t, h, fs)),
+            medir(lambda: reconstruccion(xn, n, t, h, fs)))
+
+
+@benchmark("reconstruccion_sinc")
+def bench_reconstruccion_sinc():
+    # Línea base: sinc truncada evaluada punto a punto (forma de banda) en la malla 10× más densa
+    xn = np.random.default_rng(13).standard_normal(100000)
+    u = np.arange(10 * xn.size) / 10
+    return ("100k muestras → malla 10×, semiancho 32",
+            medir(lambda: _sinc_banda(xn, u, 32, "hann"), 1),
+            medir(lambda: reconstruir(xn, u, 1.0, semiancho=32), 1))
+
+
+@benchmark("tabla_barrido")
+def bench_tabla_barrido():
+    # Réplicas del espectro muestreado (Clase 03) sobre la rejilla de dos sliders
+    f_axis = np.linspace(-50, 50, 2000)
+
+    def espectro(f0, fs):
+        return sum(np.exp(-((f_axis - f0 - m * fs) / 0.1) ** 2) for m in range(-5, 6))
+
+    # Línea base: recalcular en cada movimiento del slider; núcleo: búsqueda en la tabla
+    # (la tabla completa se llena una vez, en segundo plano, en ~0.7 s)
+    tabla = TablaBarrido(espectro, {"f0": rejilla(0.5, 20, 0.5), "fs": rejilla(5, 40, 0.5)})
+    tabla.calcular()
+    return ("por movimiento, rejilla 40×71",
+            medir(lambda: espectro(7.5, 20.0)),
+            medir(lambda: tabla.buscar(f0=7.5, fs=20.0)))
+
+
+@benchmark("cuantizacion")
+def bench_cuantizacion():
+    # Línea base: la fórmula de la Clase 06 evaluada una vez por profundidad
+    x = 5 * np.sin(2 * np.pi * 0.01234 * np.arange(1_000_000))
+    bits = np.arange(2, 21)
+
+    def por_profundidad():
+        for B in bits:
+            Q = 10 / 2**B
+            np.clip(np.round(x / Q) * Q, -5, 5 - Q)
+
+    return ("1M muestras, B = 2..20",
+            medir(por_profundidad, 1),
+            medir(lambda: cuantizar(x, 10, bits), 1))
+
+
+@benchmark("espectro_ventanas")
+def bench_espectro_ventanas():
+    # Línea base: calc_fft de la Clase 11, una fft compleja por ventana
+    x = np.cos(2 * np.pi * 0.1 * np.arange(64))
+    tipos = ("rectangular", "hamming", "hann", "blackman")
+    ventaneadas = [x * ventana(t, x.size) for t in tipos]
+    w = np.fft.fftfreq(2048)
+
+    def por_ventana():
+        for xw in ventaneadas:
+            np.abs(np.fft.fft(xw, 2048)[(w >= 0) & (w <= 0.5)])
+
+    analizador = AnalizadorEspectral(2048)
+    return ("4 ventanas, L=64, Nfft=2048",
+            medir(por_ventana),
+            medir(lambda: (analizador.analizar(x, tipos), analizador.magnitud())))
+
+
+@benchmark("artistas_stem")
+def bench_artistas_stem():
+    # Línea base: el slider redibuja la figura y el stem se borra y se crea de nuevo
+    # (Clase 02 antes); ambos casos se manejan con Slider.set_val, como en las clases
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.widgets import Slider
+
+    n = np.arange(24)
+    figuras = []
+    for _ in range(2):
+        fig = Figure(figsize=(12, 7))
+        FigureCanvasAgg(fig)
+        axs = fig.subplots(2, 2)
+        fig.subplots_adjust(bottom=0.2)
+        for ax in axs.flat:
+            ax.plot(np.linspace(0, 1, 1000))
+        slider = Slider(fig.add_axes([0.15, 0.05, 0.7, 0.03]), "f", 0.5, 2, valinit=1)
+        figuras.append((fig, axs[0, 0], [axs[0, 0].stem(n, np.cos(n), basefmt=" ")], slider))
+
+    fig, ax, stem, slider = figuras[0]
+
+    def recrear(f):
+        for artista in stem[0]:
+            artista.remove()
+        stem[0] = ax.stem(n, np.cos(f * n), basefmt=" ")
+
+    slider.on_changed(recrear)
+    fig.canvas.draw()
+
+    fig_b, _, stem_b, slider_b = figuras[1]
+    blit = GestorBlit(fig_b, stem_b, sliders=[slider_b])
+    slider_b.on_changed(lambda f: (actualizar_stem(stem_b[0], n, np.cos(f * n)), blit.actualizar()))
+    fig_b.canvas.draw()
+    dibujos = []
+    fig_b.canvas.mpl_connect("draw_event", dibujos.append)
+    valores = iter(np.tile([0.8, 1.2], 1000))
+    t_blit = medir(lambda: slider_b.set_val(next(valores)))
+    if dibujos:
+        raise RuntimeError(f"GestorBlit hizo {len(dibujos)} redibujos completos")
+    return ("stem de 24 muestras, figura 2×2, Slider.set_val",
+            medir(lambda: slider.set_val(next(valores))),
+            t_blit)
+
+
+@benchmark("transformada_z")
+def bench_transformada_z():
+    x = np.random.default_rng(5).standard_normal(32)
+    _, _, Z = malla_plano_z((-2, 2, -2, 2), (100, 100))
+    return ("N=32, malla 100×100",
+            medir(lambda: referencia.transformada_z_bucle(x, Z), 1),
+            medir(lambda: transformada_z(x, Z)))
+
+
+@benchmark("superficie_hz")
+def bench_superficie_hz():
+    polos = 0.9 * np.exp(1j * np.array([0.5, -0.5]))
+    ceros = np.array([-1.0, 1.0])
+    _, _, Z = malla_plano_z((-1.5, 1.5, -1.5, 1.5), (400, 400))
+    return ("2 polos, 2 ceros, 400×400",
+            medir(lambda: referencia.superficie_hz_bucle(Z, polos, ceros), 1),
+            medir(lambda: respuesta_hz(Z, ceros, polos)))
+
+
+@benchmark("respuesta_impulso")
+def bench_respuesta_impulso():
+    polos = 0.95 * np.exp(1j * np.array([0.3, -0.3, 0.9, -0.9, 1.6, -1.6, 2.4, -2.4]))
+    ceros = np.exp(1j * np.array([1.2, -1.2, 2.0, -2.0, np.pi, np.pi, 0.0, 0.0]))
+    b, a = coeficientes(ceros, polos)
+    impulso = np.zeros(4096)
+    impulso[0] = 1.0
+    return ("8 polos, N=4096 (SOS)",
+            medir(lambda: referencia.ecuacion_diferencias_bucle(b, a, impulso), 1),
+            medir(lambda: respuesta_impulso(ceros, polos, N=4096)))
+
+
+@benchmark("diseno_filtros")
+def bench_diseno_filtros():
+    # Línea base: rediseñar con scipy en cada evento, como hacían los sliders
+    from scipy import signal
+    cortes = np.arange(200, 3010, 10)
+    disenar_filtro("butter", "Pasa Bajas", cortes[0], 6, fs=8000)
+    return ("Butterworth 6, 282 cortes",
+            medir(lambda: [signal.butter(6, fc, fs=8000, output="sos") for fc in cortes]),
+            medir(lambda: [disenar_filtro("butter", "Pasa Bajas", fc, 6, fs=8000) for fc in cortes]))
+
+
+@benchmark("respuesta_fir")
+def bench_respuesta_fir():
+    # Línea base: sumar Σ h[n]·e^{-jωn} para cada frecuencia de la rejilla
+    filtro = disenar_fir("Pasa Bajas", 300, 2000, fs=2000, ventana="kaiser", atenuacion_db=80)
+    omega = np.linspace(0, np.pi, PUNTOS_RESPUESTA)
+    return ("FIR L=2001, 4097 frecuencias",
+            medir(lambda: referencia.calcular_dtft_bucle(filtro.b, omega), 1),
+            medir(lambda: respuesta_fir(filtro, fs=2000)))
+
+
+@benchmark("respuesta_sos")
+def bench_respuesta_sos():
+    # Línea base: sosfreqz y group_delay de scipy, filtro por filtro y sección por sección
+    from scipy import signal
+    disenos = [disenar_bilineal("Pasa Bajas", fc, 20, fs=1000, familia="ellip", rp=0.5, rs=60)
+               for fc in np.linspace(50, 400, 32)]
+    sos = np.stack([d.sos for d in disenos])
+    f = np.linspace(0, 499, 1024)
+
+    def por_filtro():
+        for d in disenos:
+            signal.sosfreqz(d.sos, worN=f, fs=1000)
+            sum(signal.group_delay((s[:3], s[3:]), w=f, fs=1000)[1] for s in d.sos)
+
+    return ("32 elípticos orden 20, 1024 f",
+            medir(por_filtro, 1),
+            medir(lambda: respuesta_sos(sos, f, fs=1000)))
+
+
+
+@benchmark("respuesta_frecuencia")
+def bench_respuesta_frecuencia():
+    # Línea base: freqz y group_delay de scipy filtro por filtro, como en cada evento de un slider
+    from scipy import signal
+    cortes = np.linspace(0.05, 0.45, 64)
+    n = np.arange(255) - 127
+    b = 2 * cortes[:, None] * np.sinc(2 * cortes[:, None] * n) * np.hamming(255)
+    f = rejilla_frecuencias(2049, fs=2.0)
+
+    def por_filtro():
+        for h in b:
+            signal.freqz(h, worN=f, fs=2.0)
+            signal.group_delay((h, 1), w=f, fs=2.0)
+
+    return ("64 FIR L=255, 2049 f",
+            medir(por_filtro, 1),
+            medir(lambda: respuesta_frecuencia(b, f=f, fs=2.0)))
+
+
+@benchmark("welch")
+def bench_welch():
+    # Línea base: scipy.signal.welch con el registro completo en memoria (segmenta todo a la vez)
+    from scipy import signal
+    x = np.random.default_rng(19).standard_normal((8, 250 * 600))
+    return ("8 canales, 10 min a 250 Hz",
+            medir(lambda: signal.welch(x, fs=250, nperseg=1024)),
+            medir(lambda: welch(x, fs=250, nperseg=1024)))
+
+def cruces_convolucion(longitudes_x=(1000, 30000, 300000),
+                       longitudes_h=(8, 32, 128, 256, 512, 1024, 4096)):
+    """
+    Medir cada método de convolución para varias longitudes e imprimir el más rápido
+    junto al elegido por el modelo de costos (documenta los puntos de cruce)
+    """
+    metodos = ("directo", "fft", "ola", "ols")
+    rng = np.random.default_rng(8)
+    print("⏱️ Cruces entre métodos de convolución [ms]")
+    print("=" * 80)
+    print(f"{'Lx':>8}{'Lh':>6}" + "".join(f"{m:>10}" for m in metodos) + f"{'Medido':>12}{'Modelo':>10}")
+    print("-" * 80)
+    filas = []
+    for Lx in longitudes_x:
+        x = rng.standard_normal(Lx)
+        for Lh in longitudes_h:
+            if Lh > Lx:
+                continue
+            h = rng.standard_normal(Lh)
+            tiempos = {m: medir(lambda: convolucionar(x, h, metodo=m)) for m in metodos}
+            medido = min(tiempos, key=tiempos.get)
+            modelo = elegir_metodo(Lx, Lh)
+            filas.append((Lx, Lh, tiempos, medido, modelo))
+            print(f"{Lx:>8}{Lh:>6}" + "".join(f"{tiempos[m] * 1e3:>10.3f}" for m in metodos)
+                  + f"{medido:>12}{modelo:>10}")
+    print("=" * 80)
+    return filas
+
+
+def ejecutar(nombres=None):
+    """Ejecutar los benchmarks indicados (todos por defecto) e imprimir la tabla"""
+    print("⏱️ Benchmarks de dsp_core")
+    print("=" * 80)
+    print(f"{'Núcleo':<24}{'Caso':<28}{'Bucle [ms]':>10}{'Núcleo [ms]':>12}{'×':>6}")
+    print("-" * 80)
+    resultados = {}
+    for nombre, funcion in BENCHMARKS.items():
+        if nombres and nombre not in nombres:
+            continue
+        caso, t_ref, t_nucleo = funcion()
+        resultados[nombre] = (caso, t_ref, t_nucleo)
+        print(f"{nombre:<24}{caso:<28}{t_ref * 1e3:>10.2f}{t_nucleo * 1e3:>12.3f}"
+              f"{t_ref / max(t_nucleo, 1e-12):>6.0f}")
+    print("=" * 80)
+    return resultados
+
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:] == ["cruces"]:
+        cruces_convolucion()
+    else:
+        ejecutar(sys.argv[1:] or None)
@@ -0,0 +1,262 @@
+"""
+Convolución lineal, "same" y circular con selección automática del método
+
+Métodos disponibles:
+    "directo" : suma directa (np.convolve), O(Lx·Lh)
+    "fft"     : una FFT de la longitud completa Lx + Lh - 1
+    "ola"     : overlap-add por bloques, todas las FFT de bloque en un solo lote
+    "ols"     : overlap-save por bloques, procesado en grupos de memoria acotada
+
+El modo "auto" elige el método con menor costo estimado (modelo_costos) entre los
+que caben en el presupuesto de memoria. Los métodos FFT completo y overlap-add
+mantienen en memoria espectros de toda la señal; overlap-save solo los de un grupo
+de bloques, por lo que es el que se usa con señales muy largas.
+Los puntos de cruce entre métodos se documentan con: python -m dsp_core.benchmark cruces
+"""
+
+import numpy as np
+
+from ._bloques import MEMORIA_MAXIMA_BYTES
+
+MODOS = ("lineal", "same", "circular")
+METODOS = ("auto", "directo", "fft", "ola", "ols")
+
+# Constantes del modelo de costos (ns), calibradas con NumPy en un equipo de escritorio
+COSTO_MAC = 0.15         # multiplicación-acumulación de np.convolve
+COSTO_FFT = 1.2          # por N·log2(N) de una FFT real aislada
+COSTO_FFT_LOTE = 1.1     # por N·log2(N) de cada FFT dentro de un lote
+COSTO_COPIA = 1.0        # por muestra copiada, rellenada o sumada
+COSTO_FIJO_FFT = 20e3    # sobrecarga fija de preparar las FFT
+
+
+def convolucionar(x, h, modo="lineal", metodo="auto", N=None, max_bytes=None):
+    """
+    Convolución de x con h.
+
+    modo     : "lineal" (longitud Lx + Lh - 1), "same" (longitud max(Lx, Lh), centrada
+               como np.convolve) o "circular" (N puntos, por defecto max(Lx, Lh))
+    metodo   : "auto", "directo", "fft", "ola" u "ols"
+    N        : número de puntos de la convolución circular
+    max_bytes: presupuesto de memoria para los métodos por FFT (None = valor por defecto)
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de convolución desconocido: {modo!r}")
+    if metodo not in METODOS:
+        raise ValueError(f"Método de convolución desconocido: {metodo!r}")
+
+    x = _como_arreglo(x)
+    h = _como_arreglo(h)
+    if x.size == 0 or h.size == 0:
+        raise ValueError("x y h deben tener al menos una muestra")
+
+    if modo == "circular":
+        return _convolucion_circular(x, h, N, metodo, max_bytes)
+
+    y = _convolucion_lineal(x, h, metodo, max_bytes)
+    if modo == "same":
+        inicio = (min(x.size, h.size) - 1) // 2
+        y = y[inicio:inicio + max(x.size, h.size)]
+    return y
+
+
+def convolucion_directa(x, h):
+    """
+    Convolución lineal y[n] = Σ h[m]·x[n-m], de longitud len(x) + len(h) - 1
+    """
+    return convolucionar(x, h, modo="lineal")
+
+
+def convolucion_circular(x, h, N=None):
+    """
+    Convolución circular de N = max(len(x), len(h)) puntos (o N indicado)
+    """
+    return convolucionar(x, h, modo="circular", N=N)
+
+
+def modelo_costos(Lx, Lh, max_bytes=None):
+    """
+    Costo estimado (ns) de cada método para una convolución lineal de Lx y Lh muestras.
+    Los métodos que no caben en el presupuesto de memoria tienen costo inf.
+    """
+    max_bytes = MEMORIA_MAXIMA_BYTES if max_bytes is None else max_bytes
+    Lx, Lh = max(Lx, Lh), min(Lx, Lh)
+    Ly = Lx + Lh - 1
+
+    costos = {"directo": COSTO_MAC * Lx * Lh}
+
+    # FFT completa: dos transformadas directas y una inversa de longitud L
+    L = longitud_rapida(Ly)
+    costos["fft"] = COSTO_FIJO_FFT + 3 * COSTO_FFT * L * np.log2(max(L, 2))
+    if 3 * 16 * L > max_bytes:
+        costos["fft"] = np.inf
+
+    # Bloques: FFT directa e inversa por bloque más el relleno y las sumas/descartes
+    Nfft = tamano_bloque(Lx, Lh)
+    paso = Nfft - Lh + 1
+    bloques = -(-Lx // paso)
+    por_bloque = 2 * COSTO_FFT_LOTE * Nfft * np.log2(Nfft)
+    costos["ola"] = COSTO_FIJO_FFT + bloques * (por_bloque + COSTO_COPIA * (Nfft + Lh))
+    costos["ols"] = COSTO_FIJO_FFT + bloques * (por_bloque + COSTO_COPIA * 2 * Nfft)
+    if 2 * 16 * bloques * Nfft > max_bytes:
+        costos["ola"] = np.inf
+
+    return costos
+
+
+def elegir_metodo(Lx, Lh, max_bytes=None):
+    """Método de menor costo estimado para una convolución lineal de Lx y Lh muestras"""
+    costos = modelo_costos(Lx, Lh, max_bytes)
+    return min(costos, key=costos.get)
+
+
+def longitud_rapida(n):
+    """Menor longitud ≥ n de la forma 2^a·3^b·5^c (FFT eficiente)"""
+    n = max(int(n), 1)
+    mejor = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < mejor:
+        p35 = p5
+        while p35 < mejor:
+            # Completar con la menor potencia de 2 que alcance n
+            candidato = p35
+            while candidato < n:
+                candidato *= 2
+            mejor = min(mejor, candidato)
+            p35 *= 3
+        p5 *= 5
+    return mejor
+
+
+def tamano_bloque(Lx, Lh):
+    """
+    Tamaño de FFT por bloque (potencia de 2) que minimiza el costo por muestra de salida,
+    con al menos 2·Lh para que el solapamiento sea menor que el paso
+    """
+    Lx, Lh = max(Lx, Lh), min(Lx, Lh)
+    minimo = 1 << int(np.ceil(np.log2(max(2 * Lh, 8))))
+    maximo = max(minimo, 1 << int(np.ceil(np.log2(Lx + Lh - 1))))
+
+    mejor, mejor_costo = minimo, np.inf
+    Nfft = minimo
+    while Nfft <= maximo:
+        costo = Nfft * np.log2(Nfft) / (Nfft - Lh + 1)
+        if costo < mejor_costo:
+            mejor, mejor_costo = Nfft, costo
+        Nfft *= 2
+    return mejor
+
+
+def _como_arreglo(v):
+    """Convertir a arreglo 1-D real (float) o complejo"""
+    v = np.asarray(v)
+    return v.astype(complex if np.iscomplexobj(v) else float, copy=False).ravel()
+
+
+def _convolucion_lineal(x, h, metodo, max_bytes):
+    """Convolución lineal completa con el método indicado (o el elegido por el modelo)"""
+    if metodo == "auto":
+        metodo = elegir_metodo(x.size, h.size, max_bytes)
+
+    if metodo == "directo":
+        return np.convolve(x, h)
+
+    # Los métodos por bloques recorren la señal larga con el núcleo corto
+    if x.size < h.size:
+        x, h = h, x
+
+    if metodo == "fft":
+        return _lineal_fft(x, h)
+    if metodo == "ola":
+        return _overlap_add(x, h, tamano_bloque(x.size, h.size))
+    return _overlap_save(x, h, tamano_bloque(x.size, h.size), max_bytes)
+
+
+def _convolucion_circular(x, h, N, metodo, max_bytes):
+    """Convolución circular de N puntos: FFT de N puntos o plegado de la lineal"""
+    N = max(x.size, h.size) if N is None else int(N)
+    if N < 1:
+        raise ValueError("N debe ser positivo")
+
+    if metodo == "auto":
+        costo_fft = COSTO_FIJO_FFT + 3 * COSTO_FFT * N * np.log2(max(N, 2))
+        metodo = "fft" if costo_fft < COSTO_MAC * x.size * h.size else "directo"
+
+    if metodo == "fft":
+        # Plegar las entradas módulo N y multiplicar espectros de N puntos
+        xn, hn = _plegar(x, N), _plegar(h, N)
+        if np.iscomplexobj(xn) or np.iscomplexobj(hn):
+            return np.fft.ifft(np.fft.fft(xn) * np.fft.fft(hn))
+        return np.fft.irfft(np.fft.rfft(xn) * np.fft.rfft(hn), N)
+
+    # Plegar la convolución lineal módulo N
+    return _plegar(_convolucion_lineal(x, h, metodo, max_bytes), N)
+
+
+def _plegar(v, N):
+    """Sumar las muestras de v cuyo índice coincide módulo N"""
+    relleno = -v.size % N
+    if relleno:
+        v = np.concatenate([v, np.zeros(relleno, dtype=v.dtype)])
+    return v.reshape(-1, N).sum(axis=0)
+
+
+def _transformadas(es_complejo):
+    """(fft, ifft(X, n)) reales o complejas según los datos"""
+    if es_complejo:
+        return np.fft.fft, lambda X, n, axis=-1: np.fft.ifft(X, n, axis=axis)
+    return np.fft.rfft, lambda X, n, axis=-1: np.fft.irfft(X, n, axis=axis)
+
+
+def _lineal_fft(x, h):
+    """Convolución lineal con una única FFT de longitud rápida ≥ Lx + Lh - 1"""
+    Ly = x.size + h.size - 1
+    L = longitud_rapida(Ly)
+    fft, ifft = _transformadas(np.iscomplexobj(x) or np.iscomplexobj(h))
+    return ifft(fft(x, L) * fft(h, L), L)[:Ly]
+
+
+def _overlap_add(x, h, Nfft):
+    """Overlap-add: bloques de paso Nfft - Lh + 1 transformados en un solo lote"""
+    Lx, Lh = x.size, h.size
+    paso = Nfft - Lh + 1
+    bloques = -(-Lx // paso)
+    fft, ifft = _transformadas(np.iscomplexobj(x) or np.iscomplexobj(h))
+
+    x_bloques = np.zeros((bloques, paso), dtype=x.dtype)
+    x_bloques.ravel()[:Lx] = x
+    Y = ifft(fft(x_bloques, Nfft, axis=-1) * fft(h, Nfft), Nfft, axis=-1)
+
+    # Sumar la cola de cada bloque (Lh - 1 < paso muestras) al comienzo del siguiente
+    cola = Lh - 1
+    y = np.empty(bloques * paso + cola, dtype=Y.dtype)
+    cuerpo = y[:bloques * paso].reshape(bloques, paso)
+    cuerpo[:] = Y[:, :paso]
+    if cola:
+        cuerpo[1:, :cola] += Y[:-1, paso:]
+        y[bloques * paso:] = Y[-1, paso:]
+    return y[:Lx + Lh - 1]
+
+
+def _overlap_save(x, h, Nfft, max_bytes=None):
+    """Overlap-save: tramas solapadas en Lh - 1 muestras, en grupos de memoria acotada"""
+    max_bytes = MEMORIA_MAXIMA_BYTES if max_bytes is None else max_bytes
+    Lx, Lh = x.size, h.size
+    Ly = Lx + Lh - 1
+    paso = Nfft - Lh + 1
+    bloques = -(-Ly // paso)
+    fft, ifft = _transformadas(np.iscomplexobj(x) or np.iscomplexobj(h))
+    H = fft(h, Nfft)
+
+    # Señal con Lh - 1 ceros al inicio y relleno hasta completar la última trama
+    xp = np.zeros((bloques - 1) * paso + Nfft, dtype=x.dtype)
+    xp[Lh - 1:Lh - 1 + Lx] = x
+    tramas = np.lib.stride_tricks.sliding_window_view(xp, Nfft)[::paso]
+
+    y = np.empty(bloques * paso, dtype=np.result_type(x, h))
+    por_grupo = max(1, int(max_bytes // (3 * 16 * Nfft)))
+    for inicio in range(0, bloques, por_grupo):
+        fin = min(inicio + por_grupo, bloques)
+        Y = ifft(fft(tramas[inicio:fin], axis=-1) * H, Nfft, axis=-1)
+        # Descartar las primeras Lh - 1 muestras de cada trama (afectadas por el solapamiento)
+        y[inicio * paso:fin * paso] = Y[:, Lh - 1:].ravel()
+    return y[:Ly]
@@ -0,0 +1,208 @@
+"""
+Cuantización uniforme en el dominio entero, para varias profundidades de bits a la vez
+
+Una señal real en el rango R se lleva una sola vez a enteros finos de
+max(B) + BITS_GUARDA bits (x/R·2^k es exacto en punto flotante); el código de cada
+profundidad B se obtiene con desplazamientos enteros, por lo que todas las
+profundidades de un barrido salen del mismo arreglo sin volver a dividir. Como
+⌊(⌊v·2^s⌋ + 2^(s-1))/2^s⌋ = ⌊v + 1/2⌋, el resultado es el mismo que redondear x/Q. Con señales que ya son enteras (p. ej. archivos
+WAV de 16 bits) la recuantización es puramente entera.
+
+Modos:
+    "redondeo"     : código más cercano (como np.round(x/Q), empates hacia arriba)
+    "truncamiento" : piso de x/Q
+    "dither"       : redondeo tras sumar dither triangular (TPDF) de ±1 LSB de salida
+
+Los códigos de B bits están en [-2^(B-1), 2^(B-1) - 1] y el valor cuantizado es código·Q,
+con Q = R/2^B.
+"""
+
+import numpy as np
+
+from ._bloques import iterar_bloques
+from .streaming import TAMANO_BLOQUE, bloques_wav, formato_wav
+
+MODOS = ("redondeo", "truncamiento", "dither")
+
+# Bits de la representación entera intermedia por debajo del LSB de la mayor profundidad
+# (resolución del dither); con max(B) + BITS_GUARDA ≤ 28 los enteros caben en int32
+BITS_GUARDA = 8
+
+# Profundidades máximas aceptadas
+BITS_MAXIMOS = 32
+
+# Las señales se procesan en tramos cuyos códigos (todas las profundidades) ocupan
+# como mucho esto, para que los enteros intermedios queden en caché
+BLOQUE_BYTES = 1024 * 1024
+
+
+def codigos(x, R, B, modo="redondeo", rng=None):
+    """
+    Códigos enteros de B bits de la señal real x en el rango R (de -R/2 a R/2).
+    B puede ser un entero o un arreglo de profundidades: el resultado tiene entonces
+    forma (len(B),) + x.shape
+    """
+    x = np.asarray(x, dtype=float)
+    B, escalar = _profundidades(B)
+    c = np.empty((B.size, x.size), dtype=np.int32)
+    for bloque in iterar_bloques(x.size, B.size, itemsize=4, max_bytes=BLOQUE_BYTES):
+        c[:, bloque] = _codigos_tramo(x.ravel()[bloque], R, B, modo, rng)
+    c = c.reshape((B.size,) + x.shape)
+    return c[0] if escalar else c
+
+
+def cuantizar(x, R, B, modo="redondeo", rng=None):
+    """
+    Señal cuantizada con B bits en el rango R (mismo resultado que
+    clip(round(x/Q)·Q, -R/2, R/2 - Q) en modo "redondeo").
+    B puede ser un arreglo de profundidades (una fila por profundidad)
+    """
+    x = np.asarray(x, dtype=float)
+    B_arr, escalar = _profundidades(B)
+    Q = (R / 2.0 ** B_arr)[:, None]
+    xq = np.empty((B_arr.size, x.size))
+    for bloque in iterar_bloques(x.size, B_arr.size, itemsize=4, max_bytes=BLOQUE_BYTES):
+        np.multiply(_codigos_tramo(x.ravel()[bloque], R, B_arr, modo, rng), Q, out=xq[:, bloque])
+    xq = xq.reshape((B_arr.size,) + x.shape)
+    return xq[0] if escalar else xq
+
+
+def recuantizar(c, bits_entrada, B, modo="redondeo", rng=None):
+    """
+    Recuantizar códigos enteros de bits_entrada bits (p. ej. muestras int16) a B bits
+    sin pasar por punto flotante. Para B ≥ bits_entrada los códigos no cambian.
+    B puede ser un arreglo de profundidades (una fila por profundidad)
+    """
+    c = np.asarray(c)
+    if not np.issubdtype(c.dtype, np.integer):
+        raise ValueError("recuantizar espera códigos enteros")
+    B, escalar = _profundidades(B)
+    desplazamiento = np.maximum(int(bits_entrada) - B, 0)
+    q = _saturar(_reducir(c.astype(np.int64), desplazamiento, modo, rng), np.minimum(B, bits_entrada))
+    return q[0] if escalar else q
+
+
+def error_rms(R, B):
+    """Error RMS teórico del cuantizador: Q/√12, con Q = R/2^B"""
+    return R / 2.0 ** np.asarray(B) / np.sqrt(12)
+
+
+def metricas_cuantizacion(x, R, B, modo="redondeo", rng=None):
+    """
+    SNR (dB) y error RMS medidos al cuantizar x con cada profundidad de B.
+    Retorna (snr_db, error_rms) con la forma de B
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    error = cuantizar(x, R, np.atleast_1d(B), modo, rng) - x
+    potencia_error = np.mean(error ** 2, axis=-1)
+    with np.errstate(divide='ignore'):
+        snr = 10 * np.log10(np.mean(x ** 2) / potencia_error)
+    forma = np.shape(B)
+    return snr.reshape(forma), np.sqrt(potencia_error).reshape(forma)
+
+
+class MedidorCuantizacion:
+    """
+    Acumulador de SNR y error RMS de la recuantización de una señal entera que se
+    recibe por bloques (p. ej. un WAV leído con streaming.bloques_wav). Las sumas de
+    potencia se llevan con enteros exactos; el error RMS está en LSB de la entrada.
+    """
+
+    def __init__(self, bits, bits_entrada=16, modo="redondeo", rng=None):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de cuantización desconocido: {modo!r}")
+        self.bits, _ = _profundidades(bits)
+        self.bits_entrada = int(bits_entrada)
+        self.modo = modo
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Descartar lo acumulado"""
+        self.muestras = 0
+        self.potencia_senal = 0
+        self.potencia_error = [0] * self.bits.size
+
+    def procesar(self, bloque):
+        """Acumular las potencias de señal y de error de un bloque de códigos enteros"""
+        c = np.asarray(bloque).ravel().astype(np.int64)
+        q = recuantizar(c, self.bits_entrada, self.bits, self.modo, self.rng)
+        desplazamiento = np.maximum(self.bits_entrada - self.bits, 0)[:, None]
+        error = (q << desplazamiento) - c
+        self.muestras += c.size
+        self.potencia_senal += int(np.dot(c, c))
+        for i, fila in enumerate(error):
+            self.potencia_error[i] += int(np.dot(fila, fila))
+        return q
+
+    @property
+    def snr_db(self):
+        """SNR medida (dB) para cada profundidad (inf si no hay error)"""
+        potencia_error = np.array(self.potencia_error, dtype=float)
+        with np.errstate(divide='ignore'):
+            return 10 * np.log10(float(self.potencia_senal) / potencia_error)
+
+    @property
+    def error_rms(self):
+        """Error RMS medido, en LSB de la entrada, para cada profundidad"""
+        return np.sqrt(np.array(self.potencia_error, dtype=float) / max(self.muestras, 1))
+
+
+def cuantizar_wav(ruta, bits=range(2, 17), modo="redondeo", tamano_bloque=None, rng=None):
+    """
+    Medir la recuantización de un archivo WAV entero leyéndolo por bloques,
+    sin convertirlo a punto flotante. Retorna el MedidorCuantizacion con los resultados
+    """
+    formato = formato_wav(ruta)
+    medidor = MedidorCuantizacion(bits, 8 * formato.sampwidth, modo, rng)
+    for bloque in bloques_wav(ruta, tamano_bloque or TAMANO_BLOQUE):
+        medidor.procesar(bloque)
+    return medidor
+
+
+def _profundidades(B):
+    """Arreglo 1-D de profundidades válidas y si B era un escalar"""
+    escalar = np.ndim(B) == 0
+    B = np.atleast_1d(np.asarray(B)).astype(np.int64)
+    if B.ndim != 1 or np.any(B < 1) or np.any(B > BITS_MAXIMOS):
+        raise ValueError(f"Las profundidades deben ser enteros entre 1 y {BITS_MAXIMOS}")
+    return B, escalar
+
+
+def _codigos_tramo(x, R, B, modo, rng):
+    """Códigos (profundidades × muestras) de un tramo 1-D de la señal real"""
+    k = int(B.max()) + BITS_GUARDA
+    dtype = np.int32 if k <= 28 else np.int64
+    # Fuera de [-R/2, R/2) el código se satura igual, así que recortar antes evita desbordes
+    finos = np.floor(np.clip(x / R, -1.0, 1.0) * 2.0 ** k).astype(dtype)
+    return _saturar(_reducir(finos, k - B, modo, rng), B)
+
+
+def _reducir(c, desplazamiento, modo, rng):
+    """
+    Quitar 'desplazamiento' bits a los enteros c (un desplazamiento por profundidad):
+    resultado de forma (profundidades,) + c.shape
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo de cuantización desconocido: {modo!r}")
+    s = np.asarray(desplazamiento).astype(c.dtype).reshape((-1,) + (1,) * c.ndim)
+    mitad = np.where(s > 0, np.left_shift(1, np.maximum(s - 1, 0)), 0).astype(c.dtype)
+
+    if modo == "truncamiento":
+        return c >> s
+
+    r = c + mitad
+    if modo == "dither":
+        # Dither TPDF: diferencia de dos uniformes enteras en [0, 2^s), es decir ±1 LSB de salida
+        rng = np.random.default_rng() if rng is None else rng
+        paso = np.broadcast_to(np.left_shift(1, s), r.shape)
+        r += rng.integers(0, paso, dtype=c.dtype)
+        r -= rng.integers(0, paso, dtype=c.dtype)
+    return np.right_shift(r, s, out=r)
+
+
+def _saturar(c, B):
+    """Recortar los códigos al intervalo de B bits [-2^(B-1), 2^(B-1) - 1]"""
+    limite = np.left_shift(1, np.asarray(B) - 1).astype(c.dtype).reshape((-1,) + (1,) * (c.ndim - 1))
+    np.minimum(c, limite - 1, out=c)
+    return np.maximum(c, -limite, out=c)
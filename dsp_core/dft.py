@@ -0,0 +1,77 @@
+"""
+Transformada discreta de Fourier (DFT) en forma matricial
+
+La matriz W se construye con una sola operación de arreglos y se guarda en una caché
+LRU por N (de solo lectura). La forma matricial X = W·x se mantiene para los ejemplos
+de clase; a partir de UMBRAL_FFT puntos dft/idft usan la FFT, que da el mismo resultado
+en O(N log N).
+"""
+
+import numpy as np
+
+from ._cache import CacheLRU
+
+# Desde este N la DFT se calcula con FFT en modo "auto"
+UMBRAL_FFT = 64
+
+# Las matrices más grandes que esto (bytes) no se guardan en caché
+MATRIZ_MAXIMA_CACHE_BYTES = 64 * 1024 * 1024
+
+METODOS = ("auto", "matriz", "fft")
+
+_matrices = CacheLRU(max_entradas=8)
+
+
+def matriz_dft(N):
+    """
+    Matriz DFT de N puntos: W[k, n] = e^{-j2πkn/N}.
+    El producto k·n se reduce módulo N para conservar la precisión con N grande.
+    La matriz retornada es de solo lectura (se comparte desde la caché).
+    """
+    N = int(N)
+    if N * N * 16 > MATRIZ_MAXIMA_CACHE_BYTES:
+        return _construir_matriz(N)
+    return _matrices.obtener(N, lambda: _construir_matriz(N))
+
+
+def dft(x, metodo="auto"):
+    """
+    DFT de x a lo largo del último eje.
+    metodo: "matriz" (X = W·x), "fft" o "auto" (FFT desde UMBRAL_FFT puntos)
+    """
+    x = np.asarray(x)
+    if _usar_fft(x.shape[-1], metodo):
+        return np.fft.fft(x)
+    return x @ matriz_dft(x.shape[-1]).T
+
+
+def idft(X, metodo="auto"):
+    """
+    DFT inversa a lo largo del último eje.
+    metodo: "matriz" (x = (1/N)·W*·X), "fft" o "auto" (FFT desde UMBRAL_FFT puntos)
+    """
+    X = np.asarray(X)
+    N = X.shape[-1]
+    if _usar_fft(N, metodo):
+        return np.fft.ifft(X)
+    return X @ np.conj(matriz_dft(N)).T / N
+
+
+def limpiar_cache():
+    """Vaciar la caché de matrices DFT"""
+    _matrices.limpiar()
+
+
+def _construir_matriz(N):
+    """Construir W de N puntos sin bucles de Python"""
+    k = np.arange(N)
+    return np.exp(-2j * np.pi * (np.outer(k, k) % N) / N)
+
+
+def _usar_fft(N, metodo):
+    """Decidir si se usa la FFT para una DFT de N puntos"""
+    if metodo not in METODOS:
+        raise ValueError(f"Método de DFT desconocido: {metodo!r}")
+    if metodo == "auto":
+        return N >= UMBRAL_FFT
+    return metodo == "fft"
@@ -0,0 +1,228 @@
+"""
+Diseño de filtros digitales con caché por especificación
+
+disenar_filtro reúne los diseños usados en el curso:
+    FIR por ventanas ("fir", con cualquier ventana de dsp_core.ventanas) y de Kaiser
+    ("kaiser", con el orden y β obtenidos de la atenuación y la transición)
+    IIR Butterworth, Chebyshev I y II, elíptico y Bessel
+en formas pasa bajas, pasa altas, pasa banda y rechaza banda.
+
+Los IIR se entregan siempre como secciones de segundo orden (SOS) calculadas desde los
+polos y ceros del diseño, sin pasar por (b, a): con órdenes altos los coeficientes del
+polinomio completo pierden precisión y el filtro puede volverse inestable. Los FIR se
+entregan como coeficientes (no tienen realimentación, y pasarlos a SOS exigiría hallar
+las raíces de un polinomio de orden alto).
+
+Cada especificación se reduce a una clave canónica (EspecFiltro, con las frecuencias
+normalizadas a Nyquist y solo los parámetros que usa la familia), de modo que pedir el
+mismo filtro con otra fs o con parámetros irrelevantes reutiliza el diseño guardado.
+Los arreglos guardados son de solo lectura; scipy.signal.sosfilt no los acepta, así que
+se filtra con DisenoFiltro.filtrar o dsp_core.filtrar (o con una copia de sos).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import signal
+
+from ._cache import CacheLRU
+from .lti import filtrar
+from .ventanas import _TIPOS, _canonico
+
+# Los diseños ocupan poco: caben los de un barrido completo de un slider
+_disenos = CacheLRU(max_entradas=1024)
+
+EspecFiltro = namedtuple("EspecFiltro", "familia tipo orden corte parametros")
+EspecFiltro.__doc__ = """
+Especificación canónica de un diseño (clave de la caché):
+    familia    : "fir", "kaiser", "butter", "cheby1", "cheby2", "ellip" o "bessel"
+    tipo       : "lowpass", "highpass", "bandpass" o "bandstop"
+    orden      : orden del filtro (número de coeficientes - 1 en los FIR)
+    corte      : frecuencias de corte normalizadas a Nyquist (tupla de 1 o 2 valores)
+    parametros : parámetros propios de la familia (ventana, β, rizado, atenuación)
+"""
+
+# Nombres aceptados (sin distinguir mayúsculas) para cada familia y cada tipo
+FAMILIAS = {
+    "fir": "fir", "ventana": "fir",
+    "kaiser": "kaiser",
+    "butter": "butter", "butterworth": "butter",
+    "cheby1": "cheby1", "chebyshev i": "cheby1", "chebyshev 1": "cheby1",
+    "cheby2": "cheby2", "chebyshev ii": "cheby2", "chebyshev 2": "cheby2",
+    "ellip": "ellip", "eliptico": "ellip", "elíptico": "ellip",
+    "bessel": "bessel",
+}
+
+TIPOS = {
+    "pasa bajas": "lowpass", "lowpass": "lowpass", "low": "lowpass",
+    "pasa altas": "highpass", "highpass": "highpass", "high": "highpass",
+    "pasa banda": "bandpass", "bandpass": "bandpass",
+    "rechaza banda": "bandstop", "bandstop": "bandstop",
+}
+
+# Familias FIR (el resto son IIR)
+_FIR = ("fir", "kaiser")
+
+# Nombre de cada ventana de dsp_core.ventanas para scipy.signal.get_window
+_VENTANAS_SCIPY = {
+    "rectangular": "boxcar", "hamming": "hamming", "hann": "hann", "blackman": "blackman",
+    "kaiser": "kaiser", "tukey": "tukey", "flattop": "flattop", "dpss": "dpss",
+}
+
+
+class DisenoFiltro(namedtuple("DisenoFiltro", "espec sos b zpk")):
+    """
+    Filtro diseñado:
+        espec : EspecFiltro del diseño
+        sos   : secciones de segundo orden (IIR), o None
+        b     : coeficientes (FIR), o None
+        zpk   : (ceros, polos, ganancia) del diseño IIR, o None
+    """
+
+    __slots__ = ()
+
+    @property
+    def es_fir(self):
+        """True si el filtro es FIR"""
+        return self.b is not None
+
+    def filtrar(self, x):
+        """Filtrar x (muestras, o canales × muestras) desde el reposo"""
+        if self.es_fir:
+            return filtrar(x, b=self.b)
+        return filtrar(x, sos=self.sos)
+
+
+BancoFiltros = namedtuple("BancoFiltros", "disenos coeficientes")
+BancoFiltros.__doc__ = """
+Banco de filtros de un mismo diseño con distintas frecuencias de corte:
+    disenos      : lista de DisenoFiltro
+    coeficientes : SOS apiladas (filtros × secciones × 6) o coeficientes FIR apilados
+                   (filtros × coeficientes)
+"""
+
+
+def especificacion(familia, tipo, corte, orden=None, fs=2.0, ventana="hamming", parametro_ventana=None,
+                   rp=1.0, rs=40.0, atenuacion=60.0, transicion=None):
+    """
+    Clave canónica (EspecFiltro) de un diseño; lanza ValueError si no es válido.
+
+    familia    : ver FAMILIAS
+    tipo       : "Pasa Bajas", "Pasa Altas", "Pasa Banda", "Rechaza Banda" (o los nombres de scipy)
+    corte      : frecuencia de corte, o (f1, f2) para pasa banda y rechaza banda, en las unidades de fs
+    orden      : orden del filtro (en "kaiser" puede omitirse si se indica transicion)
+    ventana    : ventana de los FIR "fir" (nombre de dsp_core.ventanas)
+    parametro_ventana : β (Kaiser), alpha (Tukey) o NW (DPSS) de esa ventana; None = por defecto
+    rp, rs     : rizado en la banda de paso y atenuación en la de rechazo (dB) de los IIR
+    atenuacion : atenuación (dB) del diseño de Kaiser
+    transicion : ancho de la banda de transición del diseño de Kaiser, en las unidades de fs
+    """
+    familia_canonica = FAMILIAS.get(str(familia).lower())
+    if familia_canonica is None:
+        raise ValueError(f"Familia de filtro desconocida: {familia!r}")
+    tipo_canonico = TIPOS.get(str(tipo).lower())
+    if tipo_canonico is None:
+        raise ValueError(f"Tipo de filtro desconocido: {tipo!r}")
+
+    corte = tuple(float(f) / (fs / 2) for f in np.atleast_1d(corte))
+    bandas = 2 if tipo_canonico in ("bandpass", "bandstop") else 1
+    if len(corte) != bandas:
+        raise ValueError(f"El tipo {tipo!r} requiere {bandas} frecuencia(s) de corte")
+    if not all(0 < f < 1 for f in corte) or (bandas == 2 and corte[0] >= corte[1]):
+        raise ValueError("Las frecuencias de corte deben ser crecientes y estar entre 0 y fs/2")
+    corte = tuple(round(f, 12) for f in corte)
+
+    if familia_canonica == "fir":
+        nombre = _canonico(ventana)
+        if nombre not in _VENTANAS_SCIPY:
+            raise ValueError(f"La ventana {ventana!r} no sirve para diseñar FIR")
+        parametro = _TIPOS[nombre][1]
+        if parametro_ventana is not None:
+            if parametro is None:
+                raise ValueError(f"La ventana {ventana!r} no tiene parámetro")
+            parametro = float(parametro_ventana)
+        parametros = (nombre, parametro)
+    elif familia_canonica == "kaiser":
+        if orden is None:
+            if transicion is None:
+                raise ValueError("El diseño de Kaiser requiere el orden o el ancho de transición")
+            numtaps, beta = signal.kaiserord(atenuacion, transicion / (fs / 2))
+            orden = numtaps - 1
+            if tipo_canonico in ("highpass", "bandstop") and orden % 2:
+                orden += 1
+        else:
+            beta = signal.kaiser_beta(atenuacion)
+        parametros = (round(float(beta), 12),)
+    else:
+        parametros = {"butter": (), "bessel": (), "cheby1": (float(rp),), "cheby2": (float(rs),),
+                      "ellip": (float(rp), float(rs))}[familia_canonica]
+
+    if orden is None or int(orden) < 1:
+        raise ValueError("El orden del filtro debe ser un entero positivo")
+    orden = int(orden)
+    if familia_canonica in _FIR and tipo_canonico in ("highpass", "bandstop") and orden % 2:
+        raise ValueError("Los FIR pasa altas y rechaza banda requieren orden par")
+    return EspecFiltro(familia_canonica, tipo_canonico, orden, corte, parametros)
+
+
+def disenar_filtro(familia, tipo, corte, orden=None, fs=2.0, **parametros):
+    """
+    Diseñar (o recuperar de la caché) un filtro; retorna un DisenoFiltro cuyos arreglos
+    son de solo lectura. Argumentos como en especificacion
+    """
+    return disenar(especificacion(familia, tipo, corte, orden, fs, **parametros))
+
+
+def disenar(espec):
+    """DisenoFiltro de una EspecFiltro, guardado en caché"""
+    return _disenos.obtener(espec, lambda: _construir(espec))
+
+
+def disenar_banco(cortes, familia, tipo, orden=None, fs=2.0, **parametros):
+    """
+    Diseñar un banco de filtros en una sola llamada: un filtro por cada frecuencia de corte
+    (o par de frecuencias) de cortes, con la misma familia, tipo y orden. Retorna BancoFiltros
+    """
+    bandas = 2 if TIPOS.get(str(tipo).lower()) in ("bandpass", "bandstop") else 1
+    cortes = np.asarray(cortes, dtype=float).reshape(-1, bandas)
+    disenos = [disenar_filtro(familia, tipo, corte, orden, fs, **parametros) for corte in cortes]
+    if not disenos:
+        raise ValueError("Indique al menos una frecuencia de corte")
+    formas = {d.b.shape if d.es_fir else d.sos.shape for d in disenos}
+    if len(formas) > 1:
+        raise ValueError("Los filtros del banco deben tener el mismo número de coeficientes")
+    coeficientes = np.stack([d.b if d.es_fir else d.sos for d in disenos])
+    return BancoFiltros(disenos, coeficientes)
+
+
+def limpiar_cache():
+    """Vaciar la caché de diseños"""
+    _disenos.limpiar()
+
+
+def _construir(espec):
+    """Diseñar el filtro de una especificación canónica"""
+    corte = espec.corte[0] if len(espec.corte) == 1 else list(espec.corte)
+    if espec.familia in _FIR:
+        if espec.familia == "fir":
+            nombre, parametro = espec.parametros
+            ventana = _VENTANAS_SCIPY[nombre] if parametro is None else (_VENTANAS_SCIPY[nombre], parametro)
+        else:
+            ventana = ("kaiser", espec.parametros[0])
+        pasa_cero = espec.tipo in ("lowpass", "bandstop")
+        b = signal.firwin(espec.orden + 1, corte, window=ventana, pass_zero=pasa_cero)
+        return DisenoFiltro(espec, None, b, None)
+
+    rp = rs = None
+    if espec.familia == "cheby1":
+        rp, = espec.parametros
+    elif espec.familia == "cheby2":
+        rs, = espec.parametros
+    elif espec.familia == "ellip":
+        rp, rs = espec.parametros
+    ceros, polos, ganancia = signal.iirfilter(espec.orden, corte, rp=rp, rs=rs, btype=espec.tipo,
+                                              ftype=espec.familia, output="zpk")
+    sos = signal.zpk2sos(ceros, polos, ganancia)
+    ceros.setflags(write=False)
+    polos.setflags(write=False)
+    return DisenoFiltro(espec, sos, None, (ceros, polos, float(ganancia)))
@@ -0,0 +1,155 @@
+"""
+Transformada de Fourier en tiempo discreto (DTFT)
+
+Se elige automáticamente el método de evaluación según la rejilla de frecuencias:
+    "fft"     : rejilla uniforme con paso 2π/K (K entero), p. ej. linspace(-π, π, M)
+                o linspace(0, 2π, M, endpoint=False). La señal se pliega módulo K
+                y basta una FFT de K puntos.
+    "czt"     : rejilla uniforme cualquiera (sub-bandas, zoom espectral) mediante
+                la transformada chirp-z (algoritmo de Bluestein).
+    "directo" : rejilla arbitraria, producto matriz-vector por bloques con memoria acotada.
+"""
+
+import numpy as np
+
+from ._bloques import MEMORIA_MAXIMA_BYTES, iterar_bloques
+
+METODOS = ("auto", "fft", "czt", "directo")
+
+# Por debajo de este número de operaciones (M·N) el producto directo es más rápido
+_UMBRAL_DIRECTO = 1 << 15
+
+
+def calcular_dtft(x, omega, n0=0, max_bytes=None, metodo="auto"):
+    """
+    Evaluar X(e^{jω}) = Σ x[n]·e^{-jωn} en las frecuencias omega.
+
+    x        : señal de longitud N, definida en n = n0, n0+1, ..., n0+N-1
+    omega    : frecuencias en rad/muestra (cualquier forma)
+    n0       : índice temporal de la primera muestra
+    max_bytes: memoria máxima del bloque intermedio del método directo (None = valor por defecto)
+    metodo   : "auto", "fft", "czt" o "directo"
+
+    Retorna un arreglo complejo con la misma forma que omega.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de DTFT desconocido: {metodo!r}")
+
+    x = np.asarray(x)
+    omega = np.asarray(omega, dtype=float)
+    w = omega.ravel()
+    N, M = x.size, w.size
+
+    if N == 0 or M == 0:
+        return np.zeros(omega.shape, dtype=complex)
+
+    rejilla = _rejilla_uniforme(w) if metodo != "directo" else None
+    if metodo in ("fft", "czt") and rejilla is None:
+        raise ValueError(f"El método {metodo!r} requiere una rejilla de frecuencias uniforme")
+
+    if metodo == "auto":
+        metodo = _elegir_metodo(N, M, rejilla)
+
+    if metodo == "fft":
+        K = _periodo_fft(rejilla[1])
+        if K is None:
+            raise ValueError("El método 'fft' requiere un paso de frecuencia 2π/K con K entero")
+        X = _dtft_fft(x, rejilla[0], K, M)
+    elif metodo == "czt":
+        X = _dtft_czt(x, rejilla[0], rejilla[1], M)
+    else:
+        X = _dtft_directa(x, w, max_bytes)
+
+    # Desplazamiento temporal: x[n] comienza en n0
+    if n0:
+        X *= np.exp(-1j * w * n0)
+
+    return X.reshape(omega.shape)
+
+
+def _rejilla_uniforme(w):
+    """(ω0, Δω) si w es una rejilla uniforme de al menos dos puntos, si no None"""
+    if w.size < 2:
+        return None
+    w0 = w[0]
+    dw = (w[-1] - w0) / (w.size - 1)
+    if dw == 0:
+        return None
+    tolerancia = 1e-12 * max(1.0, np.abs(w).max())
+    if np.abs(w - (w0 + dw * np.arange(w.size))).max() > tolerancia:
+        return None
+    return w0, dw
+
+
+def _periodo_fft(dw):
+    """K entero tal que Δω = 2π/K (None si no existe)"""
+    if dw <= 0:
+        return None
+    K = 2 * np.pi / dw
+    K_entero = int(round(K))
+    if K_entero < 1 or abs(K - K_entero) > 1e-9 * K:
+        return None
+    return K_entero
+
+
+def _elegir_metodo(N, M, rejilla):
+    """Método más económico para N muestras y M frecuencias"""
+    if rejilla is None or N * M <= _UMBRAL_DIRECTO:
+        return "directo"
+    K = _periodo_fft(rejilla[1])
+    if K is not None and K <= 4 * (N + M):
+        return "fft"
+    return "czt"
+
+
+def _dtft_directa(x, w, max_bytes=None):
+    """Producto e^{-jωn}·x por bloques de frecuencias y, si N es muy grande, de muestras"""
+    max_bytes = MEMORIA_MAXIMA_BYTES if max_bytes is None else max_bytes
+    N = x.size
+    X = np.zeros(w.size, dtype=complex)
+
+    # Cada fila del bloque ocupa como máximo max_bytes
+    ancho = max(1, min(N, int(max_bytes // 16)))
+    for inicio in range(0, N, ancho):
+        n = np.arange(inicio, min(inicio + ancho, N))
+        x_bloque = x[inicio:inicio + ancho]
+        for bloque in iterar_bloques(w.size, n.size, max_bytes=max_bytes):
+            X[bloque] += np.exp(-1j * np.outer(w[bloque], n)) @ x_bloque
+    return X
+
+
+def _dtft_fft(x, w0, K, M):
+    """DTFT en ω_k = ω0 + 2πk/K (k = 0..M-1) con una FFT de K puntos"""
+    N = x.size
+    n = np.arange(N)
+    y = x * np.exp(-1j * w0 * n)
+
+    # Plegar la señal módulo K: e^{-j2πkn/K} tiene periodo K en n
+    relleno = -N % K
+    if N > K or relleno:
+        y = np.concatenate([y, np.zeros(relleno, dtype=complex)]).reshape(-1, K).sum(axis=0)
+
+    Y = np.fft.fft(y)
+    return Y[np.arange(M) % K]
+
+
+def _dtft_czt(x, w0, dw, M):
+    """
+    DTFT en ω_k = ω0 + k·Δω (k = 0..M-1) mediante la transformada chirp-z:
+    k·n = (k² + n² - (k-n)²)/2 convierte la suma en una convolución calculada con FFT
+    """
+    N = x.size
+    n = np.arange(N, dtype=float)
+    k = np.arange(M, dtype=float)
+
+    a = x * np.exp(-1j * (w0 * n + 0.5 * dw * n * n))
+
+    L = 1 << int(np.ceil(np.log2(N + M - 1)))
+    chirp = np.zeros(L, dtype=complex)
+    chirp[:M] = np.exp(0.5j * dw * k * k)
+    if N > 1:
+        m = np.arange(1, N, dtype=float)
+        chirp[L - N + 1:] = np.exp(0.5j * dw * m[::-1] * m[::-1])
+
+    c = np.fft.ifft(np.fft.fft(a, L) * np.fft.fft(chirp))
+    return c[:M] * np.exp(-0.5j * dw * k * k)
@@ -0,0 +1,144 @@
+"""
+Analizador espectral por lotes para señales reales
+
+AnalizadorEspectral apila varias señales (o una señal con varias ventanas) en un
+búfer 2-D de nfft columnas, rellenado con ceros, y calcula todas las DFT con una sola
+rfft a lo largo del último eje. La rfft entrega solo los nfft//2 + 1 bins de 0 a fs/2,
+la mitad del cálculo y de la memoria de una fft compleja a la que luego se le quitan
+las frecuencias negativas. Los búferes de entrada y de salida (espectro, magnitud, dB y
+fase) se reservan una vez y se reutilizan en cada análisis, y la FFT es siempre del
+mismo tamaño, por lo que su plan queda en la caché de NumPy.
+
+Las salidas son vistas de los búferes internos: el siguiente análisis las sobrescribe
+(copiarlas si se necesitan después).
+"""
+
+import inspect
+
+import numpy as np
+
+from ._cache import CacheLRU
+from .ventanas import ventana
+
+# np.fft.rfft acepta out= desde NumPy 2.0
+_RFFT_CON_SALIDA = "out" in inspect.signature(np.fft.rfft).parameters
+
+_analizadores = CacheLRU(max_entradas=8)
+
+
+class AnalizadorEspectral:
+    """
+    Espectros de lotes de señales reales con una DFT de nfft puntos.
+
+    nfft      : número de puntos de la DFT (las señales más cortas se rellenan con ceros)
+    fs        : frecuencia de muestreo, para el eje frecuencias (0 a fs/2)
+    capacidad : número de señales para el que se reservan los búferes (crece si hace falta)
+    """
+
+    def __init__(self, nfft, fs=1.0, capacidad=4):
+        self.nfft = int(nfft)
+        if self.nfft < 1:
+            raise ValueError("nfft debe ser positivo")
+        self.fs = fs
+        self.bins = self.nfft // 2 + 1
+        self.frecuencias = np.fft.rfftfreq(self.nfft, 1 / fs)
+        self.senales = 0
+        self._reservar(max(1, int(capacidad)))
+
+    def analizar(self, senales, ventanas=None):
+        """
+        Calcular los espectros de un lote de señales.
+
+        senales : arreglo (..., muestras) o lista de señales 1-D (de hasta nfft muestras)
+        ventanas: None, un nombre de ventana para todas, o una lista de nombres (uno por señal).
+                  Con una sola señal 1-D y una lista de ventanas se analiza la señal con cada una.
+        Retorna el espectro complejo (señales × nfft//2 + 1) como vista del búfer interno
+        """
+        filas = _como_filas(senales)
+        if len(filas) == 0:
+            raise ValueError("Indique al menos una señal")
+        if ventanas is not None and not isinstance(ventanas, str):
+            ventanas = list(ventanas)
+            if len(filas) == 1 and len(ventanas) > 1:
+                filas = [filas[0]] * len(ventanas)
+            if len(ventanas) != len(filas):
+                raise ValueError(f"Se indicaron {len(ventanas)} ventanas para {len(filas)} señales")
+        elif ventanas is not None:
+            ventanas = [ventanas] * len(filas)
+
+        if len(filas) > self._entrada.shape[0]:
+            self._reservar(len(filas))
+        self.senales = len(filas)
+        entrada = self._entrada[:self.senales]
+        ancho = filas.shape[1] if isinstance(filas, np.ndarray) else max(fila.size for fila in filas)
+        if ancho > self.nfft:
+            raise ValueError(f"Las señales deben tener como máximo nfft = {self.nfft} muestras")
+        entrada.fill(0.0)
+        if ventanas is None and isinstance(filas, np.ndarray):
+            # Lote rectangular sin ventanas: una sola copia
+            entrada[:, :filas.shape[1]] = filas
+        else:
+            for i, fila in enumerate(filas):
+                if ventanas is None:
+                    entrada[i, :fila.size] = fila
+                else:
+                    np.multiply(fila, ventana(ventanas[i], fila.size), out=entrada[i, :fila.size])
+
+        espectro = self._espectro[:self.senales]
+        if _RFFT_CON_SALIDA:
+            np.fft.rfft(entrada, axis=-1, out=espectro)
+        else:
+            espectro[:] = np.fft.rfft(entrada, axis=-1)
+        return espectro
+
+    @property
+    def espectro(self):
+        """Espectro complejo del último análisis (señales × bins)"""
+        return self._espectro[:self.senales]
+
+    def magnitud(self, completo=False):
+        """
+        |X(k)| del último análisis. Con completo=True se retornan los nfft bins de 0 a fs
+        (los de frecuencias negativas se obtienen por simetría conjugada, sin otra FFT)
+        """
+        magnitud = np.abs(self.espectro, out=self._magnitud[:self.senales])
+        if not completo:
+            return magnitud
+        return np.concatenate([magnitud, magnitud[:, (self.nfft + 1) // 2 - 1:0:-1]], axis=1)
+
+    def db(self, piso=1e-10):
+        """20·log10(|X(k)| + piso) del último análisis"""
+        db = self._db[:self.senales]
+        np.add(np.abs(self.espectro, out=self._magnitud[:self.senales]), piso, out=db)
+        np.log10(db, out=db)
+        db *= 20
+        return db
+
+    def fase(self):
+        """Fase (rad) del último análisis"""
+        espectro = self.espectro
+        return np.arctan2(espectro.imag, espectro.real, out=self._fase[:self.senales])
+
+    def _reservar(self, capacidad):
+        """Reservar los búferes de entrada y de salida para 'capacidad' señales"""
+        self._entrada = np.zeros((capacidad, self.nfft))
+        self._espectro = np.empty((capacidad, self.bins), dtype=complex)
+        self._magnitud = np.empty((capacidad, self.bins))
+        self._db = np.empty((capacidad, self.bins))
+        self._fase = np.empty((capacidad, self.bins))
+
+
+def analizador(nfft, fs=1.0):
+    """Analizador compartido para (nfft, fs), guardado en caché para reutilizar sus búferes"""
+    return _analizadores.obtener((int(nfft), float(fs)), lambda: AnalizadorEspectral(nfft, fs))
+
+
+def _como_filas(senales):
+    """
+    Señales 1-D reales: matriz (señales × muestras) si la entrada es un arreglo
+    (..., muestras), o lista de arreglos si es una lista de señales
+    """
+    if isinstance(senales, np.ndarray) or np.isscalar(senales):
+        senales = np.atleast_1d(np.asarray(senales, dtype=float))
+        return senales.reshape(-1, senales.shape[-1])
+    return [np.asarray(fila, dtype=float).ravel() for fila in senales]
@@ -0,0 +1,175 @@
+"""
+Diseño de filtros FIR por ventanas y su respuesta en frecuencia
+
+El filtro ideal h_d[n] se trunca con una ventana de L = M + 1 muestras centrada en M/2
+(fase lineal). Los coeficientes salen de dsp_core.diseno (en caché por especificación).
+Aquí se agregan:
+
+    estimar_orden  : orden M para un ancho de transición Δf con cada ventana fija
+                     (Δf·L/fs ≈ 0.9 rectangular, 3.1 Hann, 3.3 Hamming, 5.5 Blackman)
+    estimar_kaiser : orden M y β de Kaiser a partir del rizado en la banda de paso y la
+                     atenuación en la de rechazo: A = -20·log10(min(δp, δs)),
+                     M = (A - 7.95)/(2.285·Δω)
+    respuesta_fir  : H(e^{jω}) de 0 a fs/2 sobre una rejilla densa, con una sola rfft del
+                     filtro rellenado con ceros (en lugar de sumar Σ h[n]·e^{-jωn} para cada
+                     frecuencia), en caché por diseño y número de puntos
+    metricas_fir   : rizado y atenuación medidos sobre esa respuesta
+
+Los filtros se redondean a orden par (tipo I, longitud impar), que admite todos los tipos.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from ._cache import CacheLRU
+from .diseno import DisenoFiltro, disenar_filtro
+from .ventanas import _canonico
+
+# Δf·L/fs de la banda de transición y atenuación mínima (dB) de cada ventana fija
+ANCHO_TRANSICION = {"rectangular": 0.9, "hann": 3.1, "hamming": 3.3, "blackman": 5.5}
+ATENUACION_VENTANA = {"rectangular": 21.0, "hann": 44.0, "hamming": 53.0, "blackman": 74.0}
+
+# Puntos por defecto de la respuesta en frecuencia (de 0 a fs/2)
+PUNTOS_RESPUESTA = 4097
+
+_respuestas = CacheLRU(max_entradas=256)
+
+EstimacionKaiser = namedtuple("EstimacionKaiser", "orden beta atenuacion_db")
+EstimacionKaiser.__doc__ = """
+Diseño de Kaiser estimado: orden M (par), β de la ventana y atenuación A (dB) que se
+diseña, la mayor entre la pedida en la banda de rechazo y la que impone el rizado
+"""
+
+RespuestaFIR = namedtuple("RespuestaFIR", "f H db")
+RespuestaFIR.__doc__ = """
+Respuesta en frecuencia de 0 a fs/2: frecuencias f, H(e^{jω}) compleja y 20·log10|H| (dB).
+H y db son de solo lectura (compartidas por la caché)
+"""
+
+
+def desviaciones(rizado_db, atenuacion_db):
+    """
+    Desviaciones δp (banda de paso) y δs (banda de rechazo) de un rizado pico a pico
+    (dB) y una atenuación (dB)
+    """
+    r = 10 ** (rizado_db / 20)
+    return (r - 1) / (r + 1), 10 ** (-atenuacion_db / 20)
+
+
+def estimar_kaiser(rizado_db, atenuacion_db, transicion, fs=2.0):
+    """Orden (par) y β de la ventana de Kaiser que cumplen el rizado y la atenuación pedidos"""
+    if transicion <= 0:
+        raise ValueError("El ancho de transición debe ser positivo")
+    A = _atenuacion_diseno(rizado_db, atenuacion_db)
+    delta_omega = 2 * np.pi * transicion / fs
+    orden = _par(max(np.ceil((A - 7.95) / (2.285 * delta_omega)), 2))
+    return EstimacionKaiser(orden, beta_kaiser(A), A)
+
+
+def beta_kaiser(atenuacion_db):
+    """β de la ventana de Kaiser para una atenuación A (dB), con las fórmulas empíricas de Kaiser"""
+    A = atenuacion_db
+    if A > 50:
+        return 0.1102 * (A - 8.7)
+    if A >= 21:
+        return 0.5842 * (A - 21) ** 0.4 + 0.07886 * (A - 21)
+    return 0.0
+
+
+def estimar_orden(ventana, transicion, fs=2.0, rizado_db=0.1, atenuacion_db=60.0):
+    """
+    Orden (par) para el ancho de transición pedido con la ventana indicada. Con la de
+    Kaiser el orden sale de estimar_kaiser; las demás tienen su ancho de transición fijo
+    """
+    nombre = _canonico(ventana)
+    if nombre == "kaiser":
+        return estimar_kaiser(rizado_db, atenuacion_db, transicion, fs).orden
+    if nombre not in ANCHO_TRANSICION:
+        raise ValueError(f"No hay estimación de orden para la ventana {ventana!r}")
+    if transicion <= 0:
+        raise ValueError("El ancho de transición debe ser positivo")
+    return _par(max(np.ceil(ANCHO_TRANSICION[nombre] * fs / transicion) - 1, 2))
+
+
+def disenar_fir(tipo, corte, orden=None, fs=2.0, ventana="hamming", beta=None,
+                rizado_db=0.1, atenuacion_db=60.0, transicion=None):
+    """
+    Filtro FIR por ventanas (DisenoFiltro, en caché). Si orden es None se estima con
+    estimar_orden (se necesita transicion); si no, se redondea a par. Con la ventana de
+    Kaiser y beta None, β sale del rizado y la atenuación pedidos
+    """
+    nombre = _canonico(ventana)
+    if orden is None:
+        if transicion is None:
+            raise ValueError("Indique el orden o el ancho de transición")
+        orden = estimar_orden(nombre, transicion, fs, rizado_db, atenuacion_db)
+    orden = _par(orden)
+    if nombre == "kaiser" and beta is None:
+        beta = beta_kaiser(_atenuacion_diseno(rizado_db, atenuacion_db))
+    return disenar_filtro("fir", tipo, corte, orden, fs, ventana=nombre,
+                          parametro_ventana=beta if nombre == "kaiser" else None)
+
+
+def respuesta_fir(filtro, puntos=PUNTOS_RESPUESTA, fs=2.0):
+    """
+    RespuestaFIR de un DisenoFiltro FIR o de unos coeficientes h[n], con al menos
+    'puntos' frecuencias de 0 a fs/2 (más si el filtro es más largo que la rejilla)
+    """
+    if isinstance(filtro, DisenoFiltro):
+        if not filtro.es_fir:
+            raise ValueError("respuesta_fir requiere un diseño FIR")
+        h, clave = filtro.b, ("diseno", filtro.espec)
+    else:
+        h = np.asarray(filtro, dtype=float).ravel()
+        clave = ("coeficientes", h.tobytes())
+    if h.size == 0:
+        raise ValueError("El filtro no tiene coeficientes")
+
+    # rfft de nfft puntos: nfft//2 + 1 frecuencias; nfft ≥ L para que el filtro no se pliegue
+    nfft = max(2 * (int(puntos) - 1), 2)
+    if nfft < h.size:
+        nfft = 1 << int(np.ceil(np.log2(h.size)))
+
+    def calcular():
+        H = np.fft.rfft(h, nfft)
+        with np.errstate(divide='ignore'):
+            db = 20 * np.log10(np.abs(H))
+        return H, np.maximum(db, -400.0)
+
+    H, db = _respuestas.obtener(clave + (nfft,), calcular)
+    return RespuestaFIR(np.linspace(0, fs / 2, H.size), H, db)
+
+
+def metricas_fir(respuesta, paso, rechazo):
+    """
+    Rizado pico a pico (dB) en la banda de paso y atenuación mínima (dB) en la de rechazo.
+    paso y rechazo son intervalos (f1, f2), o listas de intervalos, en las unidades de f
+    """
+    def en_bandas(bandas):
+        bandas = np.atleast_2d(np.asarray(bandas, dtype=float))
+        mascara = np.zeros(respuesta.f.size, dtype=bool)
+        for f1, f2 in bandas:
+            mascara |= (respuesta.f >= f1) & (respuesta.f <= f2)
+        if not mascara.any():
+            raise ValueError("La banda no contiene frecuencias de la rejilla")
+        return respuesta.db[mascara]
+
+    db_paso = en_bandas(paso)
+    return db_paso.max() - db_paso.min(), -en_bandas(rechazo).max()
+
+
+def limpiar_cache():
+    """Vaciar la caché de respuestas en frecuencia"""
+    _respuestas.limpiar()
+
+
+def _atenuacion_diseno(rizado_db, atenuacion_db):
+    """A = -20·log10(min(δp, δs)): atenuación que cumple a la vez el rizado y la atenuación"""
+    return -20 * np.log10(min(desviaciones(rizado_db, atenuacion_db)))
+
+
+def _par(orden):
+    """Orden entero par (hacia arriba)"""
+    orden = int(orden)
+    return orden + orden % 2
@@ -0,0 +1,224 @@
+"""
+Diseño de filtros IIR por transformación bilineal, en polos, ceros y SOS
+
+    s = 2·fs·(z - 1)/(z + 1)   ⇔   z = (2·fs + s)/(2·fs - s)
+
+La transformación lleva el eje jΩ completo a la circunferencia unitaria con la
+compresión ω = 2·arctan(Ω/(2·fs)); la predistorsión Ω = 2·fs·tan(ω/2) de las
+frecuencias de corte hace que el filtro digital las conserve exactamente.
+
+    disenar_bilineal      : prototipo analógico (Butterworth, Chebyshev, elíptico, Bessel)
+                            → transformación de frecuencia → bilineal, con o sin predistorsión
+    seccion_segundo_orden : secciones pico, notch, pasa bajas, pasa altas y pasa banda de
+                            segundo orden (bilineal de los prototipos con predistorsión en f0),
+                            vectorizadas sobre arreglos de f0, Q y ganancia
+    respuesta_sos         : magnitud, fase desenrollada y retardo de grupo de una o varias
+                            cascadas SOS sobre una rejilla de frecuencias, en un solo cálculo
+
+Todo el diseño se hace con polos y ceros, y el filtro se entrega como secciones de
+segundo orden: los coeficientes del polinomio completo de un orden 20 pierden las
+raíces (y la estabilidad) por redondeo, mientras que cada sección conserva las suyas.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import signal
+
+from ._cache import CacheLRU
+from .diseno import _FIR, especificacion
+from .lti import filtrar
+from .respuesta_frecuencia import _evaluar_sos, _magnitud_fase
+
+_disenos = CacheLRU(max_entradas=512)
+
+# Prototipos analógicos pasa bajas normalizados (Ωc = 1 rad/s): (orden, rp, rs) -> (z, p, k)
+PROTOTIPOS = {
+    "butter": lambda orden, rp, rs: signal.buttap(orden),
+    "cheby1": lambda orden, rp, rs: signal.cheb1ap(orden, rp),
+    "cheby2": lambda orden, rp, rs: signal.cheb2ap(orden, rs),
+    "ellip": lambda orden, rp, rs: signal.ellipap(orden, rp, rs),
+    "bessel": lambda orden, rp, rs: signal.besselap(orden),
+}
+
+# Tipos de sección de segundo orden aceptados (sin distinguir mayúsculas)
+SECCIONES = {
+    "pico": "pico", "peaking": "pico",
+    "notch": "notch", "rechaza banda": "notch",
+    "pasa bajas": "pasa bajas", "lowpass": "pasa bajas",
+    "pasa altas": "pasa altas", "highpass": "pasa altas",
+    "pasa banda": "pasa banda", "bandpass": "pasa banda",
+}
+
+RespuestaIIR = namedtuple("RespuestaIIR", "f H db fase retardo")
+RespuestaIIR.__doc__ = """
+Respuesta en frecuencia de una o varias cascadas SOS (el último eje es la frecuencia):
+    f       : frecuencias evaluadas
+    H       : H(e^{jω}) compleja
+    db      : 20·log10|H| (limitada a -400 dB en los ceros)
+    fase    : fase desenrollada (rad)
+    retardo : retardo de grupo -dφ/dω (muestras)
+"""
+
+
+class DisenoIIR(namedtuple("DisenoIIR", "espec predistorsion sos zpk analogico")):
+    """
+    Filtro IIR diseñado por transformación bilineal:
+        espec        : EspecFiltro del diseño (frecuencias normalizadas a Nyquist)
+        predistorsion: True si las frecuencias de corte se predistorsionaron
+        sos          : secciones de segundo orden (n_secciones × 6)
+        zpk          : (ceros, polos, ganancia) digitales
+        analogico    : (ceros, polos, ganancia) del filtro analógico, en rad/s
+    """
+
+    __slots__ = ()
+
+    def filtrar(self, x):
+        """Filtrar x (muestras, o canales × muestras) desde el reposo"""
+        return filtrar(x, sos=self.sos)
+
+
+def predistorsion(f, fs):
+    """Frecuencia analógica Ω = 2·fs·tan(π·f/fs) (rad/s) que la bilineal lleva a f (Hz)"""
+    return 2 * fs * np.tan(np.pi * np.asarray(f, dtype=float) / fs)
+
+
+def frecuencia_digital(omega, fs):
+    """Frecuencia digital f = (fs/π)·arctan(Ω/(2·fs)) (Hz) a la que la bilineal lleva Ω (rad/s)"""
+    return fs / np.pi * np.arctan(np.asarray(omega, dtype=float) / (2 * fs))
+
+
+def bilineal(ceros, polos, ganancia, fs):
+    """
+    Transformación bilineal de un sistema analógico (ceros, polos, ganancia) en s.
+    Los ceros en el infinito (uno por cada polo de más) quedan en z = -1
+    """
+    ceros = np.atleast_1d(np.asarray(ceros, dtype=complex)).ravel()
+    polos = np.atleast_1d(np.asarray(polos, dtype=complex)).ravel()
+    exceso = polos.size - ceros.size
+    if exceso < 0:
+        raise ValueError("El sistema analógico no puede tener más ceros que polos")
+    fs2 = 2.0 * fs
+    ceros_z = np.concatenate([(fs2 + ceros) / (fs2 - ceros), -np.ones(exceso)])
+    polos_z = (fs2 + polos) / (fs2 - polos)
+    ganancia_z = ganancia * np.real(np.prod(fs2 - ceros) / np.prod(fs2 - polos))
+    return ceros_z, polos_z, float(ganancia_z)
+
+
+def disenar_bilineal(tipo, corte, orden, fs=2.0, familia="butter", rp=1.0, rs=40.0, predistorsionar=True):
+    """
+    Diseñar (o recuperar de la caché) un IIR por transformación bilineal; retorna DisenoIIR.
+
+    tipo, corte, orden : como en dsp_core.diseno.especificacion (corte en las unidades de fs)
+    familia            : "butter", "cheby1", "cheby2", "ellip" o "bessel" (o sus nombres largos)
+    rp, rs             : rizado en la banda de paso y atenuación en la de rechazo (dB)
+    predistorsionar    : False usa Ω = 2π·f sin corregir, para mostrar la compresión de frecuencias
+    """
+    espec = especificacion(familia, tipo, corte, orden, fs, rp=rp, rs=rs)
+    if espec.familia in _FIR:
+        raise ValueError("La transformación bilineal requiere una familia IIR")
+    clave = (espec, bool(predistorsionar), float(fs))
+    return _disenos.obtener(clave, lambda: _construir(espec, bool(predistorsionar), float(fs)))
+
+
+def respuesta_analogica(analogico, f):
+    """H(jΩ) de un sistema analógico (ceros, polos, ganancia) en las frecuencias f (Hz)"""
+    ceros, polos, ganancia = analogico
+    _, H = signal.freqs_zpk(ceros, polos, ganancia, worN=2 * np.pi * np.asarray(f, dtype=float))
+    return H
+
+
+def seccion_segundo_orden(tipo, f0, Q=np.sqrt(0.5), fs=2.0, ganancia_db=0.0):
+    """
+    Coeficientes SOS de una sección de segundo orden (bilineal del prototipo analógico con
+    predistorsión en f0, a0 = 1):
+        "pico"       : ganancia_db en f0 y 0 dB lejos de f0
+        "notch"      : cero en f0 sobre la circunferencia unitaria
+        "pasa bajas", "pasa altas", "pasa banda" (0 dB en f0)
+    Q es el factor de calidad (ancho de banda ≈ f0/Q). f0, Q y ganancia_db pueden ser
+    arreglos: se combinan por broadcasting y el resultado tiene forma (..., 1, 6), una
+    cascada de una sección por combinación. Con escalares la forma es (1, 6)
+    """
+    clase = SECCIONES.get(str(tipo).lower())
+    if clase is None:
+        raise ValueError(f"Tipo de sección desconocido: {tipo!r}")
+    f0, Q, ganancia_db = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (f0, Q, ganancia_db)))
+    if np.any(f0 <= 0) or np.any(f0 >= fs / 2):
+        raise ValueError("f0 debe estar entre 0 y fs/2")
+    if np.any(Q <= 0):
+        raise ValueError("Q debe ser positivo")
+
+    w0 = 2 * np.pi * f0 / fs
+    c = np.cos(w0)
+    alfa = np.sin(w0) / (2 * Q)
+    A = 10 ** (ganancia_db / 40)
+    uno = np.ones_like(c)
+    if clase == "pico":
+        b = (1 + alfa * A, -2 * c, 1 - alfa * A)
+        a = (1 + alfa / A, -2 * c, 1 - alfa / A)
+    else:
+        a = (1 + alfa, -2 * c, 1 - alfa)
+        b = {
+            "notch": (uno, -2 * c, uno),
+            "pasa bajas": ((1 - c) / 2, 1 - c, (1 - c) / 2),
+            "pasa altas": ((1 + c) / 2, -(1 + c), (1 + c) / 2),
+            "pasa banda": (alfa, 0 * c, -alfa),
+        }[clase]
+    sos = np.stack(b + a, axis=-1) / a[0][..., None]
+    return sos[..., None, :]
+
+
+def cascada(*secciones):
+    """Unir secciones SOS (matrices n_i × 6, o filas de 6) en una sola cascada"""
+    filas = [np.atleast_2d(np.asarray(s, dtype=float)) for s in secciones]
+    if not filas:
+        raise ValueError("Indique al menos una sección")
+    if any(s.ndim != 2 or s.shape[1] != 6 for s in filas):
+        raise ValueError("Cada sección debe tener 6 coeficientes (b0 b1 b2 a0 a1 a2)")
+    return np.vstack(filas)
+
+
+def respuesta_sos(sos, f, fs=2.0):
+    """
+    RespuestaIIR de una cascada SOS (secciones × 6) o de un lote de cascadas (..., secciones × 6)
+    en las frecuencias f (Hz). Cada sección se evalúa en todas las frecuencias a la vez; el
+    retardo de grupo se suma sección por sección desde sus polinomios, sin derivar la fase
+    """
+    f = np.asarray(f, dtype=float).ravel()
+    H, retardo = _evaluar_sos(sos, f, fs)
+    return RespuestaIIR(f, H, *_magnitud_fase(H), retardo)
+
+
+def limpiar_cache():
+    """Vaciar la caché de diseños bilineales"""
+    _disenos.limpiar()
+
+
+def _construir(espec, predistorsionar, fs):
+    """Prototipo analógico, transformación de frecuencia y bilineal de una especificación"""
+    rp = rs = None
+    if espec.familia == "cheby1":
+        rp, = espec.parametros
+    elif espec.familia == "cheby2":
+        rs, = espec.parametros
+    elif espec.familia == "ellip":
+        rp, rs = espec.parametros
+    ceros, polos, ganancia = PROTOTIPOS[espec.familia](espec.orden, rp, rs)
+
+    corte = np.array(espec.corte) * fs / 2
+    omega = predistorsion(corte, fs) if predistorsionar else 2 * np.pi * corte
+    if espec.tipo == "lowpass":
+        analogico = signal.lp2lp_zpk(ceros, polos, ganancia, wo=omega[0])
+    elif espec.tipo == "highpass":
+        analogico = signal.lp2hp_zpk(ceros, polos, ganancia, wo=omega[0])
+    else:
+        centro, ancho = np.sqrt(omega[0] * omega[1]), omega[1] - omega[0]
+        transformar = signal.lp2bp_zpk if espec.tipo == "bandpass" else signal.lp2bs_zpk
+        analogico = transformar(ceros, polos, ganancia, wo=centro, bw=ancho)
+
+    ceros_z, polos_z, ganancia_z = bilineal(*analogico, fs)
+    sos = signal.zpk2sos(ceros_z, polos_z, ganancia_z)
+    for arreglo in (ceros_z, polos_z, analogico[0], analogico[1]):
+        arreglo.setflags(write=False)
+    analogico = (analogico[0], analogico[1], float(analogico[2]))
+    return DisenoIIR(espec, predistorsionar, sos, (ceros_z, polos_z, ganancia_z), analogico)
@@ -0,0 +1,140 @@
+"""
+Sistemas LTI definidos por ecuaciones en diferencias, con estado persistente
+
+SistemaLTI procesa bloques (canales × muestras) en float32 o float64 conservando
+el estado interno zi entre bloques, de modo que filtrar una señal por partes da el
+mismo resultado que filtrarla de una vez. Los coeficientes pueden darse como (b, a)
+o como secciones de segundo orden (SOS). Con varios canales el trabajo se reparte
+entre hilos (scipy.signal libera el GIL en el filtrado).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy import signal
+
+# Mínimo de canales por hilo para que repartir el trabajo compense
+CANALES_POR_HILO = 4
+
+
+class SistemaLTI:
+    """
+    Sistema LTI a·y[n] = b·x[n] (ecuación en diferencias) con estado entre bloques.
+
+    b, a    : coeficientes del numerador y denominador (a = 1 para FIR)
+    sos     : alternativa a (b, a), matriz de secciones de segundo orden (n_secciones × 6)
+    canales : número de canales de cada bloque
+    dtype   : np.float32 o np.float64
+    hilos   : hilos para repartir los canales (None = según CPU, 1 = sin hilos)
+    """
+
+    def __init__(self, b=None, a=1.0, sos=None, canales=1, dtype=np.float64, hilos=None):
+        if (b is None) == (sos is None):
+            raise ValueError("Indique los coeficientes (b, a) o sos, pero no ambos")
+
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("dtype debe ser float32 o float64")
+        self.canales = int(canales)
+
+        if sos is not None:
+            # Copia propia: sosfilt no acepta arreglos de solo lectura (p. ej. diseños en caché)
+            self.sos = np.atleast_2d(np.array(sos, dtype=self.dtype))
+            if self.sos.shape[1] != 6:
+                raise ValueError("sos debe tener forma (n_secciones, 6)")
+            self.b = self.a = None
+        else:
+            self.b = np.atleast_1d(np.asarray(b, dtype=self.dtype))
+            self.a = np.atleast_1d(np.asarray(a, dtype=self.dtype))
+            if self.a[0] == 0:
+                raise ValueError("El primer coeficiente de a no puede ser 0")
+            self.sos = None
+
+        if hilos is None:
+            hilos = os.cpu_count() or 1
+        self.hilos = max(1, min(int(hilos), self.canales // CANALES_POR_HILO))
+        self._ejecutor = ThreadPoolExecutor(self.hilos, "SistemaLTI") if self.hilos > 1 else None
+
+        self.reiniciar()
+
+    @property
+    def orden(self):
+        """Número de retardos del estado interno"""
+        if self.sos is not None:
+            return 2 * self.sos.shape[0]
+        return max(self.a.size, self.b.size) - 1
+
+    def reiniciar(self):
+        """Estado inicial nulo (sistema en reposo)"""
+        if self.sos is not None:
+            self.zi = np.zeros((self.sos.shape[0], self.canales, 2), dtype=self.dtype)
+        else:
+            self.zi = np.zeros((self.canales, max(self.a.size, self.b.size) - 1), dtype=self.dtype)
+
+    def procesar(self, bloque):
+        """
+        Filtrar un bloque (canales × muestras), o (muestras,) con un solo canal.
+        Retorna un bloque de la misma forma y dtype del sistema, y actualiza zi
+        """
+        x = np.asarray(bloque, dtype=self.dtype)
+        una_dimension = x.ndim == 1
+        if una_dimension:
+            x = x[np.newaxis, :]
+        if x.ndim != 2 or x.shape[0] != self.canales:
+            raise ValueError(f"Se esperaba un bloque de {self.canales} canales × muestras, "
+                             f"se recibió la forma {np.shape(bloque)}")
+
+        if x.shape[1] == 0:
+            y = x.copy()
+        elif self._ejecutor is None:
+            y = self._filtrar_canales(x, slice(None))
+        else:
+            y = np.empty_like(x)
+            grupos = [slice(g[0], g[-1] + 1)
+                      for g in np.array_split(np.arange(self.canales), self.hilos)]
+            tareas = [self._ejecutor.submit(self._filtrar_en, x, y, grupo) for grupo in grupos]
+            for tarea in tareas:
+                tarea.result()
+
+        return y[0] if una_dimension else y
+
+    def filtrar(self, bloques):
+        """Generador: filtrar un iterable de bloques conservando el estado"""
+        for bloque in bloques:
+            yield self.procesar(bloque)
+
+    def cerrar(self):
+        """Liberar los hilos de trabajo"""
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=True)
+            self._ejecutor = None
+
+    def _filtrar_en(self, x, y, canales):
+        """Filtrar un grupo de canales y escribir el resultado en y (usado por los hilos)"""
+        y[canales] = self._filtrar_canales(x, canales)
+
+    def _filtrar_canales(self, x, canales):
+        """Filtrar los canales indicados con su parte del estado"""
+        if self.sos is not None:
+            y, self.zi[:, canales] = signal.sosfilt(self.sos, x[canales], axis=-1,
+                                                    zi=self.zi[:, canales])
+        elif self.zi.shape[1] == 0:
+            # Sin retardos: sistema estático y = (b0/a0)·x
+            y = x[canales] * (self.b[0] / self.a[0])
+        else:
+            y, self.zi[canales] = signal.lfilter(self.b, self.a, x[canales], axis=-1,
+                                                 zi=self.zi[canales])
+        return y.astype(self.dtype, copy=False)
+
+
+def filtrar(x, b=None, a=1.0, sos=None):
+    """
+    Filtrar una señal completa desde el reposo con la ecuación en diferencias (b, a) o sos.
+    x puede ser (muestras,) o (canales × muestras)
+    """
+    x = np.asarray(x)
+    dtype = x.dtype if x.dtype in (np.float32, np.float64) else np.float64
+    canales = 1 if x.ndim == 1 else x.shape[0]
+    sistema = SistemaLTI(b=b, a=a, sos=sos, canales=canales, dtype=dtype, hilos=1)
+    return sistema.procesar(x)
@@ -0,0 +1,220 @@
+"""
+Evaluación vectorizada de X(z) y H(z) sobre el plano Z
+
+Las transformadas se evalúan sobre mallas completas a la vez, por bloques de puntos
+con memoria acotada. Para evitar desbordes con |z| ≫ 1 o |z| ≪ 1 se acumula en forma
+de Horner sobre la variable de módulo ≤ 1 (z^{-1} o z) y la potencia restante se
+suma como logaritmo de la magnitud. Las singularidades (polos, z = 0) se marcan con inf.
+
+Las superficies para gráficos se guardan en una caché LRU indexada por
+(polos, ceros, malla), de modo que redibujar con los mismos parámetros es inmediato.
+"""
+
+import numpy as np
+
+from ._bloques import iterar_bloques
+from ._cache import CacheLRU
+
+# Superficies calculadas recientemente: clave -> (Re, Im, |·|)
+_superficies = CacheLRU(max_entradas=16)
+
+
+def log_transformada_z(x, z, n=None, max_bytes=None):
+    """
+    Logaritmo natural de la magnitud y fase de X(z) = Σ x[n]·z^{-n}.
+
+    x : muestras de la señal
+    z : puntos del plano Z (cualquier forma)
+    n : índices temporales enteros de x (por defecto 0..N-1)
+
+    Retorna (ln|X(z)|, ∠X(z)) con la misma forma que z; ln|X| puede valer +inf (divergencia)
+    o -inf (cero exacto) sin producir desbordes intermedios.
+    """
+    x, n0 = _secuencia_contigua(x, n)
+    z = np.asarray(z, dtype=complex)
+    zp = z.ravel()
+
+    log_mag = np.empty(zp.size)
+    fase = np.empty(zp.size)
+    for bloque in iterar_bloques(zp.size, 1, itemsize=64, max_bytes=max_bytes):
+        log_mag[bloque], fase[bloque] = _horner_log(x, n0, zp[bloque])
+
+    return log_mag.reshape(z.shape), fase.reshape(z.shape)
+
+
+def transformada_z(x, z, n=None, max_bytes=None):
+    """
+    Evaluar X(z) = Σ x[n]·z^{-n} en los puntos z (cualquier forma).
+    Donde la suma diverge numéricamente se retorna inf.
+    """
+    log_mag, fase = log_transformada_z(x, z, n, max_bytes)
+    return _complejo_desde_log(log_mag, fase)
+
+
+def respuesta_hz(z, ceros, polos, ganancia=1.0, tolerancia=1e-6, max_bytes=None):
+    """
+    Evaluar H(z) = ganancia · Π(z - c_i) / Π(z - p_i) en los puntos z (cualquier forma).
+    Los puntos a menos de tolerancia de un polo se marcan con inf.
+    """
+    z = np.asarray(z, dtype=complex)
+    ceros = np.atleast_1d(np.asarray(ceros, dtype=complex))
+    polos = np.atleast_1d(np.asarray(polos, dtype=complex))
+    zp = z.ravel()
+
+    H = np.empty(zp.size, dtype=complex)
+    for bloque in iterar_bloques(zp.size, 1, itemsize=64, max_bytes=max_bytes):
+        zb = zp[bloque]
+        with np.errstate(divide='ignore'):
+            # Acumular ln|H| y fase por separado: sin desbordes con muchos polos/ceros
+            log_mag = np.full(zb.size, np.log(abs(ganancia)) if ganancia else -np.inf)
+            fase = np.full(zb.size, np.angle(ganancia))
+            for c in ceros:
+                d = zb - c
+                log_mag += np.log(np.abs(d))
+                fase += np.angle(d)
+            singular = np.zeros(zb.size, dtype=bool)
+            for p in polos:
+                d = zb - p
+                distancia = np.abs(d)
+                singular |= distancia <= tolerancia
+                log_mag -= np.log(np.maximum(distancia, tolerancia))
+                fase -= np.angle(d)
+
+        H[bloque] = _complejo_desde_log(log_mag, fase)
+        H[bloque][singular] = np.inf
+
+    return H.reshape(z.shape)
+
+
+def malla_plano_z(limites, puntos):
+    """
+    Malla rectangular del plano Z.
+    limites = (re_min, re_max, im_min, im_max), puntos = (n_re, n_im).
+    Retorna (Re, Im, Z) con forma (n_im, n_re), como np.meshgrid
+    """
+    re_min, re_max, im_min, im_max = limites
+    n_re, n_im = puntos
+    Re, Im = np.meshgrid(np.linspace(re_min, re_max, n_re), np.linspace(im_min, im_max, n_im))
+    return Re, Im, Re + 1j * Im
+
+
+def superficie_hz(polos, ceros, limites=(-1.5, 1.5, -1.5, 1.5), puntos=(50, 50),
+                  ganancia=1.0, tolerancia=1e-6):
+    """
+    (Re, Im, |H(z)|) sobre una malla rectangular, con inf en los polos.
+    El resultado se guarda en caché y es de solo lectura.
+    """
+    polos = np.atleast_1d(np.asarray(polos, dtype=complex))
+    ceros = np.atleast_1d(np.asarray(ceros, dtype=complex))
+    clave = ("hz", polos.tobytes(), ceros.tobytes(), tuple(limites), tuple(puntos),
+             complex(ganancia), tolerancia)
+
+    def calcular():
+        Re, Im, Z = malla_plano_z(limites, puntos)
+        return Re, Im, np.abs(respuesta_hz(Z, ceros, polos, ganancia, tolerancia))
+
+    return _superficies.obtener(clave, calcular)
+
+
+def superficie_transformada_z(x, limites=(-2, 2, -2, 2), puntos=(30, 30), n=None, radio_minimo=0.0):
+    """
+    (Re, Im, |X(z)|) sobre una malla rectangular.
+    Los puntos con |z| ≤ radio_minimo se marcan con inf. El resultado se guarda en
+    caché y es de solo lectura.
+    """
+    x = np.asarray(x)
+    n_bytes = None if n is None else np.asarray(n, dtype=np.int64).tobytes()
+    clave = ("xz", x.dtype.str, x.tobytes(), n_bytes, tuple(limites), tuple(puntos), radio_minimo)
+
+    def calcular():
+        Re, Im, Z = malla_plano_z(limites, puntos)
+        magnitud = np.abs(transformada_z(x, Z, n))
+        magnitud[np.abs(Z) <= radio_minimo] = np.inf
+        return Re, Im, magnitud
+
+    return _superficies.obtener(clave, calcular)
+
+
+def limpiar_cache():
+    """Vaciar la caché de superficies"""
+    _superficies.limpiar()
+
+
+def _secuencia_contigua(x, n):
+    """Convertir (x, n) en una secuencia contigua x[0..N-1] que empieza en n0"""
+    x = np.asarray(x)
+    if n is None:
+        return x, 0
+
+    n = np.asarray(n)
+    if n.size != x.size:
+        raise ValueError("x y n deben tener la misma longitud")
+    if x.size == 0:
+        return x, 0
+    if not np.issubdtype(n.dtype, np.integer):
+        if not np.all(n == np.round(n)):
+            raise ValueError("Los índices temporales n deben ser enteros")
+        n = n.astype(np.int64)
+
+    n0 = int(n.min())
+    if np.array_equal(n, np.arange(n0, n0 + n.size)):
+        return x, n0
+
+    # Índices no consecutivos: rellenar los huecos con ceros
+    denso = np.zeros(int(n.max()) - n0 + 1, dtype=np.result_type(x, float))
+    np.add.at(denso, n - n0, x)
+    return denso, n0
+
+
+def _horner_log(x, n0, z):
+    """(ln|X|, ∠X) de Σ x[m]·z^{-(n0+m)} acumulando siempre sobre una variable de módulo ≤ 1"""
+    N = x.size
+    log_mag = np.full(z.size, -np.inf)
+    fase = np.zeros(z.size)
+    if N == 0:
+        return log_mag, fase
+
+    radio = np.abs(z)
+    exterior = radio >= 1
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # |z| ≥ 1: X = z^{-n0} · Σ x[m]·w^m con w = 1/z
+        if exterior.any():
+            w = 1 / z[exterior]
+            acumulado = np.full(w.size, x[-1], dtype=complex)
+            for coeficiente in x[-2::-1]:
+                acumulado = acumulado * w + coeficiente
+            log_mag[exterior], fase[exterior] = _sumar_potencia(acumulado, z[exterior], -n0)
+
+        # |z| < 1: X = z^{-(n0+N-1)} · Σ x[m]·z^{N-1-m}
+        interior = ~exterior
+        if interior.any():
+            zi = z[interior]
+            acumulado = np.full(zi.size, x[0], dtype=complex)
+            for coeficiente in x[1:]:
+                acumulado = acumulado * zi + coeficiente
+            log_mag[interior], fase[interior] = _sumar_potencia(acumulado, zi, -(n0 + N - 1))
+
+    return log_mag, fase
+
+
+def _sumar_potencia(polinomio, z, exponente):
+    """(ln|P·z^k|, ∠(P·z^k)) sin calcular z^k explícitamente"""
+    log_mag = np.log(np.abs(polinomio))
+    fase = np.angle(polinomio)
+    if exponente:
+        nulo = polinomio == 0
+        log_mag = log_mag + exponente * np.log(np.abs(z))
+        fase = fase + exponente * np.angle(z)
+        # Polinomio nulo: el resultado es cero aunque la potencia diverja
+        log_mag[nulo] = -np.inf
+    return log_mag, fase
+
+
+def _complejo_desde_log(log_mag, fase):
+    """Reconstruir e^{ln|X|}·e^{j∠X}, con inf donde la magnitud desborda"""
+    with np.errstate(over='ignore', invalid='ignore'):
+        magnitud = np.exp(log_mag)
+        valor = magnitud * np.exp(1j * fase)
+    valor[np.isinf(magnitud)] = np.inf
+    return valor
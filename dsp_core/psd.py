@@ -0,0 +1,200 @@
+"""
+Densidad espectral de potencia (PSD) por el método de Welch, en streaming
+
+    P(f) = c · (1/K) · Σ_k |DFT{w · (x_k - tendencia_k)}|²
+
+x_k son K segmentos de nperseg muestras desplazados en paso = nperseg - solapamiento, y
+c = 1/(fs·Σw²) para la densidad (unidades²/Hz) o 1/(Σw)² para el espectro de potencia
+(unidades²). En la forma de un lado (señales reales) se duplican los bins distintos de
+0 y fs/2.
+
+WelchBloques consume la señal en bloques de cualquier tamaño: solo guarda las muestras
+del segmento aún incompleto (menos de nperseg por canal) y la suma de |X_k|², así que la
+memoria es O(canales·(bloque + nfft)) sin importar la duración del registro, y
+estimacion() entrega en cualquier momento la PSD de los segmentos ya recibidos.
+Los segmentos de cada bloque son vistas del búfer (sin copias) y se transforman por
+lotes con una rfft de memoria acotada. Con la señal completa el resultado coincide con
+scipy.signal.welch (average='mean'); periodograma es el caso de un solo segmento con
+toda la señal (scipy.signal.periodogram).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from ._bloques import iterar_bloques
+from .streaming import TAMANO_BLOQUE
+from .ventanas import ventana as _ventana
+
+ESCALADOS = ("densidad", "espectro")
+
+# Tendencia que se resta a cada segmento antes de la ventana (sin distinguir mayúsculas)
+TENDENCIAS = {
+    "constante": "constante", "constant": "constante",
+    "lineal": "lineal", "linear": "lineal",
+    "ninguna": None,
+}
+
+EstimacionPSD = namedtuple("EstimacionPSD", "f psd segmentos")
+EstimacionPSD.__doc__ = """
+Estimación de la PSD de una o varias señales (el último eje es la frecuencia):
+    f         : frecuencias de 0 a fs/2 (Hz)
+    psd       : densidad (unidades²/Hz) o espectro de potencia (unidades²), de un lado
+    segmentos : número de segmentos promediados
+"""
+
+
+class WelchBloques:
+    """
+    Estimador de Welch con estado para una señal que llega por bloques.
+
+    fs           : frecuencia de muestreo
+    nperseg      : muestras por segmento (por defecto 256, o la longitud de la ventana dada)
+    solapamiento : muestras compartidas por segmentos consecutivos (por defecto nperseg//2)
+    ventana      : nombre de ventana (forma periódica, como scipy) o arreglo de nperseg valores
+    nfft         : puntos de la DFT de cada segmento (≥ nperseg, por defecto nperseg)
+    tendencia    : "constante", "lineal" o None
+    escalado     : "densidad" o "espectro"
+
+    Los bloques son (muestras,) o (..., muestras) con varios canales; todos los bloques
+    deben tener los mismos canales.
+    """
+
+    def __init__(self, fs=1.0, nperseg=None, solapamiento=None, ventana="hann", nfft=None,
+                 tendencia="constante", escalado="densidad"):
+        if escalado not in ESCALADOS:
+            raise ValueError(f"Escalado de PSD desconocido: {escalado!r}")
+        if isinstance(tendencia, str) and tendencia.lower() in TENDENCIAS:
+            tendencia = TENDENCIAS[tendencia.lower()]
+        elif tendencia not in (None, False):
+            raise ValueError(f"Tendencia desconocida: {tendencia!r}")
+
+        if isinstance(ventana, str):
+            nperseg = 256 if nperseg is None else int(nperseg)
+            if nperseg < 1:
+                raise ValueError("nperseg debe ser positivo")
+            w = np.asarray(_ventana(ventana, nperseg, simetrica=False), dtype=float)
+        else:
+            w = np.asarray(ventana, dtype=float).ravel()
+            if nperseg is not None and int(nperseg) != w.size:
+                raise ValueError(f"La ventana tiene {w.size} muestras y nperseg = {nperseg}")
+            nperseg = w.size
+            if nperseg < 1:
+                raise ValueError("La ventana debe tener al menos una muestra")
+
+        solapamiento = nperseg // 2 if solapamiento is None else int(solapamiento)
+        if not 0 <= solapamiento < nperseg:
+            raise ValueError("El solapamiento debe cumplir 0 ≤ solapamiento < nperseg")
+        nfft = nperseg if nfft is None else int(nfft)
+        if nfft < nperseg:
+            raise ValueError("nfft debe ser mayor o igual que nperseg")
+
+        self.fs = fs
+        self.nperseg = nperseg
+        self.solapamiento = solapamiento
+        self.paso = nperseg - solapamiento
+        self.nfft = nfft
+        self.ventana = w
+        self.tendencia = tendencia or None
+        self.escalado = escalado
+        self.frecuencias = np.fft.rfftfreq(nfft, 1 / fs)
+
+        # Escala de cada bin de |X|² en la forma de un lado
+        escala = 1 / (fs * np.sum(w * w)) if escalado == "densidad" else 1 / np.sum(w) ** 2
+        self._factor = np.full(self.frecuencias.size, 2 * escala)
+        self._factor[0] = escala
+        if nfft % 2 == 0:
+            self._factor[-1] = escala
+        if self.tendencia == "lineal":
+            t = np.arange(nperseg) - (nperseg - 1) / 2
+            self._rampa = t / np.dot(t, t)
+            self._t = t
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Olvidar la señal recibida (los canales se fijan con el próximo bloque)"""
+        self.segmentos = 0
+        self.muestras_procesadas = 0
+        self._pendiente = None
+        self._suma = None
+
+    def procesar(self, bloque):
+        """Acumular los segmentos completos de un bloque (muestras,) o (..., muestras)"""
+        bloque = np.asarray(bloque, dtype=float)
+        if bloque.ndim == 0:
+            bloque = bloque.reshape(1)
+        if self._pendiente is None:
+            self._pendiente = np.zeros(bloque.shape[:-1] + (0,))
+            self._suma = np.zeros(bloque.shape[:-1] + (self.frecuencias.size,))
+        elif bloque.shape[:-1] != self._pendiente.shape[:-1]:
+            raise ValueError(f"Bloque con canales {bloque.shape[:-1]}; se esperaban "
+                             f"{self._pendiente.shape[:-1]}")
+        self.muestras_procesadas += bloque.shape[-1]
+
+        datos = np.concatenate([self._pendiente, bloque], axis=-1)
+        if datos.shape[-1] < self.nperseg:
+            self._pendiente = datos
+            return self
+
+        # Segmentos como vistas del búfer: (..., K, nperseg)
+        segmentos = np.lib.stride_tricks.sliding_window_view(datos, self.nperseg, axis=-1)[..., ::self.paso, :]
+        K = segmentos.shape[-2]
+        canales = int(np.prod(datos.shape[:-1], dtype=int))
+        for lote in iterar_bloques(K, canales * self.nfft, itemsize=32):
+            self._suma += np.sum(self._potencia(segmentos[..., lote, :]), axis=-2)
+        self.segmentos += K
+        # Quedan menos de nperseg muestras: el inicio del próximo segmento en adelante
+        self._pendiente = datos[..., K * self.paso:].copy()
+        return self
+
+    def estimacion(self):
+        """EstimacionPSD promedio de los segmentos completos recibidos hasta ahora"""
+        if not self.segmentos:
+            raise ValueError(f"Aún no hay segmentos completos ({self.muestras_procesadas} muestras "
+                             f"de {self.nperseg})")
+        return EstimacionPSD(self.frecuencias, self._suma * (self._factor / self.segmentos), self.segmentos)
+
+    def estimaciones(self, bloques):
+        """Generador: procesar un iterable de bloques y emitir la estimación tras cada bloque"""
+        for bloque in bloques:
+            self.procesar(bloque)
+            if self.segmentos:
+                yield self.estimacion()
+
+    def _potencia(self, segmentos):
+        """|DFT{w·(x - tendencia)}|² de un lote de segmentos (..., K, nperseg)"""
+        if self.tendencia == "constante":
+            segmentos = segmentos - segmentos.mean(axis=-1, keepdims=True)
+        elif self.tendencia == "lineal":
+            # Recta de mínimos cuadrados con la rampa centrada t: x - x̄ - (x·t/t·t)·t
+            pendiente = segmentos @ self._rampa
+            segmentos = segmentos - segmentos.mean(axis=-1, keepdims=True) - pendiente[..., None] * self._t
+        X = np.fft.rfft(segmentos * self.ventana, self.nfft, axis=-1)
+        return X.real ** 2 + X.imag ** 2
+
+
+def welch(x, fs=1.0, nperseg=None, solapamiento=None, ventana="hann", nfft=None,
+          tendencia="constante", escalado="densidad", tamano_bloque=TAMANO_BLOQUE):
+    """
+    PSD de Welch de una señal (..., muestras), de un np.memmap o de un iterable de bloques.
+    Los arreglos se recorren por bloques de tamano_bloque muestras a lo largo del último eje
+    (de un memmap solo se lee el bloque en curso). Si el arreglo es más corto que nperseg,
+    se usa un solo segmento con toda la señal, como en scipy.signal.welch
+    """
+    if isinstance(x, np.ndarray):
+        if isinstance(ventana, str) and x.shape[-1] < (256 if nperseg is None else nperseg):
+            nperseg = x.shape[-1]
+        bloques = (x[..., inicio:inicio + tamano_bloque] for inicio in range(0, x.shape[-1], tamano_bloque))
+    else:
+        bloques = x
+    estimador = WelchBloques(fs, nperseg, solapamiento, ventana, nfft, tendencia, escalado)
+    for bloque in bloques:
+        estimador.procesar(bloque)
+    return estimador.estimacion()
+
+
+def periodograma(x, fs=1.0, ventana="rectangular", nfft=None, tendencia="constante", escalado="densidad"):
+    """Periodograma (un solo segmento con toda la señal x (..., muestras)), como scipy.signal.periodogram"""
+    x = np.asarray(x, dtype=float)
+    nperseg = x.shape[-1] if isinstance(ventana, str) else None
+    return WelchBloques(fs, nperseg, 0, ventana, nfft, tendencia, escalado).procesar(x).estimacion()
@@ -0,0 +1,204 @@
+"""
+Reconstrucción de señales continuas a partir de sus muestras
+
+reconstruccion(...) evalúa la suma general y(t) = Σ x[n]·h(t - n) para cualquier h.
+Para los reconstructores del curso hay motores específicos, con muestras uniformes
+x[k] en t0 + k·T:
+    "zoh"   : retención de orden cero (escalera), una indexación por punto, O(M)
+    "foh"   : retención de primer orden (interpolación lineal, h triangular), O(M)
+    "ideal" : sinc exacta (todas las muestras) o sinc truncada a ±semiancho muestras
+              con ventana, como operación de banda: O(M·semiancho); si los instantes
+              caen en una malla T/L se usa la forma polifásica
+interpolar_polifase evalúa la sinc truncada sobre una malla L veces más densa con
+L filtros de fase (una convolución por fase) e interpolar_fft hace la interpolación
+de banda limitada periódica rellenando el espectro con ceros.
+"""
+
+import numpy as np
+
+from ._bloques import iterar_bloques
+
+METODOS = ("ideal", "zoh", "foh")
+VENTANAS_SINC = ("rectangular", "hann", "lanczos")
+
+# Con semiancho=None, la sinc exacta se usa mientras muestras × puntos no supere esto
+MAXIMO_SINC_EXACTA = 50_000_000
+
+# Semiancho usado cuando la sinc exacta sería demasiado costosa
+SEMIANCHO_POR_DEFECTO = 32
+
+
+def reconstruccion(xn, n, t, h_func, *h_args, max_bytes=None):
+    """
+    Suma de respuestas desplazadas y(t) = Σ x[n]·h(t - n).
+
+    xn     : valores de las muestras
+    n      : instantes de las muestras (mismas unidades que t)
+    t      : instantes donde se evalúa la reconstrucción
+    h_func : respuesta al impulso del reconstructor, h_func(t, *h_args), debe aceptar arreglos
+
+    La matriz h(t - n) se evalúa por bloques de t para acotar la memoria.
+    """
+    xn = np.asarray(xn, dtype=float)
+    n = np.asarray(n, dtype=float)
+    t = np.asarray(t, dtype=float)
+
+    tf = t.ravel()
+    y = np.empty(tf.size)
+    for bloque in iterar_bloques(tf.size, n.size, itemsize=8, max_bytes=max_bytes):
+        y[bloque] = h_func(tf[bloque, None] - n[None, :], *h_args) @ xn
+
+    return y.reshape(t.shape)
+
+
+def reconstruir(xn, t, T, metodo="ideal", t0=0.0, semiancho=None, ventana="hann", max_bytes=None):
+    """
+    Reconstruir en los instantes t una señal muestreada uniformemente (x[k] en t0 + k·T).
+
+    metodo    : "ideal" (sinc), "zoh" (escalera) o "foh" (lineal)
+    semiancho : para "ideal", número de muestras a cada lado que se usan (None = sinc exacta
+                si el tamaño lo permite, si no SEMIANCHO_POR_DEFECTO)
+    ventana   : ventana aplicada a la sinc truncada: "rectangular", "hann" o "lanczos"
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de reconstrucción desconocido: {metodo!r}")
+
+    xn = np.asarray(xn, dtype=float).ravel()
+    t = np.asarray(t, dtype=float)
+    u = ((t - t0) / T).ravel()  # Posición en unidades de muestra
+
+    if metodo == "zoh":
+        y = _retencion_orden_cero(xn, u)
+    elif metodo == "foh":
+        y = _retencion_primer_orden(xn, u)
+    else:
+        if semiancho is None and xn.size * u.size <= MAXIMO_SINC_EXACTA:
+            y = _sinc_exacta(xn, u, max_bytes)
+        else:
+            y = _sinc_en_malla(xn, u, semiancho or SEMIANCHO_POR_DEFECTO, ventana, max_bytes)
+
+    return y.reshape(t.shape)
+
+
+def interpolar_polifase(xn, L, semiancho=SEMIANCHO_POR_DEFECTO, ventana="hann"):
+    """
+    Reconstrucción sinc truncada en la malla t0 + m·T/L, m = 0..L·N - 1.
+    La fase p de la salida, y[k·L + p], es la convolución de x con un filtro fijo
+    de 2·semiancho coeficientes
+    """
+    xn = np.asarray(xn, dtype=float).ravel()
+    L = int(L)
+    if L < 1:
+        raise ValueError("El factor de interpolación debe ser positivo")
+    N, K = xn.size, int(semiancho)
+
+    # Desplazamientos j de las muestras vecinas: y(k + p/L) = Σ_j x[k - j]·h(p/L + j)
+    j = np.arange(-K, K)
+    y = np.empty((N, L))
+    for p in range(L):
+        fase = p / L + j
+        h = np.sinc(fase) * _ventana_sinc(fase, K, ventana)
+        # np.convolve(x, h)[i] = Σ_m h[m]·x[i-m]; con m = j + K, la salida k está en i = k + K
+        y[:, p] = np.convolve(xn, h)[K:K + N]
+    return y.ravel()
+
+
+def interpolar_fft(xn, L):
+    """
+    Interpolación de banda limitada por un factor entero L rellenando con ceros el
+    espectro (la señal se supone periódica de N muestras). Retorna L·N muestras
+    en t0 + m·T/L
+    """
+    xn = np.asarray(xn, dtype=float).ravel()
+    N, L = xn.size, int(L)
+    X = np.fft.rfft(xn)
+    if N % 2 == 0:
+        # Repartir la componente de Nyquist entre ±fs/2
+        X[-1] *= 0.5
+    return np.fft.irfft(X, L * N) * L
+
+
+def _retencion_orden_cero(xn, u):
+    """y(t) = x[⌊u⌋] para 0 ≤ u < N y 0 fuera del intervalo"""
+    k = np.floor(u)
+    dentro = (k >= 0) & (k < xn.size)
+    y = np.zeros(u.size)
+    y[dentro] = xn[k[dentro].astype(np.intp)]
+    return y
+
+
+def _retencion_primer_orden(xn, u):
+    """Suma de triángulos de ancho 2T: interpolación lineal con rampas a cero en los extremos"""
+    extendido = np.concatenate([[0.0], xn, [0.0]])
+    posiciones = np.arange(-1, xn.size + 1, dtype=float)
+    return np.interp(u, posiciones, extendido, left=0.0, right=0.0)
+
+
+def _sinc_exacta(xn, u, max_bytes=None):
+    """Σ_k x[k]·sinc(u - k) con todas las muestras, por bloques de puntos"""
+    k = np.arange(xn.size, dtype=float)
+    y = np.empty(u.size)
+    for bloque in iterar_bloques(u.size, xn.size, itemsize=8, max_bytes=max_bytes):
+        y[bloque] = np.sinc(u[bloque, None] - k[None, :]) @ xn
+    return y
+
+
+def _sinc_en_malla(xn, u, semiancho, ventana, max_bytes=None):
+    """
+    Sinc truncada: si los puntos caen en una malla k + p/L que cubre buena parte de la
+    señal se usa la forma polifásica, y la forma de banda para los puntos restantes
+    """
+    L = _factor_malla(u)
+    if L is None or u.size < xn.size * L // 4:
+        return _sinc_banda(xn, u, semiancho, ventana, max_bytes)
+
+    m = np.rint(u * L).astype(np.int64)
+    en_malla = (m >= 0) & (m < xn.size * L)
+    y = np.empty(u.size)
+    y[en_malla] = interpolar_polifase(xn, L, semiancho, ventana)[m[en_malla]]
+    if not en_malla.all():
+        y[~en_malla] = _sinc_banda(xn, u[~en_malla], semiancho, ventana, max_bytes)
+    return y
+
+
+def _factor_malla(u, factor_maximo=1024):
+    """L entero si todos los puntos u son múltiplos de 1/L (None si no)"""
+    if u.size < 2:
+        return None
+    paso = np.min(np.abs(np.diff(u)))
+    if paso <= 0 or paso > 1:
+        return None
+    L = int(round(1 / paso))
+    if L < 1 or L > factor_maximo:
+        return None
+    if np.abs(u * L - np.rint(u * L)).max() > 1e-6:
+        return None
+    return L
+
+
+def _sinc_banda(xn, u, semiancho, ventana, max_bytes=None):
+    """Σ_k x[k]·sinc(u - k)·w(u - k) sobre las 2·semiancho muestras más cercanas a cada punto"""
+    K = int(semiancho)
+    j = np.arange(-K + 1, K + 1)
+    y = np.empty(u.size)
+    for bloque in iterar_bloques(u.size, 2 * K, itemsize=8 * 3, max_bytes=max_bytes):
+        ub = u[bloque]
+        base = np.floor(ub).astype(np.int64)
+        indices = base[:, None] + j[None, :]
+        distancia = ub[:, None] - indices
+        valido = (indices >= 0) & (indices < xn.size)
+        pesos = np.sinc(distancia) * _ventana_sinc(distancia, K, ventana) * valido
+        y[bloque] = np.einsum('ij,ij->i', pesos, xn[np.clip(indices, 0, xn.size - 1)])
+    return y
+
+
+def _ventana_sinc(d, K, tipo):
+    """Ventana de la sinc truncada evaluada en la distancia d (|d| ≤ K)"""
+    if tipo not in VENTANAS_SINC:
+        raise ValueError(f"Ventana desconocida: {tipo!r}")
+    dentro = np.abs(d) <= K
+    if tipo == "rectangular":
+        return dentro.astype(float)
+    if tipo == "hann":
+        return (0.5 + 0.5 * np.cos(np.pi * d / K)) * dentro
+    return np.sinc(d / K) * dentro
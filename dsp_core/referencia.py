@@ -0,0 +1,112 @@
+"""
+Implementaciones de referencia con bucles explícitos (tal como se presentan en clase).
+Se usan para verificar los núcleos vectorizados y como línea base en los benchmarks.
+"""
+
+import numpy as np
+
+
+def calcular_dtft_bucle(x, omega):
+    """DTFT evaluando la suma completa para cada frecuencia"""
+    n = np.arange(len(x))
+    X = np.zeros(len(omega), dtype=complex)
+    for i, w in enumerate(omega):
+        X[i] = np.sum(x * np.exp(-1j * w * n))
+    return X
+
+
+def matriz_dft_bucle(N):
+    """Matriz DFT llenada elemento a elemento"""
+    W = np.zeros((N, N), dtype=complex)
+    for k in range(N):
+        for n in range(N):
+            W[k, n] = np.exp(-2j * np.pi * k * n / N)
+    return W
+
+
+def convolucion_directa_bucle(x, h):
+    """Convolución lineal con doble bucle"""
+    L = len(x)
+    M = len(h) - 1
+    y = np.zeros(L + M)
+    for n in range(L + M):
+        m_min = max(0, n - L + 1)
+        m_max = min(n, M)
+        for m in range(m_min, m_max + 1):
+            y[n] += h[m] * x[n - m]
+    return y
+
+
+def convolucion_circular_bucle(x, h):
+    """Convolución circular con doble bucle"""
+    N = max(len(x), len(h))
+    x_pad = np.pad(x, (0, N - len(x)), mode='constant')
+    h_pad = np.pad(h, (0, N - len(h)), mode='constant')
+    y = np.zeros(N)
+    for n in range(N):
+        for m in range(N):
+            y[n] += x_pad[m] * h_pad[(n - m) % N]
+    return y
+
+
+def reconstruccion_bucle(xn, n, t, h_func, *h_args):
+    """Reconstrucción sumando una respuesta desplazada por muestra"""
+    y = np.zeros_like(t)
+    for i, ni in enumerate(n):
+        y += xn[i] * h_func(t - ni, *h_args)
+    return y
+
+
+def ventana_formula(tipo, L):
+    """Ventanas simétricas escritas con su fórmula de cosenos"""
+    n = np.arange(L)
+    a = {
+        "rectangular": (1.0, 0.0, 0.0),
+        "hamming": (0.54, 0.46, 0.0),
+        "hann": (0.5, 0.5, 0.0),
+        "blackman": (0.42, 0.5, 0.08),
+    }[tipo]
+    return a[0] - a[1] * np.cos(2 * np.pi * n / (L - 1)) + a[2] * np.cos(4 * np.pi * n / (L - 1))
+
+
+def transformada_z_bucle(x, z_values, n=None):
+    """X(z) evaluando la suma completa en cada punto"""
+    n = np.arange(len(x)) if n is None else np.asarray(n, dtype=float)
+    z_values = np.asarray(z_values, dtype=complex)
+    X = np.zeros(z_values.size, dtype=complex)
+    for i, z in enumerate(z_values.ravel()):
+        X[i] = np.sum(x * (z ** (-n)))
+    return X.reshape(z_values.shape)
+
+
+def superficie_hz_bucle(Z_plane, polos, ceros):
+    """|H(z)| punto a punto multiplicando ceros y dividiendo por polos"""
+    H_mag = np.ones_like(Z_plane, dtype=float)
+    for i in range(Z_plane.shape[0]):
+        for j in range(Z_plane.shape[1]):
+            z = Z_plane[i, j]
+            h_val = 1.0 + 0j
+            for cero in ceros:
+                h_val *= (z - cero)
+            for polo in polos:
+                if np.abs(z - polo) > 1e-6:
+                    h_val /= (z - polo)
+                else:
+                    h_val = np.inf
+            H_mag[i, j] = np.abs(h_val)
+    return H_mag
+
+
+def ecuacion_diferencias_bucle(b, a, x):
+    """a[0]·y[n] = Σ b[k]·x[n-k] - Σ a[k]·y[n-k] evaluada muestra a muestra"""
+    y = np.zeros(len(x))
+    for n in range(len(x)):
+        acumulado = 0.0
+        for k in range(len(b)):
+            if n - k >= 0:
+                acumulado += b[k] * x[n - k]
+        for k in range(1, len(a)):
+            if n - k >= 0:
+                acumulado -= a[k] * y[n - k]
+        y[n] = acumulado / a[0]
+    return y
@@ -0,0 +1,232 @@
+"""
+Respuesta en frecuencia por lotes: magnitud, fase desenrollada y retardo de grupo
+
+Un mismo llamado evalúa muchos filtros a la vez, dados como polinomios (b, a) apilados
+(..., coeficientes), como cascadas SOS (..., secciones, 6) o como polos y ceros.
+El retardo de grupo sale de los polinomios, sin derivar la fase numéricamente:
+
+    P(e^{jω}) = Σ p_k·e^{-jωk}   →   τ_P(ω) = Re{ Σ k·p_k·e^{-jωk} / P(e^{jω}) }
+    τ_H = τ_b - τ_a
+
+Evaluación de los polinomios según la rejilla de frecuencias:
+    "fft"     : rejilla uniforme con paso fs/K (K entero), p. ej. linspace(0, fs/2, M)
+                o la de freqz (worN = M). Los coeficientes se pliegan módulo K y basta
+                una FFT de K puntos por filtro (rfft si son reales y la rejilla parte en 0).
+    "directo" : rejilla arbitraria (logarítmica, sub-bandas): producto por la matriz
+                e^{-jωk}, que se guarda en caché junto con el tipo de cada rejilla.
+
+Las rejillas lineales y logarítmicas se guardan en caché por tamaño y espaciado, de modo
+que los sliders que reevalúan un filtro en cada evento no vuelven a construirlas.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from ._bloques import MEMORIA_MAXIMA_BYTES
+from ._cache import CacheLRU
+from .dtft import _periodo_fft, _rejilla_uniforme
+
+ESCALAS = ("lineal", "log")
+
+# Rejillas por (escala, puntos, f_min, f_max) y, para cada rejilla, su método de evaluación
+_rejillas = CacheLRU(max_entradas=64)
+_planes = CacheLRU(max_entradas=64)
+# Matrices e^{-jωk} de la evaluación directa: (rejilla, fs, coeficientes) -> matriz
+_potencias = CacheLRU(max_entradas=16)
+
+RespuestaFrecuencia = namedtuple("RespuestaFrecuencia", "f H db fase retardo")
+RespuestaFrecuencia.__doc__ = """
+Respuesta en frecuencia de uno o varios filtros (el último eje es la frecuencia):
+    f       : frecuencias evaluadas (Hz)
+    H       : H(e^{jω}) compleja
+    db      : 20·log10|H| (limitada a -400 dB en los ceros)
+    fase    : fase desenrollada (rad)
+    retardo : retardo de grupo -dφ/dω (muestras)
+"""
+
+
+def rejilla_frecuencias(puntos, fs=2.0, escala="lineal", f_min=None, f_max=None):
+    """
+    Rejilla de frecuencias (Hz) de solo lectura, guardada en caché.
+
+    puntos : número de frecuencias
+    escala : "lineal" (por defecto de 0 a fs/2) o "log" (por defecto de fs/2000 a fs/2)
+    """
+    if escala not in ESCALAS:
+        raise ValueError(f"Escala de frecuencias desconocida: {escala!r}")
+    puntos = int(puntos)
+    if puntos < 1:
+        raise ValueError("La rejilla necesita al menos una frecuencia")
+    f_max = fs / 2 if f_max is None else float(f_max)
+    if escala == "lineal":
+        f_min = 0.0 if f_min is None else float(f_min)
+        calcular = lambda: np.linspace(f_min, f_max, puntos)
+    else:
+        f_min = f_max / 1000 if f_min is None else float(f_min)
+        if f_min <= 0 or f_max <= 0:
+            raise ValueError("La rejilla logarítmica requiere frecuencias positivas")
+        calcular = lambda: np.geomspace(f_min, f_max, puntos)
+    return _rejillas.obtener((escala, puntos, f_min, f_max), calcular)
+
+
+def respuesta_frecuencia(b=None, a=1.0, sos=None, zpk=None, f=512, fs=2.0, escala="lineal"):
+    """
+    RespuestaFrecuencia de uno o varios filtros en las frecuencias f (Hz).
+
+    b, a   : polinomios en z^{-1}, de forma (coeficientes,) o apilados (..., coeficientes);
+             los ejes iniciales de b y a se combinan por difusión
+    sos    : cascadas SOS de forma (..., secciones, 6), en lugar de (b, a)
+    zpk    : (ceros, polos, ganancia) con H(z) = ganancia·Π(z - c)/Π(z - p), en lugar de (b, a);
+             ceros y polos de forma (..., n) y ganancia escalar o de forma (...)
+    f      : número de frecuencias (rejilla en caché con la escala dada) o arreglo de frecuencias
+    escala : "lineal" o "log", si f es un número de frecuencias
+    """
+    if sum(dato is not None for dato in (b, sos, zpk)) != 1:
+        raise ValueError("Indique exactamente uno de b, sos o zpk")
+    if np.ndim(f) == 0:
+        f = rejilla_frecuencias(f, fs, escala)
+    else:
+        f = np.asarray(f, dtype=float).ravel()
+
+    if sos is not None:
+        H, retardo = _evaluar_sos(sos, f, fs)
+    elif zpk is not None:
+        H, retardo = _evaluar_zpk(*zpk, f, fs)
+    else:
+        H, retardo = _evaluar_ba(b, a, f, fs)
+    return RespuestaFrecuencia(f, H, *_magnitud_fase(H), retardo)
+
+
+def limpiar_cache():
+    """Vaciar las cachés de rejillas y de matrices de evaluación"""
+    _rejillas.limpiar()
+    _planes.limpiar()
+    _potencias.limpiar()
+
+
+def _magnitud_fase(H):
+    """(dB limitados a -400, fase desenrollada en el último eje)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        db = np.maximum(20 * np.log10(np.abs(H)), -400.0)
+    return db, np.unwrap(np.angle(H), axis=-1)
+
+
+def _evaluar_ba(b, a, f, fs):
+    """H y retardo de grupo de polinomios (b, a) apilados"""
+    b = np.atleast_1d(np.asarray(b))
+    a = np.atleast_1d(np.asarray(a))
+    if b.shape[-1] == 0 or a.shape[-1] == 0:
+        raise ValueError("b y a deben tener al menos un coeficiente")
+
+    B, tau_b = _evaluar_polinomio(b, f, fs)
+    if a.shape[-1] == 1:
+        # Denominador constante (FIR): sin evaluación ni retardo
+        A, tau_a = a, 0.0
+    else:
+        A, tau_a = _evaluar_polinomio(a, f, fs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return B / A, tau_b - tau_a
+
+
+def _evaluar_polinomio(p, f, fs):
+    """P(e^{jω}) y su retardo de grupo Re{Σ k·p_k·e^{-jωk} / P} en las frecuencias f"""
+    k = np.arange(p.shape[-1])
+    valores = _evaluar_coeficientes(np.stack([p, p * k]), f, fs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return valores[0], np.real(valores[1] / valores[0])
+
+
+def _evaluar_coeficientes(p, f, fs):
+    """Σ p_k·e^{-jωk} (ω = 2πf/fs) para cada fila de p (..., coeficientes)"""
+    N, M = p.shape[-1], f.size
+    plan = _plan(f, fs, N)
+    if plan[0] == "fft":
+        return _evaluar_fft(p, plan[1], plan[2], M)
+
+    # Evaluación directa: la matriz e^{-jωk} se reutiliza mientras quepa en memoria
+    if N * M * 16 <= MEMORIA_MAXIMA_BYTES:
+        clave = (f.tobytes(), fs, N)
+        potencias = _potencias.obtener(clave, lambda: np.exp(-2j * np.pi * np.outer(np.arange(N), f) / fs))
+        return p @ potencias
+    resultado = np.zeros(p.shape[:-1] + (M,), dtype=complex)
+    paso = max(1, int(MEMORIA_MAXIMA_BYTES // (16 * N)))
+    for inicio in range(0, M, paso):
+        bloque = f[inicio:inicio + paso]
+        resultado[..., inicio:inicio + paso] = p @ np.exp(-2j * np.pi * np.outer(np.arange(N), bloque) / fs)
+    return resultado
+
+
+def _plan(f, fs, N):
+    """("fft", ω0, K) si la rejilla es uniforme con paso 2π/K conveniente, si no ("directo",)"""
+    rejilla = _planes.obtener((f.tobytes(), fs), lambda: _clasificar(f, fs))
+    if rejilla[0] == "fft" and rejilla[2] <= 4 * (N + f.size):
+        return rejilla
+    return ("directo",)
+
+
+def _clasificar(f, fs):
+    """Tipo de una rejilla de frecuencias: uniforme con paso 2π/K entero o arbitraria"""
+    uniforme = _rejilla_uniforme(2 * np.pi * f / fs)
+    if uniforme is not None:
+        K = _periodo_fft(uniforme[1])
+        if K is not None:
+            return ("fft", uniforme[0], K)
+    return ("directo",)
+
+
+def _evaluar_fft(p, w0, K, M):
+    """Σ p_k·e^{-jω_m k} en ω_m = ω0 + 2πm/K (m = 0..M-1) con una FFT de K puntos por fila"""
+    N = p.shape[-1]
+    if w0:
+        p = p * np.exp(-1j * w0 * np.arange(N))
+
+    # Plegar los coeficientes módulo K: e^{-j2πmk/K} tiene periodo K en k
+    if N > K:
+        relleno = -N % K
+        p = np.concatenate([p, np.zeros(p.shape[:-1] + (relleno,), dtype=p.dtype)], axis=-1)
+        p = p.reshape(p.shape[:-1] + (-1, K)).sum(axis=-2)
+
+    indices = np.arange(M) % K
+    if not np.iscomplexobj(p) and indices.max() <= K // 2:
+        return np.fft.rfft(p, K, axis=-1)[..., indices]
+    return np.fft.fft(p, K, axis=-1)[..., indices]
+
+
+def _evaluar_sos(sos, f, fs):
+    """H y retardo de grupo de cascadas SOS (..., secciones, 6), sección por sección"""
+    sos = np.asarray(sos, dtype=float)
+    if sos.ndim < 2 or sos.shape[-1] != 6:
+        raise ValueError("sos debe tener forma (..., secciones, 6)")
+    # e^{-jωk}, k = 0, 1, 2 (filas) en cada frecuencia (columnas)
+    potencias = np.exp(-1j * 2 * np.pi * f / fs) ** np.arange(3)[:, None]
+
+    # Numerador y denominador de cada sección en todas las frecuencias con un producto
+    # matricial: P y Σ k·p_k·e^{-jωk}, de forma (..., secciones, 2, frecuencias)
+    coeficientes = sos.reshape(sos.shape[:-1] + (2, 3)).astype(complex)
+    P = coeficientes @ potencias
+    dP = (coeficientes * np.arange(3)) @ potencias
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        H = np.prod(P[..., 0, :], axis=-2) / np.prod(P[..., 1, :], axis=-2)
+        retardo_polinomios = np.real(dP / P)
+        retardo = np.sum(retardo_polinomios[..., 0, :] - retardo_polinomios[..., 1, :], axis=-2)
+    return H, retardo
+
+
+def _evaluar_zpk(ceros, polos, ganancia, f, fs):
+    """
+    H y retardo de grupo de polos y ceros: cada factor (z - c) aporta -Re{z/(z - c)}
+    al retardo y cada (z - p) aporta +Re{z/(z - p)}
+    """
+    ceros = np.asarray(ceros, dtype=complex)
+    polos = np.asarray(polos, dtype=complex)
+    ganancia = np.asarray(ganancia)
+    z = np.exp(2j * np.pi * f / fs)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dz_ceros = z - ceros[..., None]
+        dz_polos = z - polos[..., None]
+        H = ganancia[..., None] * np.prod(dz_ceros, axis=-2) / np.prod(dz_polos, axis=-2)
+        retardo = np.sum(np.real(z / dz_polos), axis=-2) - np.sum(np.real(z / dz_ceros), axis=-2)
+    return H, retardo
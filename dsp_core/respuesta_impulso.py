@@ -0,0 +1,142 @@
+"""
+Respuesta al impulso exacta de un sistema dado por sus polos, ceros y ganancia
+
+H(z) = ganancia · Π(1 - c_i·z^{-1}) / Π(1 - p_i·z^{-1})   (forma en z^{-1}, como lfilter)
+
+respuesta_impulso convierte (ceros, polos, ganancia) a secciones de segundo orden (SOS)
+y filtra un impulso: h[n] sale de la recursión de la ecuación en diferencias, O(N) por
+sección, sin elevar polos a potencias ni limitarse a los polos estables. Si los polos
+o ceros complejos no forman pares conjugados el sistema es complejo y la recursión se
+hace con los coeficientes (b, a) complejos.
+
+expansion_residuos y respuesta_residuos dan la forma cerrada equivalente
+h[n] = Σ r_i·C(n + m_i - 1, m_i - 1)·p_i^n + k[n]  (m_i: potencia del término del polo p_i),
+útil para mostrar la contribución de cada polo y para verificar la recursión.
+
+Con menos ceros que polos, scipy.signal.dimpulse usa la forma en potencias positivas de z
+y su respuesta queda retrasada len(polos) - len(ceros) muestras respecto a esta.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import signal
+
+from .lti import filtrar
+
+# Parte imaginaria relativa por debajo de la cual los coeficientes se consideran reales
+TOLERANCIA_REAL = 1e-10
+
+ExpansionResiduos = namedtuple("ExpansionResiduos", "residuos polos potencias directos")
+ExpansionResiduos.__doc__ = """
+Expansión en fracciones parciales de H(z) en z^{-1}:
+    residuos  : r_i de cada término r_i / (1 - p_i·z^{-1})^m_i
+    polos     : p_i (repetidos una vez por potencia si el polo es múltiple)
+    potencias : m_i de cada término
+    directos  : términos directos k[n] (cuando hay tantos ceros como polos o más)
+"""
+
+
+def coeficientes(ceros, polos, ganancia=1.0):
+    """
+    Coeficientes (b, a) de la ecuación en diferencias en z^{-1}. Son reales (float)
+    cuando los polos y ceros complejos forman pares conjugados, y complejos si no
+    """
+    ceros, polos = _raices(ceros), _raices(polos)
+    b = ganancia * np.poly(ceros) if ceros.size else np.atleast_1d(np.asarray(ganancia) * 1.0)
+    a = np.poly(polos) if polos.size else np.ones(1)
+    return _real_si_puede(np.asarray(b)), _real_si_puede(np.asarray(a))
+
+
+def zpk_a_sos(ceros, polos, ganancia=1.0):
+    """
+    Secciones de segundo orden (n_secciones × 6) de un sistema real, o None si el sistema
+    es complejo (polos o ceros sin su conjugado)
+    """
+    b, a = coeficientes(ceros, polos, ganancia)
+    if np.iscomplexobj(b) or np.iscomplexobj(a):
+        return None
+    try:
+        return signal.zpk2sos(_raices(ceros), _raices(polos), float(np.real(ganancia)))
+    except ValueError:
+        # Pares conjugados solo dentro de TOLERANCIA_REAL: agrupar desde los coeficientes reales
+        return signal.tf2sos(b, a)
+
+
+def respuesta_impulso(ceros, polos, ganancia=1.0, N=64):
+    """
+    h[n], n = 0..N-1, filtrando un impulso con las secciones SOS del sistema (o con sus
+    coeficientes complejos). Retorna float para sistemas reales y complex si no
+    """
+    N = int(N)
+    if N < 0:
+        raise ValueError("N no puede ser negativo")
+    impulso = np.zeros(N)
+    if N:
+        impulso[0] = 1.0
+    sos = zpk_a_sos(ceros, polos, ganancia)
+    if sos is not None:
+        return filtrar(impulso, sos=sos)
+    b, a = coeficientes(ceros, polos, ganancia)
+    return signal.lfilter(b, a, impulso)
+
+
+def respuestas_impulso(sistemas, N=64):
+    """
+    Respuestas al impulso de un lote de sistemas [(ceros, polos, ganancia), ...], de
+    órdenes posiblemente distintos. Retorna un arreglo (sistemas × N)
+    """
+    filas = [respuesta_impulso(*sistema, N=N) for sistema in sistemas]
+    if not filas:
+        return np.zeros((0, int(N)))
+    dtype = complex if any(np.iscomplexobj(fila) for fila in filas) else float
+    return np.array(filas, dtype=dtype)
+
+
+def expansion_residuos(ceros, polos, ganancia=1.0, tolerancia=1e-3):
+    """
+    Expansión en fracciones parciales (ExpansionResiduos) de H(z). Los polos a menos de
+    tolerancia entre sí se tratan como un polo múltiple
+    """
+    b, a = coeficientes(ceros, polos, ganancia)
+    r, p, k = signal.residuez(b, a, tol=tolerancia)
+    # residuez lista un polo múltiple seguido, con potencias 1, 2, ... en orden
+    potencias = np.ones(p.size, dtype=int)
+    for i in range(1, p.size):
+        if abs(p[i] - p[i - 1]) <= tolerancia:
+            potencias[i] = potencias[i - 1] + 1
+    return ExpansionResiduos(r, p, potencias, np.atleast_1d(k))
+
+
+def respuesta_residuos(expansion, N=64):
+    """
+    h[n], n = 0..N-1, desde la forma cerrada de una ExpansionResiduos. Retorna float si
+    las partes imaginarias se cancelan (sistema real)
+    """
+    n = np.arange(int(N))
+    h = np.zeros(n.size, dtype=complex)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for r, p, m in zip(expansion.residuos, expansion.polos, expansion.potencias):
+            # Antitransformada de 1/(1 - p·z^{-1})^m: C(n + m - 1, m - 1)·p^n·u[n]
+            binomial = np.ones(n.size)
+            for j in range(1, m):
+                binomial *= (n + j) / j
+            h += r * binomial * np.power(complex(p), n)
+    directos = expansion.directos[:n.size]
+    h[:directos.size] += directos
+    return _real_si_puede(h)
+
+
+def _raices(valores):
+    """Arreglo 1-D complejo de polos o ceros"""
+    return np.atleast_1d(np.asarray(valores, dtype=complex)).ravel()
+
+
+def _real_si_puede(c):
+    """c como float si su parte imaginaria es despreciable (relativa a TOLERANCIA_REAL)"""
+    if not np.iscomplexobj(c):
+        return c.astype(float)
+    escala = np.max(np.abs(c), initial=0.0)
+    if np.all(np.abs(c.imag) <= TOLERANCIA_REAL * max(escala, 1.0)):
+        return c.real.copy()
+    return c
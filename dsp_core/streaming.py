@@ -0,0 +1,147 @@
+"""
+Filtrado FIR por bloques para registros largos (streaming)
+
+FiltroFIRBloques guarda las últimas Lh - 1 muestras de entrada entre bloques
+(estado de solapamiento), por lo que la salida concatenada es idéntica a la del
+cálculo de una sola vez y la memoria usada es O(bloque + coeficientes) sin importar
+la duración del registro. Las fuentes pueden ser arreglos, archivos mapeados en
+memoria (np.memmap), archivos WAV PCM o cualquier iterador de bloques.
+"""
+
+import wave
+
+import numpy as np
+
+from .convolucion import convolucionar
+
+MODOS = ("causal", "lineal", "same")
+
+# Tamaño por defecto de los bloques leídos de una fuente (muestras)
+TAMANO_BLOQUE = 65536
+
+
+class FiltroFIRBloques:
+    """
+    Filtro FIR con estado para procesar una señal bloque a bloque.
+
+    modo:
+        "causal" : y[n] = Σ h[m]·x[n-m], misma longitud que la entrada (como lfilter(h, 1, x))
+        "lineal" : convolución completa; finalizar() entrega las Lh - 1 muestras finales
+        "same"   : como np.convolve(x, h, 'same') para len(x) ≥ len(h); se descartan las
+                   primeras (Lh - 1)//2 muestras y finalizar() entrega las que faltan
+    """
+
+    def __init__(self, h, modo="causal"):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de filtrado desconocido: {modo!r}")
+        self.h = np.asarray(h, dtype=float).ravel()
+        if self.h.size == 0:
+            raise ValueError("El filtro debe tener al menos un coeficiente")
+        self.modo = modo
+
+        retardo = (self.h.size - 1) // 2
+        self._descartar_inicial = retardo if modo == "same" else 0
+        self._largo_cola = {"causal": 0, "lineal": self.h.size - 1, "same": retardo}[modo]
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Volver al estado inicial (entrada previa nula)"""
+        self.estado = np.zeros(self.h.size - 1)
+        self.muestras_procesadas = 0
+        self._por_descartar = self._descartar_inicial
+
+    def procesar(self, bloque):
+        """Filtrar un bloque de entrada y retornar el bloque de salida correspondiente"""
+        bloque = np.asarray(bloque, dtype=float).ravel()
+        if bloque.size == 0:
+            return np.zeros(0)
+
+        # Salida válida de la convolución de [estado, bloque] con h
+        extendido = np.concatenate([self.estado, bloque])
+        y = convolucionar(extendido, self.h)[self.h.size - 1:extendido.size]
+
+        if self.estado.size:
+            self.estado = extendido[-self.estado.size:].copy()
+        self.muestras_procesadas += bloque.size
+
+        if self._por_descartar:
+            descartar = min(self._por_descartar, y.size)
+            self._por_descartar -= descartar
+            y = y[descartar:]
+        return y
+
+    def finalizar(self):
+        """
+        Muestras finales que dependen solo de entradas ya recibidas
+        (vacío en modo "causal"). El filtro queda listo para una nueva señal.
+        """
+        if not self._largo_cola:
+            self.reiniciar()
+            return np.zeros(0)
+
+        cola = self.procesar(np.zeros(self._largo_cola))
+        self.reiniciar()
+        return cola
+
+    def filtrar(self, bloques, incluir_cola=True):
+        """Generador: filtrar un iterable de bloques y emitir los bloques de salida"""
+        for bloque in bloques:
+            y = self.procesar(bloque)
+            if y.size:
+                yield y
+        if incluir_cola:
+            cola = self.finalizar()
+            if cola.size:
+                yield cola
+
+
+def bloques_de(fuente, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Generar bloques consecutivos de una fuente 1-D (arreglo o np.memmap).
+    Con un memmap solo se lee del disco el bloque en curso.
+    """
+    for inicio in range(0, len(fuente), tamano_bloque):
+        yield np.asarray(fuente[inicio:inicio + tamano_bloque])
+
+
+def bloques_de_archivo(ruta, dtype=np.float32, tamano_bloque=TAMANO_BLOQUE, offset=0):
+    """Generar bloques de un archivo binario de muestras crudas mapeándolo en memoria"""
+    datos = np.memmap(ruta, dtype=dtype, mode='r', offset=offset)
+    try:
+        yield from bloques_de(datos, tamano_bloque)
+    finally:
+        del datos
+
+
+def formato_wav(ruta):
+    """Parámetros de un archivo WAV (nchannels, sampwidth, framerate, nframes, ...)"""
+    with wave.open(str(ruta), 'rb') as archivo:
+        return archivo.getparams()
+
+
+def bloques_wav(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Generar bloques de muestras enteras de un WAV PCM de 16 o 32 bits, sin convertirlas
+    a punto flotante: (muestras,) si es mono o (canales × muestras) si tiene varios canales
+    """
+    with wave.open(str(ruta), 'rb') as archivo:
+        canales, ancho = archivo.getnchannels(), archivo.getsampwidth()
+        if ancho not in (2, 4):
+            raise ValueError(f"Solo se admiten WAV PCM de 16 o 32 bits (el archivo tiene {8 * ancho})")
+        dtype = np.dtype('<i2' if ancho == 2 else '<i4')
+        while True:
+            datos = archivo.readframes(tamano_bloque)
+            if not datos:
+                break
+            bloque = np.frombuffer(datos, dtype=dtype)
+            yield bloque if canales == 1 else bloque.reshape(-1, canales).T
+
+
+def filtrar_en_bloques(h, fuente, modo="causal", tamano_bloque=TAMANO_BLOQUE):
+    """
+    Filtrar una fuente con un FIR por bloques.
+    fuente: arreglo, np.memmap o iterable de bloques. Retorna un generador de bloques de salida
+    """
+    if isinstance(fuente, np.ndarray):
+        fuente = bloques_de(fuente, tamano_bloque)
+    return FiltroFIRBloques(h, modo).filtrar(fuente)
@@ -0,0 +1,205 @@
+"""
+Ventanas para análisis espectral
+
+Registro de ventanas por nombre con caché LRU: ventana(tipo, L, simetrica) retorna un
+arreglo de solo lectura compartido, de modo que las clases que piden la misma ventana
+en cada actualización no la reconstruyen. Las formas simétricas usan el denominador
+L-1 (como np.hamming); las periódicas (simetrica=False) son la simétrica de L+1
+muestras sin la última, la forma adecuada para la DFT.
+
+Las métricas espectrales de cada ventana (ENBW, ganancia coherente, ancho del lóbulo
+principal y nivel del mayor lóbulo lateral) se calculan solo cuando se piden, con
+metricas_ventana, y también quedan en caché.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy.signal import windows
+
+from ._cache import CacheLRU
+
+# Solo se guardan en caché las ventanas de hasta esta longitud
+LONGITUD_MAXIMA_CACHE = 4096
+
+# Sobremuestreo del espectro usado para medir los lóbulos
+SOBREMUESTREO_METRICAS = 32
+
+_ventanas = CacheLRU(max_entradas=2048)
+_metricas = CacheLRU(max_entradas=256)
+
+MetricasVentana = namedtuple("MetricasVentana",
+                             "enbw ganancia_coherente ancho_lobulo lobulo_lateral_db")
+MetricasVentana.__doc__ = """
+Métricas espectrales de una ventana:
+    enbw               : ancho de banda equivalente de ruido (bins)
+    ganancia_coherente : Σw/L (amplitud de una senoidal centrada en un bin)
+    ancho_lobulo       : ancho del lóbulo principal entre sus primeros mínimos (bins)
+    lobulo_lateral_db  : nivel del mayor lóbulo lateral respecto al principal (dB)
+"""
+
+
+def ventana_rect(L, simetrica=True):
+    """Ventana rectangular de L muestras"""
+    return _obtener("rectangular", L, simetrica)
+
+
+def ventana_hamming(L, simetrica=True):
+    """Ventana de Hamming: 0.54 - 0.46·cos(2πn/(L-1))"""
+    return _obtener("hamming", L, simetrica)
+
+
+def ventana_hann(L, simetrica=True):
+    """Ventana de Hann: 0.5 - 0.5·cos(2πn/(L-1))"""
+    return _obtener("hann", L, simetrica)
+
+
+def ventana_blackman(L, simetrica=True):
+    """Ventana de Blackman: 0.42 - 0.5·cos(2πn/(L-1)) + 0.08·cos(4πn/(L-1))"""
+    return _obtener("blackman", L, simetrica)
+
+
+def ventana_kaiser(L, beta=8.6, simetrica=True):
+    """Ventana de Kaiser: I0(β·√(1 - (2n/(L-1) - 1)²)) / I0(β)"""
+    return _obtener("kaiser", L, simetrica, beta)
+
+
+def ventana_tukey(L, alpha=0.5, simetrica=True):
+    """Ventana de Tukey (coseno ahusado): plana salvo una fracción alpha con flancos de Hann"""
+    return _obtener("tukey", L, simetrica, alpha)
+
+
+def ventana_flattop(L, simetrica=True):
+    """Ventana flat-top de 5 términos (error de amplitud casi nulo entre bins)"""
+    return _obtener("flattop", L, simetrica)
+
+
+def ventana_dpss(L, NW=3.0, simetrica=True):
+    """Primera secuencia de Slepian (DPSS) con semiancho de banda NW, máximo 1"""
+    return _obtener("dpss", L, simetrica, NW)
+
+
+# Construcción de cada tipo (forma simétrica) y valor por defecto de su parámetro
+_TIPOS = {
+    "rectangular": (lambda L, p: np.ones(L), None),
+    "hamming": (lambda L, p: np.hamming(L), None),
+    "hann": (lambda L, p: np.hanning(L), None),
+    "blackman": (lambda L, p: np.blackman(L), None),
+    "kaiser": (lambda L, beta: np.kaiser(L, beta), 8.6),
+    "tukey": (lambda L, alpha: windows.tukey(L, alpha), 0.5),
+    "flattop": (lambda L, p: windows.flattop(L), None),
+    "dpss": (lambda L, NW: windows.dpss(L, NW) if L > 1 else np.ones(L), 3.0),
+}
+
+# Nombres aceptados (sin distinguir mayúsculas) para cada ventana
+VENTANAS = {
+    "rectangular": ventana_rect,
+    "rect": ventana_rect,
+    "hamming": ventana_hamming,
+    "hann": ventana_hann,
+    "hanning": ventana_hann,
+    "blackman": ventana_blackman,
+    "kaiser": ventana_kaiser,
+    "tukey": ventana_tukey,
+    "flattop": ventana_flattop,
+    "flat-top": ventana_flattop,
+    "dpss": ventana_dpss,
+    "slepian": ventana_dpss,
+}
+
+_CANONICOS = {
+    "rect": "rectangular", "hanning": "hann", "flat-top": "flattop", "slepian": "dpss",
+}
+
+
+def ventana(tipo, L, simetrica=True, parametro=None):
+    """
+    Obtener una ventana por nombre ("Rectangular", "Hamming", "Hann"/"Hanning", "Blackman",
+    "Kaiser", "Tukey", "Flat-top", "DPSS"). parametro es β (Kaiser), alpha (Tukey) o NW (DPSS);
+    None usa el valor por defecto. El arreglo retornado es de solo lectura si viene de la caché.
+    Lanza ValueError si el tipo no existe.
+    """
+    return _obtener(_canonico(tipo), L, simetrica, parametro)
+
+
+def aplicar_ventana(x, tipo, simetrica=True, parametro=None):
+    """Multiplicar la señal x por la ventana indicada de su misma longitud"""
+    x = np.asarray(x)
+    return x * ventana(tipo, x.shape[-1], simetrica, parametro)
+
+
+def metricas_ventana(tipo, L, simetrica=True, parametro=None):
+    """
+    Métricas espectrales (MetricasVentana) de la ventana indicada, calculadas la primera
+    vez que se piden y guardadas en caché
+    """
+    tipo = _canonico(tipo)
+    clave = _clave(tipo, L, simetrica, parametro)
+    return _metricas.obtener(clave, lambda: _calcular_metricas(ventana(tipo, L, simetrica, parametro)))
+
+
+def limpiar_cache():
+    """Vaciar las cachés de ventanas y de métricas"""
+    _ventanas.limpiar()
+    _metricas.limpiar()
+
+
+def _canonico(tipo):
+    """Nombre canónico de un tipo de ventana (ValueError si no existe)"""
+    nombre = tipo.lower()
+    if nombre not in VENTANAS:
+        raise ValueError(f"Ventana desconocida: {tipo!r}")
+    return _CANONICOS.get(nombre, nombre)
+
+
+def _clave(tipo, L, simetrica, parametro):
+    """Clave de caché (tipo, L, simetrica, parametro) con el parámetro por defecto resuelto"""
+    if parametro is None:
+        parametro = _TIPOS[tipo][1]
+    return (tipo, int(L), bool(simetrica), parametro)
+
+
+def _obtener(tipo, L, simetrica=True, parametro=None):
+    """Ventana desde la caché (o construida directamente si es muy larga)"""
+    clave = _clave(tipo, L, simetrica, parametro)
+    if clave[1] < 0:
+        raise ValueError("La longitud de la ventana no puede ser negativa")
+    if clave[1] > LONGITUD_MAXIMA_CACHE:
+        return _construir(*clave)
+    return _ventanas.obtener(clave, lambda: _construir(*clave))
+
+
+def _construir(tipo, L, simetrica, parametro):
+    """Ventana simétrica de L muestras, o periódica (simétrica de L+1 sin la última)"""
+    if L == 0:
+        return np.zeros(0)
+    construir = _TIPOS[tipo][0]
+    if simetrica:
+        return np.asarray(construir(L, parametro), dtype=float)
+    return np.asarray(construir(L + 1, parametro), dtype=float)[:-1]
+
+
+def _calcular_metricas(w):
+    """ENBW, ganancia coherente y lóbulos a partir del espectro sobremuestreado de w"""
+    L = w.size
+    suma = w.sum()
+    if L == 0 or suma == 0:
+        raise ValueError("La ventana debe tener suma no nula")
+    enbw = L * np.sum(w ** 2) / suma ** 2
+
+    Nfft = max(1024, 1 << int(np.ceil(np.log2(SOBREMUESTREO_METRICAS * L))))
+    W = np.abs(np.fft.rfft(w, Nfft))
+    W /= W[0]
+
+    # Primer mínimo local después de la caída de 3 dB (los flat-top tienen rizado en el lóbulo)
+    caida = np.flatnonzero(W < 10 ** (-3 / 20))
+    if caida.size == 0:
+        return MetricasVentana(enbw, suma / L, np.inf, -np.inf)
+    sube = np.flatnonzero(np.diff(W[caida[0]:]) > 0)
+    if sube.size == 0:
+        return MetricasVentana(enbw, suma / L, np.inf, -np.inf)
+    primer_minimo = caida[0] + sube[0]
+
+    ancho = 2 * primer_minimo * L / Nfft
+    lateral = 20 * np.log10(W[primer_minimo:].max())
+    return MetricasVentana(enbw, suma / L, ancho, lateral)
@@ -13,6 +13,8 @@ import threading
 import io
 import contextlib
 import re
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 import webbrowser
 import tempfile
@@ -37,7 +39,8 @@ except ImportError:
 
 # Importar utilidades locales
 try:
-    from utils import get_resource_path, open_file_with_default_app, check_python_requirements
+    from utils import (get_resource_path, open_file_with_default_app, check_python_requirements,
+                       atomic_write_text, BackgroundFileSaver)
 except ImportError:
     # Fallback si utils.py no está disponible
     def get_resource_path(relative_path):
@@ -53,6 +56,27 @@ except ImportError:
     
     def check_python_requirements():
         return []
+    
+    def atomic_write_text(file_path, content, encoding='utf-8'):
+        with open(file_path, 'w', encoding=encoding) as file:
+            file.write(content)
+    
+    BackgroundFileSaver = None
+
+# Espacios de trabajo por clase (caché LRU con presupuesto de memoria)
+from workspace_cache import ClassWorkspace, WorkspaceCache
+
+# Precarga en segundo plano de la clase siguiente
+from class_prefetcher import ClassPrefetcher
+
+# Paquete indexado de recursos del curso (ejecutable)
+from asset_bundle import AssetBundle, find_bundle
+
+# Resaltado de sintaxis incremental (opcional)
+try:
+    from syntax_highlighter import IncrementalHighlighter
+except ImportError:
+    IncrementalHighlighter = None
 
 # Configuración de CustomTkinter (se configurará dinámicamente en la clase)
 # Se configurará el tema en la inicialización de la aplicación
@@ -107,17 +131,50 @@ class BiomedicaDSPApp:
         self.pdf_images = []  # Cache de imágenes de páginas
         self.zoom_level = 1.0
         self.is_fullscreen = False
+        self._last_page_render = None  # (página, zoom, bytes PPM) de la última página dibujada
+        
+        # Espacios de trabajo por clase: volver a una clase reciente es instantáneo
+        self.current_class_key = None
+        self.workspace_cache = WorkspaceCache(memory_budget=256 * 1024 * 1024)
+        self.plot_snapshots = []  # Figuras rasterizadas restauradas: (título, bytes PNG)
+        
+        # Precarga predictiva: orden de navegación y código ya compilado
+        self.class_sequence = []  # Clases en el orden de la navegación
+        self.prefetch_previous = True  # Precargar también la clase anterior
+        self.compiled_code_cache = OrderedDict()  # (ruta, hash) -> objeto código
+        self.compiled_code_lock = threading.Lock()  # Hilo de Tk (precarga) e hilo de ejecución
         
         # Variables para ejecución de código
         self.execution_globals = {}  # Namespace global para ejecución
         self.matplotlib_figures = []  # Lista de figuras de matplotlib
         
+        # Variables para guardado del código (seguimiento de cambios y autoguardado)
+        self.saved_code_digest = None  # Hash del contenido guardado en disco
+        self.autosave_delay_ms = 1500  # Espera tras la última edición antes de autoguardar
+        self._autosave_after_id = None
+        self.code_saver = BackgroundFileSaver() if BackgroundFileSaver else None
+        
         # Configurar icono si existe
         icon_path = self.base_dir / "icon.ico"
         if icon_path.exists():
             self.root.iconbitmap(str(icon_path))
         
+        # Paquete indexado de recursos: en el ejecutable se lee por mmap sin extraer ni escanear carpetas
+        # (junto al .exe; la copia en _MEIPASS solo como respaldo)
+        self.asset_bundle = None
+        bundle_path = find_bundle(self.base_dir) if getattr(sys, 'frozen', False) else None
+        if bundle_path:
+            try:
+                self.asset_bundle = AssetBundle(bundle_path)
+            except Exception as e:
+                print(f"Warning: Could not open asset bundle: {e}")
+        
         self.setup_ui()
+        self.prefetcher = ClassPrefetcher(
+            self.root, self._compile_for_execution,
+            read_bytes=self._read_asset_bytes, get_mtime=self._asset_mtime,
+            is_busy=self._is_executing
+        )
         self.load_course_structure()
         self.setup_keyboard_shortcuts()
     
@@ -201,6 +258,10 @@ class BiomedicaDSPApp:
         # Actualizar colores específicos según el tema
         self.update_theme_colors()
         
+        # Colores de los tokens del editor
+        if getattr(self, 'code_highlighter', None):
+            self.code_highlighter.set_theme(self.current_theme)
+        
         # Actualizar el texto del botón de tema
         if hasattr(self, 'theme_btn'):
             theme_text = "🌙 Modo Oscuro" if self.current_theme == "light" else "☀️ Modo Claro"
@@ -702,6 +763,18 @@ class BiomedicaDSPApp:
         h_scrollbar.pack(side="bottom", fill="x")
         self.code_text.pack(fill="both", expand=True)
         
+        # Seguimiento de cambios para el autoguardado diferido
+        self.code_text.bind("<<Modified>>", self._on_code_modified)
+        self.code_text.bind("<KeyRelease>", self._on_code_modified, add="+")
+        
+        # Resaltado de sintaxis incremental: solo re-tokeniza líneas modificadas
+        self.code_highlighter = None
+        if IncrementalHighlighter is not None:
+            try:
+                self.code_highlighter = IncrementalHighlighter(self.code_text, theme=self.current_theme)
+            except tk.TclError as e:
+                print(f"Warning: Could not enable syntax highlighting: {e}")
+        
         # Sección de salida compacta en la parte inferior del panel izquierdo - mejor estilo
         output_section = ctk.CTkFrame(left_panel, corner_radius=8)
         output_section.pack(fill="x", padx=15, pady=(0, 15))
@@ -986,60 +1059,21 @@ class BiomedicaDSPApp:
         self.output_text.configure(state="disabled")
         
     def load_course_structure(self):
-        """Cargar la estructura del curso desde los directorios"""
+        """Cargar la estructura del curso desde el paquete de recursos o los directorios"""
         
         units = []
         
-        # Buscar todas las unidades
-        for item in self.base_dir.iterdir():
-            if item.is_dir() and item.name.startswith("Unidad"):
-                unit_data = {
-                    "name": item.name,
-                    "path": item,
-                    "classes": []
-                }
-                
-                # Buscar clases en cada unidad
-                pdf_files = list(item.glob("*.pdf"))
-                py_files = list(item.glob("*.py"))
-                
-                # Agrupar archivos por número de clase
-                classes = {}
-                
-                # Procesar PDFs
-                for pdf_file in pdf_files:
-                    class_key = self._extract_class_number(pdf_file.name)
-                    if class_key:
-                        if class_key not in classes:
-                            classes[class_key] = {"pdf": None, "py": None, "display_name": ""}
-                        classes[class_key]["pdf"] = pdf_file
-                        # Usar el nombre del PDF para el display name
-                        if not classes[class_key]["display_name"]:
-                            classes[class_key]["display_name"] = self.extract_class_name(pdf_file.name)
-                
-                # Procesar archivos Python
-                for py_file in py_files:
-                    class_key = self._extract_class_number(py_file.name)
-                    if class_key:
-                        if class_key not in classes:
-                            classes[class_key] = {"pdf": None, "py": None, "display_name": ""}
-                        classes[class_key]["py"] = py_file
-                        # Si no hay display name del PDF, usar el del Python
-                        if not classes[class_key]["display_name"]:
-                            classes[class_key]["display_name"] = self.extract_class_name(py_file.name)
-                
-                # Convertir a lista ordenada por número de clase
-                sorted_class_keys = sorted(classes.keys(), key=lambda x: int(x) if x.isdigit() else 999)
-                
-                for class_key in sorted_class_keys:
-                    class_info = classes[class_key]
-                    unit_data["classes"].append({
-                        "name": class_info["display_name"],
-                        "pdf_path": class_info["pdf"],
-                        "py_path": class_info["py"]
-                    })
-                
-                units.append(unit_data)
+        if self.asset_bundle:
+            # Manifiesto del paquete: sin escanear directorios
+            for unit in self.asset_bundle.manifest["units"]:
+                files = [self.base_dir / name for name in unit["files"]]
+                units.append(self._build_unit_data(unit["name"], self.base_dir / unit["name"], files))
+        else:
+            # Buscar todas las unidades
+            for item in self.base_dir.iterdir():
+                if item.is_dir() and item.name.startswith("Unidad"):
+                    files = list(item.glob("*.pdf")) + list(item.glob("*.py"))
+                    units.append(self._build_unit_data(item.name, item, files))
         
         # Ordenar unidades
         units.sort(key=lambda x: x["name"])
@@ -1047,6 +1081,57 @@ class BiomedicaDSPApp:
         # Crear navegación
         self.create_navigation(units)
     
+    def _build_unit_data(self, unit_name, unit_path, files):
+        """Agrupar los archivos de una unidad por número de clase"""
+        
+        unit_data = {
+            "name": unit_name,
+            "path": unit_path,
+            "classes": []
+        }
+        
+        # Solo archivos de primer nivel de la unidad
+        pdf_files = [f for f in files if f.parent == unit_path and f.suffix == ".pdf"]
+        py_files = [f for f in files if f.parent == unit_path and f.suffix == ".py"]
+        
+        # Agrupar archivos por número de clase
+        classes = {}
+        
+        # Procesar PDFs
+        for pdf_file in pdf_files:
+            class_key = self._extract_class_number(pdf_file.name)
+            if class_key:
+                if class_key not in classes:
+                    classes[class_key] = {"pdf": None, "py": None, "display_name": ""}
+                classes[class_key]["pdf"] = pdf_file
+                # Usar el nombre del PDF para el display name
+                if not classes[class_key]["display_name"]:
+                    classes[class_key]["display_name"] = self.extract_class_name(pdf_file.name)
+        
+        # Procesar archivos Python
+        for py_file in py_files:
+            class_key = self._extract_class_number(py_file.name)
+            if class_key:
+                if class_key not in classes:
+                    classes[class_key] = {"pdf": None, "py": None, "display_name": ""}
+                classes[class_key]["py"] = py_file
+                # Si no hay display name del PDF, usar el del Python
+                if not classes[class_key]["display_name"]:
+                    classes[class_key]["display_name"] = self.extract_class_name(py_file.name)
+        
+        # Convertir a lista ordenada por número de clase
+        sorted_class_keys = sorted(classes.keys(), key=lambda x: int(x) if x.isdigit() else 999)
+        
+        for class_key in sorted_class_keys:
+            class_info = classes[class_key]
+            unit_data["classes"].append({
+                "name": class_info["display_name"],
+                "pdf_path": class_info["pdf"],
+                "py_path": class_info["py"]
+            })
+        
+        return unit_data
+    
     def _extract_class_number(self, filename):
         """Extraer solo el número de clase del nombre del archivo"""
         
@@ -1135,6 +1220,7 @@ class BiomedicaDSPApp:
             
             # Clases de la unidad con mejor estilo
             for class_data in unit["classes"]:
+                self.class_sequence.append(class_data)
                 class_btn = ctk.CTkButton(
                     unit_frame,
                     text=class_data["name"],
@@ -1153,6 +1239,15 @@ class BiomedicaDSPApp:
     def load_class(self, class_data, selected_btn=None):
         """Cargar una clase específica"""
         
+        # La clase en primer plano tiene prioridad sobre cualquier precarga
+        self.prefetcher.cancel()
+        
+        # Guardar cambios pendientes de la clase anterior antes de cambiar
+        self.save_code_changes(notify=False)
+        
+        # Conservar el espacio de trabajo de la clase anterior
+        self._stash_current_workspace()
+        
         # Resetear el botón anteriormente seleccionado
         if self.selected_button:
             self.selected_button.configure(fg_color=("gray75", "gray25"))  # Color normal
@@ -1164,6 +1259,11 @@ class BiomedicaDSPApp:
         
         self.current_pdf_path = class_data.get("pdf_path")
         self.current_py_path = class_data.get("py_path")
+        self.current_class_key = self._workspace_key(class_data)
+        workspace = self.workspace_cache.pop(self.current_class_key)
+        prefetched = None if workspace else self.prefetcher.take(self.current_class_key)
+        if prefetched and prefetched.compiled:
+            self._store_compiled_code(*prefetched.compiled)
         
         # Actualizar indicador de clase seleccionada
         class_name = class_data.get("name", "Clase sin nombre")
@@ -1176,7 +1276,13 @@ class BiomedicaDSPApp:
         if self.current_pdf_path:
             self.pdf_label.configure(text=f"📄 {self.current_pdf_path.name}")
             self.open_pdf_btn.configure(state="normal")
-            self.load_pdf_document()
+            if workspace and workspace.pdf_document is not None:
+                self._restore_pdf_workspace(workspace)
+            elif prefetched and prefetched.pdf_document is not None:
+                self.load_pdf_document(prefetched.pdf_document, prefetched.page_render)
+                prefetched.pdf_document = None  # El documento pasa a la aplicación
+            else:
+                self.load_pdf_document()
         else:
             self.pdf_label.configure(text="❌ No hay PDF disponible para esta clase")
             self.open_pdf_btn.configure(state="disabled")
@@ -1185,7 +1291,8 @@ class BiomedicaDSPApp:
         # Actualizar labels de código
         if self.current_py_path:
             self.code_label.configure(text=f"💻 {self.current_py_path.name}")
-            self.load_code_content()
+            if not self._restore_code_workspace(workspace):
+                self.load_code_content(self._prefetched_code(prefetched))
             self.save_code_btn.configure(state="normal")
             self.run_btn.configure(state="normal")
         else:
@@ -1193,6 +1300,7 @@ class BiomedicaDSPApp:
             self.code_text.delete(1.0, tk.END)
             self.code_text.insert(1.0, "# No hay archivo de código Python para esta clase\n"
                                         "# Puedes crear uno nuevo escribiendo aquí y guardando")
+            self._mark_code_clean(None)
             self.save_code_btn.configure(state="disabled")
             self.run_btn.configure(state="disabled")
         
@@ -1202,57 +1310,376 @@ class BiomedicaDSPApp:
         # Limpiar gráficos solo si ya existe el tab
         if hasattr(self, 'plots_scroll_frame'):
             self.clear_plots()
+        
+        # Restaurar salida y gráficos del espacio de trabajo guardado
+        if workspace:
+            self._restore_results_workspace(workspace)
+            workspace.release()
+        if prefetched:
+            prefetched.release()
+        
+        # Precargar las clases vecinas cuando la aplicación quede ociosa
+        self._schedule_prefetch()
+    
+    def _schedule_prefetch(self):
+        """Programar la precarga de la clase siguiente (y opcionalmente la anterior)"""
+        
+        keys = [self._workspace_key(cd) for cd in self.class_sequence]
+        if self.current_class_key not in keys:
+            return
+        
+        index = keys.index(self.current_class_key)
+        neighbours = [index + 1]
+        if self.prefetch_previous:
+            neighbours.append(index - 1)
+        
+        targets = []
+        for i in neighbours:
+            if 0 <= i < len(self.class_sequence) and keys[i] not in self.workspace_cache:
+                class_data = self.class_sequence[i]
+                targets.append((keys[i], class_data.get("pdf_path"), class_data.get("py_path")))
+        
+        # Dimensiones actuales del visor para renderizar al mismo zoom de ajuste
+        canvas_width = self.pdf_canvas.winfo_width()
+        canvas_height = self.pdf_canvas.winfo_height()
+        self.prefetcher.schedule(
+            targets,
+            lambda w, h: self._compute_fit_zoom(w, h, canvas_width, canvas_height)
+        )
+    
+    def _prefetched_code(self, prefetched):
+        """Código precargado si el archivo no cambió desde la precarga"""
+        if not prefetched or prefetched.code_content is None:
+            return None
+        if self._asset_mtime(self.current_py_path) != prefetched.code_mtime:
+            return None
+        return prefetched.code_content
+    
+    def _is_executing(self):
+        """Indicar si hay código ejecutándose (la precarga cede el paso)"""
+        thread = getattr(self, 'execution_thread', None)
+        return thread is not None and thread.is_alive()
+    
+    def _compile_for_execution(self, code_content, path):
+        """Compilar el código tal como se ejecutará en la aplicación"""
+        modified_code = self._modify_code_for_integration(code_content)
+        key = (str(path), self._code_digest(modified_code))
+        return key, compile(modified_code, str(path), 'exec')
+    
+    def _compile_for_execution_cached(self, code_content):
+        """Obtener el código compilado desde la caché o compilarlo"""
+        modified_code = self._modify_code_for_integration(code_content)
+        key = (str(self.current_py_path), self._code_digest(modified_code))
+        with self.compiled_code_lock:
+            code_object = self.compiled_code_cache.get(key)
+        if code_object is None:
+            # Se compila fuera del candado para no bloquear al hilo de Tk
+            code_object = compile(modified_code, str(self.current_py_path), 'exec')
+            self._store_compiled_code(key, code_object)
+        return code_object
+    
+    def _store_compiled_code(self, key, code_object):
+        """Guardar un objeto código compilado (caché acotada; se llama desde ambos hilos)"""
+        with self.compiled_code_lock:
+            self.compiled_code_cache[key] = code_object
+            self.compiled_code_cache.move_to_end(key)
+            while len(self.compiled_code_cache) > 8:
+                self.compiled_code_cache.popitem(last=False)
+    
+    def _workspace_key(self, class_data):
+        """Clave única del espacio de trabajo de una clase"""
+        path = class_data.get("py_path") or class_data.get("pdf_path")
+        return str(path) if path else class_data.get("name")
+    
+    def _stash_current_workspace(self):
+        """Guardar el estado de la clase actual en la caché de espacios de trabajo"""
+        
+        if self.current_class_key is None:
+            return
+        
+        workspace = ClassWorkspace(self.current_class_key)
+        
+        # Documento PDF: se traspasa abierto al espacio de trabajo
+        if self.pdf_document is not None:
+            workspace.pdf_document = self.pdf_document
+            workspace.current_page = self.current_page
+            workspace.zoom_level = self.zoom_level
+            workspace.page_render = self._last_page_render
+            workspace.pdf_size = self._asset_size(self.current_pdf_path)
+            self.pdf_document = None  # Evitar que close_pdf_document lo cierre
+        
+        # Buffer del editor
+        if self.current_py_path:
+            workspace.code_content = self.code_text.get(1.0, tk.END + "-1c")
+            workspace.code_modified = bool(self.code_text.edit_modified())
+            workspace.saved_code_digest = self.saved_code_digest
+            workspace.code_yview = self.code_text.yview()[0]
+            workspace.code_insert = self.code_text.index(tk.INSERT)
+            # Si hay un guardado en curso, _on_code_saved actualiza este mtime al terminar
+            workspace.code_mtime = self._asset_mtime(self.current_py_path)
+        
+        # Salida y figuras rasterizadas
+        workspace.output_content = self.output_text.get(1.0, tk.END + "-1c")
+        workspace.figures = list(self.plot_snapshots) + self._rasterize_figures()
+        
+        self.workspace_cache.put(workspace)
+    
+    def _rasterize_figures(self):
+        """Convertir las figuras actuales a PNG para guardarlas sin mantener matplotlib vivo"""
+        
+        snapshots = []
+        for i, fig in enumerate(self.matplotlib_figures, 1):
+            try:
+                title = self._figure_title(fig, len(self.plot_snapshots) + i)
+                buffer = io.BytesIO()
+                if hasattr(fig.canvas, 'buffer_rgba') and getattr(fig.canvas, 'renderer', None) is not None:
+                    # Reutilizar el último render de Agg en vez de volver a dibujar
+                    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(buffer, format='PNG', compress_level=1)
+                else:
+                    fig.savefig(buffer, format='png', dpi=fig.dpi)
+                snapshots.append((title, buffer.getvalue()))
+            except Exception as e:
+                print(f"Error rasterizando figura: {e}")
+        return snapshots
+    
+    def _figure_title(self, fig, index):
+        """Título mostrado sobre una figura"""
+        fig_title = f"Gráfico {index}"
+        if hasattr(fig, '_suptitle') and fig._suptitle:
+            fig_title += f": {fig._suptitle.get_text()}"
+        return fig_title
+    
+    def _restore_pdf_workspace(self, workspace):
+        """Reactivar el documento PDF guardado en un espacio de trabajo"""
+        
+        self.close_pdf_document()
+        
+        self.pdf_document = workspace.pdf_document
+        workspace.pdf_document = None  # El documento vuelve a ser de la aplicación
+        self.total_pages = len(self.pdf_document)
+        self.current_page = min(workspace.current_page, self.total_pages - 1)
+        self.zoom_level = workspace.zoom_level
+        self._last_page_render = workspace.page_render
+        
+        self._set_pdf_controls_state("normal")
+        self.pdf_info_label.pack_forget()
+        self.update_zoom_display()
+        self.root.after(0, self.display_current_page)
+    
+    def _restore_code_workspace(self, workspace):
+        """Restaurar el buffer del editor; retorna False si hay que recargar desde disco"""
+        
+        if not workspace or workspace.code_content is None:
+            return False
+        
+        # Si el archivo cambió fuera de la aplicación, se recarga desde disco
+        if self._asset_mtime(self.current_py_path) != workspace.code_mtime:
+            return False
+        
+        self.code_text.delete(1.0, tk.END)
+        self.code_text.insert(1.0, workspace.code_content)
+        self._cancel_autosave()
+        self.saved_code_digest = workspace.saved_code_digest
+        self.code_text.edit_modified(workspace.code_modified)
+        self.code_text.mark_set(tk.INSERT, workspace.code_insert)
+        self.code_text.yview_moveto(workspace.code_yview)
+        return True
+    
+    def _restore_results_workspace(self, workspace):
+        """Restaurar la salida y las figuras rasterizadas de un espacio de trabajo"""
+        
+        if workspace.output_content is not None:
+            self.output_text.configure(state="normal")
+            self.output_text.delete(1.0, tk.END)
+            self.output_text.insert(1.0, workspace.output_content)
+            self.output_text.configure(state="disabled")
+        
+        if hasattr(self, 'plots_scroll_frame'):
+            for title, png in workspace.figures:
+                self._display_figure_snapshot(title, png)
+    
+    def _display_figure_snapshot(self, title, png):
+        """Mostrar una figura rasterizada en el panel de gráficos"""
+        
+        try:
+            self.plot_snapshots.append((title, png))
+            if len(self.plot_snapshots) + len(self.matplotlib_figures) == 1:
+                self.plots_info_label.pack_forget()
+            
+            fig_frame = ctk.CTkFrame(self.plots_scroll_frame)
+            fig_frame.pack(fill="x", padx=10, pady=10)
+            
+            title_label = ctk.CTkLabel(fig_frame, text=title, font=self.fonts['body'])
+            title_label.pack(pady=5)
+            
+            photo = ImageTk.PhotoImage(Image.open(io.BytesIO(png)))
+            image_label = tk.Label(fig_frame, image=photo, borderwidth=0)
+            image_label.image = photo  # Evitar garbage collection
+            image_label.pack(fill="both", expand=True, padx=10, pady=10)
+            
+            total = len(self.plot_snapshots) + len(self.matplotlib_figures)
+            self.plots_label.configure(text=f"📈 {total} Gráfico(s) Generado(s)")
+            
+        except Exception as e:
+            print(f"Error mostrando figura guardada: {e}")
     
-    def load_code_content(self):
-        """Cargar el contenido del archivo Python"""
+    def load_code_content(self, content=None):
+        """Cargar el contenido del archivo Python (o el contenido ya precargado)"""
         
-        if self.current_py_path and self.current_py_path.exists():
+        if self.current_py_path and (content is not None or self._asset_exists(self.current_py_path)):
             try:
-                with open(self.current_py_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
+                if content is None:
+                    content = self._read_asset_bytes(self.current_py_path).decode('utf-8')
                 
                 self.code_text.delete(1.0, tk.END)
                 self.code_text.insert(1.0, content)
+                self._mark_code_clean(content)
                 
             except Exception as e:
                 messagebox.showerror("Error", f"No se pudo cargar el archivo: {str(e)}")
     
-    def save_code_changes(self):
-        """Guardar cambios en el código"""
+    def _code_digest(self, content):
+        """Hash del contenido del editor para detectar cambios reales"""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _mark_code_clean(self, content):
+        """Marcar el buffer como sincronizado con el disco"""
+        self._cancel_autosave()
+        self.code_text.edit_modified(False)
+        self.saved_code_digest = self._code_digest(content) if content is not None else None
+    
+    def _cancel_autosave(self):
+        """Cancelar el autoguardado programado, si existe"""
+        if self._autosave_after_id is not None:
+            self.root.after_cancel(self._autosave_after_id)
+            self._autosave_after_id = None
+    
+    def _on_code_modified(self, event=None):
+        """Reprogramar el autoguardado tras cada edición (debounce)"""
+        if not self.current_py_path or not self.code_text.edit_modified():
+            return
+        
+        self._cancel_autosave()
+        self._autosave_after_id = self.root.after(self.autosave_delay_ms, self._autosave)
+    
+    def _autosave(self):
+        """Autoguardado silencioso del código"""
+        self._autosave_after_id = None
+        self.save_code_changes(notify=False)
+    
+    def save_code_changes(self, notify=True, content=None):
+        """Guardar cambios en el código solo si el buffer cambió (escritura atómica en segundo plano)"""
         
         if not self.current_py_path:
             return
         
-        try:
+        self._cancel_autosave()
+        
+        # Sin ediciones desde el último guardado: no hay nada que escribir
+        if not self.code_text.edit_modified():
+            if notify:
+                self._show_save_status("💾 Sin cambios")
+            return
+        
+        if content is None:
             content = self.code_text.get(1.0, tk.END + "-1c")
-            
-            with open(self.current_py_path, 'w', encoding='utf-8') as file:
-                file.write(content)
-            
-            messagebox.showinfo("Éxito", "Código guardado correctamente")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(e)}")
+        digest = self._code_digest(content)
+        self.code_text.edit_modified(False)
+        
+        # El contenido volvió a ser igual al del disco
+        if digest == self.saved_code_digest:
+            if notify:
+                self._show_save_status("💾 Sin cambios")
+            return
+        
+        self.saved_code_digest = digest
+        path = self.current_py_path
+        
+        # En el ejecutable con paquete de recursos la carpeta de la unidad puede no existir en disco
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if self.code_saver:
+            self.code_saver.submit(
+                path, content,
+                callback=lambda error: self.root.after(0, self._on_code_saved, path, digest, error, notify)
+            )
+        else:
+            try:
+                atomic_write_text(path, content)
+                self._on_code_saved(path, digest, None, notify)
+            except Exception as e:
+                self._on_code_saved(path, digest, e, notify)
+    
+    def _on_code_saved(self, path, digest, error, notify):
+        """Procesar el resultado de un guardado (se ejecuta en el hilo principal)"""
+        
+        # La clase pudo quedar guardada en la caché antes de terminar la escritura: su
+        # mtime se tomó antes del reemplazo atómico y hay que actualizarlo aquí
+        workspace = None if path == self.current_py_path else self.workspace_cache.peek(str(path))
+        if workspace is not None and workspace.saved_code_digest == digest:
+            if error is None:
+                workspace.code_mtime = self._asset_mtime(path)
+            else:
+                workspace.saved_code_digest = None
+                workspace.code_modified = True
+        
+        if error is None:
+            if notify and path == self.current_py_path:
+                self._show_save_status("💾 Guardado")
+            return
+        
+        # Si el buffer sigue siendo el mismo, volver a marcarlo como pendiente
+        if path == self.current_py_path and self.saved_code_digest == digest:
+            self.saved_code_digest = None
+            self.code_text.edit_modified(True)
+        
+        if notify:
+            messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(error)}")
+        else:
+            print(f"Error al guardar {path}: {error}")
+            self._show_save_status("⚠️ Error al guardar")
+    
+    def _show_save_status(self, status):
+        """Mostrar brevemente el estado del guardado junto al nombre del archivo"""
+        if not self.current_py_path:
+            return
+        
+        self.code_label.configure(text=f"💻 {self.current_py_path.name}  ·  {status}")
+        self.root.after(2000, self._restore_code_label)
+    
+    def _restore_code_label(self):
+        """Restaurar el nombre del archivo en el encabezado del editor"""
+        if self.current_py_path:
+            self.code_label.configure(text=f"💻 {self.current_py_path.name}")
     
     def open_pdf_external(self):
         """Abrir PDF en el visor externo"""
         
-        if not self.current_pdf_path or not self.current_pdf_path.exists():
+        if not self._asset_exists(self.current_pdf_path):
             messagebox.showerror("Error", "No hay PDF disponible")
             return
         
         try:
-            success = open_file_with_default_app(str(self.current_pdf_path))
+            pdf_path = self.current_pdf_path
+            if not pdf_path.exists():
+                # El PDF está dentro del paquete: extraer solo este archivo para el visor externo
+                extract_dir = Path(tempfile.gettempdir()) / "BiomedicalDSP"
+                extract_dir.mkdir(exist_ok=True)
+                pdf_path = extract_dir / pdf_path.name
+                if not pdf_path.exists():
+                    pdf_path.write_bytes(self._read_asset_bytes(self.current_pdf_path))
+            
+            success = open_file_with_default_app(str(pdf_path))
             if not success:
                 messagebox.showerror("Error", "No se pudo abrir el PDF")
                 
         except Exception as e:
             messagebox.showerror("Error", f"No se pudo abrir el PDF: {str(e)}")
     
-    def load_pdf_document(self):
-        """Cargar documento PDF en el visor integrado"""
+    def load_pdf_document(self, document=None, page_render=None):
+        """Cargar documento PDF en el visor integrado (opcionalmente ya precargado)"""
         
-        if not self.current_pdf_path or not self.current_pdf_path.exists():
+        if document is None and not self._asset_exists(self.current_pdf_path):
             return
         
         try:
@@ -1262,19 +1689,18 @@ class BiomedicaDSPApp:
             # Cerrar documento anterior si existe
             self.close_pdf_document()
             
-            # Abrir nuevo documento
-            self.pdf_document = fitz.open(str(self.current_pdf_path))
+            # Abrir nuevo documento (o usar el precargado con su primera página)
+            if document is None:
+                self._show_prerendered_page()
+                document = self._open_pdf_asset(self.current_pdf_path)
+            self.pdf_document = document
+            self._last_page_render = page_render
             self.total_pages = len(self.pdf_document)
             self.current_page = 0
             self.zoom_level = 1.0
             
             # Habilitar controles
-            self.prev_page_btn.configure(state="normal")
-            self.next_page_btn.configure(state="normal")
-            self.zoom_in_btn.configure(state="normal")
-            self.zoom_out_btn.configure(state="normal")
-            self.fit_window_btn.configure(state="normal")
-            self.fullscreen_btn.configure(state="normal")
+            self._set_pdf_controls_state("normal")
             
             # Ocultar el label de información
             self.pdf_info_label.pack_forget()
@@ -1286,6 +1712,66 @@ class BiomedicaDSPApp:
             messagebox.showerror("Error", f"No se pudo cargar el PDF: {str(e)}")
             self.close_pdf_document()
     
+    def _bundle_entry(self, path):
+        """Nombre del recurso en el paquete para una ruta del curso, o None"""
+        if not self.asset_bundle or path is None:
+            return None
+        try:
+            name = Path(path).relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return None
+        return name if name in self.asset_bundle else None
+    
+    def _asset_exists(self, path):
+        """Indicar si un recurso existe en disco o en el paquete"""
+        return path is not None and (Path(path).exists() or self._bundle_entry(path) is not None)
+    
+    def _read_asset_bytes(self, path):
+        """Leer un recurso: primero el disco (p. ej. código guardado por el usuario), luego el paquete"""
+        path = Path(path)
+        if path.exists():
+            return path.read_bytes()
+        name = self._bundle_entry(path)
+        if name is None:
+            raise FileNotFoundError(str(path))
+        return self.asset_bundle.read_bytes(name)
+    
+    def _asset_mtime(self, path):
+        """Fecha de modificación en disco de un recurso (None si solo está en el paquete)"""
+        try:
+            return os.path.getmtime(path)
+        except (OSError, TypeError):
+            return None
+    
+    def _asset_size(self, path):
+        """Tamaño en bytes de un recurso en disco o en el paquete"""
+        try:
+            return os.path.getsize(path)
+        except (OSError, TypeError):
+            name = self._bundle_entry(path)
+            return self.asset_bundle.size(name) if name else 0
+    
+    def _open_pdf_asset(self, path):
+        """Abrir un PDF desde disco o directamente desde el mmap del paquete"""
+        if Path(path).exists():
+            return fitz.open(str(path))
+        return fitz.open(stream=self.asset_bundle.read(self._bundle_entry(path)), filetype="pdf")
+    
+    def _show_prerendered_page(self):
+        """Mostrar la primera página pre-renderizada del paquete mientras se ajusta el zoom"""
+        name = self._bundle_entry(self.current_pdf_path)
+        prerendered = self.asset_bundle.prerendered_page(name) if name else None
+        if not prerendered:
+            return
+        
+        try:
+            photo = ImageTk.PhotoImage(Image.open(io.BytesIO(prerendered[1])))
+            self.pdf_canvas.delete("all")
+            self.pdf_canvas.create_image(0, 0, anchor="nw", image=photo)
+            self.pdf_canvas.image = photo
+        except Exception as e:
+            print(f"Error mostrando página pre-renderizada: {e}")
+    
     def show_loading_message(self, message):
         """Mostrar mensaje de carga en el canvas"""
         
@@ -1312,17 +1798,13 @@ class BiomedicaDSPApp:
         self.current_page = 0
         self.total_pages = 0
         self.pdf_images.clear()
+        self._last_page_render = None
         
         # Limpiar canvas
         self.pdf_canvas.delete("all")
         
         # Deshabilitar controles
-        self.prev_page_btn.configure(state="disabled")
-        self.next_page_btn.configure(state="disabled")
-        self.zoom_in_btn.configure(state="disabled")
-        self.zoom_out_btn.configure(state="disabled")
-        self.fit_window_btn.configure(state="disabled")
-        self.fullscreen_btn.configure(state="disabled")
+        self._set_pdf_controls_state("disabled")
         
         # Actualizar labels
         self.page_label.configure(text="0/0")
@@ -1331,6 +1813,12 @@ class BiomedicaDSPApp:
         # Mostrar el label de información
         self.pdf_info_label.pack(expand=True)
     
+    def _set_pdf_controls_state(self, state):
+        """Habilitar o deshabilitar los controles del visor de PDF"""
+        for button in (self.prev_page_btn, self.next_page_btn, self.zoom_in_btn,
+                       self.zoom_out_btn, self.fit_window_btn, self.fullscreen_btn):
+            button.configure(state=state)
+    
     def display_current_page(self):
         """Mostrar la página actual del PDF"""
         
@@ -1338,15 +1826,21 @@ class BiomedicaDSPApp:
             return
         
         try:
-            # Obtener la página
-            page = self.pdf_document[self.current_page]
-            
-            # Crear matriz de transformación para el zoom
-            mat = fitz.Matrix(self.zoom_level, self.zoom_level)
-            
-            # Renderizar página como imagen
-            pix = page.get_pixmap(matrix=mat)
-            img_data = pix.tobytes("ppm")
+            render = self._last_page_render
+            if render and render[0] == self.current_page and render[1] == self.zoom_level:
+                # Reutilizar el último render (p. ej. al volver a una clase reciente)
+                img_data = render[2]
+            else:
+                # Obtener la página
+                page = self.pdf_document[self.current_page]
+                
+                # Crear matriz de transformación para el zoom
+                mat = fitz.Matrix(self.zoom_level, self.zoom_level)
+                
+                # Renderizar página como imagen
+                pix = page.get_pixmap(matrix=mat)
+                img_data = pix.tobytes("ppm")
+                self._last_page_render = (self.current_page, self.zoom_level, img_data)
             
             # Convertir a PIL Image y luego a PhotoImage
             pil_image = Image.open(io.BytesIO(img_data))
@@ -1446,6 +1940,27 @@ class BiomedicaDSPApp:
             self.update_zoom_display()
             self.display_current_page()
     
+    @staticmethod
+    def _compute_fit_zoom(page_width, page_height, canvas_width, canvas_height):
+        """Zoom para que una página quepa completa en el canvas"""
+        
+        # Si las dimensiones son muy pequeñas, usar valores por defecto
+        if canvas_width < 100:
+            canvas_width = 800
+        if canvas_height < 100:
+            canvas_height = 600
+        
+        # Calcular zoom para ajustar al ancho y alto, tomando el menor
+        zoom_width = (canvas_width - 20) / page_width  # 20px de margen
+        zoom_height = (canvas_height - 20) / page_height  # 20px de margen
+        
+        # Usar el zoom más pequeño para que quepa completo
+        zoom = min(zoom_width, zoom_height)
+        
+        # Limitar el zoom a rangos razonables
+        zoom = max(0.25, min(5.0, zoom))
+        return round(zoom, 2)
+    
     def fit_to_window(self):
         """Ajustar zoom para que la página se ajuste a la ventana"""
         
@@ -1470,22 +1985,7 @@ class BiomedicaDSPApp:
             canvas_width = canvas.winfo_width()
             canvas_height = canvas.winfo_height()
             
-            # Si las dimensiones son muy pequeñas, usar valores por defecto
-            if canvas_width < 100:
-                canvas_width = 800
-            if canvas_height < 100:
-                canvas_height = 600
-            
-            # Calcular zoom para ajustar al ancho y alto, tomando el menor
-            zoom_width = (canvas_width - 20) / page_width  # 20px de margen
-            zoom_height = (canvas_height - 20) / page_height  # 20px de margen
-            
-            # Usar el zoom más pequeño para que quepa completo
-            self.zoom_level = min(zoom_width, zoom_height)
-            
-            # Limitar el zoom a rangos razonables
-            self.zoom_level = max(0.25, min(5.0, self.zoom_level))
-            self.zoom_level = round(self.zoom_level, 2)
+            self.zoom_level = self._compute_fit_zoom(page_width, page_height, canvas_width, canvas_height)
             
             self.update_zoom_display()
             self.display_current_page()
@@ -1557,8 +2057,9 @@ class BiomedicaDSPApp:
             messagebox.showerror("Error", "No hay código para ejecutar")
             return
         
-        # Guardar cambios primero
-        self.save_code_changes()
+        # Guardar cambios primero (sin diálogos; no escribe si el código no cambió)
+        code_content = self.code_text.get(1.0, tk.END + "-1c")
+        self.save_code_changes(notify=False, content=code_content)
         
         # Limpiar salida anterior y gráficos
         self.clear_output()
@@ -1570,21 +2071,23 @@ class BiomedicaDSPApp:
         self.stop_btn.configure(state="normal")
         
         # Ejecutar en un hilo separado
-        self.execution_thread = threading.Thread(target=self._run_code_integrated)
+        self.execution_thread = threading.Thread(target=self._run_code_integrated, args=(code_content,))
         self.execution_thread.daemon = True
         self.execution_thread.start()
     
-    def _run_code_integrated(self):
+    def _run_code_integrated(self, code_content):
         """Ejecutar código de manera integrada con captura de plots"""
         
         try:
-            # Obtener el código del editor
-            code_content = self.code_text.get(1.0, tk.END + "-1c")
-            
             # Preparar el entorno de ejecución
             original_dir = os.getcwd()
+            self.current_py_path.parent.mkdir(parents=True, exist_ok=True)
             os.chdir(self.current_py_path.parent)
             
+            # Los códigos de las clases importan dsp_core desde la raíz del curso
+            if str(self.base_dir) not in sys.path:
+                sys.path.insert(0, str(self.base_dir))
+            
             # Capturar stdout y stderr
             old_stdout = sys.stdout
             old_stderr = sys.stderr
@@ -1594,10 +2097,10 @@ class BiomedicaDSPApp:
             # Configurar matplotlib para no mostrar ventanas
             plt.ioff()  # Modo interactivo desactivado
             
-            # Modificar el código para capturar plt.show()
-            modified_code = self._modify_code_for_integration(code_content)
-            
             try:
+                # Modificar el código para capturar plt.show() y compilarlo (reutilizando la precarga)
+                compiled_code = self._compile_for_execution_cached(code_content)
+                
                 # Redirigir stdout y stderr
                 sys.stdout = stdout_capture
                 sys.stderr = stderr_capture
@@ -1613,7 +2116,7 @@ class BiomedicaDSPApp:
                 }
                 
                 # Ejecutar el código modificado
-                exec(modified_code, exec_globals)
+                exec(compiled_code, exec_globals)
                 
                 # Actualizar el namespace global para próximas ejecuciones
                 self.execution_globals.update({
@@ -1714,7 +2217,7 @@ plt.ioff()  # Modo no interactivo
         
         try:
             # Ocultar el label de información si es la primera figura
-            if len(self.matplotlib_figures) == 1:
+            if len(self.matplotlib_figures) + len(self.plot_snapshots) == 1:
                 self.plots_info_label.pack_forget()
             
             # Crear frame para esta figura
@@ -1722,9 +2225,7 @@ plt.ioff()  # Modo no interactivo
             fig_frame.pack(fill="x", padx=10, pady=10)
             
             # Título de la figura
-            fig_title = f"Gráfico {len(self.matplotlib_figures)}"
-            if hasattr(fig, '_suptitle') and fig._suptitle:
-                fig_title += f": {fig._suptitle.get_text()}"
+            fig_title = self._figure_title(fig, len(self.plot_snapshots) + len(self.matplotlib_figures))
             
             title_label = ctk.CTkLabel(
                 fig_frame,
@@ -1739,7 +2240,7 @@ plt.ioff()  # Modo no interactivo
             canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
             
             # Actualizar el label de gráficos
-            self.plots_label.configure(text=f"� {len(self.matplotlib_figures)} Gráfico(s) Generado(s)")
+            self.plots_label.configure(text=f"� {len(self.plot_snapshots) + len(self.matplotlib_figures)} Gráfico(s) Generado(s)")
             
         except Exception as e:
             print(f"Error mostrando figura: {e}")
@@ -1791,6 +2292,7 @@ plt.ioff()  # Modo no interactivo
                 plt.close(fig)
             
             self.matplotlib_figures.clear()
+            self.plot_snapshots.clear()
             
             # Limpiar el frame de gráficos solo si existe
             if hasattr(self, 'plots_scroll_frame') and self.plots_scroll_frame.winfo_exists():
@@ -1817,7 +2319,7 @@ plt.ioff()  # Modo no interactivo
     def save_plots(self):
         """Guardar todos los gráficos como imágenes"""
         
-        if not self.matplotlib_figures:
+        if not self.matplotlib_figures and not self.plot_snapshots:
             messagebox.showinfo("Información", "No hay gráficos para guardar")
             return
         
@@ -1828,7 +2330,15 @@ plt.ioff()  # Modo no interactivo
         
         try:
             saved_count = 0
-            for i, fig in enumerate(self.matplotlib_figures, 1):
+            
+            # Figuras restauradas de un espacio de trabajo (ya rasterizadas)
+            for i, (_, png) in enumerate(self.plot_snapshots, 1):
+                filepath = os.path.join(directory, f"grafico_{i}.png")
+                with open(filepath, 'wb') as file:
+                    file.write(png)
+                saved_count += 1
+            
+            for i, fig in enumerate(self.matplotlib_figures, saved_count + 1):
                 filename = f"grafico_{i}.png"
                 filepath = os.path.join(directory, filename)
                 fig.savefig(filepath, dpi=300, bbox_inches='tight')
@@ -1969,13 +2479,23 @@ plt.ioff()  # Modo no interactivo
     
     def on_closing(self):
         """Manejar el cierre de la aplicación"""
-        # Limpiar recursos del PDF
+        # Guardar cambios pendientes y esperar a que terminen las escrituras
+        self.save_code_changes(notify=False)
+        if self.code_saver:
+            self.code_saver.flush(timeout=5)
+        
+        # Limpiar recursos del PDF, de los espacios de trabajo y de la precarga
+        self.prefetcher.shutdown()
         self.close_pdf_document()
+        self.workspace_cache.clear()
         
         # Limpiar figuras de matplotlib solo si existe el tab
         if hasattr(self, 'plots_scroll_frame'):
             self.clear_plots()
         
+        if self.asset_bundle:
+            self.asset_bundle.close()
+        
         # Cerrar la aplicación
         self.root.destroy()
 
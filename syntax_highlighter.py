@@ -0,0 +1,320 @@
+"""
+Resaltado de sintaxis incremental para el editor de código de Biomedical DSP
+"""
+
+import builtins
+import keyword
+import re
+import time
+
+# Etiquetas de Tk usadas para cada tipo de token
+TOKEN_TAGS = ("keyword", "builtin", "string", "comment", "number", "decorator", "definition")
+
+# Colores por tema (coherentes con los fondos del editor en main.py)
+THEME_COLORS = {
+    "dark": {
+        "keyword": "#569cd6",
+        "builtin": "#4ec9b0",
+        "string": "#ce9178",
+        "comment": "#6a9955",
+        "number": "#b5cea8",
+        "decorator": "#dcdcaa",
+        "definition": "#dcdcaa",
+    },
+    "light": {
+        "keyword": "#0000ff",
+        "builtin": "#267f99",
+        "string": "#a31515",
+        "comment": "#008000",
+        "number": "#098658",
+        "decorator": "#795e26",
+        "definition": "#795e26",
+    },
+}
+
+KEYWORDS = frozenset(keyword.kwlist) | frozenset(getattr(keyword, "softkwlist", []))
+BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_")) - KEYWORDS
+
+_TOKEN_RE = re.compile(
+    r"(?P<comment>#.*)"
+    r"|(?P<triple>[rRbBuUfF]{0,2}(?:\"\"\"|'''))"
+    r"|(?P<string>[rRbBuUfF]{0,2}(?:\"[^\"\\]*(?:\\.[^\"\\]*)*\"?|'[^'\\]*(?:\\.[^'\\]*)*'?))"
+    r"|(?P<decorator>@[^\W\d][\w.]*)"
+    r"|(?P<number>\b(?:0[xXoObB][\da-fA-F_]+|\d[\d_]*\.?[\d_]*(?:[eE][+-]?\d+)?[jJ]?)"
+    r"|\.\d[\d_]*(?:[eE][+-]?\d+)?[jJ]?)"
+    r"|(?P<name>[^\W\d]\w*)"
+)
+
+
+def _find_closing(line, pos, delimiter):
+    """
+    Buscar el cierre de una cadena triple a partir de pos, ignorando comillas escapadas.
+    Retorna la posición justo después del delimitador o -1 si la cadena sigue abierta.
+    """
+    start = pos
+    while True:
+        index = line.find(delimiter, start)
+        if index < 0:
+            return -1
+        # Contar barras invertidas consecutivas antes de la comilla
+        backslashes = 0
+        k = index
+        while k > pos and line[k - 1] == "\\":
+            backslashes += 1
+            k -= 1
+        if backslashes % 2 == 0:
+            return index + len(delimiter)
+        start = index + 1
+
+
+def tokenize_line(line, state=None):
+    """
+    Tokenizar una línea de Python partiendo del estado heredado de la línea anterior.
+
+    state es None o el delimitador ('\"\"\"' o "'''") de una cadena triple abierta.
+    Retorna (spans, estado_final) con spans = [(etiqueta, inicio, fin), ...].
+    """
+    spans = []
+    pos = 0
+    length = len(line)
+
+    # Continuación de una cadena triple abierta en líneas anteriores
+    if state:
+        end = _find_closing(line, 0, state)
+        if end < 0:
+            if length:
+                spans.append(("string", 0, length))
+            return spans, state
+        spans.append(("string", 0, end))
+        pos = end
+
+    expect_definition = False
+    while pos < length:
+        match = _TOKEN_RE.search(line, pos)
+        if match is None:
+            break
+
+        kind = match.lastgroup
+        start, end = match.span()
+
+        if kind == "triple":
+            delimiter = match.group()[-3:]
+            close = _find_closing(line, end, delimiter)
+            if close < 0:
+                spans.append(("string", start, length))
+                return spans, delimiter
+            spans.append(("string", start, close))
+            pos = close
+            continue
+
+        if kind == "decorator" and line[:start].strip():
+            # Operador @ (multiplicación de matrices), no un decorador
+            pos = start + 1
+            continue
+
+        if kind == "name":
+            word = match.group()
+            if expect_definition:
+                spans.append(("definition", start, end))
+                expect_definition = False
+            elif word in KEYWORDS:
+                spans.append(("keyword", start, end))
+                expect_definition = word in ("def", "class")
+            elif word in BUILTINS:
+                spans.append(("builtin", start, end))
+        else:
+            spans.append((kind, start, end))
+
+        pos = end
+
+    return spans, None
+
+
+class IncrementalHighlighter:
+    """
+    Resaltador de sintaxis incremental para un tk.Text.
+
+    Intercepta las operaciones insert/delete/replace del widget para marcar
+    únicamente las líneas modificadas. Las líneas sucias visibles se procesan
+    primero y el resto del archivo se tokeniza en porciones durante el tiempo
+    ocioso, de modo que la latencia al escribir no depende del tamaño del archivo.
+    """
+
+    SLICE_BUDGET_MS = 8  # Tiempo máximo por porción de trabajo en segundo plano
+    IDLE_DELAY_MS = 1    # Espera entre porciones para dejar respirar al bucle de eventos
+
+    def __init__(self, text_widget, theme="dark"):
+        self.text = text_widget
+        self.theme = theme
+        self._after_id = None
+
+        # Estado de cadena triple al inicio de cada línea (índice 0 = línea 1)
+        self.line_states = [None]
+        # Líneas (base 1) pendientes de tokenizar
+        self.dirty = set()
+
+        self._install_proxy()
+        self.set_theme(theme)
+
+        # Marcar el contenido inicial completo como sucio
+        total = self._line_count()
+        self.line_states = [None] * total
+        self.dirty.update(range(1, total + 1))
+        self._schedule()
+
+    # ------------------------------------------------------------------
+    # Intercepción de comandos del widget
+    # ------------------------------------------------------------------
+    def _install_proxy(self):
+        """Renombrar el comando Tcl del widget y reemplazarlo por un despachador"""
+        widget = self.text
+        self._orig_command = widget._w + "_orig"
+        widget.tk.call("rename", widget._w, self._orig_command)
+        widget.tk.createcommand(widget._w, self._dispatch)
+
+    def _call(self, *args):
+        """Invocar el comando original del widget sin pasar por el despachador"""
+        return self.text.tk.call((self._orig_command,) + args)
+
+    def _dispatch(self, operation, *args):
+        """Ejecutar la operación original y registrar las líneas afectadas"""
+        if operation == "insert" and args:
+            line = self._line_of(args[0])
+            result = self._call(operation, *args)
+            inserted = "".join(str(chunk) for chunk in args[1::2])
+            self._on_insert(line, inserted.count("\n"))
+            return result
+
+        if operation in ("delete", "replace") and args:
+            # Las líneas eliminadas se cuentan en el documento, no en los índices: un
+            # delete con un solo índice (BackSpace al inicio o Delete al final de una
+            # línea) también puede borrar un salto de línea
+            first = self._line_of(args[0])
+            inserted = "".join(str(chunk) for chunk in args[2::2]) if operation == "replace" else ""
+            lines_before = self._line_count()
+            result = self._call(operation, *args)
+            removed = lines_before - self._line_count() + inserted.count("\n")
+            self._on_delete(first, first + removed)
+            if inserted:
+                self._on_insert(first, inserted.count("\n"))
+            return result
+
+        return self._call(operation, *args)
+
+    def _line_count(self):
+        """Número de líneas del documento"""
+        return int(str(self._call("index", "end-1c")).split(".")[0])
+
+    def _line_of(self, index):
+        """Número de línea de un índice de Tk, acotado al documento"""
+        line = int(str(self._call("index", index)).split(".")[0])
+        return min(line, self._line_count())
+
+    # ------------------------------------------------------------------
+    # Seguimiento de líneas sucias
+    # ------------------------------------------------------------------
+    def _on_insert(self, line, new_lines):
+        """Actualizar estados tras insertar new_lines saltos de línea en line"""
+        if new_lines:
+            self.line_states[line:line] = [None] * new_lines
+            self.dirty = {d + new_lines if d > line else d for d in self.dirty}
+        self.dirty.update(range(line, line + new_lines + 1))
+        self._schedule()
+
+    def _on_delete(self, first, last):
+        """Actualizar estados tras fusionar las líneas first..last en una sola"""
+        removed = last - first
+        if removed:
+            del self.line_states[first:last]
+            self.dirty = {d - removed if d > last else d
+                          for d in self.dirty if not first < d <= last}
+        if not self.line_states:
+            self.line_states = [None]
+        self.dirty.add(first)
+        self._schedule()
+
+    def _schedule(self):
+        """Programar la siguiente porción de trabajo si no hay una pendiente"""
+        if self._after_id is None and self.dirty:
+            self._after_id = self.text.after(self.IDLE_DELAY_MS, self._process_slice)
+
+    def _visible_range(self):
+        """Primera y última línea visibles en el viewport"""
+        first = int(str(self._call("index", "@0,0")).split(".")[0])
+        height = self.text.winfo_height()
+        last = int(str(self._call("index", f"@0,{height}")).split(".")[0])
+        return first, last
+
+    def _process_slice(self):
+        """Tokenizar primero el viewport y después el resto dentro del presupuesto"""
+        self._after_id = None
+        if not self.dirty:
+            return
+
+        deadline = time.perf_counter() + self.SLICE_BUDGET_MS / 1000.0
+
+        try:
+            first_visible, last_visible = self._visible_range()
+        except Exception:
+            first_visible, last_visible = 1, 0
+
+        # 1) Líneas visibles: siempre se resaltan en esta porción
+        for line in sorted(d for d in self.dirty if first_visible <= d <= last_visible):
+            self._highlight_line(line)
+
+        # 2) Resto del archivo en orden, respetando el presupuesto de tiempo
+        for count, line in enumerate(sorted(self.dirty)):
+            if count % 32 == 0 and time.perf_counter() >= deadline:
+                break
+            if line in self.dirty:
+                self._highlight_line(line)
+
+        self._schedule()
+
+    def _highlight_line(self, line):
+        """Aplicar etiquetas de tokens a una línea y propagar el estado si cambió"""
+        self.dirty.discard(line)
+        total = len(self.line_states)
+        if line < 1 or line > total:
+            return
+
+        start, end = f"{line}.0", f"{line}.end"
+        content = str(self._call("get", start, end))
+        spans, end_state = tokenize_line(content, self.line_states[line - 1])
+
+        for tag in TOKEN_TAGS:
+            self._call("tag", "remove", tag, start, end)
+
+        # Agrupar rangos por etiqueta para minimizar llamadas a Tk
+        ranges = {}
+        for tag, s, e in spans:
+            ranges.setdefault(tag, []).extend((f"{line}.{s}", f"{line}.{e}"))
+        for tag, indices in ranges.items():
+            self._call("tag", "add", tag, *indices)
+
+        # Si cambió el estado al final de la línea, la siguiente debe re-tokenizarse
+        if line < total and self.line_states[line] != end_state:
+            self.line_states[line] = end_state
+            self.dirty.add(line + 1)
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    def set_theme(self, theme):
+        """Configurar los colores de las etiquetas según el tema"""
+        self.theme = theme if theme in THEME_COLORS else "dark"
+        for tag, color in THEME_COLORS[self.theme].items():
+            self._call("tag", "configure", tag, "-foreground", color)
+        # La selección debe verse por encima de los tokens
+        self._call("tag", "raise", "sel")
+
+    def rehighlight(self):
+        """Forzar el re-resaltado completo en segundo plano"""
+        total = self._line_count()
+        self.line_states = [None] * total
+        self.dirty = set(range(1, total + 1))
+        self._schedule()
+
+    def pending_lines(self):
+        """Número de líneas que aún esperan ser tokenizadas"""
+        return len(self.dirty)
@@ -66,6 +66,197 @@ class TestBiomedicalDSP(unittest.TestCase):
             # Utils might not exist or have fallbacks, that's OK
             print(f"⚠️ Utils module test skipped: {e}")
     
+    def test_background_atomic_save(self):
+        """Test atomic writes and coalesced background saves"""
+        import utils
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / "clase.py"
+            utils.atomic_write_text(target, "x = 1\n")
+            self.assertEqual(target.read_text(encoding='utf-8'), "x = 1\n")
+
+            results = []
+            saver = utils.BackgroundFileSaver()
+            for i in range(5):
+                saver.submit(target, f"x = {i}\n", callback=results.append)
+            self.assertTrue(saver.flush(timeout=5))
+
+            # Only the latest content must end up on disk, with no temp files left
+            self.assertEqual(target.read_text(encoding='utf-8'), "x = 4\n")
+            self.assertTrue(all(error is None for error in results))
+            self.assertEqual([p.name for p in Path(tmp_dir).iterdir()], ["clase.py"])
+
+        print("✅ Atomic background save works")
+
+    def test_workspace_cache_budget(self):
+        """Test that class workspaces are evicted in LRU order under the memory budget"""
+        from workspace_cache import ClassWorkspace, WorkspaceCache
+
+        cache = WorkspaceCache(memory_budget=2500)
+        for key in ("clase_01", "clase_02", "clase_03"):
+            workspace = ClassWorkspace(key)
+            workspace.figures = [("Gráfico 1", b"\0" * 1000)]
+            cache.put(workspace)
+
+        # The oldest workspace is released to stay under the budget
+        self.assertNotIn("clase_01", cache)
+        self.assertIn("clase_03", cache)
+        self.assertLessEqual(cache.memory_used, cache.memory_budget)
+
+        # Taking a workspace out transfers ownership and frees its share of the budget
+        restored = cache.pop("clase_02")
+        self.assertEqual(restored.figures[0][0], "Gráfico 1")
+        self.assertEqual(cache.memory_used, 1000)
+
+        print("✅ Workspace cache respects its memory budget")
+
+    def test_save_completion_updates_cached_workspace(self):
+        """Test that a save finishing after the class was stashed keeps its workspace valid"""
+        import main
+        from workspace_cache import ClassWorkspace, WorkspaceCache
+
+        app = main.BiomedicaDSPApp.__new__(main.BiomedicaDSPApp)
+        app.current_py_path = None
+        app.workspace_cache = WorkspaceCache()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "clase.py"
+            path.write_text("x = 1\n", encoding="utf-8")
+            os.utime(path, (0, 0))
+
+            # Stashed while the background save of "x = 2" was still pending
+            workspace = ClassWorkspace(str(path))
+            workspace.code_content = "x = 2\n"
+            workspace.saved_code_digest = app._code_digest("x = 2\n")
+            workspace.code_mtime = app._asset_mtime(path)
+            app.workspace_cache.put(workspace)
+
+            path.write_text("x = 2\n", encoding="utf-8")
+            app._on_code_saved(path, workspace.saved_code_digest, None, False)
+            self.assertEqual(workspace.code_mtime, app._asset_mtime(path))
+            self.assertFalse(workspace.code_modified)
+
+            # A failed save leaves the cached buffer pending instead of trusting the disk
+            app._on_code_saved(path, workspace.saved_code_digest, OSError("disco lleno"), False)
+            self.assertIsNone(workspace.saved_code_digest)
+            self.assertTrue(workspace.code_modified)
+
+        print("✅ Background save completion updates the cached workspace")
+
+    def test_class_prefetcher(self):
+        """Test that the next class is read, compiled and its first page rendered"""
+        import time
+        from class_prefetcher import ClassPrefetcher
+
+        class ImmediateRoot:
+            """Minimal stand-in for Tk that runs scheduled callbacks right away"""
+            def after(self, ms, func, *args):
+                func(*args)
+                return "after#1"
+            def after_idle(self, func, *args):
+                func(*args)
+            def after_cancel(self, after_id):
+                pass
+
+        unit_dir = next(d for d in self.base_dir.glob("Unidad 01*") if d.is_dir())
+        pdf_path = sorted(unit_dir.glob("*.pdf"))[0]
+        py_path = sorted(unit_dir.glob("*.py"))[0]
+
+        compile_source = lambda code, path: (str(path), compile(code, str(path), 'exec'))
+        prefetcher = ClassPrefetcher(ImmediateRoot(), compile_source, idle_delay_ms=0)
+        prefetcher.schedule([("siguiente", pdf_path, py_path)], lambda w, h: 0.5)
+
+        task = None
+        for _ in range(100):
+            task = prefetcher.take("siguiente")
+            if task:
+                break
+            time.sleep(0.05)
+
+        self.assertIsNotNone(task, "Prefetch did not finish")
+        self.assertEqual(task.code_content, py_path.read_text(encoding='utf-8'))
+        self.assertEqual(task.page_render[:2], (0, 0.5))
+        self.assertIsNotNone(task.compiled)
+        task.release()
+        prefetcher.shutdown()
+
+        print("✅ Class prefetcher works")
+
+    def test_compiled_code_cache_threads(self):
+        """Test that the compiled code cache stays bounded when two threads fill it"""
+        import threading
+        from collections import OrderedDict
+        import main
+
+        app = main.BiomedicaDSPApp.__new__(main.BiomedicaDSPApp)
+        app.compiled_code_cache = OrderedDict()
+        app.compiled_code_lock = threading.Lock()
+        app.current_py_path = Path("clase.py")
+        errors = []
+
+        def fill(action):
+            try:
+                for i in range(300):
+                    action(i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=fill, args=(lambda i: app._compile_for_execution_cached(f"x = {i}"),)),
+            threading.Thread(target=fill, args=(lambda i: app._store_compiled_code(("otra.py", i), None),)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(app.compiled_code_cache), 8)
+        print("✅ Compiled code cache is thread safe")
+
+    def test_asset_bundle_roundtrip(self):
+        """Test that the indexed asset bundle stores every course file and its manifest"""
+        from asset_bundle import AssetBundle, build_bundle
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bundle_path = build_bundle(self.base_dir, Path(tmp_dir) / "course.bdsp", prerender=True)
+            bundle = AssetBundle(bundle_path)
+            try:
+                units = bundle.manifest["units"]
+                self.assertEqual(len(units), len([d for d in self.base_dir.glob("Unidad *") if d.is_dir()]))
+
+                for unit in units:
+                    for name in unit["files"]:
+                        self.assertEqual(bytes(bundle.read(name)), (self.base_dir / name).read_bytes())
+
+                pdf_name = next(name for unit in units for name in unit["files"] if name.endswith(".pdf"))
+                zoom, png = bundle.prerendered_page(pdf_name)
+                self.assertTrue(png.startswith(b"\x89PNG"))
+            finally:
+                bundle.close()
+
+        print("✅ Asset bundle round trip works")
+
+    def test_find_asset_bundle(self):
+        """Test that the bundle next to the executable wins over the extracted copy"""
+        from unittest import mock
+        from asset_bundle import BUNDLE_NAME, find_bundle
+
+        with tempfile.TemporaryDirectory() as exe_dir, tempfile.TemporaryDirectory() as meipass:
+            executable = Path(exe_dir) / "Biomedical-DSP.exe"
+            with mock.patch.object(sys, "executable", str(executable)):
+                self.assertIsNone(find_bundle(meipass))
+
+                extracted = Path(meipass) / BUNDLE_NAME
+                extracted.write_bytes(b"")
+                self.assertEqual(find_bundle(meipass), extracted)
+
+                beside_exe = Path(exe_dir) / BUNDLE_NAME
+                beside_exe.write_bytes(b"")
+                self.assertEqual(find_bundle(meipass).resolve(), beside_exe.resolve())
+
+        print("✅ Asset bundle is found next to the executable")
+
     def test_file_structure(self):
         """Test that required files and directories exist"""
         
@@ -103,6 +294,80 @@ class TestBiomedicalDSP(unittest.TestCase):
         self.assertGreater(total_py_files, 0, "No Python files found in units")
         print(f"✅ Found {total_pdfs} PDF files and {total_py_files} Python files")
     
+    def test_syntax_highlighter_tokenizer(self):
+        """Test that the incremental highlighter tokenizes lines and carries string state"""
+        from syntax_highlighter import tokenize_line
+
+        spans, state = tokenize_line("def foo(x=1):  # comentario")
+        tags = [tag for tag, _, _ in spans]
+        self.assertEqual(tags, ["keyword", "definition", "number", "comment"])
+        self.assertIsNone(state)
+
+        # A triple-quoted string left open must propagate to the next line
+        spans, state = tokenize_line('doc = """inicio')
+        self.assertEqual(state, '"""')
+        spans, state = tokenize_line('fin""" + 1', state)
+        self.assertEqual(spans[0], ("string", 0, 6))
+        self.assertIsNone(state)
+
+        print("✅ Syntax highlighter tokenizer works")
+
+    def test_syntax_highlighter_line_joins(self):
+        """Test that joining lines with single-index deletes keeps the string states aligned"""
+        import tkinter as tk
+        from syntax_highlighter import IncrementalHighlighter
+
+        try:
+            root = tk.Tk()
+        except tk.TclError as e:
+            self.skipTest(f"No display for Tk: {e}")
+        try:
+            text = tk.Text(root)
+            highlighter = IncrementalHighlighter(text)
+            text.insert("1.0", 'a = 1\n"""\ndoc\n"""\nb = 2')
+
+            def settle():
+                while highlighter.pending_lines():
+                    highlighter._process_slice()
+
+            settle()
+            # Delete at the end of line 1 and BackSpace at the start of line 3
+            for index in ("1.end", "3.0-1c"):
+                text.delete(index)
+                settle()
+                self.assertEqual(len(highlighter.line_states), highlighter._line_count())
+
+            self.assertEqual(text.get("1.0", "end-1c"), 'a = 1"""\ndoc"""\nb = 2')
+            self.assertIsNone(highlighter.line_states[2])
+            self.assertEqual(text.tag_names("3.0"), ())
+        finally:
+            root.destroy()
+
+        print("✅ Syntax highlighter keeps line states across line joins")
+
+    def test_toggle_theme_updates_highlighter(self):
+        """Test that switching the theme recolours the editor tokens"""
+        from unittest import mock
+        import main
+
+        app = main.BiomedicaDSPApp.__new__(main.BiomedicaDSPApp)
+        app.current_theme = "dark"
+        app.code_highlighter = mock.Mock()
+        with mock.patch.object(main.ctk, "set_appearance_mode"), \
+                mock.patch.object(app, "save_theme_preferences", create=True), \
+                mock.patch.object(app, "update_theme_colors", create=True):
+            app.toggle_theme()
+            app.code_highlighter.set_theme.assert_called_once_with("light")
+            app.toggle_theme()
+            app.code_highlighter.set_theme.assert_called_with("dark")
+
+            # Without a highlighter (it could not be created) the toggle still works
+            app.code_highlighter = None
+            app.toggle_theme()
+            self.assertEqual(app.current_theme, "light")
+
+        print("✅ Theme toggle updates the syntax highlighter")
+
     def test_app_initialization_dry_run(self):
         """Test that app can be initialized without actually creating GUI"""
         try:
@@ -5,7 +5,10 @@ Utilidades para la aplicación Biomedical DSP
 import sys
 import os
 import platform
+import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
 
 def get_resource_path(relative_path):
@@ -97,3 +100,90 @@ def get_safe_filename(filename):
         safe_name = safe_name[:255]
     
     return safe_name
+
+def atomic_write_text(file_path, content, encoding='utf-8'):
+    """
+    Escribir texto de forma atómica: se escribe en un archivo temporal del mismo
+    directorio y luego se renombra sobre el destino, de modo que nunca queda un
+    archivo a medio escribir
+    """
+    file_path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", suffix=".tmp", dir=str(file_path.parent)
+    )
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        
+        # Conservar los permisos del archivo original
+        if file_path.exists():
+            shutil.copymode(file_path, tmp_path)
+        
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class BackgroundFileSaver:
+    """
+    Guardar archivos en un hilo de fondo usando escritura atómica.
+    Las solicitudes pendientes para una misma ruta se combinan: solo se escribe
+    la versión más reciente del contenido.
+    """
+    
+    def __init__(self):
+        self._pending = {}  # ruta -> (contenido, callback)
+        self._busy = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name="BackgroundFileSaver", daemon=True)
+        self._thread.start()
+    
+    def submit(self, file_path, content, callback=None):
+        """
+        Encolar el guardado de un archivo. callback(error) se llama desde el hilo
+        de fondo con None si la escritura fue exitosa
+        """
+        with self._condition:
+            self._pending[str(file_path)] = (content, callback)
+            self._condition.notify_all()
+    
+    def flush(self, timeout=None):
+        """
+        Esperar a que terminen todas las escrituras pendientes.
+        Retorna False si se agotó el tiempo de espera
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+    
+    def _worker(self):
+        """Bucle del hilo de fondo que procesa las escrituras"""
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                file_path = next(iter(self._pending))
+                content, callback = self._pending.pop(file_path)
+                self._busy = True
+            
+            error = None
+            try:
+                atomic_write_text(file_path, content)
+            except Exception as e:
+                error = e
+            
+            with self._condition:
+                self._busy = False
+                self._condition.notify_all()
+            
+            if callback:
+                try:
+                    callback(error)
+                except Exception as e:
+                    print(f"Error en callback de guardado: {e}")
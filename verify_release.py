@@ -58,12 +58,14 @@ def main():
     # Verificar build
     print("\n🔨 Archivos de build:")
     all_good &= check_file_exists("dist/Biomedical-DSP.exe", "Ejecutable principal")
+    all_good &= check_file_exists("dist/course_assets.bdsp", "Paquete de recursos")
     all_good &= check_file_exists("build_enhanced.bat", "Script de build")
     
     # Verificar distribución
     print("\n📦 Distribución:")
     all_good &= check_file_exists("Biomedical-DSP-v2.0-Portable.zip", "Package portable")
     all_good &= check_file_exists("distribution/Biomedical-DSP.exe", "Ejecutable en distribución")
+    all_good &= check_file_exists("distribution/course_assets.bdsp", "Paquete de recursos en distribución")
     all_good &= check_file_exists("distribution/CHANGELOG_v2.0.md", "Changelog")
     all_good &= check_file_exists("distribution/INSTALAR.bat", "Script de instalación")
     
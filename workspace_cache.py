@@ -0,0 +1,127 @@
+"""
+Espacios de trabajo por clase para Biomedical DSP
+Cada clase abierta conserva su documento, editor, gráficos y salida en una caché LRU
+limitada por un presupuesto global de memoria
+"""
+
+import sys
+from collections import OrderedDict
+
+
+class ClassWorkspace:
+    """
+    Estado guardado de una clase: posición en el PDF, buffer del editor,
+    figuras rasterizadas (PNG) y salida de la última ejecución
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+        # Documento PDF (se mantiene abierto para volver sin reabrirlo)
+        self.pdf_document = None
+        self.pdf_size = 0  # Tamaño estimado en memoria (bytes)
+        self.current_page = 0
+        self.zoom_level = 1.0
+        self.page_render = None  # (página, zoom, bytes PPM) de la última página dibujada
+
+        # Editor de código
+        self.code_content = None
+        self.code_modified = False
+        self.saved_code_digest = None
+        self.code_mtime = None  # mtime del archivo al guardar el espacio de trabajo
+        self.code_yview = 0.0
+        self.code_insert = "1.0"
+
+        # Resultados de la ejecución
+        self.figures = []  # Lista de (título, bytes PNG)
+        self.output_content = None
+
+    def memory_size(self):
+        """Estimar la memoria ocupada por el espacio de trabajo en bytes"""
+        size = self.pdf_size
+        if self.page_render:
+            size += len(self.page_render[2])
+        if self.code_content:
+            size += sys.getsizeof(self.code_content)
+        if self.output_content:
+            size += sys.getsizeof(self.output_content)
+        size += sum(len(png) for _, png in self.figures)
+        return size
+
+    def release(self):
+        """Liberar los recursos del espacio de trabajo"""
+        if self.pdf_document is not None:
+            try:
+                self.pdf_document.close()
+            except Exception as e:
+                print(f"Error al cerrar documento en caché: {e}")
+            self.pdf_document = None
+        self.page_render = None
+        self.figures = []
+        self.code_content = None
+        self.output_content = None
+
+
+class WorkspaceCache:
+    """
+    Caché LRU de espacios de trabajo con presupuesto global de memoria.
+    Al superar el presupuesto se liberan los espacios usados hace más tiempo
+    """
+
+    def __init__(self, memory_budget=256 * 1024 * 1024):
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self._workspaces = OrderedDict()  # clave -> (espacio, tamaño)
+
+    def __contains__(self, key):
+        return key in self._workspaces
+
+    def __len__(self):
+        return len(self._workspaces)
+
+    def put(self, workspace):
+        """
+        Guardar un espacio de trabajo como el más reciente.
+        Retorna False si no cabe en el presupuesto (en ese caso se libera)
+        """
+        previous = self.pop(workspace.key)
+        if previous is not None and previous is not workspace:
+            previous.release()
+
+        size = workspace.memory_size()
+        if size > self.memory_budget:
+            workspace.release()
+            return False
+
+        self._workspaces[workspace.key] = (workspace, size)
+        self.memory_used += size
+        self._evict()
+        return True
+
+    def pop(self, key):
+        """Retirar un espacio de trabajo de la caché (el llamador pasa a ser su dueño)"""
+        entry = self._workspaces.pop(key, None)
+        if entry is None:
+            return None
+        workspace, size = entry
+        self.memory_used -= size
+        return workspace
+
+    def peek(self, key):
+        """Consultar un espacio de trabajo sin alterar el orden LRU"""
+        entry = self._workspaces.get(key)
+        return entry[0] if entry else None
+
+    def clear(self):
+        """Liberar todos los espacios de trabajo"""
+        for workspace, _ in self._workspaces.values():
+            workspace.release()
+        self._workspaces.clear()
+        self.memory_used = 0
+
+    def _evict(self):
+        """Liberar los espacios menos recientes hasta respetar el presupuesto"""
+        while self.memory_used > self.memory_budget and self._workspaces:
+            _, (workspace, size) = self._workspaces.popitem(last=False)
+            self.memory_used -= size
+            workspace.release()